@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Any, Literal, Tuple
 import numpy as np
 import json
 import math
+from collections import deque
 
 from core.measurements.metadata_v0 import create_metadata_v0, get_evidence_ref
 
@@ -318,10 +319,75 @@ def _cluster_trim_torso(pts: np.ndarray, body_center_2d: np.ndarray) -> Optional
         return None
 
 
+def _dedup_sorted_points_2d(sorted_pts: np.ndarray) -> np.ndarray:
+    """
+    Drop points that are np.allclose(atol=1e-9) to their predecessor in sorted order.
+
+    Vectorized form of the per-pair loop: each point is compared with the previous
+    sorted point (whether or not that one was kept), exactly like the loop did.
+    """
+    if len(sorted_pts) < 2:
+        return sorted_pts
+    unique_mask = np.ones(len(sorted_pts), dtype=bool)
+    unique_mask[1:] = ~np.all(np.isclose(sorted_pts[1:], sorted_pts[:-1], atol=1e-9), axis=1)
+    return sorted_pts[unique_mask]
+
+
+def _monotone_chain_indices(xs: List[float], ys: List[float], dtype: np.dtype) -> List[int]:
+    """
+    Andrew's monotone chain over lexsorted points; returns hull indices (CCW).
+
+    The turn test is evaluated in float64 and accepted when its magnitude clears the
+    worst-case rounding error of the same expression evaluated in the input dtype;
+    otherwise (near-collinear, zero, tiny/huge magnitudes, non-finite) it is evaluated
+    in the input dtype with the original operation order. Decisions, and therefore
+    the hull, are identical to the scalar-numpy loop.
+    """
+    dtype = np.dtype(dtype)
+    scalar = dtype.type
+    # float64 (and exact integer) inputs: plain float/int arithmetic is the original arithmetic
+    guarded = np.issubdtype(dtype, np.floating) and dtype.itemsize < 8
+    err_scale = 8.0 * float(np.finfo(dtype).eps) if guarded else 0.0
+
+    def pops(i_o: int, i_a: int, i_b: int) -> bool:
+        ox = xs[i_o]
+        oy = ys[i_o]
+        t1 = (xs[i_a] - ox) * (ys[i_b] - oy)
+        t2 = (ys[i_a] - oy) * (xs[i_b] - ox)
+        diff = t1 - t2
+        if not guarded:
+            return diff <= 0
+        mag = abs(t1) + abs(t2)
+        if 1e-30 < mag < 1e37 and abs(diff) > err_scale * mag:
+            return diff < 0
+        # Exact replay in the input dtype (same expression as the original cross())
+        o0, o1 = scalar(ox), scalar(oy)
+        cross = (scalar(xs[i_a]) - o0) * (scalar(ys[i_b]) - o1) - (scalar(ys[i_a]) - o1) * (scalar(xs[i_b]) - o0)
+        return bool(cross <= 0)
+
+    n = len(xs)
+    lower: List[int] = []
+    for i in range(n):
+        while len(lower) >= 2 and pops(lower[-2], lower[-1], i):
+            lower.pop()
+        lower.append(i)
+
+    upper: List[int] = []
+    for i in range(n - 1, -1, -1):
+        while len(upper) >= 2 and pops(upper[-2], upper[-1], i):
+            upper.pop()
+        upper.append(i)
+
+    return lower[:-1] + upper[:-1]
+
+
 def _convex_hull_2d_monotone_chain(pts: np.ndarray) -> Optional[np.ndarray]:
     """
     Compute 2D convex hull using Andrew's monotone chain algorithm (numpy-only).
     
+    Dedup is vectorized and the chain runs on plain floats with an exactness guard
+    (_monotone_chain_indices); output is byte-identical to the scalar-numpy loop.
+    
     Returns:
         Convex hull points in counter-clockwise order, or None if degenerate.
     """
@@ -333,35 +399,15 @@ def _convex_hull_2d_monotone_chain(pts: np.ndarray) -> Optional[np.ndarray]:
     sorted_pts = pts[sort_indices]
     
     # Remove duplicates (consecutive)
-    unique_mask = np.ones(len(sorted_pts), dtype=bool)
-    for i in range(1, len(sorted_pts)):
-        if np.allclose(sorted_pts[i], sorted_pts[i-1], atol=1e-9):
-            unique_mask[i] = False
-    sorted_pts = sorted_pts[unique_mask]
+    sorted_pts = _dedup_sorted_points_2d(sorted_pts)
     
     if len(sorted_pts) < 3:
         return None
     
-    # Cross product for orientation check (2D: (x1-x0)*(y2-y0) - (y1-y0)*(x2-x0))
-    def cross(o, a, b):
-        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
-    
-    # Build lower hull
-    lower = []
-    for p in sorted_pts:
-        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
-            lower.pop()
-        lower.append(p)
-    
-    # Build upper hull
-    upper = []
-    for p in reversed(sorted_pts):
-        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
-            upper.pop()
-        upper.append(p)
-    
-    # Combine (remove duplicate endpoints)
-    hull = np.array(lower[:-1] + upper[:-1], dtype=np.float32)
+    hull_indices = _monotone_chain_indices(
+        sorted_pts[:, 0].tolist(), sorted_pts[:, 1].tolist(), sorted_pts.dtype
+    )
+    hull = np.asarray(sorted_pts[hull_indices], dtype=np.float32)
     
     # Check for degenerate cases
     if len(hull) < 3:
@@ -379,6 +425,31 @@ def _convex_hull_2d_monotone_chain(pts: np.ndarray) -> Optional[np.ndarray]:
     return hull
 
 
+def _convex_hull_2d_qhull(pts: np.ndarray) -> Optional[np.ndarray]:
+    """
+    2D convex hull via scipy Qhull, in the monotone chain convention
+    (starts at the lexicographically smallest hull point, counter-clockwise, float32).
+    
+    Same hull up to Qhull's own near-collinear tolerance; not guaranteed byte-identical.
+    Falls back to the monotone chain if scipy is unavailable or Qhull rejects the input (degenerate).
+    """
+    if pts.shape[0] < 3:
+        return None
+    try:
+        from scipy.spatial import ConvexHull
+        hull_obj = ConvexHull(np.asarray(pts, dtype=np.float64))
+    except Exception:
+        return _convex_hull_2d_monotone_chain(pts)
+    
+    # 2D: hull_obj.vertices are already counter-clockwise
+    hull = np.asarray(pts[hull_obj.vertices], dtype=np.float32)
+    start = int(np.lexsort((hull[:, 1], hull[:, 0]))[0])
+    hull = np.roll(hull, -start, axis=0)
+    if len(hull) < 3:
+        return None
+    return hull
+
+
 def _compute_perimeter(vertices_2d: np.ndarray, return_debug: bool = False) -> Optional[float] | Tuple[Optional[float], Dict[str, Any]]:
     """
     Compute closed curve perimeter from 2D vertices using convex hull.
@@ -548,13 +619,18 @@ def _compute_perimeter(vertices_2d: np.ndarray, return_debug: bool = False) -> O
     return float(perimeter_final)
 
 
-def _compute_tolerance_from_mesh_scale(verts: np.ndarray, base_tolerance: float) -> float:
+def _compute_tolerance_from_mesh_scale(
+    verts: np.ndarray,
+    base_tolerance: float,
+    bbox_size: Optional[np.ndarray] = None,
+) -> float:
     """
     Round55: Compute tolerance based on mesh scale/edge length.
     
     Args:
         verts: Mesh vertices (N, 3)
         base_tolerance: Original tolerance value (fallback)
+        bbox_size: Optional precomputed bbox size (e.g. from SliceIndex)
     
     Returns:
         Adjusted tolerance based on mesh scale
@@ -564,9 +640,10 @@ def _compute_tolerance_from_mesh_scale(verts: np.ndarray, base_tolerance: float)
     
     try:
         # Compute mesh bounding box
-        bbox_min = np.min(verts, axis=0)
-        bbox_max = np.max(verts, axis=0)
-        bbox_size = bbox_max - bbox_min
+        if bbox_size is None:
+            bbox_min = np.min(verts, axis=0)
+            bbox_max = np.max(verts, axis=0)
+            bbox_size = bbox_max - bbox_min
         
         # Estimate edge length from mesh scale (use median of bbox dimensions)
         # This gives a rough estimate of mesh resolution
@@ -588,6 +665,114 @@ def _compute_tolerance_from_mesh_scale(verts: np.ndarray, base_tolerance: float)
         return base_tolerance
 
 
+# -----------------------------
+# Slice Index (per-mesh, shared across keys)
+# -----------------------------
+@dataclass
+class SliceIndex:
+    """
+    Per-mesh vertex index sorted by height (y), shared across slice-based keys.
+
+    Built once per mesh (one sort); each band query is a searchsorted window plus
+    the exact np.abs(y - y_value) < tolerance test on that window only. Returns the
+    same vertex set, in original vertex order, as the full-array mask.
+    """
+    verts: np.ndarray  # (N, 3) float32, the array the index was built from
+    order: np.ndarray  # (N,) vertex indices sorted by y
+    y_sorted: np.ndarray  # (N,) y coordinates in sorted order
+    y_min: float
+    y_max: float
+    bbox_size: np.ndarray  # (3,) bbox span, reused for mesh-scale tolerance
+    body_center: np.ndarray  # (3,) vertex mean
+
+    @classmethod
+    def from_verts(cls, verts: np.ndarray) -> "SliceIndex":
+        """Build index from body vertices (N, 3) in meters."""
+        verts = _as_np_f32(verts)
+        y_coords = verts[:, 1]
+        order = np.argsort(y_coords, kind="stable")
+        return cls(
+            verts=verts,
+            order=order,
+            y_sorted=y_coords[order],
+            y_min=float(np.min(y_coords)),
+            y_max=float(np.max(y_coords)),
+            bbox_size=np.max(verts, axis=0) - np.min(verts, axis=0),
+            body_center=np.mean(verts, axis=0),
+        )
+
+    @classmethod
+    def from_batch(cls, verts_batch: np.ndarray) -> List["SliceIndex"]:
+        """
+        Build one index per case from stacked vertices (B, N, 3) in meters.
+
+        Sort, bbox and center are computed over the whole batch in single calls;
+        each returned index holds a view of its own case, so it matches verts_batch[b].
+        """
+        verts_batch = _as_np_f32(verts_batch)
+        y_coords = verts_batch[:, :, 1]
+        order = np.argsort(y_coords, axis=1, kind="stable")
+        y_sorted = np.take_along_axis(y_coords, order, axis=1)
+        bbox_min = np.min(verts_batch, axis=1)
+        bbox_max = np.max(verts_batch, axis=1)
+        bbox_size = bbox_max - bbox_min
+        return [
+            cls(
+                verts=verts_batch[b],
+                order=order[b],
+                y_sorted=y_sorted[b],
+                y_min=float(bbox_min[b, 1]),
+                y_max=float(bbox_max[b, 1]),
+                bbox_size=bbox_size[b],
+                # Per case: keeps the float32 summation order of from_verts
+                body_center=np.mean(verts_batch[b], axis=0),
+            )
+            for b in range(verts_batch.shape[0])
+        ]
+
+    def matches(self, verts: np.ndarray) -> bool:
+        """True if this index was built from verts (same array, or same float32 content)."""
+        if verts is self.verts:
+            return True
+        verts = _as_np_f32(verts)
+        return verts.shape == self.verts.shape and np.array_equal(verts, self.verts, equal_nan=True)
+
+    def band_indices(self, y_value: float, tolerance: float) -> np.ndarray:
+        """
+        Vertex indices with |y - y_value| < tolerance, ascending.
+
+        The searchsorted window is padded by a few float32 ulps so rounding in the
+        exact test can never fall outside it.
+        """
+        pad = 4.0 * float(np.finfo(np.float32).eps) * (abs(float(y_value)) + abs(float(tolerance)) + 1.0)
+        lo = int(np.searchsorted(self.y_sorted, y_value - tolerance - pad, side="left"))
+        hi = int(np.searchsorted(self.y_sorted, y_value + tolerance + pad, side="right"))
+        if hi <= lo:
+            return np.zeros(0, dtype=np.int64)
+        window = self.y_sorted[lo:hi]
+        in_band = np.abs(window - y_value) < tolerance
+        return np.sort(self.order[lo:hi][in_band])
+
+    def band_count(self, y_value: float, tolerance: float) -> int:
+        """Number of vertices with |y - y_value| < tolerance."""
+        return int(self.band_indices(y_value, tolerance).size)
+
+
+def _resolve_slice_index(
+    verts: np.ndarray,
+    slice_index: Optional[SliceIndex],
+    warnings: Optional[List[str]],
+) -> Optional[SliceIndex]:
+    """Drop a slice index that was built for a different mesh (recorded as warning)."""
+    if slice_index is None:
+        return None
+    if not slice_index.matches(verts):
+        if warnings is not None:
+            warnings.append("SLICE_INDEX_MISMATCH: ignored")
+        return None
+    return slice_index
+
+
 def _find_cross_section(
     verts: np.ndarray,
     y_value: float,
@@ -597,6 +782,7 @@ def _find_cross_section(
     y_max: Optional[float] = None,
     target_mode: str = "ratio",
     allow_nearest_fallback: bool = False,
+    slice_index: Optional[SliceIndex] = None,
 ) -> tuple[Optional[np.ndarray], Optional[Dict[str, Any]]]:
     """
     Find cross-section vertices at given y-value.
@@ -604,12 +790,13 @@ def _find_cross_section(
     
     Args:
         allow_nearest_fallback: If True, when target is out of bounds, use nearest valid plane
+        slice_index: Optional per-mesh SliceIndex (band query instead of full-array mask)
     """
     y_coords = verts[:, 1]
     if y_min is None:
-        y_min = float(np.min(y_coords))
+        y_min = slice_index.y_min if slice_index is not None else float(np.min(y_coords))
     if y_max is None:
-        y_max = float(np.max(y_coords))
+        y_max = slice_index.y_max if slice_index is not None else float(np.max(y_coords))
     y_range = y_max - y_min
     
     # Enhanced debug info
@@ -656,8 +843,12 @@ def _find_cross_section(
         debug_info["reason_not_found"] = "too_thin_slice"
         return None, debug_info
     
-    mask = np.abs(y_coords - y_value) < tolerance
-    candidate_count = int(np.sum(mask))
+    if slice_index is not None:
+        mask = slice_index.band_indices(y_value, tolerance)
+        candidate_count = int(mask.size)
+    else:
+        mask = np.abs(y_coords - y_value) < tolerance
+        candidate_count = int(np.sum(mask))
     debug_info["candidates_count"] = candidate_count
     
     if candidate_count < 3:
@@ -681,6 +872,7 @@ def _find_nearest_valid_plane(
     y_min: float,
     y_max: float,
     step_mm: float = 1.0,
+    slice_index: Optional[SliceIndex] = None,
 ) -> tuple[Optional[np.ndarray], Optional[float], Optional[Dict[str, Any]]]:
     """
     Find nearest valid plane within max_shift_mm from target.
@@ -690,6 +882,7 @@ def _find_nearest_valid_plane(
     
     Args:
         step_mm: Step size in mm for searching candidate planes (default: 1.0mm)
+        slice_index: Optional per-mesh SliceIndex (band query instead of full-array mask)
     """
     y_coords = verts[:, 1]
     max_shift_m = max_shift_mm / 1000.0  # Convert to meters
@@ -711,8 +904,12 @@ def _find_nearest_valid_plane(
         if y_candidate > search_max:
             break
         
-        mask = np.abs(y_coords - y_candidate) < tolerance
-        candidate_count = int(np.sum(mask))
+        if slice_index is not None:
+            mask = slice_index.band_indices(y_candidate, tolerance)
+            candidate_count = int(mask.size)
+        else:
+            mask = np.abs(y_coords - y_candidate) < tolerance
+            candidate_count = int(np.sum(mask))
         
         if candidate_count >= 3:  # Valid plane found
             shift_mm = abs(y_candidate - y_target) * 1000.0
@@ -734,6 +931,102 @@ def _find_nearest_valid_plane(
     return None, None, None
 
 
+def _build_neighbor_graph_2d(
+    vertices_2d: np.ndarray,
+    connectivity_threshold: float,
+    max_pairs_per_chunk: int = 2_000_000,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the neighbor graph of a 2D point cloud using a uniform spatial grid.
+
+    Two points are neighbors iff np.linalg.norm(p_j - p_i) < connectivity_threshold,
+    i.e. the same predicate the brute-force scan evaluates. The grid cell is slightly
+    larger than the threshold, so only the 3x3 surrounding cells are candidates.
+    Non-finite points never have neighbors.
+
+    Returns:
+        (indptr, indices) in CSR layout: neighbors of point i are
+        indices[indptr[i]:indptr[i + 1]], sorted ascending, self excluded.
+    """
+    n = vertices_2d.shape[0]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    empty = np.zeros(0, dtype=np.int64)
+    if n < 2 or not (connectivity_threshold > 0):
+        return indptr, empty
+
+    pts64 = np.asarray(vertices_2d, dtype=np.float64)
+    finite_idx = np.nonzero(np.all(np.isfinite(pts64), axis=1))[0]
+    if finite_idx.size < 2:
+        return indptr, empty
+
+    pts_finite = pts64[finite_idx]
+    origin = np.min(pts_finite, axis=0)
+    # Margin covers rounding of the distance predicate in the input dtype
+    dtype_eps = np.finfo(vertices_2d.dtype).eps if np.issubdtype(vertices_2d.dtype, np.floating) else 0.0
+    max_abs = float(np.max(np.abs(pts_finite)))
+    cell_size = float(connectivity_threshold) * (1.0 + 1e-6) + 8.0 * dtype_eps * max_abs
+
+    cells = np.floor((pts_finite - origin) / cell_size).astype(np.int64)
+    ny = int(cells[:, 1].max()) + 3
+    keys = (cells[:, 0] + 1) * ny + (cells[:, 1] + 1)
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    sorted_idx = finite_idx[order]
+
+    # Half neighborhood (own cell + 4 forward cells); edges are mirrored afterwards
+    offsets = [0, 1, ny - 1, ny, ny + 1]
+    lo = np.stack([np.searchsorted(sorted_keys, keys + off, side="left") for off in offsets])
+    hi = np.stack([np.searchsorted(sorted_keys, keys + off, side="right") for off in offsets])
+    counts = hi - lo
+    per_point = counts.sum(axis=0)
+
+    rows_parts: List[np.ndarray] = []
+    cols_parts: List[np.ndarray] = []
+
+    # Chunk source points so candidate pair arrays stay bounded
+    m = finite_idx.size
+    start = 0
+    cum = np.cumsum(per_point)
+    while start < m:
+        base = cum[start - 1] if start > 0 else 0
+        end = int(np.searchsorted(cum, base + max_pairs_per_chunk, side="right"))
+        end = min(max(end, start + 1), m)
+
+        for k in range(len(offsets)):
+            cnt = counts[k, start:end]
+            total = int(cnt.sum())
+            if total == 0:
+                continue
+            starts = np.cumsum(cnt) - cnt
+            pos = np.arange(total, dtype=np.int64) - np.repeat(starts, cnt) + np.repeat(lo[k, start:end], cnt)
+            p = np.repeat(finite_idx[start:end], cnt)
+            q = sorted_idx[pos]
+            if offsets[k] == 0:
+                keep = p < q
+                p = p[keep]
+                q = q[keep]
+            # Same value as np.linalg.norm(q - p, axis=1) for (K, 2) input, without its overhead
+            diff = vertices_2d[q] - vertices_2d[p]
+            distances = np.sqrt(diff[:, 0] * diff[:, 0] + diff[:, 1] * diff[:, 1])
+            close = distances < connectivity_threshold
+            rows_parts.append(p[close])
+            cols_parts.append(q[close])
+        start = end
+
+    rows = np.concatenate(rows_parts) if rows_parts else empty
+    if rows.size == 0:
+        return indptr, empty
+    cols = np.concatenate(cols_parts)
+
+    # Symmetric edges sorted by (row, col); keys are unique so a plain sort suffices
+    edge_keys = np.sort(np.concatenate([rows * n + cols, cols * n + rows]))
+    rows = edge_keys // n
+    indices = edge_keys % n
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength=n))
+    return indptr, indices
+
+
 def _find_connected_components_2d(
     vertices_2d: np.ndarray,
     connectivity_threshold: float = 0.01,
@@ -743,6 +1036,8 @@ def _find_connected_components_2d(
     Round41: Find connected components in 2D point cloud.
     Round43: Add diagnostics for observability.
     Uses distance-based connectivity: points within threshold are connected.
+    Neighbors come from a spatial grid (_build_neighbor_graph_2d); components,
+    their order and point order match the original brute-force BFS.
     
     Returns:
         List of component arrays, or (components, diagnostics) if return_diagnostics=True
@@ -764,28 +1059,30 @@ def _find_connected_components_2d(
     n = vertices_2d.shape[0]
     visited = np.zeros(n, dtype=bool)
     components = []
-    
+
+    # Neighbor graph from spatial grid (replaces per-point full-array distance scan)
+    indptr, indices = _build_neighbor_graph_2d(vertices_2d, connectivity_threshold)
+
     for i in range(n):
         if visited[i]:
             continue
-        
-        # BFS to find all connected points
+
+        # BFS to find all connected points (neighbors visited in ascending index order)
         component_indices = []
-        queue = [i]
+        queue = deque([i])
         visited[i] = True
-        
+
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             component_indices.append(current)
-            
-            # Find neighbors within threshold
-            distances = np.linalg.norm(vertices_2d - vertices_2d[current], axis=1)
-            neighbors = np.where((distances < connectivity_threshold) & (~visited))[0]
-            
-            for neighbor in neighbors:
-                visited[neighbor] = True
-                queue.append(neighbor)
-        
+
+            # Find unvisited neighbors within threshold
+            neighbors = indices[indptr[current]:indptr[current + 1]]
+            neighbors = neighbors[~visited[neighbors]]
+
+            visited[neighbors] = True
+            queue.extend(neighbors.tolist())
+
         if len(component_indices) >= 3:  # Minimum 3 points for a valid component
             components.append(vertices_2d[component_indices])
             diagnostics["component_sizes"].append(len(component_indices))
@@ -968,20 +1265,26 @@ def _compute_circumference_at_height(
     return_debug: bool = False,
     return_torso_components: bool = False,  # Round41: Enable torso-only analysis
     case_id: Optional[str] = None,  # Round50: For deterministic alpha_k assignment
+    slice_index: Optional[SliceIndex] = None,
 ) -> tuple[Optional[float], Optional[Dict[str, Any]]]:
     """
     Compute circumference at given height. Returns (perimeter or None, debug_info or None).
     
     Round41: If return_torso_components=True, also analyzes connected components and selects torso-only.
     Round55: Adjust tolerance based on mesh scale for better slice point coverage.
+    slice_index: Optional per-mesh SliceIndex (cached bbox/center, band queries).
     """
     # Round55: Adjust tolerance based on mesh scale (geometry-based mitigation)
     original_tolerance = tolerance
-    tolerance = _compute_tolerance_from_mesh_scale(verts, tolerance)
+    tolerance = _compute_tolerance_from_mesh_scale(
+        verts, tolerance, bbox_size=slice_index.bbox_size if slice_index is not None else None
+    )
     if tolerance != original_tolerance and warnings is not None:
         warnings.append(f"SLICE_THICKNESS_ADJUSTED: {original_tolerance:.6f} -> {tolerance:.6f} m")
     
-    vertices_2d, debug_info = _find_cross_section(verts, y_value, tolerance, warnings, y_min, y_max)
+    vertices_2d, debug_info = _find_cross_section(
+        verts, y_value, tolerance, warnings, y_min, y_max, slice_index=slice_index
+    )
     if vertices_2d is None:
         return None, debug_info
     
@@ -993,7 +1296,7 @@ def _compute_circumference_at_height(
         warnings.append(f"DOWNSAMPLED: {vertices_2d.shape[0]} points (stride={stride})")
     
     # Round41: Compute body center (2D projection of body center)
-    body_center_3d = np.mean(verts, axis=0)
+    body_center_3d = slice_index.body_center if slice_index is not None else np.mean(verts, axis=0)
     body_center_2d = np.array([body_center_3d[0], body_center_3d[2]])  # x, z
     
     # Round41: Find connected components if requested
@@ -1388,10 +1691,14 @@ class SliceArtifact:
 def measure_waist_group_with_shared_slice(
     verts: np.ndarray,
     case_id: Optional[str] = None,  # Round50: For deterministic alpha_k assignment
+    slice_index: Optional[SliceIndex] = None,
 ) -> Dict[str, MeasurementResult]:
     """
     Measure WAIST group (CIRC, WIDTH, DEPTH) with shared slice artifact.
     
+    Args:
+        slice_index: Optional per-mesh SliceIndex built from the same verts
+    
     Returns:
         Dictionary with keys: WAIST_CIRC_M, WAIST_WIDTH_M, WAIST_DEPTH_M
     """
@@ -1421,9 +1728,14 @@ def measure_waist_group_with_shared_slice(
         return results
     
     # Find measurement height region (same as WAIST_CIRC_M)
-    y_coords = verts[:, 1]
-    y_min = float(np.min(y_coords))
-    y_max = float(np.max(y_coords))
+    slice_index = _resolve_slice_index(verts, slice_index, warnings_circ)
+    if slice_index is not None:
+        y_min = slice_index.y_min
+        y_max = slice_index.y_max
+    else:
+        y_coords = verts[:, 1]
+        y_min = float(np.min(y_coords))
+        y_max = float(np.max(y_coords))
     y_range = y_max - y_min
     
     if y_range < 1e-6:
@@ -1469,7 +1781,9 @@ def measure_waist_group_with_shared_slice(
     
     for i in range(num_slices):
         y_value = y_start + i * slice_step
-        perimeter, debug_info = _compute_circumference_at_height(verts, y_value, tolerance, warnings_circ, y_min, y_max, case_id=case_id)
+        perimeter, debug_info = _compute_circumference_at_height(
+            verts, y_value, tolerance, warnings_circ, y_min, y_max, case_id=case_id, slice_index=slice_index
+        )
         if debug_info:
             cross_section_debug_list.append(debug_info)
         if perimeter is not None:
@@ -1489,7 +1803,8 @@ def measure_waist_group_with_shared_slice(
         vertices_2d, cross_section_debug = _find_cross_section(
             verts, selected["y_value"], tolerance, warnings_circ, y_min, y_max,
             target_mode="ratio",
-            allow_nearest_fallback=False
+            allow_nearest_fallback=False,
+            slice_index=slice_index
         )
         
         if vertices_2d is not None:
@@ -1658,10 +1973,14 @@ def measure_waist_group_with_shared_slice(
 def measure_hip_group_with_shared_slice(
     verts: np.ndarray,
     case_id: Optional[str] = None,  # Round50: For deterministic alpha_k assignment
+    slice_index: Optional[SliceIndex] = None,
 ) -> Dict[str, MeasurementResult]:
     """
     Measure HIP group (CIRC, WIDTH, DEPTH) with shared slice artifact.
     
+    Args:
+        slice_index: Optional per-mesh SliceIndex built from the same verts
+    
     Returns:
         Dictionary with keys: HIP_CIRC_M, HIP_WIDTH_M, HIP_DEPTH_M
     """
@@ -1689,9 +2008,14 @@ def measure_hip_group_with_shared_slice(
             results[key] = MeasurementResult(standard_key=key, value_m=float('nan'), metadata=metadata)
         return results
     
-    y_coords = verts[:, 1]
-    y_min = float(np.min(y_coords))
-    y_max = float(np.max(y_coords))
+    slice_index = _resolve_slice_index(verts, slice_index, warnings_circ)
+    if slice_index is not None:
+        y_min = slice_index.y_min
+        y_max = slice_index.y_max
+    else:
+        y_coords = verts[:, 1]
+        y_min = float(np.min(y_coords))
+        y_max = float(np.max(y_coords))
     y_range = y_max - y_min
     
     if y_range < 1e-6:
@@ -1736,7 +2060,9 @@ def measure_hip_group_with_shared_slice(
     
     for i in range(num_slices):
         y_value = y_start + i * slice_step
-        perimeter, debug_info = _compute_circumference_at_height(verts, y_value, tolerance, warnings_circ, y_min, y_max, case_id=case_id)
+        perimeter, debug_info = _compute_circumference_at_height(
+            verts, y_value, tolerance, warnings_circ, y_min, y_max, case_id=case_id, slice_index=slice_index
+        )
         if debug_info:
             cross_section_debug_list.append(debug_info)
         if perimeter is not None:
@@ -1756,7 +2082,8 @@ def measure_hip_group_with_shared_slice(
         vertices_2d, cross_section_debug = _find_cross_section(
             verts, selected["y_value"], tolerance, warnings_circ, y_min, y_max,
             target_mode="ratio",
-            allow_nearest_fallback=False
+            allow_nearest_fallback=False,
+            slice_index=slice_index
         )
         
         if vertices_2d is not None:
@@ -1926,6 +2253,7 @@ def measure_circumference_v0_with_metadata(
     standard_key: CircumferenceKey,
     units_metadata: Optional[Dict[str, Any]] = None,
     case_id: Optional[str] = None,  # Round50: For deterministic alpha_k assignment
+    slice_index: Optional[SliceIndex] = None,
 ) -> MeasurementResult:
     """
     Measure circumference with metadata (schema v0).
@@ -1934,6 +2262,7 @@ def measure_circumference_v0_with_metadata(
         verts: Body surface vertices (N, 3) in meters
         standard_key: Circumference key
         units_metadata: Optional units metadata (assumed meters)
+        slice_index: Optional per-mesh SliceIndex built from the same verts
     
     Returns:
         MeasurementResult with value_m and metadata
@@ -1970,9 +2299,14 @@ def measure_circumference_v0_with_metadata(
         breath_state = "neutral_mid"
     
     # Find measurement height region
-    y_coords = verts[:, 1]
-    y_min = float(np.min(y_coords))
-    y_max = float(np.max(y_coords))
+    slice_index = _resolve_slice_index(verts, slice_index, warnings)
+    if slice_index is not None:
+        y_min = slice_index.y_min
+        y_max = slice_index.y_max
+    else:
+        y_coords = verts[:, 1]
+        y_min = float(np.min(y_coords))
+        y_max = float(np.max(y_coords))
     y_range = y_max - y_min
     
     if y_range < 1e-6:
@@ -2086,7 +2420,7 @@ def measure_circumference_v0_with_metadata(
     for i in range(num_slices):
         y_value = y_start + i * slice_step
         # Round36: Enable debug for selected candidate
-        perimeter, debug_info = _compute_circumference_at_height(verts, y_value, tolerance, warnings, y_min, y_max, return_debug=(i == num_slices // 2), case_id=case_id)  # Debug middle slice
+        perimeter, debug_info = _compute_circumference_at_height(verts, y_value, tolerance, warnings, y_min, y_max, return_debug=(i == num_slices // 2), case_id=case_id, slice_index=slice_index)  # Debug middle slice
         if debug_info:
             cross_section_debug_list.append(debug_info)
         if perimeter is not None:
@@ -2173,7 +2507,8 @@ def measure_circumference_v0_with_metadata(
         verts, selected_y_value, tolerance, warnings, y_min, y_max, 
         return_debug=True, 
         return_torso_components=is_torso_key,
-        case_id=case_id  # Round50: Pass case_id for deterministic alpha_k
+        case_id=case_id,  # Round50: Pass case_id for deterministic alpha_k
+        slice_index=slice_index
     )
     
     # Round37: Store old perimeter as raw (before path fix)
@@ -2312,6 +2647,7 @@ def measure_width_depth_v0_with_metadata(
     units_metadata: Optional[Dict[str, Any]] = None,
     proxy_used: bool = False,
     proxy_tool: Optional[str] = None,
+    slice_index: Optional[SliceIndex] = None,
 ) -> MeasurementResult:
     """
     Measure width or depth with metadata (schema v0).
@@ -2322,6 +2658,7 @@ def measure_width_depth_v0_with_metadata(
         units_metadata: Optional units metadata
         proxy_used: Whether plane_clamp proxy was used
         proxy_tool: Proxy tool name if proxy_used (e.g., "acrylic_board", "caliper")
+        slice_index: Optional per-mesh SliceIndex built from the same verts
     
     Returns:
         MeasurementResult with value_m and metadata
@@ -2360,9 +2697,14 @@ def measure_width_depth_v0_with_metadata(
         arms_down = True  # Evidence requires arms down
     
     # Find cross-section at appropriate height
-    y_coords = verts[:, 1]
-    y_min = float(np.min(y_coords))
-    y_max = float(np.max(y_coords))
+    slice_index = _resolve_slice_index(verts, slice_index, warnings)
+    if slice_index is not None:
+        y_min = slice_index.y_min
+        y_max = slice_index.y_max
+    else:
+        y_coords = verts[:, 1]
+        y_min = float(np.min(y_coords))
+        y_max = float(np.max(y_coords))
     y_range = y_max - y_min
     
     if y_range < 1e-6:
@@ -2447,7 +2789,8 @@ def measure_width_depth_v0_with_metadata(
     vertices_2d, cross_section_debug = _find_cross_section(
         verts, y_target, tolerance, warnings, y_min, y_max,
         target_mode="ratio",
-        allow_nearest_fallback=False  # Don't use old fallback logic
+        allow_nearest_fallback=False,  # Don't use old fallback logic
+        slice_index=slice_index
     )
     
     # Track initial state for debug
@@ -2468,7 +2811,8 @@ def measure_width_depth_v0_with_metadata(
             # Try nearest valid plane fallback (<=10mm shift)
             # Use finer step (1mm) for better coverage
             fallback_vertices, fallback_shift_mm, fallback_debug = _find_nearest_valid_plane(
-                verts, y_target, tolerance, max_shift_mm=10.0, y_min=y_min, y_max=y_max, step_mm=1.0
+                verts, y_target, tolerance, max_shift_mm=10.0, y_min=y_min, y_max=y_max, step_mm=1.0,
+                slice_index=slice_index
             )
             if fallback_vertices is not None and fallback_shift_mm is not None:
                 if fallback_shift_mm <= 10.0:  # Policy limit
@@ -2497,7 +2841,8 @@ def measure_width_depth_v0_with_metadata(
                     vertices_2d, cross_section_debug = _find_cross_section(
                         verts, y_target, larger_tolerance, warnings, y_min, y_max,
                         target_mode="ratio",
-                        allow_nearest_fallback=False
+                        allow_nearest_fallback=False,
+                        slice_index=slice_index
                     )
                     if cross_section_debug:
                         cross_section_debug["slice_half_thickness_m"] = float(larger_tolerance)
@@ -3014,3 +3359,128 @@ def create_weight_metadata(
         value_kg=value_kg,
         metadata=metadata
     )
+
+
+# -----------------------------
+# Batched Measurements (stacked cases, shared topology)
+# -----------------------------
+BATCH_CIRCUMFERENCE_KEYS: List[str] = [
+    "NECK_CIRC_M", "BUST_CIRC_M", "UNDERBUST_CIRC_M",
+    "WAIST_CIRC_M", "HIP_CIRC_M", "THIGH_CIRC_M", "MIN_CALF_CIRC_M"
+]
+
+BATCH_WIDTH_DEPTH_KEYS: List[str] = [
+    "CHEST_WIDTH_M", "CHEST_DEPTH_M",
+    "WAIST_WIDTH_M", "WAIST_DEPTH_M",
+    "HIP_WIDTH_M", "HIP_DEPTH_M"
+]
+
+BATCH_HEIGHT_KEYS: List[str] = ["HEIGHT_M", "CROTCH_HEIGHT_M", "KNEE_HEIGHT_M"]
+
+
+def _exec_fail_result(standard_key: str, exc: Exception) -> MeasurementResult:
+    """NaN result for a key whose measurement raised (same shape as runner EXEC_FAIL)."""
+    return MeasurementResult(
+        standard_key=standard_key,
+        value_m=float('nan'),
+        metadata={
+            "standard_key": standard_key,
+            "value_m": float('nan'),
+            "unit": "m",
+            "precision": 0.001,
+            "warnings": [f"EXEC_FAIL: {str(exc)}"],
+            "version": {"semantic_tag": "semantic-v0", "schema_version": "metadata-schema-v0"}
+        }
+    )
+
+
+def _measure_all_keys_indexed(
+    verts: np.ndarray,
+    slice_index: Optional[SliceIndex],
+    case_id: Optional[str] = None,
+) -> Dict[str, MeasurementResult]:
+    """All mesh keys for one case, using a prebuilt slice index."""
+    results: Dict[str, MeasurementResult] = {}
+
+    # WAIST/HIP groups: shared slice (CIRC, WIDTH, DEPTH)
+    for group_fn, group_keys in (
+        (measure_waist_group_with_shared_slice, ["WAIST_CIRC_M", "WAIST_WIDTH_M", "WAIST_DEPTH_M"]),
+        (measure_hip_group_with_shared_slice, ["HIP_CIRC_M", "HIP_WIDTH_M", "HIP_DEPTH_M"]),
+    ):
+        try:
+            results.update(group_fn(verts, case_id=case_id, slice_index=slice_index))
+        except Exception as e:
+            for key in group_keys:
+                results[key] = _exec_fail_result(key, e)
+
+    for key in BATCH_CIRCUMFERENCE_KEYS:
+        if key in results:
+            continue  # Already measured by group
+        try:
+            results[key] = measure_circumference_v0_with_metadata(
+                verts, key, case_id=case_id, slice_index=slice_index
+            )
+        except Exception as e:
+            results[key] = _exec_fail_result(key, e)
+
+    for key in BATCH_WIDTH_DEPTH_KEYS:
+        if key in results:
+            continue  # Already measured by group
+        try:
+            results[key] = measure_width_depth_v0_with_metadata(
+                verts, key, proxy_used=False, slice_index=slice_index
+            )
+        except Exception as e:
+            results[key] = _exec_fail_result(key, e)
+
+    for key in BATCH_HEIGHT_KEYS:
+        try:
+            results[key] = measure_height_v0_with_metadata(verts, key)
+        except Exception as e:
+            results[key] = _exec_fail_result(key, e)
+
+    # ARM_LEN_M (no joints in batch input)
+    try:
+        results["ARM_LEN_M"] = measure_arm_length_v0_with_metadata(verts, joints_xyz=None, joint_ids=None)
+    except Exception as e:
+        results["ARM_LEN_M"] = _exec_fail_result("ARM_LEN_M", e)
+
+    return results
+
+
+def measure_all_keys_batch(
+    verts_batch: np.ndarray,
+    case_ids: Optional[List[Optional[str]]] = None,
+) -> List[Dict[str, MeasurementResult]]:
+    """
+    Measure all mesh keys for a stack of cases sharing vertex count.
+
+    Height sort, bbox and center for every case are computed once over the batch
+    (SliceIndex.from_batch); each case then runs the same per-key functions as the
+    facts runners' measure_all_keys, so values and metadata are unchanged.
+
+    Args:
+        verts_batch: Stacked body vertices (B, N, 3) in meters
+        case_ids: Optional per-case ids (Round50 alpha_k assignment); None = not passed
+
+    Returns:
+        List of B dicts {standard_key: MeasurementResult}, in batch order
+    """
+    verts_batch = _as_np_f32(verts_batch)
+    if verts_batch.ndim != 3 or verts_batch.shape[2] != 3:
+        raise ValueError(f"verts_batch must be (B, N, 3), got {verts_batch.shape}")
+    n_cases = verts_batch.shape[0]
+    if case_ids is None:
+        case_ids = [None] * n_cases
+    elif len(case_ids) != n_cases:
+        raise ValueError(f"case_ids length {len(case_ids)} != batch size {n_cases}")
+
+    try:
+        slice_indices: List[Optional[SliceIndex]] = SliceIndex.from_batch(verts_batch)
+    except Exception:
+        slice_indices = [None] * n_cases
+
+    return [
+        _measure_all_keys_indexed(verts_batch[b], slice_indices[b], case_id=case_ids[b])
+        for b in range(n_cases)
+    ]
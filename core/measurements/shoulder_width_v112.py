@@ -111,58 +111,159 @@ def _robust_cap_landmark(
     return points[idx].mean(axis=0)
 
 
+def _check_joint_ids(joint_ids: Dict[str, int]) -> None:
+    required = ["L_shoulder","R_shoulder","L_elbow","R_elbow","L_wrist","R_wrist"]
+    missing = [k for k in required if k not in joint_ids]
+    if missing:
+        raise KeyError(f"joint_ids missing required keys: {missing}")
+
+
+def _distal_joint_ids(joint_ids: Dict[str, int]) -> Tuple[int, int, int, int]:
+    return (joint_ids["L_elbow"], joint_ids["L_wrist"], joint_ids["R_elbow"], joint_ids["R_wrist"])
+
+
 # -----------------------------
-# Main API
+# Topology precompute (Step1)
 # -----------------------------
-def measure_shoulder_width_v112(
-    verts: np.ndarray,
+@dataclass(frozen=True)
+class ShoulderWidthV112Topology:
+    """
+    Step1 (distal arm removal) for one mesh topology.
+
+    Depends only on lbs_weights, the elbow/wrist joint ids and
+    cfg.distal_w_threshold (not on betas or pose), so it is computed once
+    per model and reused for every measurement on that topology.
+    """
+    n_verts: int
+    n_joints: int
+    distal_joint_ids: Tuple[int, int, int, int]  # L_elbow, L_wrist, R_elbow, R_wrist
+    distal_w_threshold: float
+    mask_keep_step1: np.ndarray  # (N,) bool, read-only
+    candidate_idx: np.ndarray    # (M,) int64 step1 survivors, read-only
+
+    @property
+    def n_candidates(self) -> int:
+        return int(self.candidate_idx.shape[0])
+
+
+def precompute_shoulder_width_v112_topology(
     lbs_weights: np.ndarray,
-    joints_xyz: np.ndarray,
     joint_ids: Dict[str, int],
     cfg: Optional[ShoulderWidthV112Config] = None,
-    return_debug: bool = False,
-) -> Tuple[float, Dict[str, Any]] | float:
+) -> ShoulderWidthV112Topology:
+    """
+    Step1 distal-arm mask and candidate vertex subset for measure_shoulder_width_v112(topology=...).
 
+    Args:
+        lbs_weights: (N, J) LBS weights of the model
+        joint_ids: same keys as measure_shoulder_width_v112
+        cfg: only distal_w_threshold is used (default config if None)
+    """
     if cfg is None:
         cfg = ShoulderWidthV112Config()
 
-    verts = _as_np_f32(verts)
     lbs_weights = _as_np_f32(lbs_weights)
-    joints_xyz = _as_np_f32(joints_xyz)
-
-    # Basic validation
-    if verts.ndim != 2 or verts.shape[1] != 3:
-        raise ValueError(f"verts must be (N,3), got {verts.shape}")
     if lbs_weights.ndim != 2:
         raise ValueError(f"lbs_weights must be (N,J), got {lbs_weights.shape}")
-    if joints_xyz.ndim != 2 or joints_xyz.shape[1] != 3:
-        raise ValueError(f"joints_xyz must be (J,3), got {joints_xyz.shape}")
-    if lbs_weights.shape[0] != verts.shape[0]:
-        raise ValueError("lbs_weights and verts must have same N.")
-    if lbs_weights.shape[1] != joints_xyz.shape[0]:
-        raise ValueError("lbs_weights J must match joints_xyz J.")
-
-    required = ["L_shoulder","R_shoulder","L_elbow","R_elbow","L_wrist","R_wrist"]
-    missing = [k for k in required if k not in joint_ids]
-    if missing:
-        raise KeyError(f"joint_ids missing required keys: {missing}")
-
-    # -------------------------
-    # Step1) distal arm removal (LBS)
-    # -------------------------
-    L_elb, L_wri = joint_ids["L_elbow"], joint_ids["L_wrist"]
-    R_elb, R_wri = joint_ids["R_elbow"], joint_ids["R_wrist"]
+    _check_joint_ids(joint_ids)
 
+    L_elb, L_wri, R_elb, R_wri = _distal_joint_ids(joint_ids)
     distal_w = (lbs_weights[:, L_elb] + lbs_weights[:, L_wri] +
                 lbs_weights[:, R_elb] + lbs_weights[:, R_wri])
 
     mask_keep_1 = distal_w < cfg.distal_w_threshold
+    candidate_idx = np.flatnonzero(mask_keep_1).astype(np.int64)
+    mask_keep_1.setflags(write=False)
+    candidate_idx.setflags(write=False)
+
+    return ShoulderWidthV112Topology(
+        n_verts=int(lbs_weights.shape[0]),
+        n_joints=int(lbs_weights.shape[1]),
+        distal_joint_ids=(L_elb, L_wri, R_elb, R_wri),
+        distal_w_threshold=float(cfg.distal_w_threshold),
+        mask_keep_step1=mask_keep_1,
+        candidate_idx=candidate_idx,
+    )
+
+
+# -----------------------------
+# Main API
+# -----------------------------
+def measure_shoulder_width_v112(
+    verts: np.ndarray,
+    lbs_weights: Optional[np.ndarray],
+    joints_xyz: np.ndarray,
+    joint_ids: Dict[str, int],
+    cfg: Optional[ShoulderWidthV112Config] = None,
+    return_debug: bool = False,
+    topology: Optional[ShoulderWidthV112Topology] = None,
+) -> Tuple[float, Dict[str, Any]] | float:
+    """
+    Shoulder width v1.1.2.
+
+    With topology (precompute_shoulder_width_v112_topology), Step1 is not
+    recomputed, lbs_weights may be None, and verts may be either the full
+    mesh (N,3) or only the step1 candidates verts[topology.candidate_idx] (M,3);
+    Steps 2-3 only touch the M candidate vertices. Results are identical.
+    """
+
+    if cfg is None:
+        cfg = ShoulderWidthV112Config()
+
+    verts = _as_np_f32(verts)
+    joints_xyz = _as_np_f32(joints_xyz)
+
+    if topology is None:
+        lbs_weights = _as_np_f32(lbs_weights)
+
+        # Basic validation
+        if verts.ndim != 2 or verts.shape[1] != 3:
+            raise ValueError(f"verts must be (N,3), got {verts.shape}")
+        if lbs_weights.ndim != 2:
+            raise ValueError(f"lbs_weights must be (N,J), got {lbs_weights.shape}")
+        if joints_xyz.ndim != 2 or joints_xyz.shape[1] != 3:
+            raise ValueError(f"joints_xyz must be (J,3), got {joints_xyz.shape}")
+        if lbs_weights.shape[0] != verts.shape[0]:
+            raise ValueError("lbs_weights and verts must have same N.")
+        if lbs_weights.shape[1] != joints_xyz.shape[0]:
+            raise ValueError("lbs_weights J must match joints_xyz J.")
+
+        # -------------------------
+        # Step1) distal arm removal (LBS)
+        # -------------------------
+        topology = precompute_shoulder_width_v112_topology(lbs_weights, joint_ids, cfg)
+    else:
+        if verts.ndim != 2 or verts.shape[1] != 3:
+            raise ValueError(f"verts must be (N,3), got {verts.shape}")
+        if joints_xyz.ndim != 2 or joints_xyz.shape[1] != 3:
+            raise ValueError(f"joints_xyz must be (J,3), got {joints_xyz.shape}")
+        if verts.shape[0] not in (topology.n_verts, topology.n_candidates):
+            raise ValueError(
+                f"verts N={verts.shape[0]} matches neither topology N={topology.n_verts} "
+                f"nor its {topology.n_candidates} candidates."
+            )
+        if topology.n_joints != joints_xyz.shape[0]:
+            raise ValueError("topology J must match joints_xyz J.")
+        _check_joint_ids(joint_ids)
+        if topology.distal_joint_ids != _distal_joint_ids(joint_ids):
+            raise ValueError("topology was built for different elbow/wrist joint_ids.")
+        if topology.distal_w_threshold != float(cfg.distal_w_threshold):
+            raise ValueError(
+                f"topology distal_w_threshold={topology.distal_w_threshold} "
+                f"!= cfg.distal_w_threshold={cfg.distal_w_threshold}"
+            )
+
+    mask_keep_1 = topology.mask_keep_step1
+    cand_idx = topology.candidate_idx
+    if verts.shape[0] == topology.n_verts and topology.n_candidates != topology.n_verts:
+        verts = verts[cand_idx]
 
     # -------------------------
     # Step2) arm-axis geometric filter (per side)
-    # IMPORTANT: apply only to mask_keep_1 survivors to preserve "2-stage defense" semantics.
+    # IMPORTANT: apply only to mask_keep_1 survivors to preserve "2-stage defense" semantics
+    # (verts is the survivor subset from here on).
     # -------------------------
-    mask_keep_2 = mask_keep_1.copy()
+    keep_c = np.ones(verts.shape[0], dtype=bool)
 
     for side in ("L", "R"):
         sh = joints_xyz[joint_ids[f"{side}_shoulder"]]
@@ -185,8 +286,7 @@ def measure_shoulder_width_v112(
         r = _cone_radius(s, L, r0, r1)
 
         is_arm_bulge = (s >= s_min) & (s <= s_max) & (d <= r)
-        is_arm_bulge = is_arm_bulge & mask_keep_1  # keep stage semantics
-        mask_keep_2 = mask_keep_2 & (~is_arm_bulge)
+        keep_c = keep_c & (~is_arm_bulge)
 
     # -------------------------
     # Step3) robust landmarks
@@ -199,14 +299,17 @@ def measure_shoulder_width_v112(
     lat_L = _unit_or_raise(L_sh - mid, cfg.eps)
     lat_R = _unit_or_raise(R_sh - mid, cfg.eps)
 
-    pts = verts[mask_keep_2]
+    pts = verts[keep_c]
+    if return_debug:
+        mask_keep_2 = np.zeros(topology.n_verts, dtype=bool)
+        mask_keep_2[cand_idx[keep_c]] = True
     if pts.shape[0] == 0:
         # Emergency fallback: no geometry left -> return joint-based shoulder distance
         width = float(np.linalg.norm(L_sh - R_sh))
         if not return_debug:
             return width
         return width, {
-            "mask_keep_step1": mask_keep_1,
+            "mask_keep_step1": mask_keep_1.copy(),
             "mask_keep_step2": mask_keep_2,
             "landmark_L": L_sh,
             "landmark_R": R_sh,
@@ -228,7 +331,7 @@ def measure_shoulder_width_v112(
         return width
 
     return width, {
-        "mask_keep_step1": mask_keep_1,
+        "mask_keep_step1": mask_keep_1.copy(),
         "mask_keep_step2": mask_keep_2,
         "landmark_L": lm_L,
         "landmark_R": lm_R,
@@ -236,3 +339,280 @@ def measure_shoulder_width_v112(
         "R_shoulder": R_sh,
         "fallback": np.array([0], dtype=np.int32),
     }
+
+
+# -----------------------------
+# Batch API (T frames)
+# -----------------------------
+def _frame_norms(v: np.ndarray) -> np.ndarray:
+    # Per-frame np.linalg.norm of (T,3) rows, same reduction as the 1-D reference call
+    return np.array([np.linalg.norm(row) for row in v], dtype=v.dtype).reshape(v.shape[0])
+
+
+@dataclass(frozen=True)
+class ShoulderWidthV112Frames:
+    """
+    Config-independent per-frame arrays of the v1.1.2 pipeline (see precompute_shoulder_width_v112_frames).
+    Side arrays are (L, R) tuples.
+    """
+    verts: np.ndarray          # (T,N,3)
+    distal_w: np.ndarray       # (N,) shared topology or (T,N)
+    shoulder: Tuple[np.ndarray, np.ndarray]      # (T,3) shoulder joints
+    axis_len: Tuple[np.ndarray, np.ndarray]      # (T,) |elbow - shoulder|
+    axis_s: Tuple[np.ndarray, np.ndarray]        # (T,N) projection on shoulder->elbow axis
+    axis_d: Tuple[np.ndarray, np.ndarray]        # (T,N) distance to that axis
+    lateral_len: Tuple[np.ndarray, np.ndarray]   # (T,) |shoulder - shoulder mid|
+    cap_score: Tuple[np.ndarray, np.ndarray]     # (T,N) lateral score w.r.t. each shoulder
+    nearest_L: np.ndarray      # (T,N) Voronoi split: closer to (or tied with) L shoulder
+
+    @property
+    def n_frames(self) -> int:
+        return int(self.verts.shape[0])
+
+
+def precompute_shoulder_width_v112_frames(
+    verts: np.ndarray,
+    lbs_weights: np.ndarray,
+    joints_xyz: np.ndarray,
+    joint_ids: Dict[str, int],
+) -> ShoulderWidthV112Frames:
+    """
+    Everything in measure_shoulder_width_v112 that does not depend on the config:
+    distal LBS weights, joint-axis projections, lateral scores and the Voronoi split.
+
+    Args:
+        verts: (T,N,3)
+        lbs_weights: (N,J) shared topology, or (T,N,J)
+        joints_xyz: (T,J,3)
+    """
+    verts = _as_np_f32(verts)
+    lbs_weights = _as_np_f32(lbs_weights)
+    joints_xyz = _as_np_f32(joints_xyz)
+
+    # Basic validation
+    if verts.ndim != 3 or verts.shape[2] != 3:
+        raise ValueError(f"verts must be (T,N,3), got {verts.shape}")
+    T, N = verts.shape[:2]
+    if lbs_weights.ndim not in (2, 3):
+        raise ValueError(f"lbs_weights must be (N,J) or (T,N,J), got {lbs_weights.shape}")
+    if lbs_weights.ndim == 3 and lbs_weights.shape[0] != T:
+        raise ValueError("lbs_weights T must match verts T.")
+    if joints_xyz.ndim != 3 or joints_xyz.shape[2] != 3:
+        raise ValueError(f"joints_xyz must be (T,J,3), got {joints_xyz.shape}")
+    if joints_xyz.shape[0] != T:
+        raise ValueError("joints_xyz T must match verts T.")
+    if lbs_weights.shape[-2] != N:
+        raise ValueError("lbs_weights and verts must have same N.")
+    if lbs_weights.shape[-1] != joints_xyz.shape[1]:
+        raise ValueError("lbs_weights J must match joints_xyz J.")
+
+    _check_joint_ids(joint_ids)
+
+    # Step1 input: distal arm weights (LBS)
+    L_elb, L_wri, R_elb, R_wri = _distal_joint_ids(joint_ids)
+
+    distal_w = (lbs_weights[..., L_elb] + lbs_weights[..., L_wri] +
+                lbs_weights[..., R_elb] + lbs_weights[..., R_wri])
+
+    # Step2 input: projections on each shoulder->elbow axis
+    axis_len, axis_s, axis_d = [], [], []
+    for side in ("L", "R"):
+        sh = joints_xyz[:, joint_ids[f"{side}_shoulder"]]
+        el = joints_xyz[:, joint_ids[f"{side}_elbow"]]
+
+        axis = el - sh
+        L = _frame_norms(axis)
+        u = axis / np.where(L > 0, L, np.float32(1.0))[:, None]  # degenerate frames fail in measure
+
+        p = verts - sh[:, None, :]
+        s = np.matmul(p, u[:, :, None])[..., 0]  # (T,N)
+        d = np.linalg.norm(p - s[..., None] * u[:, None, :], axis=2)
+
+        axis_len.append(L)
+        axis_s.append(s)
+        axis_d.append(d)
+
+    # Step3 input: lateral scores and Voronoi split
+    L_sh = joints_xyz[:, joint_ids["L_shoulder"]]
+    R_sh = joints_xyz[:, joint_ids["R_shoulder"]]
+    mid = 0.5 * (L_sh + R_sh)
+
+    lateral_len, cap_score = [], []
+    for sh, v in ((L_sh, L_sh - mid), (R_sh, R_sh - mid)):
+        n = _frame_norms(v)
+        lat = v / np.where(n > 0, n, np.float32(1.0))[:, None]
+        lateral_len.append(n)
+        cap_score.append(np.matmul(verts - sh[:, None, :], lat[:, :, None])[..., 0])
+
+    dL = np.linalg.norm(verts - L_sh[:, None, :], axis=2)
+    dR = np.linalg.norm(verts - R_sh[:, None, :], axis=2)
+
+    return ShoulderWidthV112Frames(
+        verts=verts,
+        distal_w=distal_w,
+        shoulder=(L_sh, R_sh),
+        axis_len=tuple(axis_len),
+        axis_s=tuple(axis_s),
+        axis_d=tuple(axis_d),
+        lateral_len=tuple(lateral_len),
+        cap_score=tuple(cap_score),
+        nearest_L=dL <= dR,
+    )
+
+
+def _batch_cap_landmarks(
+    verts: np.ndarray,
+    member: np.ndarray,
+    score: np.ndarray,
+    shoulder: np.ndarray,
+    quantile: float,
+    min_points: int,
+) -> np.ndarray:
+    """
+    _robust_cap_landmark for every frame at once.
+    member: (T,N) candidate points of this side; quantile relaxation is tracked per frame.
+    """
+    T = verts.shape[0]
+    n_member = member.sum(axis=1)
+    masked_score = np.where(member, score, np.nan)
+
+    q = np.full(T, quantile, dtype=np.float64)
+    keep = np.zeros_like(member)
+    pending = n_member > 0
+    for _ in range(6):
+        if not pending.any():
+            break
+        # One nanquantile call per distinct q (frames relax at different rates)
+        for q_val in np.unique(q[pending]):
+            rows = np.flatnonzero(pending & (q == q_val))
+            thr = np.nanquantile(masked_score[rows], float(q_val), axis=1)
+            keep[rows] = member[rows] & (score[rows] >= thr[:, None])
+        done = pending & (keep.sum(axis=1) >= min_points)
+        pending &= ~done
+        q[pending] = np.maximum(0.60, q[pending] - 0.05)
+
+    n_keep = keep.sum(axis=1)
+    sums = np.einsum("tn,tnk->tk", keep.astype(np.float64), verts.astype(np.float64))
+    centroid = (sums / np.maximum(n_keep, 1)[:, None]).astype(np.float32)
+    landmarks = np.where((n_keep >= 5)[:, None], centroid, shoulder)
+
+    # fallback: top-k (rare, per frame)
+    for t in np.flatnonzero((n_member > 0) & (n_keep < 5)):
+        pts = verts[t][member[t]]
+        k = min(10, pts.shape[0])
+        idx = np.argsort(score[t][member[t]])[-k:]
+        landmarks[t] = pts[idx].mean(axis=0)
+
+    return landmarks
+
+
+def measure_shoulder_width_v112_frames(
+    frames: ShoulderWidthV112Frames,
+    cfg: Optional[ShoulderWidthV112Config] = None,
+    return_debug: bool = False,
+) -> Tuple[np.ndarray, Dict[str, Any]] | np.ndarray:
+    """
+    Config-dependent part of measure_shoulder_width_v112_batch on precomputed frames.
+    Sweeps call this once per config on the same ShoulderWidthV112Frames.
+    """
+    if cfg is None:
+        cfg = ShoulderWidthV112Config()
+
+    T = frames.n_frames
+    N = frames.verts.shape[1]
+    errors: list = [None] * T
+
+    # -------------------------
+    # Step1) distal arm removal (LBS)
+    # -------------------------
+    mask_keep_1 = np.broadcast_to(frames.distal_w < cfg.distal_w_threshold, (T, N))
+
+    # -------------------------
+    # Step2) arm-axis geometric filter (per side, step1 survivors only)
+    # Scalars are formed in float64 and compared in float32, as in the per-frame path.
+    # -------------------------
+    mask_keep_2 = mask_keep_1.copy()
+
+    for k, side in enumerate(("L", "R")):
+        L = frames.axis_len[k]
+        s = frames.axis_s[k]
+        d = frames.axis_d[k]
+
+        for t in np.flatnonzero(L < cfg.min_axis_len):
+            if errors[t] is None:
+                errors[t] = f"ValueError: {side} shoulder-elbow axis too short (L={float(L[t])})."
+
+        L64 = L.astype(np.float64)
+        s_min = (cfg.s_min_ratio * L64).astype(np.float32)[:, None]
+        s_max = (cfg.s_max_ratio * L64).astype(np.float32)[:, None]
+        r0 = cfg.r0_ratio * L64
+        r1 = cfg.r1_ratio * L64
+        t_ax = np.clip(s / np.maximum(L, np.float32(1e-9))[:, None], 0.0, 1.0)
+        r = r0.astype(np.float32)[:, None] + (r1 - r0).astype(np.float32)[:, None] * t_ax
+
+        is_arm_bulge = (s >= s_min) & (s <= s_max) & (d <= r)
+        mask_keep_2 &= ~(is_arm_bulge & mask_keep_1)
+
+    # -------------------------
+    # Step3) robust landmarks
+    # -------------------------
+    for n in frames.lateral_len:
+        for t in np.flatnonzero(n < cfg.eps):
+            if errors[t] is None:
+                errors[t] = "ValueError: Zero-length vector encountered while normalizing."
+
+    L_sh, R_sh = frames.shoulder
+    member_L = mask_keep_2 & frames.nearest_L
+    member_R = mask_keep_2 & ~frames.nearest_L
+
+    lm_L = _batch_cap_landmarks(frames.verts, member_L, frames.cap_score[0], L_sh, cfg.cap_quantile, cfg.min_cap_points)
+    lm_R = _batch_cap_landmarks(frames.verts, member_R, frames.cap_score[1], R_sh, cfg.cap_quantile, cfg.min_cap_points)
+
+    # Emergency fallback (no geometry left): landmarks stay at the shoulder joints
+    fallback = (~mask_keep_2.any(axis=1)).astype(np.int32)
+
+    widths = np.linalg.norm(lm_L - lm_R, axis=1).astype(np.float64)
+    failed = np.array([e is not None for e in errors], dtype=bool)
+    widths[failed] = np.nan
+
+    if not return_debug:
+        return widths
+
+    return widths, {
+        "mask_keep_step1": mask_keep_1,
+        "mask_keep_step2": mask_keep_2,
+        "landmark_L": lm_L,
+        "landmark_R": lm_R,
+        "L_shoulder": L_sh,
+        "R_shoulder": R_sh,
+        "fallback": fallback,
+        "errors": errors,
+    }
+
+
+def measure_shoulder_width_v112_batch(
+    verts: np.ndarray,
+    lbs_weights: np.ndarray,
+    joints_xyz: np.ndarray,
+    joint_ids: Dict[str, int],
+    cfg: Optional[ShoulderWidthV112Config] = None,
+    return_debug: bool = False,
+) -> Tuple[np.ndarray, Dict[str, Any]] | np.ndarray:
+    """
+    measure_shoulder_width_v112 over T frames with array operations.
+
+    Args:
+        verts: (T,N,3)
+        lbs_weights: (N,J) shared topology, or (T,N,J)
+        joints_xyz: (T,J,3)
+
+    Returns:
+        widths (T,) float64. Frames on which measure_shoulder_width_v112 would raise
+        (degenerate shoulder-elbow axis / shoulders) are NaN; their messages are in
+        debug["errors"]. Input shape errors still raise.
+        With return_debug: (widths, debug) with per-frame "mask_keep_step1",
+        "mask_keep_step2", "landmark_L", "landmark_R", "L_shoulder", "R_shoulder",
+        "fallback" (T,) int32 and "errors" (list of "Type: message" or None).
+    """
+    frames = precompute_shoulder_width_v112_frames(verts, lbs_weights, joints_xyz, joint_ids)
+    return measure_shoulder_width_v112_frames(frames, cfg=cfg, return_debug=return_debug)
@@ -0,0 +1,203 @@
+# shoulder_width_v112_torch.py
+# Shoulder Width v1.1.2 - torch-native, differentiable port of shoulder_width_v112.py
+# Policy (identical to the NumPy reference, same cfg):
+# 1) distal arm removal by LBS weights (elbow+wrist)
+# 2) arm-axis geometric filter (shoulder->elbow direction)
+# 3) robust landmark from remaining shoulder-cap (quantile threshold, soft centroid)
+# 4) distance between left/right landmarks = shoulder width
+#
+# Masks (steps 1-2, Voronoi split, quantile threshold) are piecewise constant and are
+# evaluated without gradient; the landmark centroids and the width are differentiable
+# w.r.t. verts and joints. With temperature=0 the cap centroid is the hard mean of the
+# reference; with temperature>0 the value is still the hard mean, and gradients come from a
+# centroid where points within CAP_SOFT_BAND temperatures of the quantile threshold get
+# sigmoid weights (all other points keep their hard 0/1 weight).
+
+from __future__ import annotations
+from typing import Dict, Optional
+
+import torch
+
+from core.measurements.shoulder_width_v112 import ShoulderWidthV112Config
+
+# Default soft-quantile temperature (meters of lateral score)
+DEFAULT_CAP_TEMPERATURE = 1e-3
+# Half-width of the soft band around the quantile threshold, in temperatures
+CAP_SOFT_BAND = 4.0
+
+
+def _unit_checked(v: torch.Tensor, eps: float):
+    """(v / |v|, 0-d bool 'too short' flag); the flag is checked by the caller, once."""
+    n = torch.linalg.norm(v)
+    return v / n.clamp_min(eps), n < eps
+
+
+def _cap_landmark(
+    verts: torch.Tensor,
+    mask: torch.Tensor,
+    shoulder: torch.Tensor,
+    lateral_u: torch.Tensor,
+    quantile: float,
+    min_points: int,
+    temperature: float,
+) -> torch.Tensor:
+    """
+    Differentiable centroid of 'most lateral' points among verts[mask] (see _robust_cap_landmark).
+    Same threshold relaxation and fallbacks as the reference, evaluated with masks over all
+    verts so that no step needs the point count on the host.
+    """
+    N = verts.shape[0]
+    if N == 0:
+        return shoulder
+
+    score = (verts - shoulder[None, :]) @ lateral_u
+    dtype = score.dtype
+
+    with torch.no_grad():
+        n = mask.sum()
+        # All six relaxation steps at once; the first q keeping min_points wins, else the last
+        qs = [quantile]
+        for _ in range(5):
+            qs.append(max(0.60, qs[-1] - 0.05))
+        masked = torch.where(mask, score, torch.full_like(score, float("nan")))
+        thrs = torch.nanquantile(masked, torch.tensor(qs, dtype=dtype, device=score.device))
+        thrs = torch.where(n > 0, thrs, torch.zeros_like(thrs))
+        keep_all = mask[None, :] & (score[None, :] >= thrs[:, None])
+        ok = keep_all.sum(dim=1) >= min_points
+        step = torch.where(ok.any(), ok.to(torch.int64).argmax(), torch.tensor(len(qs) - 1, device=ok.device))
+        thr = thrs[step]
+        keep_mask = keep_all[step]
+        n_keep = keep_mask.sum()
+
+        # fallback: top-k of the masked points
+        k = min(10, N)
+        top_idx = torch.topk(torch.where(mask, score, torch.full_like(score, float("-inf"))), k).indices
+        top_w = (torch.arange(k, device=score.device) < torch.clamp(n, max=10)).to(dtype)
+
+    keep_w = keep_mask.to(dtype)
+    cap = (keep_w[:, None] * verts).sum(dim=0) / n_keep.clamp_min(1).to(dtype)
+    if temperature > 0:
+        # Soft weights only in a thin band around thr (hard keep mask elsewhere). Torso points
+        # crowd just below thr, so the soft centroid itself is biased inward: its value is
+        # renormalized to the hard-mask centroid and only its gradient is used.
+        band = CAP_SOFT_BAND * temperature
+        near = mask & ((score - thr).abs() <= band)
+        w = torch.where(near, torch.sigmoid((score - thr) / temperature), keep_w)
+        soft = (w[:, None] * verts).sum(dim=0) / w.sum().clamp_min(1e-12)
+        cap = cap + (soft - soft.detach())
+
+    top = (top_w[:, None] * verts[top_idx]).sum(dim=0) / top_w.sum().clamp_min(1.0)
+    lm = torch.where(n_keep >= 5, cap, top)
+    return torch.where(n > 0, lm, shoulder)
+
+
+def measure_shoulder_width_v112_torch(
+    verts: torch.Tensor,
+    lbs_weights: torch.Tensor,
+    joints_xyz: torch.Tensor,
+    joint_ids: Dict[str, int],
+    cfg: Optional[ShoulderWidthV112Config] = None,
+    temperature: float = DEFAULT_CAP_TEMPERATURE,
+) -> torch.Tensor:
+    """
+    Torch shoulder width v1.1.2.
+
+    Args:
+        verts: (N, 3) vertices (any float dtype/device, may require grad)
+        lbs_weights: (N, J) LBS weights
+        joints_xyz: (J, 3) joints
+        joint_ids: same keys as measure_shoulder_width_v112
+        cfg: ShoulderWidthV112Config (default config if None)
+        temperature: soft-quantile temperature for the cap centroid (0 = hard mean)
+
+    Returns:
+        0-d tensor width on verts' device; raises the same ValueError/KeyError as the reference
+    """
+    if cfg is None:
+        cfg = ShoulderWidthV112Config()
+
+    # Basic validation
+    if verts.ndim != 2 or verts.shape[1] != 3:
+        raise ValueError(f"verts must be (N,3), got {tuple(verts.shape)}")
+    if lbs_weights.ndim != 2:
+        raise ValueError(f"lbs_weights must be (N,J), got {tuple(lbs_weights.shape)}")
+    if joints_xyz.ndim != 2 or joints_xyz.shape[1] != 3:
+        raise ValueError(f"joints_xyz must be (J,3), got {tuple(joints_xyz.shape)}")
+    if lbs_weights.shape[0] != verts.shape[0]:
+        raise ValueError("lbs_weights and verts must have same N.")
+    if lbs_weights.shape[1] != joints_xyz.shape[0]:
+        raise ValueError("lbs_weights J must match joints_xyz J.")
+
+    required = ["L_shoulder", "R_shoulder", "L_elbow", "R_elbow", "L_wrist", "R_wrist"]
+    missing = [k for k in required if k not in joint_ids]
+    if missing:
+        raise KeyError(f"joint_ids missing required keys: {missing}")
+
+    verts = verts.to(torch.float32)
+    joints_xyz = joints_xyz.to(device=verts.device, dtype=torch.float32)
+    lbs_weights = lbs_weights.to(device=verts.device, dtype=torch.float32)
+
+    # Degenerate-input checks are collected as 0-d flags and synced once at the end,
+    # in the reference's raise order
+    checks = []
+
+    with torch.no_grad():
+        # Step1) distal arm removal (LBS)
+        distal_w = (lbs_weights[:, joint_ids["L_elbow"]] + lbs_weights[:, joint_ids["L_wrist"]] +
+                    lbs_weights[:, joint_ids["R_elbow"]] + lbs_weights[:, joint_ids["R_wrist"]])
+        mask_keep_1 = distal_w < cfg.distal_w_threshold
+
+        # Step2) arm-axis geometric filter (per side), only on step1 survivors
+        mask_keep_2 = mask_keep_1.clone()
+        for side in ("L", "R"):
+            sh = joints_xyz[joint_ids[f"{side}_shoulder"]]
+            el = joints_xyz[joint_ids[f"{side}_elbow"]]
+
+            axis = el - sh
+            L = torch.linalg.norm(axis)
+            checks.append((L < cfg.min_axis_len, side, L))
+            u, zero = _unit_checked(axis, cfg.eps)
+            checks.append((zero, None, None))
+
+            p = verts - sh[None, :]
+            s = p @ u
+            d = torch.linalg.norm(p - s[:, None] * u[None, :], dim=1)
+
+            t = torch.clamp(s / L.clamp_min(1e-9), 0.0, 1.0)
+            r0 = cfg.r0_ratio * L
+            r1 = cfg.r1_ratio * L
+            r = r0 + (r1 - r0) * t
+
+            is_arm_bulge = (s >= cfg.s_min_ratio * L) & (s <= cfg.s_max_ratio * L) & (d <= r)
+            mask_keep_2 &= ~(is_arm_bulge & mask_keep_1)
+
+    # Step3) robust landmarks (differentiable w.r.t. verts/joints)
+    L_sh = joints_xyz[joint_ids["L_shoulder"]]
+    R_sh = joints_xyz[joint_ids["R_shoulder"]]
+    mid = 0.5 * (L_sh + R_sh)
+    lat_L, zero_L = _unit_checked(L_sh - mid, cfg.eps)
+    lat_R, zero_R = _unit_checked(R_sh - mid, cfg.eps)
+    checks.append((zero_L, None, None))
+    checks.append((zero_R, None, None))
+
+    with torch.no_grad():
+        dL = torch.linalg.norm(verts - L_sh[None, :], dim=1)
+        dR = torch.linalg.norm(verts - R_sh[None, :], dim=1)
+        mask_L = mask_keep_2 & (dL <= dR)
+        mask_R = mask_keep_2 & (dR < dL)
+
+    lm_L = _cap_landmark(verts, mask_L, L_sh, lat_L, cfg.cap_quantile, cfg.min_cap_points, temperature)
+    lm_R = _cap_landmark(verts, mask_R, R_sh, lat_R, cfg.cap_quantile, cfg.min_cap_points, temperature)
+    width = torch.linalg.norm(lm_L - lm_R)
+    # Emergency fallback: joint-based shoulder distance
+    width = torch.where(mask_keep_2.any(), width, torch.linalg.norm(L_sh - R_sh))
+
+    # Single device->host sync for all validation checks
+    failed = torch.stack([flag for flag, _, _ in checks]).tolist()
+    for bad, (_, side, L) in zip(failed, checks):
+        if bad:
+            if side is not None:
+                raise ValueError(f"{side} shoulder-elbow axis too short (L={float(L)}).")
+            raise ValueError("Zero-length vector encountered while normalizing.")
+
+    return width
@@ -0,0 +1,389 @@
+# body_mesh_cache.py
+# Online body-mesh cache (Body_Module_Plan_v1 B4)
+#
+# Purpose: serve repeat body requests without an SMPL-X forward.
+# Key: (prototype_id, height_quant_2cm, pose_id)
+# Value: (N, 3) float32 vertices + measurement subset (JSON-serializable dict)
+#
+# - Memory tier: LRU bounded by max_bytes (vertices + subset), entries expire after ttl_s
+# - Disk tier (optional): one uncompressed NPZ per entry, vertices memory-mapped on load;
+#   usage is tracked incrementally (one directory scan per version) and LRU-evicted over budget
+# - Version keys (plan 9.2): any change invalidates both tiers
+# - Telemetry: memory/disk hits, misses, evictions, expirations, get_or_create latency
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Version keys whose change invalidates cached meshes (pose_id is part of the entry key)
+VERSION_KEY_FIELDS = (
+    "binning_version",
+    "selection_version",
+    "smplx_model_version",
+    "calibration_version",
+    "measurement_tool_version",
+)
+
+BodyMeshKey = Tuple[str, int, str]
+
+# Latency samples kept for the p50/p95 telemetry
+LATENCY_WINDOW = 4096
+
+
+def height_quant_2cm(height_cm: float) -> int:
+    """Height bucket: integer cm first (plan 10.1), then the 2 cm bucket's lower bound."""
+    h_int = int(np.rint(float(height_cm)))
+    return (h_int // 2) * 2
+
+
+def body_mesh_key(prototype_id: str, height_cm: float, pose_id: str) -> BodyMeshKey:
+    """Cache key for a request."""
+    return (str(prototype_id), height_quant_2cm(height_cm), str(pose_id))
+
+
+def version_hash(version_keys: Dict[str, str]) -> str:
+    """Hash of the VERSION_KEY_FIELDS values (all required)."""
+    missing = [k for k in VERSION_KEY_FIELDS if k not in version_keys]
+    if missing:
+        raise KeyError(f"version_keys missing required keys: {missing}")
+    payload = json.dumps({k: str(version_keys[k]) for k in VERSION_KEY_FIELDS}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_npz_member_mmap(path: str, name: str) -> np.ndarray:
+    """Read-only memmap of one array stored uncompressed in an NPZ (np.load copies NPZ members)."""
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        with np.load(path) as npz:
+            return npz[name]
+    with open(path, "rb") as f:
+        # Local file header: 30 fixed bytes, then file name and extra field
+        f.seek(info.header_offset)
+        local = f.read(30)
+        name_len, extra_len = struct.unpack("<HH", local[26:30])
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        major, _ = np.lib.format.read_magic(f)
+        if major == 1:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape,
+                     order="F" if fortran_order else "C")
+
+
+def _payload_nbytes(value: Any) -> int:
+    """Bytes held by a stored value: array buffers, JSON text for everything else."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(len(str(k)) + _payload_nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_payload_nbytes(v) for v in value)
+    return len(json.dumps(value, default=str))
+
+
+@dataclass(frozen=True)
+class BodyMeshEntry:
+    """Cached body mesh."""
+    verts: np.ndarray          # (N, 3) float32, read-only
+    subset: Dict[str, Any]     # measurement subset
+    created_at: float          # clock() at creation
+    nbytes: int = field(init=False, repr=False)  # memory tier size (verts + subset payload)
+
+    def __post_init__(self):
+        object.__setattr__(self, "nbytes", int(self.verts.nbytes) + _payload_nbytes(self.subset))
+
+
+class BodyMeshCache:
+    """
+    Two-tier TTL + LRU cache of generated body meshes.
+
+    Thread-safe. Returned vertex arrays are read-only and shared, callers must copy
+    before modifying.
+    """
+
+    def __init__(
+        self,
+        version_keys: Dict[str, str],
+        max_bytes: int = 512 * 1024 ** 2,
+        ttl_s: float = 24 * 3600.0,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 4 * 1024 ** 3,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            version_keys: values for every VERSION_KEY_FIELDS entry
+            max_bytes: memory tier bound (entry bytes: vertices plus measurement subset)
+            ttl_s: entry lifetime in seconds (both tiers)
+            disk_dir: disk tier root (None = memory only); entries live in disk_dir/<version hash>/
+            disk_max_bytes: disk tier bound for the current version (LRU, seeded from file mtimes)
+            clock: wall clock in seconds (injectable for tests)
+        """
+        self.max_bytes = int(max_bytes)
+        self.ttl_s = float(ttl_s)
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = int(disk_max_bytes)
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._mem: "OrderedDict[BodyMeshKey, BodyMeshEntry]" = OrderedDict()
+        self._mem_bytes = 0
+        # Disk tier index of the current version dir: file name -> bytes, LRU order (None = not scanned)
+        self._disk_files: "Optional[OrderedDict[str, int]]" = None
+        self._disk_bytes = 0
+        self._latencies_ms: List[float] = []
+        self._counters = {
+            "hits_memory": 0,
+            "hits_disk": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+        self.version_keys: Dict[str, str] = {}
+        self._version = ""
+        self.set_version_keys(version_keys)
+
+    # -------------------------
+    # Version keys
+    # -------------------------
+    def set_version_keys(self, version_keys: Dict[str, str]) -> bool:
+        """Switch version keys; returns True (and drops all entries) if any key changed."""
+        new_version = version_hash(version_keys)
+        with self._lock:
+            if new_version == self._version:
+                return False
+            had_version = bool(self._version)
+            old_dir = self._version_dir()
+            self.version_keys = {k: str(version_keys[k]) for k in VERSION_KEY_FIELDS}
+            self._version = new_version
+            self._mem.clear()
+            self._mem_bytes = 0
+            self._disk_files = None
+            self._disk_bytes = 0
+            if had_version:
+                self._counters["invalidations"] += 1
+                if old_dir is not None and os.path.isdir(old_dir):
+                    for name in os.listdir(old_dir):
+                        try:
+                            os.remove(os.path.join(old_dir, name))
+                        except OSError:
+                            pass
+                    try:
+                        os.rmdir(old_dir)
+                    except OSError:
+                        pass
+            return had_version
+
+    # -------------------------
+    # Lookup / store
+    # -------------------------
+    def get(self, key: BodyMeshKey) -> Optional[BodyMeshEntry]:
+        """Entry for key (memory, then disk), or None on miss/expiry."""
+        with self._lock:
+            now = self.clock()
+            entry = self._mem.get(key)
+            if entry is not None:
+                if now - entry.created_at > self.ttl_s:
+                    self._drop(key)
+                    self._counters["expirations"] += 1
+                else:
+                    self._mem.move_to_end(key)
+                    self._counters["hits_memory"] += 1
+                    return entry
+
+            entry = self._disk_get(key, now)
+            if entry is not None:
+                self._mem_put(key, entry)
+                self._counters["hits_disk"] += 1
+                return entry
+
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, key: BodyMeshKey, verts: np.ndarray, subset: Dict[str, Any]) -> BodyMeshEntry:
+        """Store a generated mesh in both tiers."""
+        verts = np.array(verts, dtype=np.float32, copy=True)
+        if verts.ndim != 2 or verts.shape[1] != 3:
+            raise ValueError(f"verts must be (N,3), got {verts.shape}")
+        verts.setflags(write=False)
+        with self._lock:
+            entry = BodyMeshEntry(verts=verts, subset=dict(subset), created_at=self.clock())
+            self._mem_put(key, entry)
+            self._disk_put(key, entry)
+            return entry
+
+    def get_or_create(
+        self,
+        key: BodyMeshKey,
+        create_fn: Callable[[], Tuple[np.ndarray, Dict[str, Any]]],
+        version_keys: Optional[Dict[str, str]] = None,
+    ) -> BodyMeshEntry:
+        """
+        Cached entry, or create_fn() -> (verts, subset) stored on miss; latency is recorded.
+
+        version_keys: the request's current version keys; a change invalidates the cache first.
+        """
+        t0 = time.perf_counter()
+        if version_keys is not None:
+            self.set_version_keys(version_keys)
+        entry = self.get(key)
+        if entry is None:
+            verts, subset = create_fn()
+            entry = self.put(key, verts, subset)
+        with self._lock:
+            self._latencies_ms.append((time.perf_counter() - t0) * 1000.0)
+            if len(self._latencies_ms) > LATENCY_WINDOW:
+                del self._latencies_ms[: len(self._latencies_ms) - LATENCY_WINDOW]
+        return entry
+
+    def clear(self) -> None:
+        """Drop the memory tier (disk entries are kept)."""
+        with self._lock:
+            self._mem.clear()
+            self._mem_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._mem)
+
+    # -------------------------
+    # Telemetry
+    # -------------------------
+    def telemetry(self) -> Dict[str, Any]:
+        """Counters, hit rate, memory usage and get_or_create latency percentiles (ms)."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            lookups = stats["hits_memory"] + stats["hits_disk"] + stats["misses"]
+            stats["hit_rate"] = (stats["hits_memory"] + stats["hits_disk"]) / lookups if lookups else None
+            stats["entries"] = len(self._mem)
+            stats["memory_bytes"] = self._mem_bytes
+            lat = np.asarray(self._latencies_ms, dtype=np.float64)
+            stats["latency_p50_ms"] = float(np.percentile(lat, 50)) if lat.size else None
+            stats["latency_p95_ms"] = float(np.percentile(lat, 95)) if lat.size else None
+            stats["version"] = self._version
+            return stats
+
+    # -------------------------
+    # Memory tier
+    # -------------------------
+    def _mem_put(self, key: BodyMeshKey, entry: BodyMeshEntry) -> None:
+        if key in self._mem:
+            self._drop(key)
+        self._mem[key] = entry
+        self._mem_bytes += entry.nbytes
+        while self._mem_bytes > self.max_bytes and len(self._mem) > 1:
+            oldest = next(iter(self._mem))
+            self._drop(oldest)
+            self._counters["evictions"] += 1
+
+    def _drop(self, key: BodyMeshKey) -> None:
+        entry = self._mem.pop(key)
+        self._mem_bytes -= entry.nbytes
+
+    # -------------------------
+    # Disk tier
+    # -------------------------
+    def _version_dir(self) -> Optional[str]:
+        if self.disk_dir is None or not self._version:
+            return None
+        return os.path.join(self.disk_dir, self._version)
+
+    def _disk_path(self, key: BodyMeshKey) -> Optional[str]:
+        root = self._version_dir()
+        if root is None:
+            return None
+        name = hashlib.sha256(json.dumps(list(key)).encode("utf-8")).hexdigest()[:24]
+        return os.path.join(root, f"{name}.npz")
+
+    def _disk_get(self, key: BodyMeshKey, now: float) -> Optional[BodyMeshEntry]:
+        path = self._disk_path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as npz:
+                meta = json.loads(str(npz["meta"]))
+            if meta["key"] != list(key) or meta["version"] != self._version:
+                return None
+            if now - meta["created_at"] > self.ttl_s:
+                os.remove(path)
+                self._disk_untrack(os.path.basename(path))
+                self._counters["expirations"] += 1
+                return None
+            verts = _load_npz_member_mmap(path, "verts")
+            os.utime(path)  # LRU recency (across processes)
+            files = self._disk_index()
+            if os.path.basename(path) in files:
+                files.move_to_end(os.path.basename(path))
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+        return BodyMeshEntry(verts=verts, subset=meta["subset"], created_at=meta["created_at"])
+
+    def _disk_put(self, key: BodyMeshKey, entry: BodyMeshEntry) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = {
+            "key": list(key),
+            "version": self._version,
+            "version_keys": self.version_keys,
+            "created_at": entry.created_at,
+            "subset": entry.subset,
+        }
+        tmp_path = f"{path}.tmp_{os.getpid()}_{threading.get_ident()}.npz"
+        # Uncompressed, so verts can be memory-mapped on load
+        np.savez(tmp_path, verts=entry.verts, meta=np.array(json.dumps(meta)))
+        os.replace(tmp_path, path)
+        name = os.path.basename(path)
+        files = self._disk_index()
+        self._disk_untrack(name)
+        files[name] = os.path.getsize(path)
+        self._disk_bytes += files[name]
+        if self._disk_bytes > self.disk_max_bytes:
+            self._disk_evict()
+
+    def _disk_index(self) -> "OrderedDict[str, int]":
+        """Tracked files of the version dir; scanned (oldest mtime first) on first use."""
+        if self._disk_files is None:
+            root = self._version_dir()
+            found = []
+            for name in os.listdir(root) if os.path.isdir(root) else []:
+                if ".tmp_" in name:
+                    continue
+                try:
+                    st = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                found.append((st.st_mtime, name, st.st_size))
+            self._disk_files = OrderedDict((name, size) for _, name, size in sorted(found))
+            self._disk_bytes = sum(self._disk_files.values())
+        return self._disk_files
+
+    def _disk_untrack(self, name: str) -> None:
+        size = self._disk_index().pop(name, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    def _disk_evict(self) -> None:
+        root = self._version_dir()
+        files = self._disk_index()
+        while files and self._disk_bytes > self.disk_max_bytes:
+            name, size = files.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(os.path.join(root, name))
+            except OSError:
+                pass  # already removed (e.g. by another process)
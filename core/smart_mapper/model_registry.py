@@ -0,0 +1,258 @@
+# model_registry.py
+# Process-wide SMPL-X model registry
+#
+# Purpose: load each SMPL-X model once per process and share it (plus its LBS weights
+# as NumPy, its canonical height and its shoulder width Step1 topology) across
+# SmartMapper instances and pipelines.
+# Key: (model_path, sex, num_betas, device, dtype)
+#
+# Optional on-disk cache of canonical heights (cache_dir/canonical_heights.json),
+# keyed by the SHA-256 of the model file, so a new process skips the zero-beta forward.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import torch
+import smplx
+
+from core.measurements.shoulder_width_v112 import (
+    ShoulderWidthV112Config,
+    ShoulderWidthV112Topology,
+    precompute_shoulder_width_v112_topology,
+)
+
+CANONICAL_HEIGHTS_FILENAME = "canonical_heights.json"
+
+ModelKey = Tuple[str, str, int, str, str]
+
+
+def compute_canonical_height(model: smplx.SMPLX, device: torch.device) -> float:
+    """Compute canonical height (robust quantile-based) for a model."""
+    model.eval()
+    with torch.no_grad():
+        betas = torch.zeros((1, model.num_betas), dtype=torch.float32, device=device)
+        out = model(betas=betas)
+        verts = out.vertices[0]  # (N, 3)
+
+        y = verts[:, 1]
+        y_low = torch.quantile(y, 0.005)
+        y_high = torch.quantile(y, 0.995)
+        height_m = (y_high - y_low).item()
+
+    return height_m
+
+
+def resolve_model_file(model_path: str, sex: str, ext: str = "pkl") -> str:
+    """Model file smplx.create() loads for (model_path, sex): <root>/smplx/SMPLX_<SEX>.<ext>."""
+    if os.path.isfile(model_path):
+        return model_path
+    root = os.path.join(model_path, "smplx")
+    return os.path.join(root, f"SMPLX_{sex.upper()}.{ext}")
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file (chunked read)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class SMPLXModelRegistry:
+    """
+    Cache of loaded SMPL-X models, NumPy LBS weights, canonical heights and
+    shoulder width v1.1.2 topologies.
+
+    Models are shared, so callers must not modify their parameters
+    (SmartMapper only runs forwards and optimizes its own betas tensor).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Directory for the on-disk canonical height cache (None = memory only)
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._models: Dict[ModelKey, smplx.SMPLX] = {}
+        self._lbs_weights_np: Dict[ModelKey, np.ndarray] = {}
+        self._canonical_heights: Dict[ModelKey, float] = {}
+        self._sw_topologies: Dict[Tuple[ModelKey, Tuple[int, ...], float], ShoulderWidthV112Topology] = {}
+        # Model file path -> ((size, mtime_ns), sha256), so each file is hashed once per change
+        self._file_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+    @staticmethod
+    def _key(
+        model_path: str,
+        sex: str,
+        num_betas: int,
+        device: torch.device,
+        dtype: torch.dtype,
+    ) -> ModelKey:
+        if sex not in ["male", "female"]:
+            raise ValueError(f"sex must be 'male' or 'female', got '{sex}'")
+        return (os.path.abspath(model_path), sex, int(num_betas), str(torch.device(device)), str(dtype))
+
+    def get_model(
+        self,
+        model_path: str,
+        sex: str,
+        num_betas: int,
+        device: torch.device,
+        dtype: torch.dtype = torch.float32,
+    ) -> smplx.SMPLX:
+        """Loaded SMPL-X model in eval mode (created on first request)."""
+        key = self._key(model_path, sex, num_betas, device, dtype)
+        with self._lock:
+            if key not in self._models:
+                model = smplx.create(
+                    model_path,
+                    model_type="smplx",
+                    gender=sex,
+                    use_pca=False,
+                    num_betas=num_betas,
+                    ext="pkl",
+                    dtype=dtype,
+                ).to(device)
+                model.eval()
+                self._models[key] = model
+            return self._models[key]
+
+    def get_lbs_weights_np(
+        self,
+        model_path: str,
+        sex: str,
+        num_betas: int,
+        device: torch.device,
+        dtype: torch.dtype = torch.float32,
+    ) -> np.ndarray:
+        """(N, J) LBS weights of the model as a read-only NumPy array."""
+        key = self._key(model_path, sex, num_betas, device, dtype)
+        with self._lock:
+            if key not in self._lbs_weights_np:
+                model = self.get_model(model_path, sex, num_betas, device, dtype)
+                lbs_weights_np = model.lbs_weights.detach().cpu().numpy()
+                lbs_weights_np.setflags(write=False)
+                self._lbs_weights_np[key] = lbs_weights_np
+            return self._lbs_weights_np[key]
+
+    def get_canonical_height(
+        self,
+        model_path: str,
+        sex: str,
+        num_betas: int,
+        device: torch.device,
+        dtype: torch.dtype = torch.float32,
+    ) -> float:
+        """Canonical height in meters (memory cache -> disk cache -> zero-beta forward)."""
+        key = self._key(model_path, sex, num_betas, device, dtype)
+        with self._lock:
+            if key in self._canonical_heights:
+                return self._canonical_heights[key]
+
+            disk_key = self._disk_key(model_path, sex, num_betas, dtype)
+            height_m = self._read_disk_height(disk_key) if disk_key is not None else None
+            if height_m is None:
+                model = self.get_model(model_path, sex, num_betas, device, dtype)
+                height_m = compute_canonical_height(model, torch.device(device))
+                if disk_key is not None:
+                    self._write_disk_height(disk_key, height_m)
+
+            self._canonical_heights[key] = height_m
+            return height_m
+
+    def get_shoulder_width_v112_topology(
+        self,
+        model_path: str,
+        sex: str,
+        num_betas: int,
+        device: torch.device,
+        joint_ids: Dict[str, int],
+        cfg: Optional[ShoulderWidthV112Config] = None,
+        dtype: torch.dtype = torch.float32,
+    ) -> ShoulderWidthV112Topology:
+        """
+        Shoulder width Step1 mask + candidate vertices of the model (betas-independent).
+
+        Keyed by model and the fields Step1 depends on (elbow/wrist joint ids,
+        cfg.distal_w_threshold).
+        """
+        if cfg is None:
+            cfg = ShoulderWidthV112Config()
+        key = self._key(model_path, sex, num_betas, device, dtype)
+        distal_ids = tuple(joint_ids[k] for k in ("L_elbow", "L_wrist", "R_elbow", "R_wrist") if k in joint_ids)
+        topo_key = (key, distal_ids, float(cfg.distal_w_threshold))
+        with self._lock:
+            if topo_key not in self._sw_topologies:
+                lbs_weights_np = self.get_lbs_weights_np(model_path, sex, num_betas, device, dtype)
+                self._sw_topologies[topo_key] = precompute_shoulder_width_v112_topology(
+                    lbs_weights_np, joint_ids, cfg
+                )
+            return self._sw_topologies[topo_key]
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk cache is kept)."""
+        with self._lock:
+            self._models.clear()
+            self._lbs_weights_np.clear()
+            self._canonical_heights.clear()
+            self._sw_topologies.clear()
+            self._file_hashes.clear()
+
+    def _model_file_hash(self, model_file: str) -> str:
+        st = os.stat(model_file)
+        stat_key = (st.st_size, st.st_mtime_ns)
+        cached = self._file_hashes.get(model_file)
+        if cached is None or cached[0] != stat_key:
+            cached = (stat_key, file_sha256(model_file))
+            self._file_hashes[model_file] = cached
+        return cached[1]
+
+    def _disk_key(self, model_path: str, sex: str, num_betas: int, dtype: torch.dtype) -> Optional[str]:
+        """Disk cache key '<sha256>:<num_betas>:<dtype>' (None if disabled or model file missing)."""
+        if self.cache_dir is None:
+            return None
+        model_file = resolve_model_file(model_path, sex)
+        if not os.path.isfile(model_file):
+            return None
+        return f"{self._model_file_hash(model_file)}:{int(num_betas)}:{dtype}"
+
+    def _cache_file(self) -> str:
+        return os.path.join(self.cache_dir, CANONICAL_HEIGHTS_FILENAME)
+
+    def _load_disk_cache(self) -> Dict[str, Any]:
+        path = self._cache_file()
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Corrupt/partial cache: recompute
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _read_disk_height(self, disk_key: str) -> Optional[float]:
+        value = self._load_disk_cache().get(disk_key)
+        return float(value) if isinstance(value, (int, float)) else None
+
+    def _write_disk_height(self, disk_key: str, height_m: float) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data = self._load_disk_cache()
+        data[disk_key] = float(height_m)
+        path = self._cache_file()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+
+# Global registry instance (memory only; set MODEL_REGISTRY.cache_dir to enable the disk cache)
+MODEL_REGISTRY = SMPLXModelRegistry()
@@ -17,12 +17,22 @@ import numpy as np
 import torch
 import torch.optim as optim
 import smplx
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, Tuple, Any, List
 
 from core.pose_policy import PoseNormalizer
 from core.policy.smart_mapper_policy import SMART_MAPPER_POLICY
-from core.measurements.shoulder_width_v112 import measure_shoulder_width_v112
+from core.measurements.shoulder_width_v112 import (
+    ShoulderWidthV112Config,
+    ShoulderWidthV112Topology,
+    measure_shoulder_width_v112,
+)
+from core.measurements.shoulder_width_v112_torch import measure_shoulder_width_v112_torch
 from core.policy.shoulder_width_v112_policy import get_cfg as get_shoulder_width_cfg
+from core.smart_mapper.model_registry import (
+    MODEL_REGISTRY,
+    SMPLXModelRegistry,
+    compute_canonical_height,  # noqa: F401  (re-exported, historical location)
+)
 
 # SMPL-X joint IDs for shoulder width measurement
 SMPLX_JOINT_IDS = {
@@ -62,22 +72,6 @@ def load_beta_means(data_dir: str) -> Dict[str, np.ndarray]:
     }
 
 
-def compute_canonical_height(model: smplx.SMPLX, device: torch.device) -> float:
-    """Compute canonical height (robust quantile-based) for a model."""
-    model.eval()
-    with torch.no_grad():
-        betas = torch.zeros((1, model.num_betas), dtype=torch.float32, device=device)
-        out = model(betas=betas)
-        verts = out.vertices[0]  # (N, 3)
-        
-        y = verts[:, 1]
-        y_low = torch.quantile(y, 0.005)
-        y_high = torch.quantile(y, 0.995)
-        height_m = (y_high - y_low).item()
-    
-    return height_m
-
-
 def get_init_betas(
     sex: str,
     height_m: float,
@@ -107,12 +101,129 @@ def get_init_betas(
     return beta_init
 
 
+def log_measurement_exception(
+    e: Exception,
+    verts_np: np.ndarray,
+    lbs_weights_np: np.ndarray,
+    joints_np: np.ndarray,
+    joint_ids: Dict[str, int],
+) -> Dict[str, Any]:
+    """Log detailed exception information."""
+    exc_type = type(e).__name__
+    exc_msg = str(e)
+    exc_traceback = traceback.format_exc()
+
+    # Input summary
+    input_summary = {
+        "verts": {
+            "shape": list(verts_np.shape),
+            "dtype": str(verts_np.dtype),
+            "min": float(np.nanmin(verts_np)),
+            "max": float(np.nanmax(verts_np)),
+            "has_nan": bool(np.any(np.isnan(verts_np))),
+        },
+        "lbs_weights": {
+            "shape": list(lbs_weights_np.shape),
+            "dtype": str(lbs_weights_np.dtype),
+            "min": float(np.nanmin(lbs_weights_np)),
+            "max": float(np.nanmax(lbs_weights_np)),
+            "has_nan": bool(np.any(np.isnan(lbs_weights_np))),
+        },
+        "joints_xyz": {
+            "shape": list(joints_np.shape),
+            "dtype": str(joints_np.dtype),
+            "min": float(np.nanmin(joints_np)),
+            "max": float(np.nanmax(joints_np)),
+            "has_nan": bool(np.any(np.isnan(joints_np))),
+        },
+        "joint_ids": {
+            "keys": list(joint_ids.keys()),
+            "required": ["L_shoulder", "R_shoulder", "L_elbow", "R_elbow", "L_wrist", "R_wrist"],
+            "has_all_required": all(k in joint_ids for k in ["L_shoulder", "R_shoulder", "L_elbow", "R_elbow", "L_wrist", "R_wrist"]),
+        },
+    }
+
+    return {
+        "exception_type": exc_type,
+        "exception_message": exc_msg,
+        "stack_trace": exc_traceback,
+        "input_summary": input_summary,
+    }
+
+
+def mask_lbfgs_history(optimizer: optim.LBFGS, keep: torch.Tensor) -> None:
+    """
+    Project LBFGS state onto the kept coordinates of its (single) parameter.
+
+    Zeroes the dropped coordinates of the last direction, the last gradient and
+    every curvature pair, and drops pairs whose projected y.s is no longer positive.
+    With zero gradient on the dropped coordinates, later directions stay zero there,
+    so those parameters no longer move while the remaining curvature is kept.
+
+    Args:
+        optimizer: LBFGS over one parameter tensor
+        keep: bool mask, same numel as the parameter
+    """
+    state = optimizer.state.get(optimizer._params[0])
+    if not state or "old_dirs" not in state:
+        return
+    keep_flat = keep.reshape(-1).to(dtype=state["d"].dtype)
+    state["d"].mul_(keep_flat)
+    if state.get("prev_flat_grad") is not None:
+        state["prev_flat_grad"].mul_(keep_flat)
+
+    old_dirs, old_stps, ro = [], [], []
+    for y, s in zip(state["old_dirs"], state["old_stps"]):
+        y = y * keep_flat
+        s = s * keep_flat
+        ys = y.dot(s)
+        if ys > 1e-10:  # Same curvature condition as LBFGS itself
+            old_dirs.append(y)
+            old_stps.append(s)
+            ro.append(1.0 / ys)
+    state["old_dirs"], state["old_stps"], state["ro"] = old_dirs, old_stps, ro
+    if old_dirs:
+        state["H_diag"] = old_dirs[-1].dot(old_stps[-1]) / old_dirs[-1].dot(old_dirs[-1])
+    else:
+        state["H_diag"] = 1
+
+
+def accepted_step_record(
+    records: List[Dict[str, Any]],
+    betas: torch.Tensor,
+    rows: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Closure record of the step LBFGS accepted.
+
+    The strong-Wolfe line search may evaluate rejected trial points after the one
+    it accepts; LBFGS leaves the parameters at the accepted point (x_init + t * d,
+    bitwise the evaluated trial), so the record whose betas equal the current betas
+    is the accepted evaluation. Falls back to the last record if none matches.
+
+    Args:
+        records: closure records of one optimizer.step(), each with a "betas" snapshot
+        betas: parameter tensor after the step
+        rows: optional subset of rows to compare (batched fits)
+    """
+    current = betas.detach()
+    if rows is not None:
+        current = current[rows]
+    for record in reversed(records):
+        snapshot = record["betas"] if rows is None else record["betas"][rows]
+        if torch.equal(snapshot, current):
+            return record
+    return records[-1]
+
+
 class SmartMapper:
     """
     Smart Mapper v0.1
     
     Maps anthropometric measurements to SMPL-X parameters using
     deterministic initialization + LBFGS optimization.
+    optimize() fits one subject; optimize_batch() fits many subjects per sex
+    in one stacked-betas problem.
     
     Policy compliance:
     - Uses A-Pose normalization via core.pose_policy.PoseNormalizer
@@ -126,6 +237,9 @@ class SmartMapper:
         beta_means: Dict[str, np.ndarray],
         device: Optional[torch.device] = None,
         policy: Any = None,
+        measurement_backend: str = "numpy",
+        trace_level: str = "summary",
+        registry: Optional[SMPLXModelRegistry] = None,
     ):
         """
         Args:
@@ -133,7 +247,27 @@ class SmartMapper:
             beta_means: Dict with 'male' and 'female' beta means
             device: torch device (default: cuda if available, else cpu)
             policy: SmartMapperPolicy instance (default: SMART_MAPPER_POLICY)
+            measurement_backend: shoulder width loss inside the optimizer closure
+                - "numpy": measure_shoulder_width_v112 on host copies (frozen v0.1 behavior,
+                  no gradient through the measurement term)
+                - "torch": measure_shoulder_width_v112_torch on device, gradient flows into betas
+                Final predictions always use the NumPy reference.
+            trace_level: per-iteration trace logging
+                - "summary": loss components of the closure evaluation at the accepted
+                  (post-step) betas, no extra forward (default)
+                - "full": loss components recomputed at the post-step betas
+                  (extra no_grad forward + NumPy measurement per iteration, v0.1 behavior;
+                  equals "summary" for the numpy backend)
+                - "off": no trace entries; final loss components as in "summary"
+            registry: SMPLXModelRegistry for models/LBS weights/canonical heights
+                (default: process-wide MODEL_REGISTRY, shared by all instances)
         """
+        if measurement_backend not in ("numpy", "torch"):
+            raise ValueError(f"measurement_backend must be 'numpy' or 'torch', got '{measurement_backend}'")
+        if trace_level not in ("off", "summary", "full"):
+            raise ValueError(f"trace_level must be 'off', 'summary' or 'full', got '{trace_level}'")
+        self.measurement_backend = measurement_backend
+        self.trace_level = trace_level
         self.device = device if device is not None else torch.device(
             "cuda" if torch.cuda.is_available() else "cpu"
         )
@@ -143,37 +277,28 @@ class SmartMapper:
         # Store model path (will load per-request by sex)
         self.model_path = model_path
         self.num_betas = len(beta_means["male"])
-        self._models = {}  # Cache models by sex
+        self.registry = registry if registry is not None else MODEL_REGISTRY
         
         # Pose normalizer (A-Pose policy)
         self.pose_normalizer = PoseNormalizer(device=self.device)
-        
-        # Cache canonical heights
-        self._canonical_heights = {}
     
     def _get_model(self, sex: str) -> smplx.SMPLX:
-        """Get SMPL-X model for sex (cached)."""
-        if sex not in self._models:
-            gender_map = {"male": "male", "female": "female"}
-            model = smplx.create(
-                self.model_path,
-                model_type="smplx",
-                gender=gender_map[sex],
-                use_pca=False,
-                num_betas=self.num_betas,
-                ext="pkl",
-            ).to(self.device)
-            model.eval()
-            self._models[sex] = model
-        return self._models[sex]
+        """Get SMPL-X model for sex (shared via the registry)."""
+        return self.registry.get_model(self.model_path, sex, self.num_betas, self.device)
+    
+    def _get_lbs_weights_np(self, sex: str) -> np.ndarray:
+        """Get (N, J) LBS weights for sex as NumPy (shared via the registry)."""
+        return self.registry.get_lbs_weights_np(self.model_path, sex, self.num_betas, self.device)
+    
+    def _get_shoulder_width_topology(self, sex: str, cfg: ShoulderWidthV112Config) -> ShoulderWidthV112Topology:
+        """Get shoulder width Step1 topology for sex and cfg (shared via the registry)."""
+        return self.registry.get_shoulder_width_v112_topology(
+            self.model_path, sex, self.num_betas, self.device, SMPLX_JOINT_IDS, cfg
+        )
     
     def _get_canonical_height(self, sex: str) -> float:
-        """Get cached canonical height for sex."""
-        if sex not in self._canonical_heights:
-            model = self._get_model(sex)
-            self._canonical_heights[sex] = compute_canonical_height(model, self.device)
-        
-        return self._canonical_heights[sex]
+        """Get canonical height for sex (shared via the registry)."""
+        return self.registry.get_canonical_height(self.model_path, sex, self.num_betas, self.device)
     
     def optimize(
         self,
@@ -241,54 +366,30 @@ class SmartMapper:
         prev_loss = float("inf")
         prev_beta = beta_init_t.detach().clone()
         
-        def _log_measurement_exception(
+        # Loss components of every closure evaluation of the current step (detached)
+        step_records: List[Dict[str, Any]] = []
+        
+        def _fail_measurement(
             e: Exception,
             verts_np: np.ndarray,
             lbs_weights_np: np.ndarray,
             joints_np: np.ndarray,
-            joint_ids: Dict[str, int],
-        ) -> Dict[str, Any]:
-            """Log detailed exception information."""
-            exc_type = type(e).__name__
-            exc_msg = str(e)
-            exc_traceback = traceback.format_exc()
-            
-            # Input summary
-            input_summary = {
-                "verts": {
-                    "shape": list(verts_np.shape),
-                    "dtype": str(verts_np.dtype),
-                    "min": float(np.nanmin(verts_np)),
-                    "max": float(np.nanmax(verts_np)),
-                    "has_nan": bool(np.any(np.isnan(verts_np))),
-                },
-                "lbs_weights": {
-                    "shape": list(lbs_weights_np.shape),
-                    "dtype": str(lbs_weights_np.dtype),
-                    "min": float(np.nanmin(lbs_weights_np)),
-                    "max": float(np.nanmax(lbs_weights_np)),
-                    "has_nan": bool(np.any(np.isnan(lbs_weights_np))),
-                },
-                "joints_xyz": {
-                    "shape": list(joints_np.shape),
-                    "dtype": str(joints_np.dtype),
-                    "min": float(np.nanmin(joints_np)),
-                    "max": float(np.nanmax(joints_np)),
-                    "has_nan": bool(np.any(np.isnan(joints_np))),
-                },
-                "joint_ids": {
-                    "keys": list(joint_ids.keys()),
-                    "required": ["L_shoulder", "R_shoulder", "L_elbow", "R_elbow", "L_wrist", "R_wrist"],
-                    "has_all_required": all(k in joint_ids for k in ["L_shoulder", "R_shoulder", "L_elbow", "R_elbow", "L_wrist", "R_wrist"]),
-                },
-            }
-            
-            return {
-                "exception_type": exc_type,
-                "exception_message": exc_msg,
-                "stack_trace": exc_traceback,
-                "input_summary": input_summary,
-            }
+        ) -> None:
+            # Log detailed exception information
+            nonlocal measurement_failed, fail_reason, fail_info
+            measurement_failed = True
+            fail_reason = f"{type(e).__name__}: {str(e)}"
+            fail_info = log_measurement_exception(e, verts_np, lbs_weights_np, joints_np, SMPLX_JOINT_IDS)
+            
+            # Save to artifacts if output dir provided
+            if debug_output_dir:
+                os.makedirs(debug_output_dir, exist_ok=True)
+                error_file = os.path.join(debug_output_dir, "measurement_error.json")
+                with open(error_file, "w", encoding="utf-8") as f:
+                    json.dump(fail_info, f, indent=2)
+            
+            # Raise to stop optimization immediately
+            raise RuntimeError(f"Measurement failed: {fail_reason}")
         
         def closure():
             optimizer.zero_grad()
@@ -310,13 +411,36 @@ class SmartMapper:
             # Measurement loss (shoulder width)
             # Call path: core.measurements.shoulder_width_v112.measure_shoulder_width_v112()
             # Uses default config (cfg=None), does NOT duplicate policy parameters
-            if target_shoulder_width_m is not None:
+            if target_shoulder_width_m is not None and self.measurement_backend == "torch":
+                # Differentiable path: no host copy, gradient flows into betas
+                verts_scaled = out.vertices[0] * scale_t
+                num_joints_weights = model.lbs_weights.shape[1]
+                joints_scaled = out.joints[0, :num_joints_weights, :] * scale_t
+                try:
+                    pred_width_t = measure_shoulder_width_v112_torch(
+                        verts=verts_scaled,
+                        lbs_weights=model.lbs_weights,
+                        joints_xyz=joints_scaled,
+                        joint_ids=SMPLX_JOINT_IDS,
+                        cfg=get_shoulder_width_cfg(),  # Use frozen policy config
+                    )
+                    target_width_t = torch.tensor(target_shoulder_width_m, dtype=torch.float32, device=self.device)
+                    loss_meas = self.policy.weight_measurement * (pred_width_t - target_width_t) ** 2
+                except Exception as e:
+                    # Host copies only for the failure report
+                    _fail_measurement(
+                        e,
+                        verts_scaled.detach().cpu().numpy(),
+                        self._get_lbs_weights_np(sex),
+                        joints_scaled.detach().cpu().numpy(),
+                    )
+            elif target_shoulder_width_m is not None:
                 # Apply global scale to vertices
                 verts_scaled = out.vertices[0] * scale_t
                 
                 # Convert to numpy for measurement
                 verts_np = verts_scaled.detach().cpu().numpy()
-                lbs_weights_np = model.lbs_weights.detach().cpu().numpy()
+                lbs_weights_np = self._get_lbs_weights_np(sex)
                 
                 # Get joints from model output and apply scale
                 # SMPL-X outputs joints: (B, J, 3) where J=127 (body + hand + face)
@@ -347,26 +471,13 @@ class SmartMapper:
                         joint_ids=SMPLX_JOINT_IDS,
                         cfg=sw_cfg,  # Use frozen policy config
                         return_debug=False,
+                        topology=self._get_shoulder_width_topology(sex, sw_cfg),
                     )
                     pred_width_t = torch.tensor(pred_width, dtype=torch.float32, device=self.device)
                     target_width_t = torch.tensor(target_shoulder_width_m, dtype=torch.float32, device=self.device)
                     loss_meas = self.policy.weight_measurement * (pred_width_t - target_width_t) ** 2
                 except Exception as e:
-                    # Log detailed exception information
-                    nonlocal measurement_failed, fail_reason, fail_info
-                    measurement_failed = True
-                    fail_reason = f"{type(e).__name__}: {str(e)}"
-                    fail_info = _log_measurement_exception(e, verts_np, lbs_weights_np, joints_np, SMPLX_JOINT_IDS)
-                    
-                    # Save to artifacts if output dir provided
-                    if debug_output_dir:
-                        os.makedirs(debug_output_dir, exist_ok=True)
-                        error_file = os.path.join(debug_output_dir, "measurement_error.json")
-                        with open(error_file, "w", encoding="utf-8") as f:
-                            json.dump(fail_info, f, indent=2)
-                    
-                    # Raise to stop optimization immediately
-                    raise RuntimeError(f"Measurement failed: {fail_reason}")
+                    _fail_measurement(e, verts_np, lbs_weights_np, joints_np)
             
             # Anchor prior: ||beta - beta_init||^2
             beta_init_ref = torch.tensor(beta_init, dtype=torch.float32, device=self.device)
@@ -379,11 +490,19 @@ class SmartMapper:
             loss_total = loss_meas + loss_anchor + loss_beta_mag
             loss_total.backward()
             
+            step_records.append({
+                "betas": beta_init_t.detach().clone(),
+                "loss_meas": loss_meas.detach() if target_shoulder_width_m is not None else None,
+                "loss_anchor": loss_anchor.detach(),
+                "loss_beta_mag": loss_beta_mag.detach(),
+            })
+            
             return loss_total
         
         n_iter = 0
         for iter_idx in range(self.policy.max_iter):
             iter_start = time.perf_counter()
+            step_records.clear()
             
             try:
                 loss_total = optimizer.step(closure)
@@ -405,59 +524,68 @@ class SmartMapper:
             
             iter_time_ms = (time.perf_counter() - iter_start) * 1000.0
             
-            # Get current loss components (approximate)
-            with torch.no_grad():
-                out = self.pose_normalizer.run_forward(
-                    model,
-                    beta_init_t.unsqueeze(0),
-                    {},
-                    enforce_policy_apose=True,
-                )
-                
-                # Approximate loss components
-                beta_init_ref = torch.tensor(beta_init, dtype=torch.float32, device=self.device)
-                loss_anchor_val = self.policy.weight_anchor * torch.sum((beta_init_t - beta_init_ref) ** 2).item()
-                loss_beta_mag_val = self.policy.weight_beta_mag * torch.sum(beta_init_t ** 2).item()
-                
-                loss_meas_val = None
-                if target_shoulder_width_m is not None:
-                    try:
-                        # Apply scale
-                        verts_scaled = out.vertices[0] * scale_t
-                        verts_np = verts_scaled.detach().cpu().numpy()
-                        lbs_weights_np = model.lbs_weights.detach().cpu().numpy()
-                        joints_full = out.joints
-                        num_joints_weights = lbs_weights_np.shape[1]
-                        
-                        # Use first 55 joints, apply scale ONCE
-                        joints_scaled = joints_full[0, :num_joints_weights, :] * scale_t
-                        joints_np = joints_scaled.detach().cpu().numpy()
-                        
-                        # Use frozen policy config
-                        sw_cfg = get_shoulder_width_cfg()
-                        pred_width = measure_shoulder_width_v112(
-                            verts=verts_np,
-                            lbs_weights=lbs_weights_np,
-                            joints_xyz=joints_np,
-                            joint_ids=SMPLX_JOINT_IDS,
-                            cfg=sw_cfg,  # Use frozen policy config
-                            return_debug=False,
-                        )
-                        pred_width_t = torch.tensor(pred_width, dtype=torch.float32, device=self.device)
-                        target_width_t = torch.tensor(target_shoulder_width_m, dtype=torch.float32, device=self.device)
-                        loss_meas_val = self.policy.weight_measurement * (pred_width_t - target_width_t) ** 2
-                        loss_meas_val = loss_meas_val.item()
-                    except Exception:
-                        loss_meas_val = None
-            
-            trace.append({
-                "iter": iter_idx + 1,
-                "loss_total": loss_val,
-                "loss_meas": loss_meas_val if loss_meas_val is not None else 0.0,
-                "loss_anchor": loss_anchor_val,
-                "loss_beta_mag": loss_beta_mag_val,
-                "dt_ms": iter_time_ms,
-            })
+            if self.trace_level == "full":
+                # Recompute loss components at the post-step betas
+                with torch.no_grad():
+                    out = self.pose_normalizer.run_forward(
+                        model,
+                        beta_init_t.unsqueeze(0),
+                        {},
+                        enforce_policy_apose=True,
+                    )
+                    
+                    # Approximate loss components
+                    beta_init_ref = torch.tensor(beta_init, dtype=torch.float32, device=self.device)
+                    loss_anchor_val = self.policy.weight_anchor * torch.sum((beta_init_t - beta_init_ref) ** 2).item()
+                    loss_beta_mag_val = self.policy.weight_beta_mag * torch.sum(beta_init_t ** 2).item()
+                    
+                    loss_meas_val = None
+                    if target_shoulder_width_m is not None:
+                        try:
+                            # Apply scale
+                            verts_scaled = out.vertices[0] * scale_t
+                            verts_np = verts_scaled.detach().cpu().numpy()
+                            lbs_weights_np = self._get_lbs_weights_np(sex)
+                            joints_full = out.joints
+                            num_joints_weights = lbs_weights_np.shape[1]
+                            
+                            # Use first 55 joints, apply scale ONCE
+                            joints_scaled = joints_full[0, :num_joints_weights, :] * scale_t
+                            joints_np = joints_scaled.detach().cpu().numpy()
+                            
+                            # Use frozen policy config
+                            sw_cfg = get_shoulder_width_cfg()
+                            pred_width = measure_shoulder_width_v112(
+                                verts=verts_np,
+                                lbs_weights=lbs_weights_np,
+                                joints_xyz=joints_np,
+                                joint_ids=SMPLX_JOINT_IDS,
+                                cfg=sw_cfg,  # Use frozen policy config
+                                return_debug=False,
+                                topology=self._get_shoulder_width_topology(sex, sw_cfg),
+                            )
+                            pred_width_t = torch.tensor(pred_width, dtype=torch.float32, device=self.device)
+                            target_width_t = torch.tensor(target_shoulder_width_m, dtype=torch.float32, device=self.device)
+                            loss_meas_val = self.policy.weight_measurement * (pred_width_t - target_width_t) ** 2
+                            loss_meas_val = loss_meas_val.item()
+                        except Exception:
+                            loss_meas_val = None
+            else:
+                # Loss components of the closure evaluation at the accepted betas
+                record = accepted_step_record(step_records, beta_init_t)
+                loss_anchor_val = record["loss_anchor"].item()
+                loss_beta_mag_val = record["loss_beta_mag"].item()
+                loss_meas_val = record["loss_meas"].item() if record["loss_meas"] is not None else None
+            
+            if self.trace_level != "off":
+                trace.append({
+                    "iter": iter_idx + 1,
+                    "loss_total": loss_val,
+                    "loss_meas": loss_meas_val if loss_meas_val is not None else 0.0,
+                    "loss_anchor": loss_anchor_val,
+                    "loss_beta_mag": loss_beta_mag_val,
+                    "dt_ms": iter_time_ms,
+                })
             
             n_iter = iter_idx + 1
             
@@ -480,7 +608,7 @@ class SmartMapper:
             # Apply scale ONCE to vertices and joints
             verts_scaled = out_final.vertices[0] * scale_t
             verts_np = verts_scaled.detach().cpu().numpy()
-            lbs_weights_np = model.lbs_weights.detach().cpu().numpy()
+            lbs_weights_np = self._get_lbs_weights_np(sex)
             joints_full = out_final.joints
             num_joints_weights = lbs_weights_np.shape[1]
             
@@ -513,6 +641,7 @@ class SmartMapper:
                         joint_ids=SMPLX_JOINT_IDS,
                         cfg=sw_cfg,  # Use frozen policy config
                         return_debug=False,
+                        topology=self._get_shoulder_width_topology(sex, sw_cfg),
                     )
                 except Exception:
                     pass
@@ -535,3 +664,329 @@ class SmartMapper:
             "joint_sw_m": joint_sw_m,
             "measured_sw_m": float(pred_shoulder_width) if pred_shoulder_width is not None else None,
         }
+    
+    def optimize_batch(self, subjects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Optimize SMPL-X parameters for many subjects.
+        
+        Subjects are grouped by sex; each group is one LBFGS problem over stacked
+        betas (B, num_betas) with one batched A-Pose forward per closure call.
+        The group loss is the sum of per-subject losses (all terms are separable
+        per subject). Early stopping is per subject: a converged or failed subject
+        is frozen: the shared LBFGS keeps its curvature history, projected onto the
+        still-active rows, so frozen betas no longer move.
+        
+        Note: the strong-Wolfe line search is shared by the group, so per-iteration
+        traces are not step-for-step identical to serial optimize() calls (they are
+        for B=1); final betas agree up to the early stopping tolerances.
+        
+        Args:
+            subjects: List of dicts with optimize() keyword arguments
+                (sex, age, height_m, weight_kg, optional target_shoulder_width_m,
+                optional debug_output_dir)
+        
+        Returns:
+            List of optimize() result dicts, in input order
+            (trace dt_ms is the wall time of the shared group step)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(subjects)
+        groups: Dict[str, List[int]] = {}
+        for idx, subject in enumerate(subjects):
+            groups.setdefault(subject["sex"], []).append(idx)
+        
+        for sex, indices in groups.items():
+            group_results = self._optimize_group(sex, [subjects[i] for i in indices])
+            for idx, result in zip(indices, group_results):
+                results[idx] = result
+        
+        return results
+    
+    def _optimize_group(self, sex: str, subjects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Joint LBFGS fit for subjects of one sex (see optimize_batch)."""
+        B = len(subjects)
+        
+        # 1. Per-subject global scale and initial betas
+        base_height = self._get_canonical_height(sex)
+        scales = [s["height_m"] / base_height for s in subjects]
+        beta_init = np.stack([
+            get_init_betas(sex, s["height_m"], s["weight_kg"], self.beta_means, self.policy)
+            for s in subjects
+        ])
+        targets = [s.get("target_shoulder_width_m") for s in subjects]
+        debug_dirs = [s.get("debug_output_dir") for s in subjects]
+        
+        model = self._get_model(sex)
+        betas_t = torch.tensor(beta_init, dtype=torch.float32, device=self.device, requires_grad=True)
+        beta_init_ref = torch.tensor(beta_init, dtype=torch.float32, device=self.device)
+        scale_t = torch.tensor(scales, dtype=torch.float32, device=self.device).view(B, 1, 1)
+        
+        lbs_weights_np = self._get_lbs_weights_np(sex)
+        num_joints_weights = lbs_weights_np.shape[1]  # Should be 55
+        max_joint_idx = max(SMPLX_JOINT_IDS.values())
+        assert max_joint_idx < num_joints_weights, (
+            f"joint_ids max index {max_joint_idx} >= num_joints_weights {num_joints_weights}"
+        )
+        sw_cfg = get_shoulder_width_cfg()  # Frozen policy config
+        sw_topology = self._get_shoulder_width_topology(sex, sw_cfg)
+        
+        def scaled_numpy(out, rows: torch.Tensor) -> Tuple[np.ndarray, np.ndarray]:
+            """Scaled (k, N, 3) verts and first-55 joints for the given subject rows."""
+            row_scale = scale_t[rows]
+            verts_np = (out.vertices * row_scale).detach().cpu().numpy()
+            joints_np = (out.joints[:, :num_joints_weights, :] * row_scale).detach().cpu().numpy()
+            return verts_np, joints_np
+        
+        def measure(verts_np: np.ndarray, joints_np: np.ndarray) -> float:
+            return measure_shoulder_width_v112(
+                verts=verts_np,
+                lbs_weights=lbs_weights_np,
+                joints_xyz=joints_np,
+                joint_ids=SMPLX_JOINT_IDS,
+                cfg=sw_cfg,
+                return_debug=False,
+                topology=sw_topology,
+            )
+        
+        def measurement_loss(pred_width: float, target: float) -> torch.Tensor:
+            pred_width_t = torch.tensor(pred_width, dtype=torch.float32, device=self.device)
+            target_width_t = torch.tensor(target, dtype=torch.float32, device=self.device)
+            return self.policy.weight_measurement * (pred_width_t - target_width_t) ** 2
+        
+        # Per-subject state
+        active = np.ones(B, dtype=bool)
+        measurement_failed = np.zeros(B, dtype=bool)
+        fail_reasons: List[Optional[str]] = [None] * B
+        failed_betas: Dict[int, torch.Tensor] = {}
+        traces: List[List[Dict[str, Any]]] = [[] for _ in range(B)]
+        n_iter = [0] * B
+        prev_loss = [float("inf")] * B
+        prev_beta = betas_t.detach().clone()
+        last_loss: List[Optional[float]] = [None] * B
+        last_meas: List[Optional[float]] = [None] * B
+        last_anchor: List[Optional[float]] = [None] * B
+        last_beta_mag: List[Optional[float]] = [None] * B
+        
+        # Per-subject losses of the first closure call of a step (what optimizer.step returns)
+        step_losses: Dict[int, float] = {}
+        # Loss components of every closure evaluation of the current step (detached)
+        step_records: List[Dict[str, Any]] = []
+        active_rows = torch.arange(B, device=self.device)
+        
+        def closure():
+            optimizer.zero_grad()
+            rows = active_rows
+            row_list = rows.tolist()
+            betas_active = betas_t[rows]  # Frozen rows get zero gradient
+            
+            # Forward pass with A-Pose (via policy), all active subjects at once
+            out = self.pose_normalizer.run_forward(model, betas_active, {}, enforce_policy_apose=True)
+            
+            meas_terms = [torch.tensor(0.0, device=self.device) for _ in row_list]
+            if any(targets[b] is not None and not measurement_failed[b] for b in row_list):
+                host_copy = None
+                if self.measurement_backend == "torch":
+                    # Differentiable path: stays on device
+                    row_scale = scale_t[rows]
+                    verts_rows = out.vertices * row_scale
+                    joints_rows = out.joints[:, :num_joints_weights, :] * row_scale
+                for k, b in enumerate(row_list):
+                    if targets[b] is None or measurement_failed[b]:
+                        continue
+                    try:
+                        if self.measurement_backend == "torch":
+                            pred_width_t = measure_shoulder_width_v112_torch(
+                                verts=verts_rows[k],
+                                lbs_weights=model.lbs_weights,
+                                joints_xyz=joints_rows[k],
+                                joint_ids=SMPLX_JOINT_IDS,
+                                cfg=sw_cfg,
+                            )
+                            target_width_t = torch.tensor(targets[b], dtype=torch.float32, device=self.device)
+                            meas_terms[k] = self.policy.weight_measurement * (pred_width_t - target_width_t) ** 2
+                        else:
+                            if host_copy is None:
+                                host_copy = scaled_numpy(out, rows)
+                            meas_terms[k] = measurement_loss(measure(host_copy[0][k], host_copy[1][k]), targets[b])
+                    except Exception as e:
+                        # Same as optimize(): subject stops at the betas that failed
+                        measurement_failed[b] = True
+                        fail_reasons[b] = f"{type(e).__name__}: {str(e)}"
+                        failed_betas[b] = betas_t[b].detach().clone()
+                        fail_verts, fail_joints = scaled_numpy(out, rows)
+                        fail_info = log_measurement_exception(
+                            e, fail_verts[k], lbs_weights_np, fail_joints[k], SMPLX_JOINT_IDS
+                        )
+                        if debug_dirs[b]:
+                            os.makedirs(debug_dirs[b], exist_ok=True)
+                            error_file = os.path.join(debug_dirs[b], "measurement_error.json")
+                            with open(error_file, "w", encoding="utf-8") as f:
+                                json.dump(fail_info, f, indent=2)
+            
+            loss_meas = torch.stack(meas_terms)
+            loss_anchor = self.policy.weight_anchor * torch.sum((betas_active - beta_init_ref[rows]) ** 2, dim=1)
+            loss_beta_mag = self.policy.weight_beta_mag * torch.sum(betas_active ** 2, dim=1)
+            loss_per_subject = loss_meas + loss_anchor + loss_beta_mag
+            
+            if not step_losses:
+                step_losses.update(zip(row_list, loss_per_subject.detach().cpu().tolist()))
+            step_records.append({
+                "betas": betas_t.detach().clone(),
+                "rows": row_list,
+                "loss_meas": loss_meas.detach(),
+                "anchor": loss_anchor.detach(),
+                "beta_mag": loss_beta_mag.detach(),
+            })
+            
+            loss_total = loss_per_subject.sum()
+            loss_total.backward()
+            return loss_total
+        
+        optimizer = optim.LBFGS(
+            [betas_t],
+            lr=0.1,
+            max_iter=20,  # Per-call max_iter
+            tolerance_grad=1e-7,
+            tolerance_change=1e-9,
+            line_search_fn="strong_wolfe",
+        )
+        active_changed = False
+        for iter_idx in range(self.policy.max_iter):
+            if not active.any():
+                break
+            if active_changed:
+                # Keep the LBFGS history, restricted to the active rows: frozen rows get
+                # zero gradient in the closure and zero history, so they no longer move
+                active_rows = torch.as_tensor(np.flatnonzero(active), device=self.device)
+                keep = torch.zeros_like(betas_t, dtype=torch.bool)
+                keep[active_rows] = True
+                mask_lbfgs_history(optimizer, keep)
+                active_changed = False
+            
+            iter_start = time.perf_counter()
+            step_losses.clear()
+            step_records.clear()
+            optimizer.step(closure)
+            iter_time_ms = (time.perf_counter() - iter_start) * 1000.0
+            
+            # Failed subjects: restore the betas they failed at and freeze them (no trace entry)
+            newly_failed = [b for b in np.flatnonzero(active) if measurement_failed[b]]
+            if newly_failed:
+                with torch.no_grad():
+                    for b in newly_failed:
+                        betas_t[b] = failed_betas[b]
+                        active[b] = False
+                active_changed = True
+            
+            trace_rows = np.flatnonzero(active)
+            if len(trace_rows) == 0:
+                continue
+            
+            if self.trace_level == "full":
+                # Recompute loss components at the post-step betas (one batched forward)
+                with torch.no_grad():
+                    rows = torch.as_tensor(trace_rows, device=self.device)
+                    betas_rows = betas_t[rows]
+                    anchor_vals = (self.policy.weight_anchor * torch.sum((betas_rows - beta_init_ref[rows]) ** 2, dim=1)).cpu().tolist()
+                    beta_mag_vals = (self.policy.weight_beta_mag * torch.sum(betas_rows ** 2, dim=1)).cpu().tolist()
+                
+                    meas_vals: List[Optional[float]] = [None] * len(trace_rows)
+                    if any(targets[b] is not None for b in trace_rows):
+                        out = self.pose_normalizer.run_forward(model, betas_rows, {}, enforce_policy_apose=True)
+                        verts_np, joints_np = scaled_numpy(out, rows)
+                        for k, b in enumerate(trace_rows):
+                            if targets[b] is None:
+                                continue
+                            try:
+                                meas_vals[k] = measurement_loss(measure(verts_np[k], joints_np[k]), targets[b]).item()
+                            except Exception:
+                                meas_vals[k] = None
+            else:
+                # Loss components of the closure evaluation at the accepted betas
+                record = accepted_step_record(step_records, betas_t, rows=trace_rows)
+                pos = {b: k for k, b in enumerate(record["rows"])}
+                record_rows = [pos[b] for b in trace_rows]
+                anchor_vals = record["anchor"][record_rows].cpu().tolist()
+                beta_mag_vals = record["beta_mag"][record_rows].cpu().tolist()
+                meas_record = record["loss_meas"][record_rows].cpu().tolist()
+                meas_vals = [
+                    meas_record[k] if targets[b] is not None else None for k, b in enumerate(trace_rows)
+                ]
+            
+            for k, b in enumerate(trace_rows):
+                loss_val = step_losses[b]
+                loss_improvement = prev_loss[b] - loss_val
+                beta_change = torch.norm(betas_t[b].detach() - prev_beta[b]).item()
+                
+                last_loss[b] = loss_val
+                last_meas[b] = meas_vals[k]
+                last_anchor[b] = anchor_vals[k]
+                last_beta_mag[b] = beta_mag_vals[k]
+                if self.trace_level != "off":
+                    traces[b].append({
+                        "iter": iter_idx + 1,
+                        "loss_total": loss_val,
+                        "loss_meas": meas_vals[k] if meas_vals[k] is not None else 0.0,
+                        "loss_anchor": last_anchor[b],
+                        "loss_beta_mag": last_beta_mag[b],
+                        "dt_ms": iter_time_ms,
+                    })
+                n_iter[b] = iter_idx + 1
+                
+                # Per-subject early stopping
+                if loss_improvement < self.policy.tol_loss and beta_change < self.policy.tol_beta:
+                    active[b] = False
+                    active_changed = True
+                    continue
+                
+                prev_loss[b] = loss_val
+                prev_beta[b] = betas_t[b].detach().clone()
+        
+        # Final prediction and sanity checks (one batched forward)
+        with torch.no_grad():
+            out_final = self.pose_normalizer.run_forward(model, betas_t.detach(), {}, enforce_policy_apose=True)
+            verts_all, joints_all = scaled_numpy(out_final, torch.arange(B, device=self.device))
+        
+        results = []
+        for b in range(B):
+            verts_np = verts_all[b]
+            joints_np = joints_all[b]
+            
+            # 1. Height prediction (scale applied)
+            y_coords = verts_np[:, 1]
+            height_pred_m = float(np.nanmax(y_coords) - np.nanmin(y_coords))
+            
+            # 2. Joint-based shoulder width (scale applied)
+            L_shoulder_pos = joints_np[SMPLX_JOINT_IDS["L_shoulder"], :]
+            R_shoulder_pos = joints_np[SMPLX_JOINT_IDS["R_shoulder"], :]
+            joint_sw_m = float(np.linalg.norm(L_shoulder_pos - R_shoulder_pos))
+            
+            # 3. Measured shoulder width
+            pred_shoulder_width = None
+            if targets[b] is not None:
+                try:
+                    pred_shoulder_width = measure(verts_np, joints_np)
+                except Exception:
+                    pass
+            
+            done = n_iter[b] > 0
+            failed = bool(measurement_failed[b])
+            results.append({
+                "scale": float(scales[b]),
+                "betas": betas_t[b].detach().cpu().numpy().astype(np.float32),
+                "beta_init": beta_init[b].astype(np.float32),
+                "predicted_shoulder_width_m": float(pred_shoulder_width) if pred_shoulder_width is not None else None,
+                "loss_total": float(last_loss[b]) if done else None,
+                "loss_measurement": None if failed else (float(last_meas[b]) if last_meas[b] is not None else None),
+                "loss_anchor": float(last_anchor[b]) if done else None,
+                "loss_beta_mag": float(last_beta_mag[b]) if done else None,
+                "n_iter": n_iter[b],
+                "trace": traces[b],
+                "status": "MEAS_FAILED" if failed else "SUCCESS",
+                "fail_reason": fail_reasons[b],
+                # Sanity checks
+                "height_pred_m": height_pred_m,
+                "joint_sw_m": joint_sw_m,
+                "measured_sw_m": float(pred_shoulder_width) if pred_shoulder_width is not None else None,
+            })
+        
+        return results
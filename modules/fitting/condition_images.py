@@ -0,0 +1,420 @@
+# modules/fitting/condition_images.py
+# Depth/normal condition images for fixed_camera_preset_v1 (fitting_module_plan_v1 6.2, F5)
+#
+# CPU z-buffer triangle rasterizer in pure NumPy: triangles are binned into screen tiles,
+# (triangle, tile) pairs are expanded to candidate pixels in bounded chunks of whole tiles,
+# coverage/depth are evaluated for all fragments at once, and each pixel keeps its nearest
+# fragment (ties -> lower face index), so output is deterministic.
+#
+# Camera (PZ1: right-handed, Y-up, Z-forward, meters, origin on the floor between the feet):
+# the camera sits camera_distance_m in front of target_m (+Z side) looking at it, then
+# yaw (about Y), pitch (about X), roll (about Z). fov_deg is the vertical field of view.
+# Depth is the view-axis distance in meters; normals are camera-space (x right, y up,
+# z toward the camera), smooth (area-weighted vertex normals), flipped to face the camera.
+#
+# Encoding: depth.png uint16, 65535 * (far - d) / (far - near) (near = bright), 0 = background;
+# normal.png uint8 RGB, 255 * (n + 1) / 2, (0, 0, 0) = background.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+CONDITION_IMAGE_VERSION = "condition_image_v0"
+
+DEFAULT_TILE_SIZE = 32
+# Candidate pixels evaluated per chunk (bounds peak memory)
+DEFAULT_MAX_FRAGMENTS = 2_000_000
+# Barycentric tolerance so pixel centers on shared edges are never dropped by both triangles
+EDGE_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class CameraPreset:
+    """Fixed camera parameters (changes only by bumping preset_id, plan 6.2)."""
+    preset_id: str
+    fov_deg: float
+    camera_distance_m: float
+    yaw_deg: float
+    pitch_deg: float
+    roll_deg: float
+    near_m: float
+    far_m: float
+    image_resolution: int
+    target_m: Tuple[float, float, float]
+
+
+FIXED_CAMERA_PRESET_V1 = CameraPreset(
+    preset_id="fixed_camera_preset_v1",
+    fov_deg=30.0,
+    camera_distance_m=3.6,
+    yaw_deg=0.0,
+    pitch_deg=0.0,
+    roll_deg=0.0,
+    near_m=2.6,
+    far_m=4.6,
+    image_resolution=1024,
+    target_m=(0.0, 0.9, 0.0),
+)
+
+
+@dataclass(frozen=True)
+class ConditionImages:
+    """Rendered maps; (H, W) row 0 = top of the image."""
+    depth_m: np.ndarray      # (H, W) float32, inf = background
+    normal: np.ndarray       # (H, W, 3) float32 camera-space unit normals, 0 = background
+    face_index: np.ndarray   # (H, W) int32 index into the concatenated faces, -1 = background
+
+    @property
+    def mask(self) -> np.ndarray:
+        return self.face_index >= 0
+
+
+def camera_frame(preset: CameraPreset) -> Tuple[np.ndarray, np.ndarray]:
+    """(R, eye): R columns are camera right/up/back axes in world coordinates."""
+    yaw, pitch, roll = np.deg2rad([preset.yaw_deg, preset.pitch_deg, preset.roll_deg])
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cr, sr = np.cos(roll), np.sin(roll)
+    ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rx = np.array([[1, 0, 0], [0, cp, -sp], [0, sp, cp]])
+    rz = np.array([[cr, -sr, 0], [sr, cr, 0], [0, 0, 1]])
+    r = ry @ rx @ rz
+    eye = np.asarray(preset.target_m, dtype=np.float64) + preset.camera_distance_m * r[:, 2]
+    return r, eye
+
+
+def _concat_meshes(meshes: Sequence[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    verts, faces, offset = [], [], 0
+    for v, f in meshes:
+        v = np.asarray(v, dtype=np.float64)
+        f = np.asarray(f, dtype=np.int64)
+        if v.ndim != 2 or v.shape[1] != 3:
+            raise ValueError(f"verts must be (N,3), got {v.shape}")
+        if f.ndim != 2 or f.shape[1] != 3:
+            raise ValueError(f"faces must be (F,3), got {f.shape}")
+        verts.append(v)
+        faces.append(f + offset)
+        offset += v.shape[0]
+    if not verts:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    return np.concatenate(verts), np.concatenate(faces)
+
+
+def vertex_normals(verts: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted unit vertex normals (zero for unreferenced vertices)."""
+    tri = verts[faces]
+    fn = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    flat = faces.reshape(-1)
+    vn = np.stack(
+        [np.bincount(flat, weights=np.repeat(fn[:, c], 3), minlength=verts.shape[0]) for c in range(3)],
+        axis=1,
+    )
+    norm = np.linalg.norm(vn, axis=1, keepdims=True)
+    return np.divide(vn, norm, out=np.zeros_like(vn), where=norm > 0)
+
+
+def render_condition_images(
+    meshes: Sequence[Tuple[np.ndarray, np.ndarray]],
+    preset: CameraPreset = FIXED_CAMERA_PRESET_V1,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    max_fragments: int = DEFAULT_MAX_FRAGMENTS,
+) -> ConditionImages:
+    """
+    Rasterize depth/normal maps of one or more meshes (e.g. body + garment) with a z-buffer.
+
+    Args:
+        meshes: [(verts (N,3) meters, faces (F,3) int), ...], rendered together
+        preset: camera preset
+        tile_size: screen tile edge in pixels for triangle binning
+        max_fragments: candidate pixels per chunk (memory bound; chunks hold whole tiles)
+    """
+    size = int(preset.image_resolution)
+    verts, faces = _concat_meshes(meshes)
+    depth = np.full(size * size, np.inf, dtype=np.float32)
+    normal = np.zeros((size * size, 3), dtype=np.float32)
+    face_index = np.full(size * size, -1, dtype=np.int32)
+
+    if faces.shape[0]:
+        r, eye = camera_frame(preset)
+        pc = (verts - eye) @ r
+        d = -pc[:, 2]
+        f = (size / 2.0) / np.tan(np.deg2rad(preset.fov_deg) / 2.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sx = size / 2.0 + f * pc[:, 0] / d
+            sy = size / 2.0 - f * pc[:, 1] / d
+        nc = vertex_normals(verts, faces) @ r
+
+        # Per-triangle setup (triangles crossing the near plane are dropped, no clipping)
+        td = d[faces]
+        tx, ty = sx[faces], sy[faces]
+        area2 = (tx[:, 1] - tx[:, 0]) * (ty[:, 2] - ty[:, 0]) - (ty[:, 1] - ty[:, 0]) * (tx[:, 2] - tx[:, 0])
+        keep = np.all(td > preset.near_m, axis=1) & np.any(td < preset.far_m, axis=1) & (area2 != 0)
+        x0 = np.clip(np.ceil(tx.min(axis=1) - 0.5), 0, size - 1)
+        x1 = np.clip(np.floor(tx.max(axis=1) - 0.5), 0, size - 1)
+        y0 = np.clip(np.ceil(ty.min(axis=1) - 0.5), 0, size - 1)
+        y1 = np.clip(np.floor(ty.max(axis=1) - 0.5), 0, size - 1)
+        with np.errstate(invalid="ignore"):
+            keep &= (tx.max(axis=1) >= 0.5) & (tx.min(axis=1) <= size - 0.5)
+            keep &= (ty.max(axis=1) >= 0.5) & (ty.min(axis=1) <= size - 0.5)
+            keep &= (x0 <= x1) & (y0 <= y1)
+        tri_ids = np.flatnonzero(keep)
+
+        # Edge functions: barycentric l_i(x, y) = A_i x + B_i y + C_i
+        j, k = [1, 2, 0], [2, 0, 1]
+        inv_area = 1.0 / area2[tri_ids, None]
+        txk, tyk = tx[tri_ids], ty[tri_ids]
+        coef_a = (tyk[:, j] - tyk[:, k]) * inv_area
+        coef_b = (txk[:, k] - txk[:, j]) * inv_area
+        coef_c = (txk[:, j] * tyk[:, k] - txk[:, k] * tyk[:, j]) * inv_area
+        inv_d = 1.0 / td[tri_ids]
+
+        # Tile binning: (triangle, tile) pairs sorted by tile
+        bx0, bx1 = x0[tri_ids].astype(np.int64), x1[tri_ids].astype(np.int64)
+        by0, by1 = y0[tri_ids].astype(np.int64), y1[tri_ids].astype(np.int64)
+        n_tiles_x = (size + tile_size - 1) // tile_size
+        tx0, tx1, ty0, ty1 = bx0 // tile_size, bx1 // tile_size, by0 // tile_size, by1 // tile_size
+        tiles_w = tx1 - tx0 + 1
+        n_pairs = tiles_w * (ty1 - ty0 + 1)
+        local = np.repeat(np.arange(tri_ids.size), n_pairs)
+        off = np.arange(local.size) - np.repeat(np.cumsum(n_pairs) - n_pairs, n_pairs)
+        ptx = tx0[local] + off % tiles_w[local]
+        pty = ty0[local] + off // tiles_w[local]
+        tile = pty * n_tiles_x + ptx
+        order = np.argsort(tile, kind="stable")
+        local, ptx, pty, tile = local[order], ptx[order], pty[order], tile[order]
+        rx0 = np.maximum(bx0[local], ptx * tile_size)
+        rx1 = np.minimum(bx1[local], ptx * tile_size + tile_size - 1)
+        ry0 = np.maximum(by0[local], pty * tile_size)
+        ry1 = np.minimum(by1[local], pty * tile_size + tile_size - 1)
+        counts = (rx1 - rx0 + 1) * (ry1 - ry0 + 1)
+        cum = np.concatenate([[0], np.cumsum(counts)])
+        tile_starts = np.flatnonzero(np.concatenate([[True], tile[1:] != tile[:-1]]))
+        tile_starts = np.append(tile_starts, local.size)
+
+        start = 0
+        while start < local.size:
+            # Greedy chunk of whole tiles, at least one tile
+            limit = cum[start] + max_fragments
+            t = np.searchsorted(tile_starts, start, side="right")
+            end_t = max(t, np.searchsorted(cum[tile_starts], limit, side="right") - 1)
+            end = tile_starts[min(end_t, tile_starts.size - 1)]
+            sl = slice(start, end)
+            start = end
+
+            c = counts[sl]
+            li = np.repeat(local[sl], c)
+            o = np.arange(li.size) - np.repeat(cum[sl] - cum[sl.start], c)
+            w = np.repeat(rx1[sl] - rx0[sl] + 1, c)
+            px = np.repeat(rx0[sl], c) + o % w
+            py = np.repeat(ry0[sl], c) + o // w
+            cx, cy = px + 0.5, py + 0.5
+
+            lam = coef_a[li] * cx[:, None] + coef_b[li] * cy[:, None] + coef_c[li]
+            inside = np.all(lam >= -EDGE_EPS, axis=1)
+            li, px, py, lam = li[inside], px[inside], py[inside], lam[inside]
+            inv_frag = np.sum(lam * inv_d[li], axis=1)
+            frag_d = 1.0 / inv_frag
+            ok = (frag_d >= preset.near_m) & (frag_d <= preset.far_m)
+            li, px, py, lam, inv_frag, frag_d = li[ok], px[ok], py[ok], lam[ok], inv_frag[ok], frag_d[ok]
+
+            # Z-test: nearest fragment per pixel, ties -> lower face index
+            pix = py * size + px
+            face = tri_ids[li]
+            zo = np.lexsort((face, frag_d, pix))
+            pix_s = pix[zo]
+            first = zo[np.concatenate([[True], pix_s[1:] != pix_s[:-1]])]
+
+            wpc = lam[first] * inv_d[li[first]] / inv_frag[first, None]   # perspective-correct
+            n = np.einsum("fi,fic->fc", wpc, nc[faces[face[first]]])
+            ray = np.stack([(px[first] + 0.5 - size / 2.0) / f, -(py[first] + 0.5 - size / 2.0) / f,
+                            -np.ones(first.size)], axis=1)
+            n = np.where((np.sum(n * ray, axis=1) > 0)[:, None], -n, n)
+            norm = np.linalg.norm(n, axis=1, keepdims=True)
+            n = np.divide(n, norm, out=np.zeros_like(n), where=norm > 0)
+
+            target = pix[first]
+            depth[target] = frag_d[first]
+            normal[target] = n
+            face_index[target] = face[first]
+
+    return ConditionImages(
+        depth_m=depth.reshape(size, size),
+        normal=normal.reshape(size, size, 3),
+        face_index=face_index.reshape(size, size),
+    )
+
+
+def encode_depth_u16(depth_m: np.ndarray, preset: CameraPreset = FIXED_CAMERA_PRESET_V1) -> np.ndarray:
+    """Depth (meters, inf = background) -> uint16, near = bright, background = 0."""
+    v = (preset.far_m - depth_m.astype(np.float64)) / (preset.far_m - preset.near_m)
+    out = np.rint(np.clip(v, 0.0, 1.0) * 65535.0)
+    out[~np.isfinite(depth_m)] = 0
+    return out.astype(np.uint16)
+
+
+def encode_normal_rgb8(normal: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Camera-space normals -> uint8 RGB, background = (0, 0, 0)."""
+    out = np.rint((np.clip(normal.astype(np.float64), -1.0, 1.0) + 1.0) * 127.5).astype(np.uint8)
+    out[~mask] = 0
+    return out
+
+
+def write_png(path: str, image: np.ndarray) -> None:
+    """Minimal deterministic PNG writer: (H,W) uint8/uint16 gray or (H,W,3) uint8 RGB."""
+    image = np.ascontiguousarray(image)
+    if image.ndim == 2 and image.dtype == np.uint8:
+        color_type, bit_depth, raw = 0, 8, image
+    elif image.ndim == 2 and image.dtype == np.uint16:
+        color_type, bit_depth, raw = 0, 16, image.astype(">u2")
+    elif image.ndim == 3 and image.shape[2] == 3 and image.dtype == np.uint8:
+        color_type, bit_depth, raw = 2, 8, image
+    else:
+        raise ValueError(f"unsupported image {image.shape} {image.dtype}")
+    h, w = image.shape[:2]
+    rows = raw.reshape(h, -1).view(np.uint8)
+    data = np.concatenate([np.zeros((h, 1), dtype=np.uint8), rows], axis=1).tobytes()  # filter 0
+
+    def chunk(tag: bytes, payload: bytes) -> bytes:
+        return struct.pack(">I", len(payload)) + tag + payload + struct.pack(">I", zlib.crc32(tag + payload))
+
+    png = (b"\x89PNG\r\n\x1a\n"
+           + chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, bit_depth, color_type, 0, 0, 0))
+           + chunk(b"IDAT", zlib.compress(data, 6))
+           + chunk(b"IEND", b""))
+    with open(path, "wb") as f:
+        f.write(png)
+
+
+def write_condition_images(out_dir: str, images: ConditionImages, preset: CameraPreset = FIXED_CAMERA_PRESET_V1) -> Dict[str, str]:
+    """Write depth.png and normal.png; returns their paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {"depth": os.path.join(out_dir, "depth.png"), "normal": os.path.join(out_dir, "normal.png")}
+    write_png(paths["depth"], encode_depth_u16(images.depth_m, preset))
+    write_png(paths["normal"], encode_normal_rgb8(images.normal, images.mask))
+    return paths
+
+
+def mesh_hash(meshes: Sequence[Tuple[np.ndarray, np.ndarray]]) -> str:
+    """sha256 over float32 verts + int32 faces of each mesh (order-sensitive)."""
+    h = hashlib.sha256()
+    for verts, faces in meshes:
+        v = np.ascontiguousarray(verts, dtype="<f4")
+        f = np.ascontiguousarray(faces, dtype="<i4")
+        h.update(struct.pack("<QQ", v.shape[0], f.shape[0]))
+        h.update(v.tobytes())
+        h.update(f.tobytes())
+    return h.hexdigest()
+
+
+class ConditionImageCache:
+    """
+    Rendered condition images keyed by (mesh hash, camera preset id, condition image version).
+
+    Memory tier: LRU of max_entries. Disk tier (optional): one uncompressed NPZ per key.
+    """
+
+    def __init__(self, max_entries: int = 16, disk_dir: Optional[str] = None):
+        self.max_entries = int(max_entries)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._mem: "OrderedDict[str, ConditionImages]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._counters = {"hits_memory": 0, "hits_disk": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(meshes: Sequence[Tuple[np.ndarray, np.ndarray]], preset: CameraPreset = FIXED_CAMERA_PRESET_V1) -> str:
+        return f"{preset.preset_id}__{CONDITION_IMAGE_VERSION}__{mesh_hash(meshes)}"
+
+    def get_or_render(
+        self,
+        meshes: Sequence[Tuple[np.ndarray, np.ndarray]],
+        preset: CameraPreset = FIXED_CAMERA_PRESET_V1,
+        **render_kwargs: Any,
+    ) -> Tuple[ConditionImages, str]:
+        """Return (images, key), rendering only on a miss in both tiers."""
+        key = self.key(meshes, preset)
+        with self._lock:
+            images = self._mem.get(key)
+            if images is not None:
+                self._mem.move_to_end(key)
+                self._counters["hits_memory"] += 1
+                return images, key
+            images = self._disk_get(key)
+            if images is not None:
+                self._counters["hits_disk"] += 1
+                self._mem_put(key, images)
+                return images, key
+            self._counters["misses"] += 1
+
+        images = render_condition_images(meshes, preset, **render_kwargs)
+        with self._lock:
+            self._mem_put(key, images)
+            self._disk_put(key, images)
+        return images, key
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._mem)
+
+    def telemetry(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            lookups = stats["hits_memory"] + stats["hits_disk"] + stats["misses"]
+            stats["hit_rate"] = (stats["hits_memory"] + stats["hits_disk"]) / lookups if lookups else None
+            stats["entries"] = len(self._mem)
+            return stats
+
+    def _mem_put(self, key: str, images: ConditionImages) -> None:
+        self._mem[key] = images
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _disk_get(self, key: str) -> Optional[ConditionImages]:
+        if self.disk_dir is None:
+            return None
+        path = self.disk_dir / f"{key}.npz"
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return ConditionImages(
+                    depth_m=data["depth_m"], normal=data["normal"], face_index=data["face_index"],
+                )
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            # Corrupt or truncated entry: a miss, rewritten by the next _disk_put
+            return None
+
+    def _disk_put(self, key: str, images: ConditionImages) -> None:
+        if self.disk_dir is None:
+            return
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        path = self.disk_dir / f"{key}.npz"
+        # Unique temp file per writer (threads/processes), then an atomic rename
+        with tempfile.NamedTemporaryFile(dir=self.disk_dir, prefix=f"{key}.", suffix=".tmp.npz", delete=False) as f:
+            tmp = f.name
+        try:
+            np.savez(tmp, depth_m=images.depth_m, normal=images.normal, face_index=images.face_index)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,51 @@
+# modules/fitting/ease.py
+# Ease-ratio measurement helpers shared by the fitting runner and the size recommendation index
+#
+# ease_ratio = garment / body per key in EASE_KEYS; a value is usable only when it is numeric
+# (not None/NaN). Issues are recorded as warnings: dict[code, list[message]], truncated per code.
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List
+
+EASE_KEYS = ['bust', 'waist', 'hip']
+
+
+def add_warning(warnings_dict: Dict[str, List[str]], code: str, message: str, max_per_code: int = 100) -> None:
+    """Helper to accumulate warnings in dict[str, list[str]] format with truncation."""
+    if code not in warnings_dict:
+        warnings_dict[code] = []
+    if len(warnings_dict[code]) < max_per_code:
+        warnings_dict[code].append(message)
+    elif len(warnings_dict[code]) == max_per_code:
+        warnings_dict[code].append("...(truncated)")
+
+
+def extract_measurements(data: Dict[str, Any], reasons: Dict[str, int], warnings_dict: Dict[str, List[str]], source_label: str = "unknown") -> tuple[Dict[str, Any], str]:
+    """
+    Extract measurements from dual format:
+    A) {"bust":..., "waist":..., "hip":...}
+    B) {"units":"m", "measurements":{"bust":...,"waist":...,"hip":...}}
+    
+    Returns: (measurements_dict, format_used)
+    """
+    if not data:
+        return {}, "none"
+    
+    # Check format B first
+    if 'measurements' in data and isinstance(data['measurements'], dict):
+        # Validate units if present
+        units = data.get('units')
+        if units is not None and units != 'm':
+            reasons['units_mismatch'] = reasons.get('units_mismatch', 0) + 1
+            add_warning(warnings_dict, 'UNITS_MISMATCH', f"{source_label}: units='{units}' (expected 'm')")
+        return data['measurements'], "B"
+    
+    # Assume format A
+    return data, "A"
+
+
+def is_valid_number(value: Any) -> bool:
+    """Validate that a measurement value is numeric, not None/NaN."""
+    return value is not None and isinstance(value, (int, float)) and not math.isnan(value)
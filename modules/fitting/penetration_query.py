@@ -0,0 +1,189 @@
+# modules/fitting/penetration_query.py
+# ROI-restricted garment-vs-body penetration query (fitting_module_plan_v1 F2(B))
+#
+# Samples the Tier-0 body SDF (modules/fitting/sdf_bank.py) at garment proxy vertices,
+# per ROI only (no full-body collision). All vertices of a ROI are sampled in one
+# vectorized trilinear gather.
+#
+# Penetration depth of a vertex = thickness_garment_m - sdf (> 0 means the garment surface
+# is inside the body or closer than its thickness). Depths are capped by the bank's band.
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from modules.fitting.sdf_bank import MM_PER_M, SDFBank, SDFGrid
+
+# Plan 8: d_threshold_mm = max(2.2, 1.1 * voxel_size_mm)
+D_THRESHOLD_MIN_MM = 2.2
+D_THRESHOLD_VOXEL_FACTOR = 1.1
+# Plan 12.4: unrecoverable case (early exit / fast fail). Depths are capped by the band, so a
+# saturated ROI is judged by its band depth, not by the (float16-rounded) capped depth.
+FAST_FAIL_PENETRATION_MM = 10.0
+
+
+def d_threshold_mm(voxel_size_mm: float) -> float:
+    """Severity threshold for penetration depth (plan 8)."""
+    return max(D_THRESHOLD_MIN_MM, D_THRESHOLD_VOXEL_FACTOR * float(voxel_size_mm))
+
+
+def trilinear_sample(grid: SDFGrid, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Trilinear SDF at points (N,3) for the points inside the grid box.
+
+    Returns:
+        (values (M,) float32 meters, point indices (M,) int64 of the sampled points)
+    """
+    pts = np.asarray(points, dtype=np.float32)
+    g = (pts - grid.origin.astype(np.float32)) / np.float32(grid.voxel_size_m)
+    shape = np.asarray(grid.shape, dtype=np.float32)
+    inside = np.all((g >= 0) & (g <= shape - 1), axis=1)
+    idx = np.flatnonzero(inside)
+    g = g[idx]
+
+    nx, ny, nz = grid.shape
+    i0 = np.minimum(np.floor(g).astype(np.int64), np.array([nx - 2, ny - 2, nz - 2]).clip(min=0))
+    f = g - i0
+    i1 = np.minimum(i0 + 1, np.array([nx - 1, ny - 1, nz - 1]))
+    flat = grid.values.reshape(-1)
+
+    def corner(ix, iy, iz):
+        return flat[(ix * ny + iy) * nz + iz].astype(np.float32)
+
+    fx, fy, fz = f[:, 0], f[:, 1], f[:, 2]
+    c00 = corner(i0[:, 0], i0[:, 1], i0[:, 2]) * (1 - fx) + corner(i1[:, 0], i0[:, 1], i0[:, 2]) * fx
+    c10 = corner(i0[:, 0], i1[:, 1], i0[:, 2]) * (1 - fx) + corner(i1[:, 0], i1[:, 1], i0[:, 2]) * fx
+    c01 = corner(i0[:, 0], i0[:, 1], i1[:, 2]) * (1 - fx) + corner(i1[:, 0], i0[:, 1], i1[:, 2]) * fx
+    c11 = corner(i0[:, 0], i1[:, 1], i1[:, 2]) * (1 - fx) + corner(i1[:, 0], i1[:, 1], i1[:, 2]) * fx
+    c0 = c00 * (1 - fy) + c10 * fy
+    c1 = c01 * (1 - fy) + c11 * fy
+    return c0 * (1 - fz) + c1 * fz, idx
+
+
+@dataclass(frozen=True)
+class RoiPenetration:
+    """Penetration facts of one ROI."""
+    roi: str
+    n_vertices: int              # garment vertices inside the ROI grid
+    n_penetrating: int           # depth > 0
+    n_severe: int                # depth >= d_threshold
+    max_depth_mm: float          # 0.0 if none penetrate
+    mean_depth_mm: float         # over penetrating vertices (0.0 if none)
+    p95_depth_mm: float          # over penetrating vertices (0.0 if none)
+    saturated: bool              # max depth reached the SDF band (true depth may be larger)
+    offending_idx: np.ndarray    # (n_penetrating,) int64 garment vertex indices, deepest first
+
+    def to_dict(self, max_indices: Optional[int] = None) -> Dict[str, object]:
+        idx = self.offending_idx if max_indices is None else self.offending_idx[:max_indices]
+        return {
+            "roi": self.roi,
+            "n_vertices": self.n_vertices,
+            "n_penetrating": self.n_penetrating,
+            "n_severe": self.n_severe,
+            "max_depth_mm": self.max_depth_mm,
+            "mean_depth_mm": self.mean_depth_mm,
+            "p95_depth_mm": self.p95_depth_mm,
+            "saturated": self.saturated,
+            "offending_idx": idx.tolist(),
+        }
+
+
+def query_penetration(
+    grids: Dict[str, SDFGrid],
+    garment_verts: np.ndarray,
+    thickness_garment_m: float = 0.0,
+    rois: Optional[Iterable[str]] = None,
+    threshold_mm: Optional[float] = None,
+) -> Dict[str, RoiPenetration]:
+    """
+    Per-ROI penetration of garment proxy vertices against body SDF grids.
+
+    Args:
+        grids: ROI name -> SDFGrid (SDFBank.fetch(prototype_id))
+        garment_verts: (N, 3) garment proxy vertices, meters, body frame
+        thickness_garment_m: garment thickness (clearance required from the body surface)
+        rois: subset of ROI names (default: all grids)
+        threshold_mm: severity threshold (default: d_threshold_mm(voxel size))
+    """
+    garment_verts = np.asarray(garment_verts, dtype=np.float32)
+    if garment_verts.ndim != 2 or garment_verts.shape[1] != 3:
+        raise ValueError(f"garment_verts must be (N,3), got {garment_verts.shape}")
+    names = list(grids.keys()) if rois is None else list(rois)
+
+    results: Dict[str, RoiPenetration] = {}
+    for name in names:
+        grid = grids[name]
+        thr_mm = d_threshold_mm(grid.voxel_size_m * MM_PER_M) if threshold_mm is None else float(threshold_mm)
+        sdf, idx = trilinear_sample(grid, garment_verts)
+        depth_mm = (np.float32(thickness_garment_m) - sdf) * np.float32(MM_PER_M)
+        pen = depth_mm > 0
+        pen_depth = depth_mm[pen]
+        order = np.argsort(-pen_depth, kind="stable")
+        offending = idx[pen][order]
+        if pen_depth.size:
+            max_depth = float(pen_depth.max())
+            mean_depth = float(pen_depth.mean())
+            p95_depth = float(np.percentile(pen_depth, 95))
+        else:
+            max_depth = mean_depth = p95_depth = 0.0
+        band_depth_mm = (thickness_garment_m + grid.band_m) * MM_PER_M
+        results[name] = RoiPenetration(
+            roi=name,
+            n_vertices=int(idx.size),
+            n_penetrating=int(pen_depth.size),
+            n_severe=int(np.count_nonzero(pen_depth >= thr_mm)),
+            max_depth_mm=max_depth,
+            mean_depth_mm=mean_depth,
+            p95_depth_mm=p95_depth,
+            saturated=bool(pen_depth.size and max_depth >= band_depth_mm - 1e-3),
+            offending_idx=offending.astype(np.int64),
+        )
+    return results
+
+
+class PenetrationQueryEngine:
+    """Penetration queries against an SDF bank (grids stay warm-cached in the bank)."""
+
+    def __init__(self, bank: SDFBank):
+        self.bank = bank
+
+    def query(
+        self,
+        prototype_id: str,
+        garment_verts: np.ndarray,
+        thickness_garment_m: float = 0.0,
+        rois: Optional[List[str]] = None,
+    ) -> Dict[str, object]:
+        """
+        Penetration facts for one attempt.
+
+        Returns:
+            {"rois": {name: RoiPenetration}, "max_depth_mm", "fast_fail" (plan 12.4),
+             "fetch_ms", "query_ms"}
+        """
+        t0 = time.perf_counter()
+        grids = self.bank.fetch(prototype_id)
+        t1 = time.perf_counter()
+        per_roi = query_penetration(grids, garment_verts, thickness_garment_m, rois)
+        t2 = time.perf_counter()
+        max_depth = max((r.max_depth_mm for r in per_roi.values()), default=0.0)
+        fast_fail = False
+        for name, pen in per_roi.items():
+            if pen.saturated:
+                # True depth >= band depth: unrecoverable only if the band reaches the limit
+                band_depth_mm = (thickness_garment_m + grids[name].band_m) * MM_PER_M
+                fast_fail |= band_depth_mm >= FAST_FAIL_PENETRATION_MM
+            else:
+                fast_fail |= pen.max_depth_mm > FAST_FAIL_PENETRATION_MM
+        return {
+            "prototype_id": prototype_id,
+            "rois": per_roi,
+            "max_depth_mm": max_depth,
+            "fast_fail": fast_fail,
+            "fetch_ms": (t1 - t0) * 1000.0,
+            "query_ms": (t2 - t1) * 1000.0,
+        }
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tier-0 SDF bank builder v0 (offline, CPU).
+Reads body_mesh NPZ files (verts + faces, meters, PZ1) named <prototype_id>.npz and
+writes ROI narrow-band float16 SDF grids + sdf_bank_index.json (modules/fitting/sdf_bank.py).
+"""
+import argparse
+import pathlib
+import sys
+import time
+
+# Bootstrap: Add project root to sys.path
+_project_root = pathlib.Path(__file__).resolve().parents[3]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from modules.fitting.sdf_bank import (
+    DEFAULT_BAND_MM,
+    DEFAULT_VOXEL_SIZE_MM,
+    SDF_INDEX_FILENAME,
+    build_sdf_bank_entry,
+    load_body_mesh_npz,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Tier-0 SDF bank from body mesh NPZ files")
+    parser.add_argument("--mesh_dir", type=str, required=True, help="Directory of <prototype_id>.npz body meshes")
+    parser.add_argument("--out_dir", type=str, required=True, help="SDF bank directory")
+    parser.add_argument("--voxel_size_mm", type=float, default=DEFAULT_VOXEL_SIZE_MM)
+    parser.add_argument("--band_mm", type=float, default=DEFAULT_BAND_MM)
+    parser.add_argument("--prototype_ids", type=str, nargs="*", default=None,
+                        help="Only these prototype ids (default: every NPZ in --mesh_dir)")
+    args = parser.parse_args()
+
+    mesh_dir = pathlib.Path(args.mesh_dir)
+    paths = sorted(mesh_dir.glob("*.npz"))
+    if args.prototype_ids:
+        wanted = set(args.prototype_ids)
+        paths = [p for p in paths if p.stem in wanted]
+    if not paths:
+        print(f"Error: no body mesh NPZ found in {mesh_dir}", file=sys.stderr)
+        return 1
+
+    total_bytes = 0
+    t0 = time.perf_counter()
+    for path in paths:
+        t_entry = time.perf_counter()
+        verts, faces = load_body_mesh_npz(str(path))
+        entry = build_sdf_bank_entry(
+            args.out_dir, path.stem, verts, faces,
+            voxel_size_mm=args.voxel_size_mm, band_mm=args.band_mm,
+        )
+        total_bytes += entry["n_bytes"]
+        shapes = ", ".join(f"{roi}={tuple(meta['shape'])}" for roi, meta in entry["rois"].items())
+        print(f"{path.stem}: {entry['n_bytes'] / 1024:.1f} KB in {time.perf_counter() - t_entry:.2f}s ({shapes})")
+
+    print(f"Prototypes: {len(paths)}, total {total_bytes / 1024 ** 2:.2f} MB, {time.perf_counter() - t0:.2f}s")
+    print(f"Index: {pathlib.Path(args.out_dir) / SDF_INDEX_FILENAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,16 @@
 Fitting runner v0 - Facts-only stub (Round4)
 Always exits with code 0. Records all issues in warnings.
 Supports dual measurement input formats.
+
+Batch mode: a manifest with schema_version 'fitting_batch_manifest.v0' evaluates many
+body x garment pairs in one process. inputs holds either
+  "pairs": [{"pair_id"?, "body_measurements_path", "garment_measurements_path"}, ...]
+or the cartesian product of
+  "body_set": [{"id"?, "body_measurements_path"}, ...] x "garment_set": [{"id"?, "garment_measurements_path"}, ...]
+Each measurement file is loaded once, ease ratios are computed as arrays over all pairs and
+the code fingerprint is computed once. Outputs: fitting_batch_columns.json (one column per
+field, one row per pair), fitting_batch_summary.json, and pairs/<pair_id>/ with the usual
+fitting_summary.json + facts_summary.json.
 """
 import argparse
 import hashlib
@@ -10,17 +20,19 @@ import json
 import math
 import pathlib
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Bootstrap: Add project root to sys.path
+_project_root = pathlib.Path(__file__).resolve().parents[3]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
 
+from modules.fitting.ease import EASE_KEYS, add_warning, extract_measurements, is_valid_number
 
-def add_warning(warnings_dict: Dict[str, List[str]], code: str, message: str, max_per_code: int = 100) -> None:
-    """Helper to accumulate warnings in dict[str, list[str]] format with truncation."""
-    if code not in warnings_dict:
-        warnings_dict[code] = []
-    if len(warnings_dict[code]) < max_per_code:
-        warnings_dict[code].append(message)
-    elif len(warnings_dict[code]) == max_per_code:
-        warnings_dict[code].append("...(truncated)")
+BATCH_SCHEMA_VERSION = 'fitting_batch_manifest.v0'
 
 
 def safe_load_json(path: str, reasons: Dict[str, int], warnings_dict: Dict[str, List[str]]) -> Dict[str, Any]:
@@ -39,48 +51,6 @@ def safe_load_json(path: str, reasons: Dict[str, int], warnings_dict: Dict[str,
         return {}
 
 
-def extract_measurements(data: Dict[str, Any], reasons: Dict[str, int], warnings_dict: Dict[str, List[str]], source_label: str = "unknown") -> tuple[Dict[str, Any], str]:
-    """
-    Extract measurements from dual format:
-    A) {"bust":..., "waist":..., "hip":...}
-    B) {"units":"m", "measurements":{"bust":...,"waist":...,"hip":...}}
-    
-    Returns: (measurements_dict, format_used)
-    """
-    if not data:
-        return {}, "none"
-    
-    # Check format B first
-    if 'measurements' in data and isinstance(data['measurements'], dict):
-        # Validate units if present
-        units = data.get('units')
-        if units is not None and units != 'm':
-            reasons['units_mismatch'] = reasons.get('units_mismatch', 0) + 1
-            add_warning(warnings_dict, 'UNITS_MISMATCH', f"{source_label}: units='{units}' (expected 'm')")
-        return data['measurements'], "B"
-    
-    # Assume format A
-    return data, "A"
-
-
-def safe_divide(numerator: Optional[float], denominator: Optional[float], reasons: Dict[str, int], warnings_dict: Dict[str, List[str]], key: str) -> float:
-    """Safely divide, return NaN on error and track reason."""
-    try:
-        if denominator is None or denominator == 0:
-            reasons['zero_division'] = reasons.get('zero_division', 0) + 1
-            add_warning(warnings_dict, 'ZERO_DIVISION', f"{key}: denom={denominator}")
-            return float('nan')
-        if numerator is None:
-            reasons['missing_key'] = reasons.get('missing_key', 0) + 1
-            add_warning(warnings_dict, 'MISSING_KEY', f"{key}: numer=None")
-            return float('nan')
-        return float(numerator) / float(denominator)
-    except Exception as e:
-        reasons['parse_fail'] = reasons.get('parse_fail', 0) + 1
-        add_warning(warnings_dict, 'PARSE_FAIL', f"{key}: {type(e).__name__}")
-        return float('nan')
-
-
 def nan_to_null(value: Any) -> Any:
     """Convert NaN/inf/-inf to None for JSON serialization."""
     if isinstance(value, float):
@@ -100,17 +70,328 @@ def serialize_safe(obj: Any) -> Any:
 
 
 def compute_code_fingerprint() -> str:
-    """Compute a simple fingerprint of this script."""
+    """Compute a simple fingerprint of this script and the ease helpers it uses."""
     try:
         script_path = pathlib.Path(__file__)
-        if script_path.exists():
-            content = script_path.read_bytes()
+        ease_path = _project_root / 'modules' / 'fitting' / 'ease.py'
+        if script_path.exists() and ease_path.exists():
+            content = script_path.read_bytes() + ease_path.read_bytes()
             return hashlib.sha256(content).hexdigest()[:16]
     except Exception:
         pass
     return "unknown"
 
 
+def record_ease_key_issues(
+    key: str,
+    garment_val: Any,
+    body_val: Any,
+    garment_valid: bool,
+    body_valid: bool,
+    zero_division: bool,
+    reasons: Dict[str, int],
+    ease_warnings: Dict[str, List[str]],
+) -> bool:
+    """
+    MISSING_KEY / ZERO_DIVISION reasons and warnings of one ease key (single and batch mode).
+
+    Returns True if both values are valid (the key counts as used).
+    """
+    if not garment_valid:
+        reasons['missing_key'] = reasons.get('missing_key', 0) + 1
+        add_warning(ease_warnings, 'MISSING_KEY', f"garment.{key}={garment_val}")
+    if not body_valid:
+        reasons['missing_key'] = reasons.get('missing_key', 0) + 1
+        add_warning(ease_warnings, 'MISSING_KEY', f"body.{key}={body_val}")
+    if zero_division:
+        reasons['zero_division'] = reasons.get('zero_division', 0) + 1
+        add_warning(ease_warnings, 'ZERO_DIVISION', f"{key}: denom={body_val}")
+    return garment_valid and body_valid
+
+
+def build_summaries(
+    ease_ratios: Dict[str, float],
+    ease_warnings: Dict[str, List[str]],
+    global_warnings: Dict[str, List[str]],
+    reasons: Dict[str, int],
+    has_body: bool,
+    has_garment: bool,
+    used_keys: List[str],
+    provenance: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Build (fitting_summary, facts_summary) for one body/garment pair."""
+    nan_count = sum(1 for v in ease_ratios.values() if isinstance(v, float) and math.isnan(v))
+    total_count = len(ease_ratios)
+    nan_rate_val = nan_count / total_count if total_count > 0 else 0.0
+
+    # fitting_summary.json
+    fitting_summary = {
+        "schema_version": "fitting_summary.v0",
+        "metrics": {
+            "bust_ease_ratio": ease_ratios.get('bust_ease_ratio', float('nan')),
+            "waist_ease_ratio": ease_ratios.get('waist_ease_ratio', float('nan')),
+            "hip_ease_ratio": ease_ratios.get('hip_ease_ratio', float('nan'))
+        },
+        "warnings": ease_warnings,
+        "provenance": provenance
+    }
+
+    # facts_summary.json
+    facts_summary = {
+        "schema_version": "facts_summary.v0",
+        "coverage": {
+            "has_body_measurements": has_body,
+            "has_garment_measurements": has_garment,
+            "used_keys": used_keys
+        },
+        "nan_count": {
+            "total": total_count,
+            "nan": nan_count
+        },
+        "nan_rate": nan_rate_val,
+        "reasons": reasons,
+        "warnings": {**global_warnings, **ease_warnings},
+        "provenance": provenance
+    }
+    return fitting_summary, facts_summary
+
+
+def write_json_safe(path: pathlib.Path, obj: Any, indent: Optional[int] = 2) -> None:
+    """Write JSON with NaN->null conversion; failures are reported, never raised."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(serialize_safe(obj), f, indent=indent, ensure_ascii=False)
+    except Exception as e:
+        print(f"Warning: Failed to write {path.name}: {e}", file=sys.stderr)
+
+
+def write_summaries(out_path: pathlib.Path, fitting_summary: Dict[str, Any], facts_summary: Dict[str, Any]) -> None:
+    """Write fitting_summary.json and facts_summary.json."""
+    write_json_safe(out_path / 'fitting_summary.json', fitting_summary)
+    write_json_safe(out_path / 'facts_summary.json', facts_summary)
+
+
+def load_measurement_source(path: Optional[str], label: str) -> Dict[str, Any]:
+    """
+    Load one measurement file for batch mode (each path is loaded once per batch).
+
+    Returns: {"has_data", "raw_values" (EASE_KEYS order), "values" (float array, NaN if invalid),
+              "reasons", "warnings"}
+    """
+    reasons: Dict[str, int] = {}
+    warnings_dict: Dict[str, List[str]] = {}
+    data = safe_load_json(path, reasons, warnings_dict) if path else {}
+    measurements, _ = extract_measurements(data, reasons, warnings_dict, label)
+    raw_values = [measurements.get(key) for key in EASE_KEYS]
+    values = np.array([float(v) if is_valid_number(v) else np.nan for v in raw_values], dtype=np.float64)
+    return {
+        "has_data": bool(data),
+        "raw_values": raw_values,
+        "values": values,
+        "reasons": reasons,
+        "warnings": warnings_dict,
+    }
+
+
+def _source_id(item: Dict[str, Any], path_key: str, id_key: str = 'id') -> str:
+    if item.get(id_key) is not None:
+        return str(item[id_key])
+    path = item.get(path_key)
+    return pathlib.Path(path).stem if path else "none"
+
+
+def _safe_pair_id(pair_id: str) -> str:
+    return ''.join(c if c.isalnum() or c in '._-' else '_' for c in pair_id) or "pair"
+
+
+def expand_batch_pairs(inputs: Dict[str, Any], warnings_dict: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """
+    Expand a batch manifest's inputs into a pair list (explicit "pairs", or body_set x garment_set).
+
+    Pair ids are sanitized for use as directory names and made unique.
+    """
+    pairs: List[Dict[str, Any]] = []
+    if 'pairs' in inputs:
+        for i, item in enumerate(inputs.get('pairs') or []):
+            pairs.append({
+                "pair_id": str(item.get('pair_id', f"pair_{i:05d}")),
+                "body_id": _source_id(item, 'body_measurements_path', 'body_id'),
+                "garment_id": _source_id(item, 'garment_measurements_path', 'garment_id'),
+                "body_measurements_path": item.get('body_measurements_path'),
+                "garment_measurements_path": item.get('garment_measurements_path'),
+            })
+    elif 'body_set' in inputs or 'garment_set' in inputs:
+        for body in inputs.get('body_set') or []:
+            body_id = _source_id(body, 'body_measurements_path')
+            for garment in inputs.get('garment_set') or []:
+                garment_id = _source_id(garment, 'garment_measurements_path')
+                pairs.append({
+                    "pair_id": f"{body_id}__{garment_id}",
+                    "body_id": body_id,
+                    "garment_id": garment_id,
+                    "body_measurements_path": body.get('body_measurements_path'),
+                    "garment_measurements_path": garment.get('garment_measurements_path'),
+                })
+    else:
+        add_warning(warnings_dict, 'MISSING_INPUT', "batch manifest has neither 'pairs' nor 'body_set'/'garment_set'")
+
+    seen = set()
+    for i, pair in enumerate(pairs):
+        pair_id = _safe_pair_id(pair['pair_id'])
+        if pair_id in seen:
+            add_warning(warnings_dict, 'DUPLICATE_PAIR_ID', f"{pair_id} (pair {i})")
+            pair_id = f"{pair_id}__{i}"
+        seen.add(pair_id)
+        pair['pair_id'] = pair_id
+    return pairs
+
+
+def compute_ease_ratio_arrays(body_values: np.ndarray, garment_values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorized ease ratios garment / body over all pairs.
+
+    Args:
+        body_values, garment_values: (P, len(EASE_KEYS)) float arrays, NaN where invalid
+    Returns:
+        {"ratios", "body_valid", "garment_valid", "zero_division"}, each (P, len(EASE_KEYS))
+    """
+    body_valid = ~np.isnan(body_values)
+    garment_valid = ~np.isnan(garment_values)
+    both = body_valid & garment_valid
+    zero_division = both & (body_values == 0)
+    ratios = np.full(body_values.shape, np.nan, dtype=np.float64)
+    np.divide(garment_values, body_values, out=ratios, where=both & ~zero_division)
+    return {
+        "ratios": ratios,
+        "body_valid": body_valid,
+        "garment_valid": garment_valid,
+        "zero_division": zero_division,
+    }
+
+
+def run_batch(
+    manifest: Dict[str, Any],
+    manifest_path: str,
+    out_dir: str,
+    reasons: Dict[str, int],
+    global_warnings: Dict[str, List[str]],
+) -> Dict[str, Any]:
+    """Evaluate all pairs of a fitting_batch_manifest.v0 in one process. Returns the batch summary."""
+    t0 = time.perf_counter()
+    inputs = manifest.get('inputs', {})
+    units = inputs.get('units')
+    if units and units != 'm':
+        add_warning(global_warnings, 'UNITS_MISMATCH', f"manifest units='{units}' (expected 'm')")
+
+    pairs = expand_batch_pairs(inputs, global_warnings)
+
+    # Load each measurement file once
+    sources: List[Dict[str, Any]] = []
+    source_index: Dict[Tuple[str, Optional[str]], int] = {}
+
+    def source(label: str, path: Optional[str]) -> int:
+        key = (label, path)
+        if key not in source_index:
+            source_index[key] = len(sources)
+            sources.append(load_measurement_source(path, label))
+        return source_index[key]
+
+    bi = np.array([source('body', p['body_measurements_path']) for p in pairs], dtype=np.int64)
+    gi = np.array([source('garment', p['garment_measurements_path']) for p in pairs], dtype=np.int64)
+    values = np.stack([s['values'] for s in sources]) if sources else np.zeros((0, len(EASE_KEYS)))
+    ease = compute_ease_ratio_arrays(values[bi], values[gi])
+    ratios = ease['ratios']
+    nan_per_pair = np.isnan(ratios).sum(axis=1)
+
+    out_path = pathlib.Path(out_dir)
+    try:
+        (out_path / 'pairs').mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        add_warning(global_warnings, 'IO_ERROR', f"mkdir {out_dir}: {type(e).__name__}")
+
+    # Hash the code once for the whole batch
+    code_fingerprint = compute_code_fingerprint()
+    manifest_resolved = str(pathlib.Path(manifest_path).resolve())
+
+    total_reasons = dict(reasons)
+    for i, pair in enumerate(pairs):
+        body, garment = sources[bi[i]], sources[gi[i]]
+        pair_reasons: Dict[str, int] = {'missing_input': 0, 'parse_fail': 0, 'zero_division': 0, 'missing_key': 0}
+        pair_warnings: Dict[str, List[str]] = {}
+        for src in (body, garment):
+            for code, n in src['reasons'].items():
+                pair_reasons[code] = pair_reasons.get(code, 0) + n
+            for code, messages in src['warnings'].items():
+                for message in messages:
+                    add_warning(pair_warnings, code, message)
+
+        ease_warnings: Dict[str, List[str]] = {}
+        used_keys = []
+        for j, key in enumerate(EASE_KEYS):
+            if record_ease_key_issues(
+                key, garment['raw_values'][j], body['raw_values'][j],
+                bool(ease['garment_valid'][i, j]), bool(ease['body_valid'][i, j]),
+                bool(ease['zero_division'][i, j]), pair_reasons, ease_warnings,
+            ):
+                used_keys.append(key)
+        for code, n in pair_reasons.items():
+            total_reasons[code] = total_reasons.get(code, 0) + n
+
+        provenance = {
+            "manifest_path": manifest_resolved,
+            "code_fingerprint": code_fingerprint,
+            "pair_id": pair['pair_id'],
+        }
+        ease_ratios = {f'{key}_ease_ratio': float(ratios[i, j]) for j, key in enumerate(EASE_KEYS)}
+        fitting_summary, facts_summary = build_summaries(
+            ease_ratios, ease_warnings, pair_warnings, pair_reasons,
+            body['has_data'], garment['has_data'], used_keys, provenance,
+        )
+        pair_dir = out_path / 'pairs' / pair['pair_id']
+        try:
+            pair_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            add_warning(global_warnings, 'IO_ERROR', f"mkdir {pair_dir}: {type(e).__name__}")
+        write_summaries(pair_dir, fitting_summary, facts_summary)
+
+    # One columnar file for all pairs
+    columns: Dict[str, List[Any]] = {
+        "pair_id": [p['pair_id'] for p in pairs],
+        "body_id": [p['body_id'] for p in pairs],
+        "garment_id": [p['garment_id'] for p in pairs],
+    }
+    for j, key in enumerate(EASE_KEYS):
+        columns[f'{key}_ease_ratio'] = ratios[:, j].tolist()
+    columns['nan_count'] = nan_per_pair.tolist()
+    provenance = {"manifest_path": manifest_resolved, "code_fingerprint": code_fingerprint}
+    write_json_safe(out_path / 'fitting_batch_columns.json', {
+        "schema_version": "fitting_batch_columns.v0",
+        "n_pairs": len(pairs),
+        "columns": columns,
+        "provenance": provenance,
+    }, indent=None)
+
+    total_count = int(ratios.size)
+    nan_count = int(nan_per_pair.sum())
+    batch_summary = {
+        "schema_version": "fitting_batch_summary.v0",
+        "n_pairs": len(pairs),
+        "n_sources": len(sources),
+        "nan_count": {"total": total_count, "nan": nan_count},
+        "nan_count_by_key": {key: int(np.isnan(ratios[:, j]).sum()) for j, key in enumerate(EASE_KEYS)},
+        "nan_rate": nan_count / total_count if total_count > 0 else 0.0,
+        "reasons": total_reasons,
+        "warnings": global_warnings,
+        "provenance": provenance,
+    }
+    write_json_safe(out_path / 'fitting_batch_summary.json', batch_summary)
+
+    print(f"Output written to: {out_path}")
+    print(f"Pairs: {len(pairs)} (sources loaded: {len(sources)}) in {time.perf_counter() - t0:.2f}s")
+    print(f"NaN rate: {batch_summary['nan_rate']:.2%} ({nan_count}/{total_count})")
+    return batch_summary
+
+
 def main():
     parser = argparse.ArgumentParser(description='Run fitting v0 facts-only (Round4)')
     parser.add_argument('--manifest', required=True, help='Path to fitting manifest JSON')
@@ -125,6 +406,10 @@ def main():
     if not manifest:
         add_warning(global_warnings, 'PARSE_FAIL', "Manifest is empty")
 
+    if manifest.get('schema_version') == BATCH_SCHEMA_VERSION:
+        run_batch(manifest, args.manifest, args.out_dir, reasons, global_warnings)
+        sys.exit(0)
+
     # Validate schema_version
     schema_ver = manifest.get('schema_version')
     if schema_ver != 'fitting_manifest.v0':
@@ -170,27 +455,23 @@ def main():
     # Calculate ease ratios
     ease_warnings: Dict[str, List[str]] = {}
     ease_ratios = {}
-    keys_of_interest = ['bust', 'waist', 'hip']
     used_keys = []
 
-    for key in keys_of_interest:
+    for key in EASE_KEYS:
         garment_val = garment_measurements.get(key)
         body_val = body_measurements.get(key)
 
         # Validate that values are numeric, not None/NaN
-        garment_valid = garment_val is not None and (isinstance(garment_val, (int, float)) and not math.isnan(garment_val))
-        body_valid = body_val is not None and (isinstance(body_val, (int, float)) and not math.isnan(body_val))
-
-        if not garment_valid:
-            reasons['missing_key'] = reasons.get('missing_key', 0) + 1
-            add_warning(ease_warnings, 'MISSING_KEY', f"garment.{key}={garment_val}")
-        if not body_valid:
-            reasons['missing_key'] = reasons.get('missing_key', 0) + 1
-            add_warning(ease_warnings, 'MISSING_KEY', f"body.{key}={body_val}")
-
-        if garment_valid and body_valid:
-            ratio = safe_divide(garment_val, body_val, reasons, ease_warnings, key)
+        garment_valid = is_valid_number(garment_val)
+        body_valid = is_valid_number(body_val)
+        zero_division = garment_valid and body_valid and body_val == 0
+
+        if record_ease_key_issues(
+            key, garment_val, body_val, garment_valid, body_valid, zero_division, reasons, ease_warnings
+        ):
             used_keys.append(key)
+        if garment_valid and body_valid and not zero_division:
+            ratio = float(garment_val) / float(body_val)
         else:
             ratio = float('nan')
 
@@ -215,52 +496,10 @@ def main():
         "code_fingerprint": code_fingerprint
     }
 
-    # fitting_summary.json
-    fitting_summary = {
-        "schema_version": "fitting_summary.v0",
-        "metrics": {
-            "bust_ease_ratio": ease_ratios.get('bust_ease_ratio', float('nan')),
-            "waist_ease_ratio": ease_ratios.get('waist_ease_ratio', float('nan')),
-            "hip_ease_ratio": ease_ratios.get('hip_ease_ratio', float('nan'))
-        },
-        "warnings": ease_warnings,
-        "provenance": provenance
-    }
-
-    # facts_summary.json
-    facts_summary = {
-        "schema_version": "facts_summary.v0",
-        "coverage": {
-            "has_body_measurements": has_body,
-            "has_garment_measurements": has_garment,
-            "used_keys": used_keys
-        },
-        "nan_count": {
-            "total": total_count,
-            "nan": nan_count
-        },
-        "nan_rate": nan_rate_val,
-        "reasons": reasons,
-        "warnings": {**global_warnings, **ease_warnings},
-        "provenance": provenance
-    }
-
-    # Serialize with NaN->null conversion
-    fitting_summary_safe = serialize_safe(fitting_summary)
-    facts_summary_safe = serialize_safe(facts_summary)
-
-    # Write outputs
-    try:
-        with open(out_path / 'fitting_summary.json', 'w', encoding='utf-8') as f:
-            json.dump(fitting_summary_safe, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"Warning: Failed to write fitting_summary.json: {e}", file=sys.stderr)
-
-    try:
-        with open(out_path / 'facts_summary.json', 'w', encoding='utf-8') as f:
-            json.dump(facts_summary_safe, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"Warning: Failed to write facts_summary.json: {e}", file=sys.stderr)
+    fitting_summary, facts_summary = build_summaries(
+        ease_ratios, ease_warnings, global_warnings, reasons, has_body, has_garment, used_keys, provenance
+    )
+    write_summaries(out_path, fitting_summary, facts_summary)
 
     print(f"Output written to: {out_path}")
     print(f"NaN rate: {nan_rate_val:.2%} ({nan_count}/{total_count})")
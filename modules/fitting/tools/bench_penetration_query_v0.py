@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Penetration Query Benchmark (fitting Tier-0 SDF bank)
+
+Purpose: Record query_penetration() time as garment vertex count scales, against the
+per-attempt CPU budget.
+- default grids: analytic sphere SDF (r = 0.1 m, 2 mm voxels, 10 mm band) split into
+  front/back ROIs, garment vertices scattered around the surface
+- --bank_dir + --prototype_id: real bank grids, garment vertices from --garment_npz (verts)
+Reports min/median per size; exits 1 if the median of the largest size exceeds --budget_ms.
+
+Usage:
+    python modules/fitting/tools/bench_penetration_query_v0.py
+    python modules/fitting/tools/bench_penetration_query_v0.py --sizes 10000 50000 200000 --out bench.json
+    python modules/fitting/tools/bench_penetration_query_v0.py --bank_dir data/sdf_bank --prototype_id M_h3_b2_a1 --garment_npz shirt.npz
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
+# Bootstrap: Add project root to sys.path
+_project_root = Path(__file__).resolve().parents[3]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from modules.fitting.penetration_query import query_penetration
+from modules.fitting.sdf_bank import SDFBank, SDFGrid
+
+# CPU budget for one 50k-vertex attempt
+QUERY_BUDGET_MS = 1500.0
+
+
+def sphere_grid(name: str, box_min, box_max, radius: float = 0.1, h: float = 0.002, band: float = 0.01) -> SDFGrid:
+    """Analytic sphere SDF (centred at the origin) clamped to the band, float16."""
+    origin = np.asarray(box_min, dtype=np.float64)
+    shape = tuple(int(round(s)) + 1 for s in (np.asarray(box_max) - origin) / h)
+    pts = origin + np.indices(shape).reshape(3, -1).T * h
+    values = np.clip(np.linalg.norm(pts, axis=1) - radius, -band, band).astype(np.float16)
+    return SDFGrid(roi=name, origin=origin, voxel_size_m=h, band_m=band, values=values.reshape(shape))
+
+
+def synthetic_case(n_max: int) -> Tuple[Dict[str, SDFGrid], np.ndarray]:
+    grids = {
+        "front": sphere_grid("front", (-0.11, -0.11, 0.0), (0.11, 0.11, 0.12)),
+        "back": sphere_grid("back", (-0.11, -0.11, -0.12), (0.11, 0.11, 0.0)),
+    }
+    rng = np.random.default_rng(1)
+    d = rng.normal(size=(n_max, 3))
+    verts = d / np.linalg.norm(d, axis=1, keepdims=True) * rng.uniform(0.095, 0.105, (n_max, 1))
+    return grids, verts
+
+
+def bench(grids: Dict[str, SDFGrid], verts: np.ndarray, sizes: List[int], repeats: int) -> List[Dict[str, Any]]:
+    rows = []
+    query_penetration(grids, verts[:100])  # warm-up
+    for size in sizes:
+        sub = verts[:size]
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            res = query_penetration(grids, sub)
+            times.append(time.perf_counter() - t0)
+        rows.append({
+            "n_vertices": int(sub.shape[0]),
+            "n_in_rois": int(sum(r.n_vertices for r in res.values())),
+            "n_penetrating": int(sum(r.n_penetrating for r in res.values())),
+            "time_ms_min": min(times) * 1000.0,
+            "time_ms_median": float(np.median(times)) * 1000.0,
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ROI penetration queries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000], help="Garment vertex counts")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per size")
+    parser.add_argument("--bank_dir", type=str, default=None, help="SDF bank (default: analytic sphere grids)")
+    parser.add_argument("--prototype_id", type=str, default=None, help="Prototype to fetch from --bank_dir")
+    parser.add_argument("--garment_npz", type=str, default=None, help="Garment vertices NPZ (verts) for --bank_dir")
+    parser.add_argument("--budget_ms", type=float, default=QUERY_BUDGET_MS, help="Median budget of the largest size")
+    parser.add_argument("--out", type=str, default=None, help="Write results JSON")
+    args = parser.parse_args()
+
+    if args.bank_dir:
+        if not (args.prototype_id and args.garment_npz):
+            parser.error("--bank_dir needs --prototype_id and --garment_npz")
+        grids = SDFBank(args.bank_dir).fetch(args.prototype_id)
+        with np.load(args.garment_npz) as npz:
+            verts = np.asarray(npz["verts"], dtype=np.float32)
+        sizes = [min(s, verts.shape[0]) for s in args.sizes]
+        source = {"bank_dir": str(Path(args.bank_dir).resolve()), "prototype_id": args.prototype_id,
+                  "garment_npz": str(Path(args.garment_npz).resolve())}
+    else:
+        grids, verts = synthetic_case(max(args.sizes))
+        sizes = args.sizes
+        source = "synthetic_sphere"
+
+    rows = bench(grids, verts, sizes, args.repeats)
+    largest = max(rows, key=lambda row: row["n_vertices"])
+    within_budget = largest["time_ms_median"] < args.budget_ms
+    for row in rows:
+        print(f"{row['n_vertices']:>8} verts  in_rois={row['n_in_rois']:>8}  penetrating={row['n_penetrating']:>7}  "
+              f"min={row['time_ms_min']:8.1f} ms  median={row['time_ms_median']:8.1f} ms")
+    print(f"median {largest['time_ms_median']:.1f} ms at {largest['n_vertices']} verts vs budget "
+          f"{args.budget_ms} ms: {'within' if within_budget else 'OVER'} budget")
+
+    if args.out:
+        result = {
+            "source": source,
+            "rois": sorted(grids.keys()),
+            "budget_ms": args.budget_ms,
+            "within_budget": within_budget,
+            "results": rows,
+        }
+        Path(args.out).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
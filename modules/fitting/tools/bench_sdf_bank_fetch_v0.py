@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+SDF Bank Fetch Benchmark (fitting Tier-0 SDF bank)
+
+Purpose: Record SDFBank.fetch() latency per prototype, cold (first fetch after evict:
+index lookup + memmap views) and warm (cached views), against the warm-fetch budget.
+- default bank: one synthetic entry built from a UV sphere into a temp dir
+- --bank_dir: existing bank (every prototype in its index, or --prototype_ids)
+Reports p50/p95 per mode; exits 1 if the warm p95 exceeds --budget_ms.
+
+Usage:
+    python modules/fitting/tools/bench_sdf_bank_fetch_v0.py
+    python modules/fitting/tools/bench_sdf_bank_fetch_v0.py --bank_dir data/sdf_bank --repeats 200 --out bench.json
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
+# Bootstrap: Add project root to sys.path
+_project_root = Path(__file__).resolve().parents[3]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from modules.fitting.sdf_bank import SDF_BANK_VERSION, SDFBank, build_sdf_bank_entry, shirt_rois
+
+# Warm-cache fetch budget (p95)
+WARM_FETCH_BUDGET_MS = 20.0
+
+
+def uv_sphere(radius: float, n_lat: int, n_lon: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Closed UV sphere mesh centred at the origin."""
+    theta = np.linspace(0, np.pi, n_lat + 1)[1:-1]
+    phi = np.linspace(0, 2 * np.pi, n_lon, endpoint=False)
+    t, p = np.meshgrid(theta, phi, indexing="ij")
+    ring = np.stack([np.sin(t) * np.cos(p), np.cos(t), np.sin(t) * np.sin(p)], axis=-1).reshape(-1, 3)
+    verts = np.vstack([[0, 1, 0], ring, [0, -1, 0]]) * radius
+    faces = []
+    idx = lambda i, j: 1 + i * n_lon + (j % n_lon)  # noqa: E731
+    last = verts.shape[0] - 1
+    for j in range(n_lon):
+        faces.append((0, idx(0, j + 1), idx(0, j)))
+        faces.append((last, idx(n_lat - 2, j), idx(n_lat - 2, j + 1)))
+        for i in range(n_lat - 2):
+            faces.append((idx(i, j), idx(i, j + 1), idx(i + 1, j)))
+            faces.append((idx(i, j + 1), idx(i + 1, j + 1), idx(i + 1, j)))
+    return verts, np.asarray(faces, dtype=np.int64)
+
+
+def _percentiles_ms(times: List[float]) -> Dict[str, float]:
+    t = np.asarray(times, dtype=np.float64) * 1000.0
+    return {"p50_ms": float(np.percentile(t, 50)), "p95_ms": float(np.percentile(t, 95))}
+
+
+def bench(bank: SDFBank, prototype_ids: List[str], repeats: int) -> List[Dict[str, Any]]:
+    rows = []
+    for prototype_id in prototype_ids:
+        cold, warm = [], []
+        for _ in range(repeats):
+            bank.evict(prototype_id)
+            t0 = time.perf_counter()
+            grids = bank.fetch(prototype_id)
+            cold.append(time.perf_counter() - t0)
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            bank.fetch(prototype_id)
+            warm.append(time.perf_counter() - t0)
+        rows.append({
+            "prototype_id": prototype_id,
+            "n_rois": len(grids),
+            "n_voxels": int(sum(g.values.size for g in grids.values())),
+            "cold": _percentiles_ms(cold),
+            "warm": _percentiles_ms(warm),
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SDF bank fetch latency")
+    parser.add_argument("--bank_dir", type=str, default=None, help="Existing SDF bank (default: synthetic)")
+    parser.add_argument("--prototype_ids", type=str, nargs="*", default=None, help="Only these prototypes")
+    parser.add_argument("--repeats", type=int, default=50, help="Timed fetches per mode and prototype")
+    parser.add_argument("--budget_ms", type=float, default=WARM_FETCH_BUDGET_MS, help="Warm fetch p95 budget")
+    parser.add_argument("--out", type=str, default=None, help="Write results JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.bank_dir:
+            bank_dir = args.bank_dir
+        else:
+            bank_dir = tmp
+            verts, faces = uv_sphere(0.15, 60, 60)
+            build_sdf_bank_entry(bank_dir, "synthetic_sphere", verts, faces, rois=shirt_rois(verts))
+        bank = SDFBank(bank_dir)
+        prototype_ids = args.prototype_ids or bank.prototype_ids
+        rows = bench(bank, prototype_ids, args.repeats)
+
+    worst_warm_p95 = max(row["warm"]["p95_ms"] for row in rows)
+    within_budget = worst_warm_p95 < args.budget_ms
+    for row in rows:
+        print(f"{row['prototype_id']:>20}  rois={row['n_rois']}  voxels={row['n_voxels']:>9}  "
+              f"cold p50={row['cold']['p50_ms']:7.3f} ms p95={row['cold']['p95_ms']:7.3f} ms  "
+              f"warm p50={row['warm']['p50_ms']:7.4f} ms p95={row['warm']['p95_ms']:7.4f} ms")
+    print(f"warm p95 {worst_warm_p95:.4f} ms vs budget {args.budget_ms} ms: "
+          f"{'within' if within_budget else 'OVER'} budget")
+
+    if args.out:
+        result = {
+            "sdf_bank_version": SDF_BANK_VERSION,
+            "bank_dir": str(Path(args.bank_dir).resolve()) if args.bank_dir else "synthetic_sphere",
+            "budget_ms": args.budget_ms,
+            "within_budget": within_budget,
+            "results": rows,
+        }
+        Path(args.out).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
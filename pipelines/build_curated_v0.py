@@ -9,15 +9,21 @@ This pipeline:
 4. Handles outliers (if rules exist) or records warnings
 5. Handles missing values (NaN + warnings)
 
+--streaming runs the same steps per row chunk and appends each chunk to the output
+(build_curated_v0_streaming): raw/intermediate frames are bounded by --chunk-rows, and the
+whole-source checks keep per-column counts plus the meter-key values their percentiles need.
+
 Contract: docs/data/curated_v0_plan.md
 """
 
 import argparse
+import codecs
 import json
+import os
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 from collections import defaultdict
 import sys
 import re
@@ -26,6 +32,17 @@ import re
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from data.ingestion import canonicalize_units_to_m
 
+# Optional: pyarrow for appending Parquet row groups in the streaming build and for
+# dictionary-encoding string columns in parse_numeric_frame_7th
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+
 
 # Source file mapping
 SOURCE_FILES = {
@@ -41,6 +58,56 @@ HEADER_ROWS = {
     "8th_3d": 6,
 }
 
+# Default rows per chunk for the streaming build (--streaming)
+STREAM_CHUNK_ROWS = 20000
+
+# Columns written as strings by the streaming build; every other output column is float64
+STREAM_STRING_COLUMNS = ('HUMAN_ID', 'SEX', '_source')
+
+# Counts rendered as an optional ", <name>=<n>" details suffix (only when > 0)
+COUNT_DETAILS_SUFFIXES = ('coercion_nan_increase',)
+
+
+def render_counted_details(template: str, counts: Dict[str, int]) -> str:
+    """Render a counted_details template (plus optional COUNT_DETAILS_SUFFIXES) with counts."""
+    details = template.format(**counts)
+    for name in COUNT_DETAILS_SUFFIXES:
+        if counts.get(name, 0) > 0:
+            details += f", {name}={counts[name]}"
+    return details
+
+
+def counted_details(template: str, **counts: Any) -> Dict[str, Any]:
+    """
+    Warning fields for details that carry row counts.
+    
+    Besides the rendered "details", the template and counts are kept in the private
+    "_details_template"/"_details_counts" fields so the streaming build can sum per-chunk
+    counts (merge_chunk_warnings) without parsing text. Private fields are dropped when
+    warnings are written.
+    """
+    counts = {name: int(value) for name, value in counts.items()}
+    return {
+        "details": render_counted_details(template, counts),
+        "_details_template": template,
+        "_details_counts": counts
+    }
+
+
+def canonicalization_details(message: str, values: np.ndarray, coercion_nan_increase: int = 0) -> Dict[str, Any]:
+    """
+    counted_details for a canonicalize_units_to_m message (PROVENANCE or UNIT_FAIL).
+    
+    The UNIT_FAIL count is recounted from values the way canonicalize_units_to_m counts it
+    (non-finite values); other messages carry no counts of their own.
+    """
+    if message.startswith("UNIT_FAIL") and "inf/-inf" in message:
+        invalid_count = np.sum(~np.isfinite(np.asarray(values, dtype=np.float64)))
+        return counted_details("UNIT_FAIL: {invalid_count} invalid value(s) (inf/-inf) detected",
+                               invalid_count=invalid_count, coercion_nan_increase=coercion_nan_increase)
+    template = message.replace('{', '{{').replace('}', '}}')
+    return counted_details(template, coercion_nan_increase=coercion_nan_increase)
+
 
 def find_header_rows(file_path: Path, mapping: Dict[str, Any], is_xlsx: bool = False, 
                      source_key: str = None, max_check: int = 20) -> tuple[int, Optional[int], Optional[int]]:
@@ -182,6 +249,10 @@ def find_header_row(file_path: Path, mapping: Dict[str, Any], encoding: str = 'u
     return primary_row
 
 
+# 7th European decimal comma pattern (rule A of parse_numeric_string_7th)
+DECIMAL_COMMA_7TH_PATTERN = r'^[+-]?\d{1,4},\d+$'
+
+
 def parse_numeric_string_7th(value: str) -> str:
     """
     Parse numeric string with 7th-specific comma handling strategy.
@@ -216,7 +287,7 @@ def parse_numeric_string_7th(value: str) -> str:
     # A) European decimal comma pattern: ^[+-]?\d{1,4},\d+$
     # Matches: "245,0", "920,0", "79,5", "1234,56" (1-4 digits before comma, any digits after)
     # This prevents 10x scale errors (e.g., "920,0" -> "920.0", not "9200")
-    decimal_comma_pattern = r'^[+-]?\d{1,4},\d+$'
+    decimal_comma_pattern = DECIMAL_COMMA_7TH_PATTERN
     if re.match(decimal_comma_pattern, s):
         # Decimal comma: replace with dot
         return s.replace(',', '.')
@@ -240,6 +311,137 @@ def parse_numeric_string_7th(value: str) -> str:
     return s.replace(',', '')
 
 
+def _parse_comma_cells_7th(cleaned: pd.Series) -> pd.Series:
+    """Apply rules A-E of parse_numeric_string_7th to already str/stripped cells."""
+    has_comma = cleaned.str.contains(',', regex=False).to_numpy(dtype=bool)
+    if not has_comma.any():
+        return cleaned
+
+    comma_cells = cleaned[has_comma]
+    is_decimal = comma_cells.str.match(DECIMAL_COMMA_7TH_PATTERN).to_numpy(dtype=bool)
+    parsed = np.where(
+        is_decimal,
+        comma_cells.str.replace(',', '.', regex=False).to_numpy(dtype=object),
+        comma_cells.str.replace(',', '', regex=False).to_numpy(dtype=object),
+    )
+    result = cleaned.copy()
+    result[has_comma] = parsed
+    return result
+
+
+def parse_numeric_series_7th(series: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_numeric_string_7th over a whole column.
+
+    Equivalent to series.astype(str).str.strip().apply(parse_numeric_string_7th):
+    only cells containing a comma are touched; those matching the European decimal
+    comma pattern (A) get ',' -> '.', every other comma cell (B/C/E) has ',' removed.
+
+    Measurement columns repeat values heavily, so float/int columns and pure-string
+    object columns are parsed once per unique value (floats keyed by bit pattern so
+    0.0/-0.0 keep distinct reprs) and expanded back; other dtypes take the direct path.
+
+    Args:
+        series: Column in any dtype (XLSX numeric or object)
+
+    Returns:
+        Object Series of parsed strings, same index
+    """
+    values = series.to_numpy()
+    kind = values.dtype.kind
+    if kind == 'f':
+        keys = values.view(f'i{values.dtype.itemsize}')
+    elif kind in 'iu' or (kind == 'O' and pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty')):
+        keys = values
+    else:
+        return _parse_comma_cells_7th(series.astype(str).str.strip())
+
+    codes, uniques = pd.factorize(keys)
+    if kind == 'f':
+        uniques = uniques.view(values.dtype)
+    parsed_uniques = _parse_comma_cells_7th(pd.Series(uniques).astype(str).str.strip()).to_numpy(dtype=object)
+    missing = codes < 0
+    parsed = np.empty(len(codes), dtype=object)
+    parsed[~missing] = parsed_uniques[codes[~missing]]
+    if missing.any():
+        # None/NaN cells in object columns: factorize drops them, str() keeps 'None'/'nan'
+        parsed[missing] = series[missing].astype(str).to_numpy(dtype=object)
+    return pd.Series(parsed, index=series.index, dtype=object)
+
+
+def _frame_pool_key_7th(series: pd.Series) -> Optional[str]:
+    """Pool for parse_numeric_frame_7th: one per float/int dtype, one for string columns."""
+    if isinstance(series.dtype, pd.StringDtype):
+        return 'str'
+    kind = series.dtype.kind
+    if kind in 'fiu':
+        return series.dtype.str
+    if kind == 'O' and pd.api.types.infer_dtype(series.to_numpy(), skipna=True) in ('string', 'empty'):
+        return 'str'
+    return None
+
+
+def _factorize_string_pool_7th(pool: List[pd.Series]) -> Tuple[np.ndarray, np.ndarray]:
+    """(codes per cell of the concatenated columns, -1 = missing; unique strings) of a string pool."""
+    if pa is not None:
+        # Arrow-backed columns are encoded without converting cells to Python objects
+        chunks = [pa.array(series, from_pandas=True).cast(pa.large_string()) for series in pool]
+        encoded = pc.dictionary_encode(pa.chunked_array(chunks, type=pa.large_string()))
+        codes = np.concatenate([
+            chunk.indices.fill_null(-1).to_numpy().astype(np.int64) for chunk in encoded.chunks
+        ]) if encoded.num_chunks else np.empty(0, dtype=np.int64)
+        uniques = encoded.chunk(0).dictionary.to_numpy(zero_copy_only=False) if encoded.num_chunks else np.empty(0, dtype=object)
+        return codes, uniques
+    return pd.factorize(np.concatenate([series.to_numpy(dtype=object) for series in pool]))
+
+
+def parse_numeric_frame_7th(df: pd.DataFrame, columns: Iterable[str]) -> Dict[str, pd.Series]:
+    """
+    parse_numeric_series_7th for many columns of one frame, parsing each distinct raw value once.
+
+    Float/int columns (per dtype) and string columns are pooled: the pool's cells are factorized
+    together (string pools via pyarrow dictionary encoding when available), the uniques are
+    str()/stripped/comma-parsed in one pass and the result is sliced back per column, so no
+    column is converted to strings on its own. Columns of other dtypes take
+    parse_numeric_series_7th.
+
+    Returns:
+        {column: object Series of parsed strings, same index}
+    """
+    columns = list(columns)
+    pools: Dict[str, List[str]] = defaultdict(list)
+    result: Dict[str, pd.Series] = {}
+    for col in columns:
+        key = _frame_pool_key_7th(df[col])
+        if key is None:
+            result[col] = parse_numeric_series_7th(df[col])
+        else:
+            pools[key].append(col)
+
+    n_rows = len(df)
+    for key, pool_cols in pools.items():
+        if key == 'str':
+            codes, uniques = _factorize_string_pool_7th([df[col] for col in pool_cols])
+        else:
+            values = np.concatenate([df[col].to_numpy() for col in pool_cols])
+            # Floats keyed by bit pattern so 0.0/-0.0 keep distinct reprs
+            is_float = values.dtype.kind == 'f'
+            codes, uniques = pd.factorize(values.view(f'i{values.dtype.itemsize}') if is_float else values)
+            if is_float:
+                uniques = uniques.view(values.dtype)
+        cells = pd.Series(uniques, dtype=object) if key == 'str' else pd.Series(uniques)
+        parsed_uniques = _parse_comma_cells_7th(cells.astype(str).str.strip()).to_numpy(dtype=object)
+        parsed = parsed_uniques[np.where(codes < 0, 0, codes)] if len(uniques) else np.empty(len(codes), dtype=object)
+        for i, col in enumerate(pool_cols):
+            col_parsed = parsed[i * n_rows:(i + 1) * n_rows]
+            missing = np.flatnonzero(codes[i * n_rows:(i + 1) * n_rows] < 0)
+            if missing.size:
+                # None/NaN cells: factorize drops them; astype(str) as the scalar path
+                col_parsed[missing] = df[col].iloc[missing].astype(str).to_numpy(dtype=object)
+            result[col] = pd.Series(col_parsed, index=df.index, dtype=object)
+    return {col: result[col] for col in columns}
+
+
 def load_mapping_v1(mapping_path: Path) -> Dict[str, Any]:
     """Load sizekorea column mapping (v1 or v2)."""
     with open(mapping_path, 'r', encoding='utf-8') as f:
@@ -346,6 +548,51 @@ def load_raw_file(file_path: Path, header_row: int, secondary_header_row: Option
         return pd.DataFrame()
 
 
+def load_secondary_frame(file_path: Path, secondary_row: Optional[int], data_start_row: int,
+                         is_xlsx: bool = False) -> Optional[pd.DataFrame]:
+    """
+    Load the secondary-header DataFrame (HUMAN_ID/SEX/AGE) with header/code/meta rows dropped.
+    
+    Returns None if there is no secondary header or the read fails.
+    """
+    df_secondary = None
+    if secondary_row is None:
+        return None
+    try:
+        if is_xlsx:
+            df_secondary = pd.read_excel(file_path, header=secondary_row, engine='openpyxl')
+        else:
+            encodings = ['utf-8-sig', 'cp949', 'utf-8']
+            for enc in encodings:
+                try:
+                    df_secondary = pd.read_csv(file_path, encoding=enc, header=secondary_row, low_memory=False)
+                    break
+                except (UnicodeDecodeError, Exception):
+                    continue
+        
+        if df_secondary is not None and len(df_secondary) > 0:
+            # Drop header/code/meta rows from secondary DataFrame as well
+            # After load with header=secondary_row, DataFrame index starts from 0
+            # Original file row (secondary_row + 1) becomes DataFrame index 0
+            # We need to drop rows before data_start_row in original file coordinates
+            # In DataFrame coordinates: drop rows with index < (data_start_row - secondary_row - 1)
+            sec_df_start_idx = data_start_row - secondary_row - 1
+            if sec_df_start_idx > 0:
+                df_secondary = df_secondary.iloc[sec_df_start_idx:].copy().reset_index(drop=True)
+        
+        # Ensure HUMAN_ID/SEX columns are string in secondary
+        if df_secondary is not None:
+            for col in df_secondary.columns:
+                col_str = str(col).strip()
+                if 'ID' in col_str or 'HUMAN_ID' in col_str or '성별' in col_str or 'SEX' in col_str:
+                    df_secondary[col] = df_secondary[col].astype(str).str.strip()
+                    df_secondary[col] = df_secondary[col].str.replace(r'\.0$', '', regex=True)
+    except Exception:
+        df_secondary = None
+    
+    return df_secondary
+
+
 def preprocess_numeric_columns(df: pd.DataFrame, source_key: str, warnings: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     Preprocess numeric columns: remove commas (7th), replace sentinel values.
@@ -359,6 +606,8 @@ def preprocess_numeric_columns(df: pd.DataFrame, source_key: str, warnings: List
     # Identify numeric columns (exclude meta columns)
     meta_cols = ['SEX', 'AGE', 'HUMAN_ID']
     numeric_cols = [col for col in df.columns if col not in meta_cols]
+    # 7th: every distinct raw value of the frame is comma-parsed once (parse_numeric_frame_7th)
+    parsed_7th = parse_numeric_frame_7th(df, numeric_cols) if source_key == '7th' else {}
     
     for col in numeric_cols:
         if col not in df.columns:
@@ -367,17 +616,15 @@ def preprocess_numeric_columns(df: pd.DataFrame, source_key: str, warnings: List
         original_series = df[col]
         
         # 7th: Handle comma-separated numbers (distinguish decimal comma vs thousands separator)
-        # Source-specific parser strategy for 7th only - uses unified parse_numeric_string_7th function
+        # Source-specific parser strategy for 7th only - uses parse_numeric_frame_7th (vectorized parse_numeric_string_7th)
         # CRITICAL: XLSX may auto-convert "920,0" to numeric 9200 (10x error), so we must convert to string first
         # CRITICAL: Apply parser regardless of dtype (numeric or object) to prevent 10x scale errors
         if source_key == '7th':
             # Convert to string first (handles both object and numeric dtype from XLSX)
             # This ensures parser is applied even if Excel already converted "920,0" to 9200
             # dtype 무관 적용: numeric dtype이어도 반드시 string 변환 후 파싱
-            cleaned = original_series.astype(str).str.strip()
-            
             # Apply unified 7th-specific parsing strategy (euro-decimal-comma disambiguation)
-            cleaned = cleaned.apply(parse_numeric_string_7th)
+            cleaned = parsed_7th[col]
             
             try:
                 numeric_series = pd.to_numeric(cleaned, errors='coerce')
@@ -395,7 +642,11 @@ def preprocess_numeric_columns(df: pd.DataFrame, source_key: str, warnings: List
                         "reason": "numeric_parsing_failed",
                         "row_index": None,
                         "original_value": None,
-                        "details": f"{failed_count} values failed to parse after 7th comma parser strategy (euro_decimal_comma vs thousands_comma disambiguation)"
+                        **counted_details(
+                            "{failed_count} values failed to parse after 7th comma parser strategy "
+                            "(euro_decimal_comma vs thousands_comma disambiguation)",
+                            failed_count=failed_count
+                        )
                     })
             except Exception:
                 pass  # Keep original if conversion fails
@@ -421,7 +672,8 @@ def preprocess_numeric_columns(df: pd.DataFrame, source_key: str, warnings: List
                     "original_value": None,  # Aggregated warning, individual row values not tracked
                     "sentinel_value": "9999",
                     "sentinel_count": int(sentinel_count),
-                    "details": f"{sentinel_count} sentinel values (9999) replaced with NaN"
+                    **counted_details("{sentinel_count} sentinel values (9999) replaced with NaN",
+                                      sentinel_count=sentinel_count)
                 })
         
         # 7th/8th_3d: Replace empty strings with NaN
@@ -441,7 +693,8 @@ def preprocess_numeric_columns(df: pd.DataFrame, source_key: str, warnings: List
                         "original_value": None,  # Aggregated warning, individual row values not tracked
                         "sentinel_value": "",
                         "sentinel_count": int(empty_count),
-                        "details": f"{empty_count} empty string values replaced with NaN"
+                        **counted_details("{sentinel_count} empty string values replaced with NaN",
+                                          sentinel_count=empty_count)
                     })
     
     return result_df
@@ -458,26 +711,34 @@ def check_all_null_extracted(
     
     Emits warning if any standard_key has non_null_count == 0 after extraction.
     """
+    check_all_null_extracted_from_stats(collect_column_stats(df), source_key, warnings, mapping)
+
+
+def check_all_null_extracted_from_stats(
+    stats: Dict[str, Dict[str, Any]],
+    source_key: str,
+    warnings: List[Dict[str, Any]],
+    mapping: Dict[str, Any]
+) -> None:
+    """check_all_null_extracted on collect_column_stats / merge_column_stats counts."""
     all_keys = [k['standard_key'] for k in mapping['keys']]
     
     for standard_key in all_keys:
-        if standard_key not in df.columns:
+        if standard_key not in stats:
             continue
         
         # Skip meta columns (non-numeric columns should not trigger ALL_NULL_EXTRACTED)
         if standard_key in ['HUMAN_ID', 'SEX', 'AGE']:
             continue
         
-        series = df[standard_key]
-        non_null_count = series.notna().sum()
-        total_rows = len(series)
+        entry = stats[standard_key]
+        non_null_count = entry["non_null_count"]
+        total_rows = entry["total_rows"]
         
         # Check if column is numeric (to avoid false positives for non-numeric columns)
-        is_numeric = pd.api.types.is_numeric_dtype(series)
-        if not is_numeric:
-            # For non-numeric columns, check if they can be converted to numeric
-            numeric_attempt = pd.to_numeric(series, errors='coerce')
-            non_numeric_count = (series.notna() & numeric_attempt.isna()).sum()
+        if not entry["is_numeric"]:
+            # For non-numeric columns, count values that cannot be converted to numeric
+            non_numeric_count = entry["non_numeric_count"]
             if non_null_count == 0 and total_rows > 0:
                 # Record as non-numeric values, not ALL_NULL_EXTRACTED
                 warnings.append({
@@ -516,13 +777,23 @@ def check_all_null_by_source(
     This checks final state after all processing.
     Emits 1 warning per key×source combination (no duplicates).
     """
+    check_all_null_by_source_from_stats(collect_column_stats(df), source_key, warnings, mapping)
+
+
+def check_all_null_by_source_from_stats(
+    stats: Dict[str, Dict[str, Any]],
+    source_key: str,
+    warnings: List[Dict[str, Any]],
+    mapping: Dict[str, Any]
+) -> None:
+    """check_all_null_by_source on collect_column_stats / merge_column_stats counts."""
     all_keys = [k['standard_key'] for k in mapping['keys']]
     
     # Track which key×source combinations already have warnings (prevent duplicates)
     warned_keys = set()
     
     for standard_key in all_keys:
-        if standard_key not in df.columns:
+        if standard_key not in stats:
             continue
         
         # Skip meta columns (non-numeric columns should not trigger ALL_NULL_BY_SOURCE)
@@ -534,16 +805,14 @@ def check_all_null_by_source(
         if key_source_id in warned_keys:
             continue
         
-        series = df[standard_key]
-        non_null_count = series.notna().sum()
-        total_rows = len(series)
+        entry = stats[standard_key]
+        non_null_count = entry["non_null_count"]
+        total_rows = entry["total_rows"]
         
         # Check if column is numeric (to avoid false positives for non-numeric columns)
-        is_numeric = pd.api.types.is_numeric_dtype(series)
-        if not is_numeric:
-            # For non-numeric columns, check if they can be converted to numeric
-            numeric_attempt = pd.to_numeric(series, errors='coerce')
-            non_numeric_count = (series.notna() & numeric_attempt.isna()).sum()
+        if not entry["is_numeric"]:
+            # For non-numeric columns, count values that cannot be converted to numeric
+            non_numeric_count = entry["non_numeric_count"]
             if non_null_count == 0 and total_rows > 0:
                 # Record as non-numeric values, not ALL_NULL_BY_SOURCE
                 warnings.append({
@@ -583,21 +852,32 @@ def check_massive_null_introduced(
     
     Compares after_preprocess vs after_unit_conversion stages.
     """
+    check_massive_null_introduced_from_stats(
+        collect_column_stats(df_before), collect_column_stats(df_after), source_key, warnings, mapping
+    )
+
+
+def check_massive_null_introduced_from_stats(
+    stats_before: Dict[str, Dict[str, Any]],
+    stats_after: Dict[str, Dict[str, Any]],
+    source_key: str,
+    warnings: List[Dict[str, Any]],
+    mapping: Dict[str, Any]
+) -> None:
+    """check_massive_null_introduced on collect_column_stats / merge_column_stats counts."""
     all_keys = [k['standard_key'] for k in mapping['keys']]
     
     for standard_key in all_keys:
-        if standard_key not in df_before.columns or standard_key not in df_after.columns:
+        if standard_key not in stats_before or standard_key not in stats_after:
             continue
         
         # Skip meta columns
         if standard_key in ['HUMAN_ID', 'SEX', 'AGE']:
             continue
         
-        before_series = df_before[standard_key]
-        after_series = df_after[standard_key]
-        
-        non_null_before = before_series.notna().sum()
-        non_null_after = after_series.notna().sum()
+        after = stats_after[standard_key]
+        non_null_before = stats_before[standard_key]["non_null_count"]
+        non_null_after = after["non_null_count"]
         
         if non_null_before == 0:
             continue  # Already all null, skip
@@ -607,7 +887,7 @@ def check_massive_null_introduced(
         
         # Trigger: drop_rate >= 0.95 AND drop_count >= 1000
         if drop_rate >= 0.95 and drop_count >= 1000:
-            nan_count_after = after_series.isna().sum()
+            nan_count_after = after["total_rows"] - non_null_after
             warnings.append({
                 "source": source_key,
                 "file": SOURCE_FILES[source_key],
@@ -691,10 +971,27 @@ def check_scale_and_range_suspected(
     SCALE_SUSPECTED: median (p50) > 10.0 or < 0.01 for expected_unit='m' keys.
     RANGE_SUSPECTED: values outside physical range >= 50 for expected_unit='m' keys.
     """
+    meter_keys = [k['standard_key'] for k in mapping['keys'] if get_expected_unit(k['standard_key']) == 'm']
+    check_scale_and_range_suspected_from_stats(
+        collect_column_stats(df, value_columns=meter_keys), source_key, warnings, mapping
+    )
+
+
+def check_scale_and_range_suspected_from_stats(
+    stats: Dict[str, Dict[str, Any]],
+    source_key: str,
+    warnings: List[Dict[str, Any]],
+    mapping: Dict[str, Any]
+) -> None:
+    """
+    check_scale_and_range_suspected on collect_column_stats / merge_column_stats results.
+    
+    Needs the finite values of the expected_unit='m' keys (value_columns) for percentiles.
+    """
     all_keys = [k['standard_key'] for k in mapping['keys']]
     
     for standard_key in all_keys:
-        if standard_key not in df.columns:
+        if standard_key not in stats:
             continue
         
         # Skip meta columns
@@ -705,9 +1002,7 @@ def check_scale_and_range_suspected(
         if expected_unit != 'm':
             continue  # Only check unit='m' keys
         
-        series = df[standard_key]
-        numeric_series = pd.to_numeric(series, errors='coerce')
-        finite_series = numeric_series[np.isfinite(numeric_series)]
+        finite_series = column_stats_values(stats[standard_key])
         
         if len(finite_series) == 0:
             continue
@@ -787,7 +1082,7 @@ def normalize_sex(df: pd.DataFrame, source_key: str, warnings: List[Dict[str, An
                 "reason": "value_missing",
                 "row_index": None,
                 "original_value": None,
-                "details": f"{invalid_count} invalid sex values found"
+                **counted_details("{invalid_count} invalid sex values found", invalid_count=invalid_count)
             })
             result_df.loc[invalid_mask, 'SEX'] = np.nan
     
@@ -801,7 +1096,8 @@ def extract_columns_from_source(
     mapping: Dict[str, Any],
     warnings: List[Dict[str, Any]],
     collect_trace: bool = False,
-    trace_data: Optional[Dict[str, Any]] = None
+    trace_data: Optional[Dict[str, Any]] = None,
+    stage_frames: Optional[Dict[str, pd.DataFrame]] = None
 ) -> pd.DataFrame:
     """
     Extract and standardize columns from raw DataFrame based on mapping.
@@ -810,6 +1106,10 @@ def extract_columns_from_source(
     - HUMAN_ID/SEX: Use secondary header DataFrame if available
     - Other keys: Use primary header DataFrame
     
+    If stage_frames is given (streaming build), the extracted frame before preprocessing
+    is stored under 'after_extraction_before_preprocess' and the ALL_NULL_EXTRACTED check
+    is left to the caller, which runs it once per source instead of once per chunk.
+    
     Returns DataFrame with standard_key columns (45 keys).
     Missing columns are filled with NaN.
     """
@@ -883,7 +1183,10 @@ def extract_columns_from_source(
     df_before_preprocess = pd.DataFrame(result_data, index=df.index)
     
     # Check for ALL_NULL_EXTRACTED (after extraction, before preprocessing)
-    check_all_null_extracted(df_before_preprocess, source_key, warnings, mapping)
+    if stage_frames is None:
+        check_all_null_extracted(df_before_preprocess, source_key, warnings, mapping)
+    else:
+        stage_frames['after_extraction_before_preprocess'] = df_before_preprocess
     
     # Collect trace before preprocessing (for ARM_LEN_M and KNEE_HEIGHT_M only)
     if collect_trace and trace_data is not None and source_key in ['8th_direct', '8th_3d']:
@@ -1039,6 +1342,12 @@ def apply_unit_canonicalization(
     """
     result_df = df.copy()
     warning_list = []  # For canonicalize_units_to_m
+    # 7th: comma-parse every distinct raw value of the unit-mapped columns once
+    parsed_7th = {}
+    if source_key == '7th':
+        parsed_7th = parse_numeric_frame_7th(df, [
+            col for col in df.columns if col in unit_map and col not in ['SEX', 'AGE', 'HUMAN_ID', 'WEIGHT_KG']
+        ])
     
     for col in df.columns:
         if col in ['SEX', 'AGE', 'HUMAN_ID']:
@@ -1081,7 +1390,11 @@ def apply_unit_canonicalization(
                         "reason": "unit_conversion_applied",
                         "row_index": None,
                         "original_value": None,
-                        "details": f"UNIT_DEFAULT_MM_NO_UNIT: assumed_unit=mm, applied_scale=1000, non_null_before={non_null_before}, non_null_after={non_null_after}"
+                        **counted_details(
+                            "UNIT_DEFAULT_MM_NO_UNIT: assumed_unit=mm, applied_scale=1000, "
+                            "non_null_before={non_null_before}, non_null_after={non_null_after}",
+                            non_null_before=non_null_before, non_null_after=non_null_after
+                        )
                     })
                     
                     # Convert warning_list strings to structured warnings
@@ -1095,7 +1408,7 @@ def apply_unit_canonicalization(
                                 "reason": "unit_conversion_applied",
                                 "row_index": None,
                                 "original_value": None,
-                                "details": w
+                                **canonicalization_details(w, values)
                             })
                         elif "UNIT_FAIL" in w and "inf/-inf" in w:
                             # Only emit unit_conversion_failed for inf/-inf detected
@@ -1106,7 +1419,7 @@ def apply_unit_canonicalization(
                                 "reason": "unit_conversion_failed",
                                 "row_index": None,
                                 "original_value": None,
-                                "details": w
+                                **canonicalization_details(w, values)
                             })
                     
                     warning_list.clear()
@@ -1178,7 +1491,7 @@ def apply_unit_canonicalization(
         if source_key == '7th':
             # Apply unified 7th parser regardless of dtype (numeric or object)
             # This prevents 10x scale errors from Excel auto-conversion
-            parsed_series = original_series.astype(str).str.strip().apply(parse_numeric_string_7th)
+            parsed_series = parsed_7th[col]
             numeric_series = pd.to_numeric(parsed_series, errors='coerce')
         else:
             numeric_series = pd.to_numeric(original_series, errors='coerce')
@@ -1197,11 +1510,6 @@ def apply_unit_canonicalization(
         
         result_df[col] = converted
         
-        # Add coercion info to details if NaN increased
-        coercion_info = ""
-        if coercion_nan_increase > 0:
-            coercion_info = f", coercion_nan_increase={coercion_nan_increase}"
-        
         # Convert warning_list strings to structured warnings
         # Only emit unit_conversion_failed for inf/-inf (not NaN)
         # Ensure source_key is set (should not be None at this point)
@@ -1209,7 +1517,6 @@ def apply_unit_canonicalization(
         file_path = SOURCE_FILES.get(warning_source, "unknown") if warning_source != "system" else "build_curated_v0.py"
         for w in warning_list:
             if "PROVENANCE" in w:
-                details = w + coercion_info if coercion_info else w
                 warnings.append({
                     "source": warning_source,
                     "file": file_path,
@@ -1217,12 +1524,11 @@ def apply_unit_canonicalization(
                     "reason": "unit_conversion_applied",
                     "row_index": None,
                     "original_value": None,
-                    "details": details
+                    **canonicalization_details(w, values, coercion_nan_increase=coercion_nan_increase)
                 })
             elif "UNIT_FAIL" in w and "inf/-inf" in w:
                 # Only emit unit_conversion_failed for inf/-inf detected (numeric coercion already done)
                 # invalid(inf/-inf) count is from numeric float, not object dtype
-                details = w + coercion_info if coercion_info else w
                 warnings.append({
                     "source": warning_source,
                     "file": file_path,
@@ -1230,7 +1536,7 @@ def apply_unit_canonicalization(
                     "reason": "unit_conversion_failed",
                     "row_index": None,
                     "original_value": None,
-                    "details": details
+                    **canonicalization_details(w, values, coercion_nan_increase=coercion_nan_increase)
                 })
         
         warning_list.clear()  # Clear for next column
@@ -1271,7 +1577,7 @@ def apply_outlier_removal(
                 "reason": "age_filter_applied",
                 "row_index": None,
                 "original_value": None,
-                "details": f"Filtered {removed_count} rows outside age range 20-59"
+                **counted_details("Filtered {removed_count} rows outside age range 20-59", removed_count=removed_count)
             })
             df = df[age_mask].copy()
     
@@ -1292,6 +1598,16 @@ def handle_missing_values(
     
     No exceptions raised (NaN + warnings policy).
     """
+    record_missing_values_from_stats(collect_column_stats(df), source_key, warnings)
+    return df
+
+
+def record_missing_values_from_stats(
+    stats: Dict[str, Dict[str, Any]],
+    source_key: str,
+    warnings: List[Dict[str, Any]]
+) -> None:
+    """handle_missing_values warnings on collect_column_stats / merge_column_stats counts."""
     # Build map of columns to sentinel_count from SENTINEL_MISSING warnings
     sentinel_counts = {}
     for w in warnings:
@@ -1304,8 +1620,8 @@ def handle_missing_values(
                 sentinel_counts[col] = 0
             sentinel_counts[col] += sentinel_count
     
-    for col in df.columns:
-        missing_count_total = df[col].isna().sum()
+    for col, entry in stats.items():
+        missing_count_total = entry["total_rows"] - entry["non_null_count"]
         if missing_count_total > 0:
             # Calculate remaining missing (excluding sentinel counts)
             sentinel_count_total = sentinel_counts.get(col, 0)
@@ -1322,8 +1638,6 @@ def handle_missing_values(
                     "original_value": None,
                     "details": f"{remaining} missing values in column (excluding {sentinel_count_total} sentinel values)"
                 })
-    
-    return df
 
 
 def detect_duplicate_headers(df: pd.DataFrame, source_key: str) -> Dict[str, List[Dict[str, Any]]]:
@@ -1373,14 +1687,23 @@ def calculate_source_quality(
     
     Returns dict mapping standard_key -> {non_null_count, missing_count, missing_rate, total_rows}
     """
+    return calculate_source_quality_from_stats(collect_column_stats(df), len(df), source_key, mapping)
+
+
+def calculate_source_quality_from_stats(
+    stats: Dict[str, Dict[str, Any]],
+    total_rows: int,
+    source_key: str,
+    mapping: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """calculate_source_quality on collect_column_stats / merge_column_stats counts."""
     quality = {}
-    total_rows = len(df)
     
     # Get all standard keys from mapping
     for key_info in mapping['keys']:
         standard_key = key_info['standard_key']
         
-        if standard_key not in df.columns:
+        if standard_key not in stats:
             quality[standard_key] = {
                 "non_null_count": 0,
                 "missing_count": total_rows,
@@ -1389,7 +1712,7 @@ def calculate_source_quality(
             }
             continue
         
-        non_null_count = df[standard_key].notna().sum()
+        non_null_count = stats[standard_key]["non_null_count"]
         missing_count = total_rows - non_null_count
         missing_rate = missing_count / total_rows if total_rows > 0 else 1.0
         
@@ -1415,6 +1738,20 @@ def generate_completeness_report(
     for each standard_key × source combination.
     Also includes scale suspicion observations (facts-only) for meter-unit keys.
     """
+    all_keys = [k['standard_key'] for k in mapping['keys']]
+    all_source_stats = {
+        source_key: collect_column_stats(df, value_columns=all_keys)
+        for source_key, df in all_source_dfs.items()
+    }
+    generate_completeness_report_from_stats(all_source_stats, mapping, output_path)
+
+
+def generate_completeness_report_from_stats(
+    all_source_stats: Dict[str, Dict[str, Dict[str, Any]]],
+    mapping: Dict[str, Any],
+    output_path: Path
+) -> None:
+    """generate_completeness_report on per-source collect_column_stats (values for every key)."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -1425,25 +1762,25 @@ def generate_completeness_report(
         all_keys = [k['standard_key'] for k in mapping['keys']]
         
         # Process each source
-        for source_key in sorted(all_source_dfs.keys()):
-            df = all_source_dfs[source_key]
+        for source_key in sorted(all_source_stats.keys()):
+            stats = all_source_stats[source_key]
             f.write(f"## {source_key}\n\n")
             
             f.write("| standard_key | non_null_count | total_rows | non_null_rate | min | p1 | p50 | p99 | max | scale_observation |\n")
             f.write("|--------------|-----------------|------------|---------------|-----|----|----|----|-----|-------------------|\n")
             
             for standard_key in sorted(all_keys):
-                if standard_key not in df.columns:
+                if standard_key not in stats:
                     f.write(f"| {standard_key} | - | - | - | - | - | - | - | - | column_not_present |\n")
                     continue
                 
-                series = df[standard_key]
-                total_rows = len(series)
-                non_null_count = series.notna().sum()
+                entry = stats[standard_key]
+                total_rows = entry["total_rows"]
+                non_null_count = entry["non_null_count"]
                 non_null_rate = non_null_count / total_rows if total_rows > 0 else 0.0
                 
                 # Check if column is numeric (to separate non-numeric columns from all_null)
-                is_numeric = pd.api.types.is_numeric_dtype(series)
+                is_numeric = entry["is_numeric"]
                 
                 # For non-numeric columns, label as NON_NUMERIC (not all_null)
                 # This prevents false all_null sensor triggers for meta columns like HUMAN_ID/SEX
@@ -1454,8 +1791,7 @@ def generate_completeness_report(
                     continue
                 
                 # Calculate percentiles for numeric columns only
-                numeric_series = pd.to_numeric(series, errors='coerce')
-                finite_values = numeric_series[np.isfinite(numeric_series)]
+                finite_values = column_stats_values(entry)
                 
                 if len(finite_values) == 0:
                     # All null (numeric column with no finite values)
@@ -2029,109 +2365,315 @@ def emit_arm_knee_trace(
     print(f"Saved ARM/KNEE trace: {output_path}")
 
 
-def build_curated_v0(
-    mapping_path: Path,
-    output_path: Path,
-    output_format: str = "parquet",
-    dry_run: bool = False,
-    max_rows: Optional[int] = None,
-    warnings_output_path: Optional[Path] = None,
-    quality_summary_path: Optional[Path] = None,
-    header_candidates_path: Optional[Path] = None,
-    arm_knee_trace_path: Optional[Path] = None,
-    unit_fail_trace_path: Optional[Path] = None,
-    completeness_report_path: Optional[Path] = None
-) -> Dict[str, Any]:
+def prepare_output_frame(df_combined: pd.DataFrame, warnings: List[Dict[str, Any]]) -> pd.DataFrame:
     """
-    Build curated_v0 dataset.
+    Normalize the combined output frame before it is written.
     
-    Args:
-        mapping_path: Path to sizekorea column mapping (v2 by default)
-        output_path: Output file path
-        output_format: "parquet" or "csv"
-        dry_run: If True, only check headers/mapping, don't create file
-        max_rows: Limit number of rows processed (for testing)
-        warnings_output_path: Path to save warnings JSONL (optional)
-    
-    Returns:
-        Dictionary with statistics
+    - HUMAN_ID is cast to string
+    - WEIGHT_KG is forced to numeric (new NaN recorded as numeric_parsing_failed)
+    - inf/-inf in numeric columns is normalized to NaN (recorded as unit_conversion_failed)
     """
-    warnings = []
-    
-    # Load mapping
-    mapping = load_mapping_v1(mapping_path)
-    
-    # Process each source
-    all_dfs = []
-    all_source_dfs = {}  # source_key -> df_final (for completeness report)
-    all_source_quality = {}  # source_key -> {standard_key -> quality_metrics}
-    all_duplicate_headers = {}  # source_key -> {base_header -> [column_info]}
-    all_header_candidates = {}  # source_key -> {standard_key -> [candidate_info]}
-    all_arm_knee_traces = {}  # source_key -> [list of trace_data dicts]
-    all_unit_fail_traces = {}  # source_key -> [list of trace_data dicts]
-    stats = {
-        "sources_processed": [],
-        "total_rows": 0,
-        "columns_created": [],
-        "warnings_count": 0
-    }
+    # Ensure HUMAN_ID is string before saving
+    if 'HUMAN_ID' in df_combined.columns:
+        df_combined['HUMAN_ID'] = df_combined['HUMAN_ID'].astype(str)
     
-    for source_key, file_path_str in SOURCE_FILES.items():
-        file_path = Path(file_path_str)
+    # Force WEIGHT_KG to numeric before parquet write to avoid pyarrow conversion failure
+    # when mixed string/float values exist
+    if 'WEIGHT_KG' in df_combined.columns:
+        # Count NaN before conversion
+        nan_before = df_combined['WEIGHT_KG'].isna().sum()
         
-        if not file_path.exists():
+        # Convert to string, remove commas, strip, then convert to numeric
+        df_combined['WEIGHT_KG'] = pd.to_numeric(
+            df_combined['WEIGHT_KG'].astype(str).str.replace(',', '', regex=False).str.strip(),
+            errors='coerce'
+        )
+        
+        # Count NaN after conversion
+        nan_after = df_combined['WEIGHT_KG'].isna().sum()
+        new_nan_count = nan_after - nan_before
+        
+        # Record warning if new NaN values were created
+        if new_nan_count > 0:
             warnings.append({
-                "source": source_key,
-                "file": str(file_path),
-                "column": "all",
-                "reason": "file_not_found",
+                "source": "system",
+                "file": "build_curated_v0.py",
+                "column": "WEIGHT_KG",
+                "reason": "numeric_parsing_failed",
                 "row_index": None,
                 "original_value": None,
-                "details": f"Source file not found: {file_path}"
+                **counted_details(
+                    "{new_nan_count} WEIGHT_KG values failed to convert to numeric during parquet write preparation",
+                    new_nan_count=new_nan_count
+                )
             })
-            continue
-        
-        print(f"Processing {source_key}: {file_path}")
-        
-        # For 7th, prefer XLSX over CSV
-        is_xlsx = False
-        if source_key == '7th':
-            xlsx_path = file_path.parent / "7th_data.xlsx"
-            if xlsx_path.exists():
-                file_path = xlsx_path
-                is_xlsx = True
-                print(f"  Using XLSX: {file_path}")
-            else:
-                print(f"  Warning: XLSX not found, using CSV fallback: {file_path}")
-        
-        # Find header rows (primary, code, and secondary)
-        # Primary: "표준 측정항목 명" anchor row (typically row 4 for 7th)
-        # Code: "표준 측정항목 코드" row (typically row 5 for 7th, primary_row + 1)
-        # Secondary: Row with "성별"/"HUMAN_ID" tokens near primary (typically row 6 for 7th)
-        primary_row, code_row, secondary_row = find_header_rows(file_path, mapping, is_xlsx=is_xlsx, source_key=source_key)
-        print(f"  Detected primary header row: {primary_row}")
-        if code_row is not None:
-            print(f"  Detected code row: {code_row}")
-        if secondary_row is not None:
-            print(f"  Detected secondary header row: {secondary_row}")
-        
-        # Calculate data start row: max of all header rows + 1
-        # This ensures header/code/meta rows are excluded from data
-        header_rows_list = [primary_row]
-        if code_row is not None:
-            header_rows_list.append(code_row)
-        if secondary_row is not None:
-            header_rows_list.append(secondary_row)
-        data_start_row = max(header_rows_list) + 1
-        print(f"  Data start row (after header cutoff): {data_start_row}")
+    
+    # Normalize non-finite values (inf/-inf) to NaN for all numeric columns
+    # This prevents pyarrow conversion failures and silent invalid values
+    numeric_cols = df_combined.select_dtypes(include=[np.number]).columns
+    for col in numeric_cols:
+        if col in ['SEX', 'AGE', 'HUMAN_ID']:
+            continue  # Skip meta columns
         
-        # Load raw file
-        df_raw = load_raw_file(file_path, primary_row, secondary_row, source_key, is_xlsx=is_xlsx)
+        # Check for inf/-inf values only (not NaN)
+        # Use np.isinf to explicitly check for inf/-inf only
+        inf_mask = np.isinf(df_combined[col])
+        non_finite_count = inf_mask.sum()
         
-        # Drop header/code/meta rows from DataFrame
-        # After load_raw_file with header=primary_row, DataFrame index starts from 0
-        # Original file row (primary_row + 1) becomes DataFrame index 0
-        # Original file row (code_row) becomes DataFrame index (code_row - primary_row - 1) if code_row > primary_row
+        if non_finite_count > 0:
+            # Replace inf/-inf with NaN
+            df_combined.loc[inf_mask, col] = np.nan
+            
+            # Record aggregated warning
+            warnings.append({
+                "source": "system",
+                "file": "build_curated_v0.py",
+                "column": col,
+                "reason": "unit_conversion_failed",
+                "row_index": None,
+                "original_value": None,
+                **counted_details(
+                    "{non_finite_count} non-finite values (inf/-inf) normalized to NaN before parquet write",
+                    non_finite_count=non_finite_count
+                )
+            })
+    
+    return df_combined
+
+
+def finalize_build_outputs(
+    warnings: List[Dict[str, Any]],
+    stats: Dict[str, Any],
+    mapping: Dict[str, Any],
+    warnings_output_path: Optional[Path] = None,
+    quality_summary_path: Optional[Path] = None,
+    all_source_quality: Optional[Dict[str, Any]] = None,
+    all_duplicate_headers: Optional[Dict[str, Any]] = None,
+    header_candidates_path: Optional[Path] = None,
+    all_header_candidates: Optional[Dict[str, Any]] = None,
+    arm_knee_trace_path: Optional[Path] = None,
+    all_arm_knee_traces: Optional[Dict[str, Any]] = None,
+    unit_fail_trace_path: Optional[Path] = None,
+    all_unit_fail_traces: Optional[Dict[str, Any]] = None,
+    completeness_report_path: Optional[Path] = None,
+    all_source_stats: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+) -> None:
+    """
+    Save warnings and the optional diagnostic reports, then print the build summary.
+    
+    Shared by the in-memory and streaming builds; updates stats["warnings_count"].
+    all_source_stats: source_key -> collect_column_stats of the final stage (values for every key).
+    """
+    all_source_quality = all_source_quality or {}
+    all_duplicate_headers = all_duplicate_headers or {}
+    all_header_candidates = all_header_candidates or {}
+    all_arm_knee_traces = all_arm_knee_traces or {}
+    all_unit_fail_traces = all_unit_fail_traces or {}
+    all_source_stats = all_source_stats or {}
+    
+    # Save warnings if path specified
+    if warnings_output_path:
+        warnings_output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(warnings_output_path, 'w', encoding='utf-8') as f:
+            for w in warnings:
+                public = {k: v for k, v in w.items() if not k.startswith('_')}
+                f.write(json.dumps(public, ensure_ascii=False) + '\n')
+        print(f"Saved warnings: {warnings_output_path} ({len(warnings)} entries)")
+    
+    stats["warnings_count"] = len(warnings)
+    
+    # Generate quality summary if requested
+    if quality_summary_path is not None and all_source_quality:
+        generate_quality_summary(all_source_quality, all_duplicate_headers, quality_summary_path)
+        print(f"Saved quality summary: {quality_summary_path}")
+    
+    # Emit header candidates if requested
+    if header_candidates_path is not None and all_header_candidates:
+        emit_header_candidates(all_header_candidates, header_candidates_path)
+    
+    # Emit ARM/KNEE trace if requested
+    if arm_knee_trace_path is not None and all_arm_knee_traces:
+        emit_arm_knee_trace(all_arm_knee_traces, arm_knee_trace_path)
+    
+    # Emit unit-fail trace if requested
+    if unit_fail_trace_path is not None and all_unit_fail_traces:
+        emit_unit_fail_trace(all_unit_fail_traces, unit_fail_trace_path)
+    
+    # Generate completeness report if requested
+    if completeness_report_path is not None and all_source_stats:
+        generate_completeness_report_from_stats(all_source_stats, mapping, completeness_report_path)
+        print(f"Saved completeness report: {completeness_report_path}")
+        
+        # Verify 7th 10x error resolution (facts-only)
+        if '7th' in all_source_stats and '8th_direct' in all_source_stats:
+            stats_7th = all_source_stats['7th']
+            stats_8th = all_source_stats['8th_direct']
+            
+            # Check key columns that were affected by 10x errors
+            check_keys = ['CHEST_CIRC_M_REF', 'ANKLE_MAX_CIRC_M', 'WRIST_CIRC_M']
+            resolved_keys = []
+            
+            for key in check_keys:
+                if key in stats_7th and key in stats_8th:
+                    # Get p50 from 7th and 8th
+                    finite_7th = column_stats_values(stats_7th[key])
+                    finite_8th = column_stats_values(stats_8th[key])
+                    
+                    if len(finite_7th) > 0 and len(finite_8th) > 0:
+                        p50_7th = float(finite_7th.quantile(0.50))
+                        p50_8th = float(finite_8th.quantile(0.50))
+                        
+                        # Check if 7th p50 is in reasonable range (within 2x of 8th p50)
+                        # This verifies 10x error is resolved (7th p50 should be ~0.7-1.2m, not 9.2m)
+                        if p50_8th > 0 and 0.5 * p50_8th <= p50_7th <= 2.0 * p50_8th:
+                            resolved_keys.append(f"{key} (7th p50={p50_7th:.3f}m, 8th p50={p50_8th:.3f}m)")
+            
+            if resolved_keys:
+                print(f"\n7th 10x error resolution (facts-only): {len(resolved_keys)} keys resolved")
+                for key_info in resolved_keys:
+                    print(f"  - {key_info}")
+    
+    # Print summary
+    print("\n=== Summary ===")
+    print(f"Sources processed: {len(stats['sources_processed'])}")
+    print(f"Total rows: {stats['total_rows']}")
+    print(f"Columns: {len(stats['columns_created'])}")
+    print(f"Warnings: {stats['warnings_count']}")
+    
+    # Warning breakdown
+    warning_reasons = {}
+    for w in warnings:
+        reason = w.get('reason', 'unknown')
+        warning_reasons[reason] = warning_reasons.get(reason, 0) + 1
+    
+    print("\nWarning breakdown:")
+    for reason, count in sorted(warning_reasons.items()):
+        print(f"  {reason}: {count}")
+
+
+def build_curated_v0(
+    mapping_path: Path,
+    output_path: Path,
+    output_format: str = "parquet",
+    dry_run: bool = False,
+    max_rows: Optional[int] = None,
+    warnings_output_path: Optional[Path] = None,
+    quality_summary_path: Optional[Path] = None,
+    header_candidates_path: Optional[Path] = None,
+    arm_knee_trace_path: Optional[Path] = None,
+    unit_fail_trace_path: Optional[Path] = None,
+    completeness_report_path: Optional[Path] = None,
+    streaming: bool = False,
+    chunk_rows: int = STREAM_CHUNK_ROWS
+) -> Dict[str, Any]:
+    """
+    Build curated_v0 dataset.
+    
+    Args:
+        mapping_path: Path to sizekorea column mapping (v2 by default)
+        output_path: Output file path
+        output_format: "parquet" or "csv"
+        dry_run: If True, only check headers/mapping, don't create file
+        max_rows: Limit number of rows processed (for testing)
+        warnings_output_path: Path to save warnings JSONL (optional)
+        streaming: If True, process sources in row chunks (build_curated_v0_streaming)
+        chunk_rows: Rows per chunk in streaming mode
+    
+    Returns:
+        Dictionary with statistics
+    """
+    if streaming:
+        return build_curated_v0_streaming(
+            mapping_path=mapping_path,
+            output_path=output_path,
+            output_format=output_format,
+            dry_run=dry_run,
+            max_rows=max_rows,
+            warnings_output_path=warnings_output_path,
+            quality_summary_path=quality_summary_path,
+            header_candidates_path=header_candidates_path,
+            arm_knee_trace_path=arm_knee_trace_path,
+            unit_fail_trace_path=unit_fail_trace_path,
+            completeness_report_path=completeness_report_path,
+            chunk_rows=chunk_rows
+        )
+    
+    warnings = []
+    
+    # Load mapping
+    mapping = load_mapping_v1(mapping_path)
+    
+    # Process each source
+    all_dfs = []
+    all_source_stats = {}  # source_key -> column stats of df_final (for completeness report)
+    all_source_quality = {}  # source_key -> {standard_key -> quality_metrics}
+    all_duplicate_headers = {}  # source_key -> {base_header -> [column_info]}
+    all_header_candidates = {}  # source_key -> {standard_key -> [candidate_info]}
+    all_arm_knee_traces = {}  # source_key -> [list of trace_data dicts]
+    all_unit_fail_traces = {}  # source_key -> [list of trace_data dicts]
+    stats = {
+        "sources_processed": [],
+        "total_rows": 0,
+        "columns_created": [],
+        "warnings_count": 0
+    }
+    
+    for source_key, file_path_str in SOURCE_FILES.items():
+        file_path = Path(file_path_str)
+        
+        if not file_path.exists():
+            warnings.append({
+                "source": source_key,
+                "file": str(file_path),
+                "column": "all",
+                "reason": "file_not_found",
+                "row_index": None,
+                "original_value": None,
+                "details": f"Source file not found: {file_path}"
+            })
+            continue
+        
+        print(f"Processing {source_key}: {file_path}")
+        
+        # For 7th, prefer XLSX over CSV
+        is_xlsx = False
+        if source_key == '7th':
+            xlsx_path = file_path.parent / "7th_data.xlsx"
+            if xlsx_path.exists():
+                file_path = xlsx_path
+                is_xlsx = True
+                print(f"  Using XLSX: {file_path}")
+            else:
+                print(f"  Warning: XLSX not found, using CSV fallback: {file_path}")
+        
+        # Find header rows (primary, code, and secondary)
+        # Primary: "표준 측정항목 명" anchor row (typically row 4 for 7th)
+        # Code: "표준 측정항목 코드" row (typically row 5 for 7th, primary_row + 1)
+        # Secondary: Row with "성별"/"HUMAN_ID" tokens near primary (typically row 6 for 7th)
+        primary_row, code_row, secondary_row = find_header_rows(file_path, mapping, is_xlsx=is_xlsx, source_key=source_key)
+        print(f"  Detected primary header row: {primary_row}")
+        if code_row is not None:
+            print(f"  Detected code row: {code_row}")
+        if secondary_row is not None:
+            print(f"  Detected secondary header row: {secondary_row}")
+        
+        # Calculate data start row: max of all header rows + 1
+        # This ensures header/code/meta rows are excluded from data
+        header_rows_list = [primary_row]
+        if code_row is not None:
+            header_rows_list.append(code_row)
+        if secondary_row is not None:
+            header_rows_list.append(secondary_row)
+        data_start_row = max(header_rows_list) + 1
+        print(f"  Data start row (after header cutoff): {data_start_row}")
+        
+        # Load raw file
+        df_raw = load_raw_file(file_path, primary_row, secondary_row, source_key, is_xlsx=is_xlsx)
+        
+        # Drop header/code/meta rows from DataFrame
+        # After load_raw_file with header=primary_row, DataFrame index starts from 0
+        # Original file row (primary_row + 1) becomes DataFrame index 0
+        # Original file row (code_row) becomes DataFrame index (code_row - primary_row - 1) if code_row > primary_row
         # Original file row (secondary_row) becomes DataFrame index (secondary_row - primary_row - 1) if secondary_row > primary_row
         # We need to drop rows before data_start_row in original file coordinates
         # In DataFrame coordinates: drop rows with index < (data_start_row - primary_row - 1)
@@ -2142,39 +2684,7 @@ def build_curated_v0(
                 print(f"  Dropped {df_start_idx} header/code/meta rows, remaining: {len(df_raw)} rows")
         
         # Load secondary DataFrame if secondary header exists
-        df_secondary = None
-        if secondary_row is not None:
-            try:
-                if is_xlsx:
-                    df_secondary = pd.read_excel(file_path, header=secondary_row, engine='openpyxl')
-                else:
-                    encodings = ['utf-8-sig', 'cp949', 'utf-8']
-                    for enc in encodings:
-                        try:
-                            df_secondary = pd.read_csv(file_path, encoding=enc, header=secondary_row, low_memory=False)
-                            break
-                        except (UnicodeDecodeError, Exception):
-                            continue
-                
-                if df_secondary is not None and len(df_secondary) > 0:
-                    # Drop header/code/meta rows from secondary DataFrame as well
-                    # After load with header=secondary_row, DataFrame index starts from 0
-                    # Original file row (secondary_row + 1) becomes DataFrame index 0
-                    # We need to drop rows before data_start_row in original file coordinates
-                    # In DataFrame coordinates: drop rows with index < (data_start_row - secondary_row - 1)
-                    sec_df_start_idx = data_start_row - secondary_row - 1
-                    if sec_df_start_idx > 0:
-                        df_secondary = df_secondary.iloc[sec_df_start_idx:].copy().reset_index(drop=True)
-                
-                # Ensure HUMAN_ID/SEX columns are string in secondary
-                if df_secondary is not None:
-                    for col in df_secondary.columns:
-                        col_str = str(col).strip()
-                        if 'ID' in col_str or 'HUMAN_ID' in col_str or '성별' in col_str or 'SEX' in col_str:
-                            df_secondary[col] = df_secondary[col].astype(str).str.strip()
-                            df_secondary[col] = df_secondary[col].str.replace(r'\.0$', '', regex=True)
-            except Exception:
-                df_secondary = None
+        df_secondary = load_secondary_frame(file_path, secondary_row, data_start_row, is_xlsx=is_xlsx)
         
         if df_raw.empty:
             warnings.append({
@@ -2277,9 +2787,11 @@ def build_curated_v0(
         # Check for ALL_NULL_BY_SOURCE (after all processing, final state)
         check_all_null_by_source(df_final, source_key, warnings, mapping)
         
-        # Store df_final for completeness report
+        # Store df_final column stats for completeness report
         if completeness_report_path is not None:
-            all_source_dfs[source_key] = df_final
+            all_source_stats[source_key] = collect_column_stats(
+                df_final, value_columns=[k['standard_key'] for k in mapping['keys']]
+            )
         
         all_dfs.append(df_final)
         stats["sources_processed"].append(source_key)
@@ -2312,155 +2824,689 @@ def build_curated_v0(
     # Save output
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Ensure HUMAN_ID is string before saving
-    if 'HUMAN_ID' in df_combined.columns:
-        df_combined['HUMAN_ID'] = df_combined['HUMAN_ID'].astype(str)
+    df_combined = prepare_output_frame(df_combined, warnings)
     
-    # Force WEIGHT_KG to numeric before parquet write to avoid pyarrow conversion failure
-    # when mixed string/float values exist
-    if 'WEIGHT_KG' in df_combined.columns:
-        # Count NaN before conversion
-        nan_before = df_combined['WEIGHT_KG'].isna().sum()
-        
-        # Convert to string, remove commas, strip, then convert to numeric
-        df_combined['WEIGHT_KG'] = pd.to_numeric(
-            df_combined['WEIGHT_KG'].astype(str).str.replace(',', '', regex=False).str.strip(),
-            errors='coerce'
-        )
-        
-        # Count NaN after conversion
-        nan_after = df_combined['WEIGHT_KG'].isna().sum()
-        new_nan_count = nan_after - nan_before
-        
-        # Record warning if new NaN values were created
-        if new_nan_count > 0:
-            warnings.append({
-                "source": "system",
-                "file": "build_curated_v0.py",
-                "column": "WEIGHT_KG",
-                "reason": "numeric_parsing_failed",
-                "row_index": None,
-                "original_value": None,
-                "details": f"{new_nan_count} WEIGHT_KG values failed to convert to numeric during parquet write preparation"
-            })
-    
-    # Normalize non-finite values (inf/-inf) to NaN for all numeric columns
-    # This prevents pyarrow conversion failures and silent invalid values
-    numeric_cols = df_combined.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        if col in ['SEX', 'AGE', 'HUMAN_ID']:
-            continue  # Skip meta columns
-        
-        # Check for inf/-inf values only (not NaN)
-        # Use np.isinf to explicitly check for inf/-inf only
-        inf_mask = np.isinf(df_combined[col])
-        non_finite_count = inf_mask.sum()
-        
-        if non_finite_count > 0:
-            # Replace inf/-inf with NaN
-            df_combined.loc[inf_mask, col] = np.nan
-            
-            # Record aggregated warning
-            warnings.append({
-                "source": "system",
-                "file": "build_curated_v0.py",
-                "column": col,
-                "reason": "unit_conversion_failed",
-                "row_index": None,
-                "original_value": None,
-                "details": f"{non_finite_count} non-finite values (inf/-inf) normalized to NaN before parquet write"
-            })
-    
-    if output_format == "parquet":
-        df_combined.to_parquet(output_path, index=False)
-    else:
-        df_combined.to_csv(output_path, index=False, encoding='utf-8-sig')
+    if output_format == "parquet":
+        df_combined.to_parquet(output_path, index=False)
+    else:
+        df_combined.to_csv(output_path, index=False, encoding='utf-8-sig')
     
     print(f"\nSaved output: {output_path}")
     print(f"  Rows: {len(df_combined)}")
     print(f"  Columns: {len(df_combined.columns)}")
     
-    # Save warnings if path specified
-    if warnings_output_path:
-        warnings_output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(warnings_output_path, 'w', encoding='utf-8') as f:
-            for w in warnings:
-                f.write(json.dumps(w, ensure_ascii=False) + '\n')
-        print(f"Saved warnings: {warnings_output_path} ({len(warnings)} entries)")
-    
-    stats["warnings_count"] = len(warnings)
-    
-    # Generate quality summary if requested
-    if quality_summary_path is not None and all_source_quality:
-        generate_quality_summary(all_source_quality, all_duplicate_headers, quality_summary_path)
-        print(f"Saved quality summary: {quality_summary_path}")
-    
-    # Emit header candidates if requested
-    if header_candidates_path is not None and all_header_candidates:
-        emit_header_candidates(all_header_candidates, header_candidates_path)
-    
-    # Emit ARM/KNEE trace if requested
-    if arm_knee_trace_path is not None and all_arm_knee_traces:
-        emit_arm_knee_trace(all_arm_knee_traces, arm_knee_trace_path)
-    
-    # Emit unit-fail trace if requested
-    if unit_fail_trace_path is not None and all_unit_fail_traces:
-        emit_unit_fail_trace(all_unit_fail_traces, unit_fail_trace_path)
-    
-    # Generate completeness report if requested
-    if completeness_report_path is not None and all_source_dfs:
-        generate_completeness_report(all_source_dfs, mapping, completeness_report_path)
-        print(f"Saved completeness report: {completeness_report_path}")
-        
-        # Verify 7th 10x error resolution (facts-only)
-        if '7th' in all_source_dfs and '8th_direct' in all_source_dfs:
-            df_7th = all_source_dfs['7th']
-            df_8th = all_source_dfs['8th_direct']
-            
-            # Check key columns that were affected by 10x errors
-            check_keys = ['CHEST_CIRC_M_REF', 'ANKLE_MAX_CIRC_M', 'WRIST_CIRC_M']
-            resolved_keys = []
-            
-            for key in check_keys:
-                if key in df_7th.columns and key in df_8th.columns:
-                    # Get p50 from 7th and 8th
-                    series_7th = pd.to_numeric(df_7th[key], errors='coerce')
-                    series_8th = pd.to_numeric(df_8th[key], errors='coerce')
-                    
-                    finite_7th = series_7th[np.isfinite(series_7th)]
-                    finite_8th = series_8th[np.isfinite(series_8th)]
-                    
-                    if len(finite_7th) > 0 and len(finite_8th) > 0:
-                        p50_7th = float(finite_7th.quantile(0.50))
-                        p50_8th = float(finite_8th.quantile(0.50))
-                        
-                        # Check if 7th p50 is in reasonable range (within 2x of 8th p50)
-                        # This verifies 10x error is resolved (7th p50 should be ~0.7-1.2m, not 9.2m)
-                        if p50_8th > 0 and 0.5 * p50_8th <= p50_7th <= 2.0 * p50_8th:
-                            resolved_keys.append(f"{key} (7th p50={p50_7th:.3f}m, 8th p50={p50_8th:.3f}m)")
-            
-            if resolved_keys:
-                print(f"\n7th 10x error resolution (facts-only): {len(resolved_keys)} keys resolved")
-                for key_info in resolved_keys:
-                    print(f"  - {key_info}")
+    finalize_build_outputs(
+        warnings, stats, mapping,
+        warnings_output_path=warnings_output_path,
+        quality_summary_path=quality_summary_path,
+        all_source_quality=all_source_quality,
+        all_duplicate_headers=all_duplicate_headers,
+        header_candidates_path=header_candidates_path,
+        all_header_candidates=all_header_candidates,
+        arm_knee_trace_path=arm_knee_trace_path,
+        all_arm_knee_traces=all_arm_knee_traces,
+        unit_fail_trace_path=unit_fail_trace_path,
+        all_unit_fail_traces=all_unit_fail_traces,
+        completeness_report_path=completeness_report_path,
+        all_source_stats=all_source_stats
+    )
     
-    # Print summary
-    print("\n=== Summary ===")
-    print(f"Sources processed: {len(stats['sources_processed'])}")
-    print(f"Total rows: {stats['total_rows']}")
-    print(f"Columns: {len(stats['columns_created'])}")
-    print(f"Warnings: {stats['warnings_count']}")
+    return stats
+
+
+def detect_csv_encoding(file_path: Path, encodings: Iterable[str] = ('utf-8-sig', 'cp949', 'utf-8'),
+                        block_size: int = 1 << 20) -> Optional[str]:
+    """
+    Return the first encoding that decodes the whole file, or None.
+
+    Decodes incrementally in blocks so the check does not hold the file in memory.
+    Same encoding order as load_raw_file.
+    """
+    for enc in encodings:
+        decoder = codecs.getincrementaldecoder(enc)()
+        try:
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(block_size), b''):
+                    decoder.decode(block)
+                decoder.decode(b'', final=True)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def dedup_header_names(values: Iterable[Any]) -> List[str]:
+    """
+    Column names pandas would give a header row: empty -> "Unnamed: i", duplicates -> "name.1", ...
+    """
+    names = [f"Unnamed: {i}" if pd.isna(v) else str(v) for i, v in enumerate(values)]
+    counts = defaultdict(int)
+    for i, col in enumerate(names):
+        cur_count = counts[col]
+        while cur_count > 0:
+            counts[col] = cur_count + 1
+            col = f"{col}.{cur_count}"
+            cur_count = counts[col]
+        names[i] = col
+        counts[col] = cur_count + 1
+    return names
+
+
+def is_numeric_token(value: Any) -> bool:
+    """True if a raw CSV cell is missing or parses as a number (does not force object dtype)."""
+    if pd.isna(value):
+        return True
+    try:
+        float(str(value).strip())
+        return True
+    except ValueError:
+        return False
+
+
+def infer_chunk_dtypes(df: pd.DataFrame, columns: Iterable[str], forced_object: Iterable[str]) -> pd.DataFrame:
+    """
+    Re-infer numeric dtypes for string-read chunk columns the way pd.read_csv would.
+
+    Columns in forced_object stay as strings (the whole-file read would be object dtype
+    because a header/code/meta row holds text in that column).
+    """
+    forced = set(forced_object)
+    for col in columns:
+        if col not in df.columns or col in forced:
+            continue
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            pass  # Non-numeric tokens: keep strings, as read_csv does
+    return df
+
+
+def iter_raw_file_chunks(
+    file_path: Path,
+    primary_row: int,
+    secondary_row: Optional[int],
+    data_start_row: int,
+    source_key: str,
+    mapping: Dict[str, Any],
+    is_xlsx: bool = False,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+    max_rows: Optional[int] = None
+) -> Iterator[Tuple[pd.DataFrame, Optional[pd.DataFrame]]]:
+    """
+    Yield (df_raw, df_secondary) row chunks matching load_raw_file + load_secondary_frame.
+
+    CSV: the file is read once, as strings, with header=primary_row and chunksize;
+    header/code/meta rows are dropped from the first chunk and also used to decide which
+    columns the whole-file read would have typed as object. The secondary frame is the same
+    rows under the secondary header names, so the second full-file read is not needed.
+    Mapped columns are re-typed per chunk (infer_chunk_dtypes), ID/SEX columns are
+    normalized to strings like the in-memory loaders.
+
+    XLSX: read_excel cannot stream rows, so the sheet is loaded whole and sliced.
+
+    Yields nothing if the file cannot be read.
+    """
+    if is_xlsx:
+        df_raw = load_raw_file(file_path, primary_row, secondary_row, source_key, is_xlsx=True)
+        df_start_idx = data_start_row - primary_row - 1
+        if len(df_raw) > 0 and df_start_idx > 0:
+            df_raw = df_raw.iloc[df_start_idx:].reset_index(drop=True)
+        df_secondary = load_secondary_frame(file_path, secondary_row, data_start_row, is_xlsx=True)
+        if max_rows and len(df_raw) > max_rows:
+            df_raw = df_raw.head(max_rows)
+        for start in range(0, len(df_raw), chunk_rows):
+            raw_chunk = df_raw.iloc[start:start + chunk_rows].reset_index(drop=True)
+            sec_chunk = None
+            if df_secondary is not None:
+                sec_chunk = df_secondary.iloc[start:start + chunk_rows].reset_index(drop=True)
+            yield raw_chunk, sec_chunk
+        return
+
+    encoding = detect_csv_encoding(file_path)
+    if encoding is None:
+        return
+
+    # Raw columns the extraction step reads (primary and secondary header names)
+    mapped_columns = set()
+    for key_info in mapping['keys']:
+        source_info = key_info['sources'].get(source_key, {})
+        if source_info.get('present', False) and source_info.get('column') is not None:
+            mapped_columns.add(source_info['column'])
+
+    df_start_idx = max(data_start_row - primary_row - 1, 0)
+    try:
+        reader = pd.read_csv(file_path, encoding=encoding, header=primary_row, dtype=str,
+                             chunksize=max(chunk_rows, df_start_idx + 1))
+        first = next(reader)
+    except Exception:
+        return
+
+    # Header/code/meta rows below the primary header (dropped from data, used for dtype decisions)
+    meta_rows = first.iloc[:df_start_idx]
+    primary_forced = [col for col in first.columns
+                      if not all(is_numeric_token(v) for v in meta_rows[col])]
+
+    secondary_names = None
+    secondary_forced: List[str] = []
+    if secondary_row is not None and 0 <= secondary_row - primary_row - 1 < len(meta_rows):
+        sec_pos = secondary_row - primary_row - 1
+        names = dedup_header_names(meta_rows.iloc[sec_pos].tolist())
+        if len(names) == len(first.columns):
+            secondary_names = names
+            sec_meta = meta_rows.iloc[sec_pos + 1:]
+            secondary_forced = [names[i] for i, col in enumerate(first.columns)
+                                if not all(is_numeric_token(v) for v in sec_meta[col])]
+
+    def to_frames(data: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        data = data.reset_index(drop=True)
+        df_secondary = None
+        if secondary_names is not None:
+            df_secondary = data.set_axis(secondary_names, axis=1)
+            df_secondary = infer_chunk_dtypes(df_secondary, mapped_columns, secondary_forced)
+            for col in df_secondary.columns:
+                col_str = str(col).strip()
+                if 'ID' in col_str or 'HUMAN_ID' in col_str or '성별' in col_str or 'SEX' in col_str:
+                    df_secondary[col] = df_secondary[col].astype(str).str.strip()
+                    df_secondary[col] = df_secondary[col].str.replace(r'\.0$', '', regex=True)
+        df_raw = infer_chunk_dtypes(data.copy(), mapped_columns, primary_forced)
+        for col in df_raw.columns:
+            col_str = str(col).strip()
+            if 'ID' in col_str or 'HUMAN_ID' in col_str:
+                df_raw[col] = df_raw[col].astype(str).str.strip()
+                df_raw[col] = df_raw[col].str.replace(r'\.0$', '', regex=True)
+        return df_raw, df_secondary
+
+    rows_left = max_rows if max_rows else None
+    pending = first.iloc[df_start_idx:]
+    while True:
+        if rows_left is not None:
+            pending = pending.iloc[:rows_left]
+            rows_left -= len(pending)
+        if len(pending) > 0:
+            yield to_frames(pending)
+        if rows_left is not None and rows_left <= 0:
+            break
+        pending = next(reader, None)
+        if pending is None:
+            break
+
+
+def merge_chunk_warnings(merged: Dict[tuple, Dict[str, Any]], chunk_warnings: List[Dict[str, Any]]) -> None:
+    """
+    Fold one chunk's warnings into merged (insertion-ordered, keyed by source/file/column/reason/details template).
     
-    # Warning breakdown
-    warning_reasons = {}
-    for w in warnings:
-        reason = w.get('reason', 'unknown')
-        warning_reasons[reason] = warning_reasons.get(reason, 0) + 1
+    Warnings built with counted_details collapse into one entry whose _details_counts (and
+    sentinel_count) are summed and whose details are re-rendered; other repeated warnings
+    are kept once.
+    """
+    for w in chunk_warnings:
+        template = w.get('_details_template', w.get('details'))
+        key = (w.get('source'), w.get('file'), w.get('column'), w.get('reason'), template)
+        entry = merged.get(key)
+        counts = w.get('_details_counts')
+        if entry is None:
+            entry = merged[key] = dict(w)
+            if counts is not None:
+                entry['_details_counts'] = dict(counts)
+            continue
+        if counts is None:
+            continue
+        totals = entry['_details_counts']
+        for name, value in counts.items():
+            totals[name] = totals.get(name, 0) + value
+        entry['details'] = render_counted_details(template, totals)
+        if 'sentinel_count' in entry:
+            entry['sentinel_count'] = totals['sentinel_count']
+
+
+def merged_warnings_list(merged: Dict[tuple, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merged chunk warnings as a list (first-seen order)."""
+    return [dict(w) for w in merged.values()]
+
+
+def merge_column_count_infos(
+    merged: Dict[str, List[Dict[str, Any]]],
+    chunk_infos: Dict[str, List[Dict[str, Any]]],
+    column_order: Dict[str, int]
+) -> None:
+    """
+    Sum per-chunk detect_duplicate_headers / find_header_candidates results.
+
+    Counts are summed per column_name, rates recomputed, and each list re-sorted by
+    non_null_count descending with ties in raw column order (as on a whole frame).
+    """
+    for key, infos in chunk_infos.items():
+        current = {info["column_name"]: info for info in merged.get(key, [])}
+        for info in infos:
+            prev = current.get(info["column_name"])
+            if prev is None:
+                current[info["column_name"]] = dict(info)
+                continue
+            prev["non_null_count"] += info["non_null_count"]
+            prev["total_rows"] += info["total_rows"]
+            if "missing_count" in prev:
+                prev["missing_count"] += info["missing_count"]
+            prev["non_null_rate"] = float(prev["non_null_count"] / prev["total_rows"]) if prev["total_rows"] > 0 else 0.0
+        merged[key] = sorted(current.values(),
+                             key=lambda x: (-x["non_null_count"], column_order.get(x["column_name"], len(column_order))))
+
+
+def collect_column_stats(df: pd.DataFrame, value_columns: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-column counts of one stage frame: the input of the whole-source checks and reports.
     
-    print("\nWarning breakdown:")
-    for reason, count in sorted(warning_reasons.items()):
-        print(f"  {reason}: {count}")
+    Each entry: total_rows, non_null_count, is_numeric (dtype), non_numeric_count (non-null
+    values pd.to_numeric cannot parse, non-numeric dtype only) and, for value_columns,
+    "values": a list of arrays of finite pd.to_numeric values (needed for quantiles).
+    Chunk results are summed with merge_column_stats.
+    """
+    value_columns = set(value_columns)
+    stats = {}
+    for col in df.columns:
+        series = df[col]
+        present = series.notna()
+        is_numeric = pd.api.types.is_numeric_dtype(series)
+        entry = {
+            "total_rows": len(series),
+            "non_null_count": int(present.sum()),
+            "is_numeric": bool(is_numeric),
+            "non_numeric_count": 0
+        }
+        numeric = None
+        if not is_numeric:
+            numeric = pd.to_numeric(series, errors='coerce')
+            entry["non_numeric_count"] = int((present & numeric.isna()).sum())
+        if col in value_columns:
+            if numeric is None:
+                numeric = pd.to_numeric(series, errors='coerce')
+            values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+            entry["values"] = [values[np.isfinite(values)]]
+        stats[col] = entry
+    return stats
+
+
+def merge_column_stats(merged: Dict[str, Dict[str, Any]], chunk_stats: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Sum one chunk's collect_column_stats into merged (column order of the first chunk).
     
+    A column is numeric only if it is numeric in every chunk (as after pd.concat).
+    """
+    for col, entry in chunk_stats.items():
+        prev = merged.get(col)
+        if prev is None:
+            merged[col] = dict(entry, values=list(entry["values"])) if "values" in entry else dict(entry)
+            continue
+        prev["total_rows"] += entry["total_rows"]
+        prev["non_null_count"] += entry["non_null_count"]
+        prev["is_numeric"] = prev["is_numeric"] and entry["is_numeric"]
+        prev["non_numeric_count"] += entry["non_numeric_count"]
+        if "values" in prev:
+            prev["values"].extend(entry.get("values", []))
+
+
+def column_stats_values(entry: Dict[str, Any]) -> pd.Series:
+    """Finite numeric values of a collect_column_stats entry (empty if values were not collected)."""
+    values = entry.get("values") or [np.empty(0)]
+    return pd.Series(np.concatenate(values))
+
+
+def concat_stage_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    One stage's trace frame for a source from its per-chunk trace slices.
+
+    The streaming build keeps no full stage frames: each chunk contributes only its traced key
+    columns (arm/knee, unit-fail), and the slices are joined once per source for the trace
+    collectors. Empty frame if the stage was not traced.
+    """
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+class CuratedChunkWriter:
+    """
+    Append curated chunks to one output file with a fixed schema.
+
+    Schema: STREAM_STRING_COLUMNS as string, every other column float64, so chunks whose
+    inferred dtypes differ still land in one table. Parquet gets one row group per chunk
+    (pyarrow ParquetWriter); CSV gets the header once and appended rows. Rows go to a
+    ".partial" file that replaces output_path on close().
+    """
+
+    def __init__(self, output_path: Path, output_format: str, columns: List[str]):
+        if output_format == "parquet" and pq is None:
+            raise ImportError("Streaming parquet output requires pyarrow (or use --format csv)")
+        self.output_path = Path(output_path)
+        self.output_format = output_format
+        self.columns = list(columns)
+        self.partial_path = self.output_path.with_name(self.output_path.name + ".partial")
+        self.rows_written = 0
+        self._parquet_writer = None
+        self._schema = None
+        if pa is not None:
+            self._schema = pa.schema([
+                (col, pa.string() if col in STREAM_STRING_COLUMNS else pa.float64())
+                for col in self.columns
+            ])
+
+    def conform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast a chunk to the fixed column order and dtypes."""
+        data = {}
+        for col in self.columns:
+            if col not in df.columns:
+                data[col] = np.full(len(df), None if col in STREAM_STRING_COLUMNS else np.nan,
+                                    dtype=object if col in STREAM_STRING_COLUMNS else np.float64)
+            elif col in STREAM_STRING_COLUMNS:
+                data[col] = np.array([None if pd.isna(v) else str(v) for v in df[col].to_numpy(dtype=object)],
+                                     dtype=object)
+            else:
+                data[col] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+        return pd.DataFrame(data, columns=self.columns)
+
+    def write(self, df: pd.DataFrame) -> None:
+        frame = self.conform(df)
+        if self.rows_written == 0 and self._parquet_writer is None:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.output_format == "parquet":
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(str(self.partial_path), self._schema)
+            self._parquet_writer.write_table(pa.Table.from_pandas(frame, schema=self._schema, preserve_index=False))
+        elif self.rows_written == 0:
+            frame.to_csv(self.partial_path, index=False, encoding='utf-8-sig')
+        else:
+            frame.to_csv(self.partial_path, index=False, header=False, mode='a', encoding='utf-8')
+        self.rows_written += len(frame)
+
+    def close(self) -> bool:
+        """Finish the file and move it into place. Returns False if nothing was written."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if not self.partial_path.exists():
+            return False
+        os.replace(self.partial_path, self.output_path)
+        return True
+
+
+def build_curated_v0_streaming(
+    mapping_path: Path,
+    output_path: Path,
+    output_format: str = "parquet",
+    dry_run: bool = False,
+    max_rows: Optional[int] = None,
+    warnings_output_path: Optional[Path] = None,
+    quality_summary_path: Optional[Path] = None,
+    header_candidates_path: Optional[Path] = None,
+    arm_knee_trace_path: Optional[Path] = None,
+    unit_fail_trace_path: Optional[Path] = None,
+    completeness_report_path: Optional[Path] = None,
+    chunk_rows: int = STREAM_CHUNK_ROWS
+) -> Dict[str, Any]:
+    """
+    Build curated_v0 dataset source by source in row chunks.
+
+    Each chunk runs the build_curated_v0 pipeline (extraction, preprocessing, unit
+    canonicalization, missing values, outlier/age filter) and is appended to the output
+    (Parquet row group or CSV rows), so raw and intermediate frames never exceed
+    chunk_rows rows and no cross-source concat is built. Per-chunk warnings are merged into
+    one warning per source/column/reason with summed structured counts (counted_details).
+    Whole-source checks (ALL_NULL_EXTRACTED, MASSIVE_NULL_INTRODUCED, value_missing,
+    ALL_NULL_BY_SOURCE) and the quality summary run once per source on per-column counts
+    summed across chunks (merge_column_stats).
+    
+    Memory that still grows with source size (facts):
+    - SCALE/RANGE_SUSPECTED percentiles keep the finite values of the expected_unit='m' keys
+      (8 bytes per value), and --completeness-report those of every key
+    - --arm-knee-trace / --unit-fail-trace keep their traced columns (2-6 keys)
+
+    Differences from build_curated_v0 (facts):
+    - sample_units runs on the first chunk (same result when it holds >= 100 non-null values per column)
+    - dtypes are inferred per chunk; a column whose first non-numeric token appears in a later chunk
+      is numeric in the earlier chunks
+    - XLSX sources are loaded whole (read_excel cannot stream rows) and then chunked
+    - output schema is fixed: HUMAN_ID/SEX/_source string, all other columns float64
+    - warnings are listed per source in first-seen order, whole-source checks last
+
+    Args:
+        chunk_rows: Rows per chunk (peak frame size)
+        Others: as build_curated_v0
+
+    Returns:
+        Dictionary with statistics (same keys as build_curated_v0, plus "chunks_processed")
+    """
+    warnings = []
+
+    # Load mapping
+    mapping = load_mapping_v1(mapping_path)
+    all_keys = [k['standard_key'] for k in mapping['keys']]
+    meter_keys = [k for k in all_keys if get_expected_unit(k) == 'm']
+    arm_knee_keys = ['ARM_LEN_M', 'KNEE_HEIGHT_M']
+    unit_fail_keys = ['NECK_WIDTH_M', 'NECK_DEPTH_M', 'UNDERBUST_CIRC_M', 'CHEST_CIRC_M_REF']
+
+    writer = None if dry_run else CuratedChunkWriter(output_path, output_format, all_keys + ['_source'])
+    system_merged = {}  # output preparation warnings, merged across all chunks
+
+    all_source_stats = {}  # source_key -> merged final-stage column stats (for completeness report)
+    all_source_quality = {}
+    all_duplicate_headers = {}
+    all_header_candidates = {}
+    all_arm_knee_traces = {}
+    all_unit_fail_traces = {}
+    stats = {
+        "sources_processed": [],
+        "total_rows": 0,
+        "columns_created": [],
+        "warnings_count": 0,
+        "chunks_processed": 0
+    }
+
+    for source_key, file_path_str in SOURCE_FILES.items():
+        file_path = Path(file_path_str)
+
+        if not file_path.exists():
+            warnings.append({
+                "source": source_key,
+                "file": str(file_path),
+                "column": "all",
+                "reason": "file_not_found",
+                "row_index": None,
+                "original_value": None,
+                "details": f"Source file not found: {file_path}"
+            })
+            continue
+
+        print(f"Processing {source_key} (streaming, chunk_rows={chunk_rows}): {file_path}")
+
+        # For 7th, prefer XLSX over CSV
+        is_xlsx = False
+        if source_key == '7th':
+            xlsx_path = file_path.parent / "7th_data.xlsx"
+            if xlsx_path.exists():
+                file_path = xlsx_path
+                is_xlsx = True
+                print(f"  Using XLSX: {file_path}")
+            else:
+                print(f"  Warning: XLSX not found, using CSV fallback: {file_path}")
+
+        primary_row, code_row, secondary_row = find_header_rows(file_path, mapping, is_xlsx=is_xlsx, source_key=source_key)
+        header_rows_list = [primary_row]
+        if code_row is not None:
+            header_rows_list.append(code_row)
+        if secondary_row is not None:
+            header_rows_list.append(secondary_row)
+        data_start_row = max(header_rows_list) + 1
+        print(f"  Header rows: primary={primary_row}, code={code_row}, secondary={secondary_row}, data_start={data_start_row}")
+
+        trace_arm_knee = arm_knee_trace_path is not None and source_key in ['8th_direct', '8th_3d']
+        trace_unit_fail = unit_fail_trace_path is not None
+        raw_trace_keys = arm_knee_keys if trace_arm_knee else []
+        trace_keys = (arm_knee_keys if trace_arm_knee else []) + (unit_fail_keys if trace_unit_fail else [])
+        final_values = all_keys if completeness_report_path is not None else []
+
+        source_merged = {}
+        stage_stats = defaultdict(dict)  # stage -> merged column stats
+        trace_frames = defaultdict(list)  # stage -> chunk frames of the traced keys only
+        duplicate_headers = {}
+        header_candidates = {}
+        unit_map = None
+        n_chunks = 0
+        rows_in = 0
+        rows_out = 0
+        columns_created = []
+
+        for df_raw, df_secondary in iter_raw_file_chunks(
+            file_path, primary_row, secondary_row, data_start_row, source_key, mapping,
+            is_xlsx=is_xlsx, chunk_rows=chunk_rows, max_rows=max_rows
+        ):
+            chunk_warnings = []
+            extracted_stages = {}
+            df_extracted = extract_columns_from_source(df_raw, df_secondary, source_key, mapping, chunk_warnings,
+                                                       stage_frames=extracted_stages)
+
+            # Units are decided once per source, from the first chunk
+            if unit_map is None:
+                unit_map = sample_units(df_extracted, sample_size=min(100, len(df_extracted)), source_key=source_key)
+                print(f"  Detected units: {len(unit_map)} columns (first chunk)")
+
+            df_canonical = apply_unit_canonicalization(df_extracted, unit_map, chunk_warnings, source_key=source_key)
+
+            df_extracted_raw = extracted_stages['after_extraction_before_preprocess']
+            merge_column_stats(stage_stats['extracted_raw'], collect_column_stats(df_extracted_raw))
+            merge_column_stats(stage_stats['extracted'], collect_column_stats(df_extracted))
+            merge_column_stats(stage_stats['canonical'], collect_column_stats(df_canonical, value_columns=meter_keys))
+            if raw_trace_keys:
+                trace_frames['extracted_raw'].append(df_extracted_raw[raw_trace_keys].copy())
+            if trace_keys:
+                trace_frames['extracted'].append(df_extracted[trace_keys].copy())
+                trace_frames['canonical'].append(df_canonical[trace_keys].copy())
+
+            # handle_missing_values only records warnings; it runs once per source below
+            df_final = apply_outlier_removal(df_canonical, chunk_warnings)
+            df_final['_source'] = source_key
+            merge_column_stats(stage_stats['final'], collect_column_stats(df_final, value_columns=final_values))
+
+            column_order = {}
+            for i, col in enumerate(df_raw.columns):
+                column_order.setdefault(str(col), i)
+                column_order.setdefault(str(col).strip(), i)
+            if quality_summary_path is not None:
+                merge_column_count_infos(duplicate_headers, detect_duplicate_headers(df_raw, source_key), column_order)
+            if header_candidates_path is not None and source_key in ['8th_direct', '8th_3d']:
+                merge_column_count_infos(
+                    header_candidates,
+                    find_header_candidates(df_raw, source_key, arm_knee_keys, primary_row),
+                    column_order
+                )
+
+            merge_chunk_warnings(source_merged, chunk_warnings)
+
+            if writer is not None:
+                output_warnings = []
+                df_output = prepare_output_frame(df_final, output_warnings)
+                merge_chunk_warnings(system_merged, output_warnings)
+                writer.write(df_output)
+
+            n_chunks += 1
+            rows_in += len(df_raw)
+            rows_out += len(df_final)
+            columns_created = list(df_final.columns)
+            print(f"  Chunk {n_chunks}: {len(df_raw)} rows in, {len(df_final)} rows out")
+
+        if n_chunks == 0:
+            warnings.append({
+                "source": source_key,
+                "file": str(file_path),
+                "column": "all",
+                "reason": "file_load_failed",
+                "row_index": None,
+                "original_value": None,
+                "details": "Failed to load file"
+            })
+            continue
+
+        print(f"  Loaded {rows_in} rows in {n_chunks} chunks")
+
+        # Per-chunk warnings (merged), then the whole-source checks
+        warnings.extend(merged_warnings_list(source_merged))
+        check_all_null_extracted_from_stats(stage_stats['extracted_raw'], source_key, warnings, mapping)
+        check_massive_null_introduced_from_stats(stage_stats['extracted'], stage_stats['canonical'],
+                                                 source_key, warnings, mapping)
+        check_scale_and_range_suspected_from_stats(stage_stats['canonical'], source_key, warnings, mapping)
+        record_missing_values_from_stats(stage_stats['canonical'], source_key, warnings)
+        check_all_null_by_source_from_stats(stage_stats['final'], source_key, warnings, mapping)
+
+        df_extracted_raw_all = concat_stage_frames(trace_frames.pop('extracted_raw', []))
+        df_extracted_all = concat_stage_frames(trace_frames.pop('extracted', []))
+        df_canonical_all = concat_stage_frames(trace_frames.pop('canonical', []))
+        if trace_arm_knee:
+            all_arm_knee_traces[source_key] = [
+                collect_arm_knee_trace(df_extracted_raw_all, source_key, 'after_extraction_before_preprocess'),
+                collect_arm_knee_trace(df_extracted_all, source_key, 'after_preprocess'),
+                collect_arm_knee_trace(df_canonical_all, source_key, 'after_unit_conversion'),
+            ]
+        if trace_unit_fail:
+            all_unit_fail_traces[source_key] = [
+                collect_unit_fail_trace(df_extracted_all, source_key, 'after_extraction_before_preprocess'),
+                collect_unit_fail_trace(df_extracted_all, source_key, 'after_preprocess'),
+                collect_unit_fail_trace(df_canonical_all, source_key, 'after_unit_conversion'),
+            ]
+        if quality_summary_path is not None:
+            all_source_quality[source_key] = calculate_source_quality_from_stats(
+                stage_stats['final'], rows_out, source_key, mapping)
+            if duplicate_headers:
+                all_duplicate_headers[source_key] = duplicate_headers
+        if header_candidates:
+            all_header_candidates[source_key] = header_candidates
+        if completeness_report_path is not None:
+            all_source_stats[source_key] = stage_stats['final']
+
+        stats["sources_processed"].append(source_key)
+        stats["total_rows"] += rows_out
+        stats["columns_created"] = columns_created
+        stats["chunks_processed"] += n_chunks
+
+    if dry_run:
+        print("\n=== DRY RUN (streaming) ===")
+        print(f"Would write {len(stats['sources_processed'])} sources in {stats['chunks_processed']} chunks")
+        print(f"Total rows: {stats['total_rows']}")
+        print(f"Columns: {len(stats['columns_created'])}")
+        print(f"Warnings: {len(warnings)}")
+        return stats
+
+    if not writer.close():
+        warnings.append({
+            "source": "system",
+            "file": "build_curated_v0.py",
+            "column": "all",
+            "reason": "no_data_processed",
+            "row_index": None,
+            "original_value": None,
+            "details": "No data was successfully processed from any source"
+        })
+        return stats
+
+    warnings.extend(merged_warnings_list(system_merged))
+
+    print(f"\nSaved output: {output_path}")
+    print(f"  Rows: {writer.rows_written}")
+    print(f"  Columns: {len(writer.columns)}")
+
+    finalize_build_outputs(
+        warnings, stats, mapping,
+        warnings_output_path=warnings_output_path,
+        quality_summary_path=quality_summary_path,
+        all_source_quality=all_source_quality,
+        all_duplicate_headers=all_duplicate_headers,
+        header_candidates_path=header_candidates_path,
+        all_header_candidates=all_header_candidates,
+        arm_knee_trace_path=arm_knee_trace_path,
+        all_arm_knee_traces=all_arm_knee_traces,
+        unit_fail_trace_path=unit_fail_trace_path,
+        all_unit_fail_traces=all_unit_fail_traces,
+        completeness_report_path=completeness_report_path,
+        all_source_stats=all_source_stats
+    )
+
     return stats
 
 
@@ -2534,6 +3580,17 @@ def main():
         default=None,
         help='Path to save completeness report markdown file (optional, facts-only report with non_null_count, percentiles, and scale observations)'
     )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Process each source in row chunks and append to the output (frames bounded by --chunk-rows)'
+    )
+    parser.add_argument(
+        '--chunk-rows',
+        type=int,
+        default=STREAM_CHUNK_ROWS,
+        help=f'Rows per chunk with --streaming (default: {STREAM_CHUNK_ROWS})'
+    )
     
     args = parser.parse_args()
     
@@ -2561,7 +3618,9 @@ def main():
         header_candidates_path=header_candidates_path,
         arm_knee_trace_path=arm_knee_trace_path,
         unit_fail_trace_path=unit_fail_trace_path,
-        completeness_report_path=completeness_report_path
+        completeness_report_path=completeness_report_path,
+        streaming=args.streaming,
+        chunk_rows=args.chunk_rows
     )
     
     return 0
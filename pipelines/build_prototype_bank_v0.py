@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Build the Body prototype bank (B1) from curated_v0.
+
+This pipeline:
+1. Loads curated_v0 (parquet or csv) and keeps rows with valid SEX/AGE/HEIGHT_M/WEIGHT_KG
+2. Bins subjects: sex(2) x height_q(8) x BMI_q(6) x age_bucket(4) = 384 bins
+   - height_q / BMI_q edges are per-sex quantiles on integer cm / integer 0.1 BMI
+     (boundary comparisons on integers only; a value equal to an edge goes to the upper bin)
+   - age buckets are fixed: [10,14], [15,29], [30,49], [50,inf)
+3. Merges sparse bins (fewer than --min-bin-size subjects): age -> BMI -> height
+   (the bin is represented from the pooled subjects of the coarser group)
+4. Selects one representative per bin: P1 medoid (Euclidean, z-scored features)
+5. Writes prototype_index.json, prototype_meta.json, prototype_targets.json and
+   prototype_params/{prototype_id}.npz
+
+Medoids are exact but never hold the O(n^2) pairwise matrix: rows whose lower bound
+n * ||x_i - mean|| exceeds an exact cost are dropped (about half of a pool; distances in
+the z-scored features concentrate, so triangle-inequality bounds prune little more), the
+rest are screened in blocks with matrix-product distances, and only rows within the
+screen's rounding error of the best are evaluated exactly.
+Ties are broken by HUMAN_ID, so the bank is deterministic for a given input.
+
+Contract: docs/plans/Body_Module_Plan_v1.md (5.2, 7 B1, 9, 10)
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+BINNING_VERSION = "binning_v1"
+SELECTION_VERSION = "selection_p1_medoid_v1"
+
+SEXES = ("M", "F")
+N_HEIGHT_Q = 8
+N_BMI_Q = 6
+# Lower bounds of the age buckets [10,14], [15,29], [30,49], [50,inf)
+AGE_BUCKET_LOWER = (10, 15, 30, 50)
+N_AGE_BUCKETS = len(AGE_BUCKET_LOWER)
+N_BINS = len(SEXES) * N_HEIGHT_Q * N_BMI_Q * N_AGE_BUCKETS
+
+CM_PER_M = 100.0
+# Sparse bins are merged until the pooled group has at least this many subjects
+MIN_BIN_SIZE = 5
+
+# Merge order for sparse bins (Body_Module_Plan_v1 B1): age -> BMI -> height
+MERGE_LEVELS = ("none", "age", "bmi", "height")
+
+# Calibration targets (torso 5 + neck) carried into prototype_targets.json
+TARGET_KEYS = (
+    "HEIGHT_M",
+    "WEIGHT_KG",
+    "BUST_CIRC_M",
+    "UNDERBUST_CIRC_M",
+    "WAIST_CIRC_M",
+    "HIP_CIRC_M",
+    "SHOULDER_WIDTH_M",
+    "NECK_CIRC_M",
+)
+
+# Medoid distance features (z-scored per sex; missing values sit at the mean)
+FEATURE_KEYS = (
+    "HEIGHT_M",
+    "BMI",
+    "BUST_CIRC_M",
+    "WAIST_CIRC_M",
+    "HIP_CIRC_M",
+    "SHOULDER_WIDTH_M",
+    "NECK_CIRC_M",
+)
+
+
+def prototype_id(sex: str, height_q: int, bmi_q: int, age_bucket: int) -> str:
+    """Stable prototype id of a bin, e.g. M_h3_b2_a1."""
+    return f"{sex}_h{height_q}_b{bmi_q}_a{age_bucket}"
+
+
+def bin_index(sex_idx: np.ndarray, height_q: np.ndarray, bmi_q: np.ndarray, age_bucket: np.ndarray) -> np.ndarray:
+    """Flat bin index in [0, N_BINS) (sex slowest, age bucket fastest)."""
+    return ((sex_idx * N_HEIGHT_Q + height_q) * N_BMI_Q + bmi_q) * N_AGE_BUCKETS + age_bucket
+
+
+def height_cm_int(height_m: np.ndarray) -> np.ndarray:
+    """Integer cm used for every height bin comparison."""
+    return np.rint(np.asarray(height_m, dtype=np.float64) * CM_PER_M).astype(np.int64)
+
+
+def bmi_x10_int(height_m: np.ndarray, weight_kg: np.ndarray) -> np.ndarray:
+    """BMI rounded to 0.1, as an integer (BMI * 10) used for every BMI bin comparison."""
+    height_m = np.asarray(height_m, dtype=np.float64)
+    bmi = np.asarray(weight_kg, dtype=np.float64) / (height_m * height_m)
+    return np.rint(bmi * 10.0).astype(np.int64)
+
+
+def quantile_edges(values: np.ndarray, n_bins: int) -> np.ndarray:
+    """n_bins - 1 interior edges: quantiles of integer values, rounded to integers."""
+    if values.size == 0:
+        return np.zeros(n_bins - 1, dtype=np.int64)
+    qs = np.arange(1, n_bins) / n_bins
+    return np.rint(np.quantile(values, qs)).astype(np.int64)
+
+
+def assign_bins(
+    sex: Sequence[str],
+    height_cm: np.ndarray,
+    bmi_x10: np.ndarray,
+    age: np.ndarray,
+    height_edges: Dict[str, Sequence[int]],
+    bmi_edges: Dict[str, Sequence[int]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized bin assignment (also used online with the edges from prototype_meta.json).
+
+    Args:
+        sex: "M"/"F" per subject
+        height_cm: integer cm
+        bmi_x10: integer BMI * 10
+        age: ages in years (>= 10)
+        height_edges / bmi_edges: per-sex interior edges (integers)
+
+    Returns:
+        (sex_idx, height_q, bmi_q, age_bucket) int64 arrays; equal-to-edge goes to the upper bin
+    """
+    sex = np.asarray(sex, dtype=object)
+    height_cm = np.asarray(height_cm, dtype=np.int64)
+    bmi_x10 = np.asarray(bmi_x10, dtype=np.int64)
+    age_int = np.floor(np.asarray(age, dtype=np.float64)).astype(np.int64)
+
+    sex_idx = np.full(sex.shape[0], -1, dtype=np.int64)
+    height_q = np.zeros(sex.shape[0], dtype=np.int64)
+    bmi_q = np.zeros(sex.shape[0], dtype=np.int64)
+    for s_idx, s in enumerate(SEXES):
+        rows = sex == s
+        sex_idx[rows] = s_idx
+        height_q[rows] = np.searchsorted(np.asarray(height_edges[s], dtype=np.int64), height_cm[rows], side="right")
+        bmi_q[rows] = np.searchsorted(np.asarray(bmi_edges[s], dtype=np.int64), bmi_x10[rows], side="right")
+    if np.any(sex_idx < 0):
+        raise ValueError(f"sex must be one of {SEXES}")
+    if np.any(age_int < AGE_BUCKET_LOWER[0]):
+        raise ValueError(f"age must be >= {AGE_BUCKET_LOWER[0]}")
+
+    age_bucket = np.searchsorted(np.asarray(AGE_BUCKET_LOWER[1:]), age_int, side="right").astype(np.int64)
+    return sex_idx, height_q, bmi_q, age_bucket
+
+
+# Candidate rows per block of the BLAS distance screen in medoid_index
+MEDOID_BLOCK_ROWS = 64
+
+
+def medoid_index(X: np.ndarray, tie_keys: Sequence[str]) -> Tuple[int, float, int]:
+    """
+    Exact Euclidean medoid of the rows of X without materialising the pairwise matrix.
+
+    1. n * ||x_i - mean|| is a lower bound on the cost E(i) = sum_j ||x_i - x_j||; rows
+       whose bound exceeds an exact cost are dropped.
+    2. The remaining rows are screened in blocks with matrix-product distances
+       (|a|^2 + |b|^2 - 2ab, on centred X), which carry a bounded rounding error.
+    3. Rows whose screened cost is within that error of the best are evaluated exactly
+       (direct differences, as the brute-force cost); equal costs are broken by the
+       smallest tie key.
+
+    Returns:
+        (row index, mean distance of the medoid to all rows, number of exact cost evaluations)
+    """
+    n = X.shape[0]
+    if n == 0:
+        raise ValueError("medoid of an empty set")
+    X = np.asarray(X, dtype=np.float64)
+    tie_keys = np.asarray(tie_keys, dtype=object)
+
+    def exact_cost(i: int) -> float:
+        return float(np.linalg.norm(X - X[i][None, :], axis=1).sum())
+
+    # Rounding of the expanded squared distance is below gamma * (|a|^2 + |b|^2) with
+    # gamma = (d + 4) * eps; |sqrt(x) - sqrt(y)| <= sqrt(|x - y|) bounds each distance,
+    # and a relative n * eps term covers summing n distances.
+    eps = np.finfo(np.float64).eps
+    gamma = (X.shape[1] + 4) * eps
+
+    mu = X.mean(axis=0)
+    Xc = X - mu[None, :]
+    sq = np.einsum("ij,ij->i", Xc, Xc)
+    sq_max = float(sq.max())
+    lower = n * np.sqrt(sq) * (1.0 - 2.0 * n * gamma)
+    order = np.lexsort((tie_keys, lower))
+
+    upper = exact_cost(int(order[0]))
+    candidates = np.sort(order[lower[order] <= upper])
+
+    screened = np.empty(candidates.shape[0])
+    tol = np.empty(candidates.shape[0])
+    for start in range(0, candidates.shape[0], MEDOID_BLOCK_ROWS):
+        rows = candidates[start:start + MEDOID_BLOCK_ROWS]
+        d = Xc[rows] @ Xc.T
+        d *= -2.0
+        d += sq[None, :]
+        d += sq[rows][:, None]
+        np.maximum(d, 0.0, out=d)
+        np.sqrt(d, out=d)
+        cost = d.sum(axis=1)
+        screened[start:start + rows.shape[0]] = cost
+        tol[start:start + rows.shape[0]] = (
+            n * np.sqrt(2.0 * gamma * (sq[rows] + sq_max)) + 2.0 * n * eps * cost
+        )
+
+    # Every row that can still tie or beat the best is evaluated exactly
+    bound = float((screened + tol).min())
+    finalists = candidates[screened - tol <= bound]
+
+    best_i, best_cost = -1, np.inf
+    for i in finalists:
+        cost = exact_cost(int(i))
+        if cost < best_cost or (cost == best_cost and tie_keys[i] < tie_keys[best_i]):
+            best_i, best_cost = int(i), cost
+    return best_i, best_cost / n, 1 + len(finalists)
+
+
+def load_curated(input_path: Path) -> pd.DataFrame:
+    """curated_v0 parquet/csv -> rows usable for binning (sorted by SEX, HUMAN_ID)."""
+    if input_path.suffix == ".csv":
+        df = pd.read_csv(input_path, dtype={"HUMAN_ID": str, "SEX": str})
+    else:
+        df = pd.read_parquet(input_path)
+
+    missing = [c for c in ("HUMAN_ID", "SEX", "AGE", "HEIGHT_M", "WEIGHT_KG") if c not in df.columns]
+    if missing:
+        raise KeyError(f"curated_v0 missing required columns: {missing}")
+
+    df = df.copy()
+    df["HUMAN_ID"] = df["HUMAN_ID"].astype(str)
+    df["SEX"] = df["SEX"].astype(str).str.strip().str.upper()
+    for col in ("AGE", "HEIGHT_M", "WEIGHT_KG") + TARGET_KEYS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        else:
+            df[col] = np.nan
+
+    valid = (
+        df["SEX"].isin(SEXES)
+        & (df["AGE"] >= AGE_BUCKET_LOWER[0])
+        & (df["HEIGHT_M"] > 0)
+        & (df["WEIGHT_KG"] > 0)
+    )
+    df = df.loc[valid.to_numpy()]
+    return df.sort_values(["SEX", "HUMAN_ID"], kind="mergesort").reset_index(drop=True)
+
+
+def _feature_matrix(df: pd.DataFrame, rows: np.ndarray) -> Tuple[np.ndarray, Dict[str, Dict[str, float]]]:
+    """z-scored FEATURE_KEYS for the given rows (one sex); NaN -> 0 (the mean)."""
+    cols = []
+    stats = {}
+    for key in FEATURE_KEYS:
+        v = df[key].to_numpy(dtype=np.float64)[rows]
+        mean = float(np.nanmean(v)) if np.any(np.isfinite(v)) else 0.0
+        std = float(np.nanstd(v)) if np.any(np.isfinite(v)) else 0.0
+        z = (v - mean) / std if std > 0 else np.zeros_like(v)
+        cols.append(np.where(np.isfinite(z), z, 0.0))
+        stats[key] = {"mean": mean, "std": std}
+    return np.stack(cols, axis=1), stats
+
+
+def _json_value(v: Any) -> Any:
+    v = float(v)
+    return v if np.isfinite(v) else None
+
+
+def build_prototype_bank(
+    input_path: Path,
+    output_dir: Path,
+    min_bin_size: int = MIN_BIN_SIZE,
+    dataset_version: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the prototype bank from curated_v0.
+
+    Args:
+        input_path: curated_v0 parquet/csv
+        output_dir: bank directory (json files + prototype_params/)
+        min_bin_size: sparse-bin merge threshold
+        dataset_version: recorded version key (default: SHA-256 prefix of the input file)
+
+    Returns:
+        Build stats dict
+    """
+    if dataset_version is None:
+        dataset_version = "sha256:" + hashlib.sha256(input_path.read_bytes()).hexdigest()[:16]
+
+    df = load_curated(input_path)
+    df["BMI"] = df["WEIGHT_KG"] / (df["HEIGHT_M"] * df["HEIGHT_M"])
+    n = len(df)
+
+    h_cm = height_cm_int(df["HEIGHT_M"].to_numpy())
+    bmi10 = bmi_x10_int(df["HEIGHT_M"].to_numpy(), df["WEIGHT_KG"].to_numpy())
+    sex_arr = df["SEX"].to_numpy(dtype=object)
+
+    height_edges = {s: quantile_edges(h_cm[sex_arr == s], N_HEIGHT_Q) for s in SEXES}
+    bmi_edges = {s: quantile_edges(bmi10[sex_arr == s], N_BMI_Q) for s in SEXES}
+    sex_idx, height_q, bmi_q, age_bucket = assign_bins(
+        sex_arr, h_cm, bmi10, df["AGE"].to_numpy(), height_edges, bmi_edges
+    )
+    flat = bin_index(sex_idx, height_q, bmi_q, age_bucket)
+    counts = np.bincount(flat, minlength=N_BINS)
+
+    # Group keys per merge level (coarser groups drop age, then BMI, then height)
+    level_keys = {
+        "none": flat,
+        "age": flat // N_AGE_BUCKETS,
+        "bmi": flat // (N_AGE_BUCKETS * N_BMI_Q),
+        "height": flat // (N_AGE_BUCKETS * N_BMI_Q * N_HEIGHT_Q),
+    }
+    level_counts = {lvl: np.bincount(keys, minlength=N_BINS) for lvl, keys in level_keys.items()}
+    level_divisor = {"none": 1, "age": N_AGE_BUCKETS, "bmi": N_AGE_BUCKETS * N_BMI_Q,
+                     "height": N_AGE_BUCKETS * N_BMI_Q * N_HEIGHT_Q}
+
+    # Row ids grouped by each level key (one stable argsort per level)
+    level_groups: Dict[str, Dict[int, np.ndarray]] = {}
+    for lvl, keys in level_keys.items():
+        order = np.argsort(keys, kind="stable")
+        uniq, starts = np.unique(keys[order], return_index=True)
+        level_groups[lvl] = dict(zip(uniq.tolist(), np.split(order, starts[1:])))
+
+    features = np.zeros((n, len(FEATURE_KEYS)), dtype=np.float64)
+    feature_stats = {}
+    for s in SEXES:
+        rows = np.flatnonzero(sex_arr == s)
+        features[rows], feature_stats[s] = _feature_matrix(df, rows)
+
+    human_ids = df["HUMAN_ID"].to_numpy(dtype=object)
+    medoid_cache: Dict[Tuple[str, int], Tuple[int, float, int]] = {}
+    params_dir = output_dir / "prototype_params"
+    params_dir.mkdir(parents=True, exist_ok=True)
+
+    index_entries: List[Dict[str, Any]] = []
+    targets_entries: Dict[str, Dict[str, Any]] = {}
+    n_exact_evals = 0
+    for b in range(N_BINS):
+        a = b % N_AGE_BUCKETS
+        bq = (b // N_AGE_BUCKETS) % N_BMI_Q
+        hq = (b // (N_AGE_BUCKETS * N_BMI_Q)) % N_HEIGHT_Q
+        s = SEXES[b // (N_AGE_BUCKETS * N_BMI_Q * N_HEIGHT_Q)]
+        pid = prototype_id(s, hq, bq, a)
+
+        merge_level = None
+        for lvl in MERGE_LEVELS:
+            if level_counts[lvl][b // level_divisor[lvl]] >= min_bin_size:
+                merge_level = lvl
+                break
+        if merge_level is None and level_counts["height"][b // level_divisor["height"]] > 0:
+            merge_level = "height"  # whole sex is below min_bin_size: use it anyway
+
+        entry = {
+            "prototype_id": pid,
+            "bin_index": b,
+            "sex": s,
+            "height_q": hq,
+            "bmi_q": bq,
+            "age_bucket": a,
+            "n_members": int(counts[b]),
+            "merge_level": merge_level,
+            "n_pool": 0,
+            "medoid_human_id": None,
+        }
+        if merge_level is None:
+            entry["status"] = "EMPTY"
+            index_entries.append(entry)
+            continue
+
+        group_key = b // level_divisor[merge_level]
+        pool = level_groups[merge_level][group_key]
+        cache_key = (merge_level, group_key)
+        if cache_key not in medoid_cache:
+            medoid_cache[cache_key] = medoid_index(features[pool], human_ids[pool])
+            n_exact_evals += medoid_cache[cache_key][2]
+        m_local, mean_dist, _ = medoid_cache[cache_key]
+        m_row = int(pool[m_local])
+
+        entry["status"] = "OK"
+        entry["n_pool"] = int(pool.size)
+        entry["medoid_human_id"] = str(human_ids[m_row])
+        entry["medoid_mean_dist"] = float(mean_dist)
+        index_entries.append(entry)
+
+        targets = {key: _json_value(df[key].iat[m_row]) for key in TARGET_KEYS}
+        targets_entries[pid] = {
+            "medoid_human_id": str(human_ids[m_row]),
+            "sex": s,
+            "age": _json_value(df["AGE"].iat[m_row]),
+            "targets": targets,
+        }
+
+        member_dist = np.linalg.norm(features[pool] - features[m_row][None, :], axis=1)
+        np.savez_compressed(
+            params_dir / f"{pid}.npz",
+            target_keys=np.array(TARGET_KEYS),
+            targets=np.array([df[key].iat[m_row] for key in TARGET_KEYS], dtype=np.float32),
+            feature_keys=np.array(FEATURE_KEYS),
+            medoid_features=features[m_row].astype(np.float32),
+            member_human_ids=human_ids[pool].astype(str),
+            member_dist=member_dist.astype(np.float32),
+        )
+
+    version_keys = {
+        "dataset_version": dataset_version,
+        "binning_version": BINNING_VERSION,
+        "selection_version": SELECTION_VERSION,
+    }
+    index = {**version_keys, "n_bins": N_BINS, "prototypes": index_entries}
+    meta = {
+        **version_keys,
+        "input": str(input_path),
+        "n_subjects": int(n),
+        "min_bin_size": int(min_bin_size),
+        "bin_schema": {
+            "sex": list(SEXES),
+            "n_height_q": N_HEIGHT_Q,
+            "n_bmi_q": N_BMI_Q,
+            "age_bucket_lower": list(AGE_BUCKET_LOWER),
+            "merge_order": list(MERGE_LEVELS[1:]),
+        },
+        "height_edges_cm": {s: height_edges[s].tolist() for s in SEXES},
+        "bmi_edges_x10": {s: bmi_edges[s].tolist() for s in SEXES},
+        "feature_keys": list(FEATURE_KEYS),
+        "feature_stats": feature_stats,
+        "target_keys": list(TARGET_KEYS),
+        "bin_counts": counts.tolist(),
+    }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, payload in (
+        ("prototype_index.json", index),
+        ("prototype_meta.json", meta),
+        ("prototype_targets.json", {**version_keys, "prototypes": targets_entries}),
+    ):
+        with open(output_dir / name, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+
+    merge_counts = {lvl: sum(1 for e in index_entries if e["merge_level"] == lvl) for lvl in MERGE_LEVELS}
+    return {
+        "n_subjects": int(n),
+        "n_prototypes": len(targets_entries),
+        "n_empty": sum(1 for e in index_entries if e["status"] == "EMPTY"),
+        "merge_counts": merge_counts,
+        "n_medoid_pools": len(medoid_cache),
+        "n_exact_cost_evals": int(n_exact_evals),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build Body prototype bank (B1) from curated_v0')
+    parser.add_argument(
+        '--input',
+        type=str,
+        default='data/processed/curated_v0/curated_v0.parquet',
+        help='curated_v0 parquet/csv path'
+    )
+    parser.add_argument(
+        '--out-dir',
+        type=str,
+        default='data/processed/prototype_bank_v0',
+        help='Output directory (prototype_*.json + prototype_params/)'
+    )
+    parser.add_argument(
+        '--min-bin-size',
+        type=int,
+        default=MIN_BIN_SIZE,
+        help=f'Sparse bins below this size are merged age -> BMI -> height (default: {MIN_BIN_SIZE})'
+    )
+    parser.add_argument(
+        '--dataset-version',
+        type=str,
+        default=None,
+        help='dataset_version key to record (default: SHA-256 prefix of the input file)'
+    )
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Error: curated_v0 not found: {input_path}")
+        return 1
+
+    stats = build_prototype_bank(
+        input_path=input_path,
+        output_dir=Path(args.out_dir),
+        min_bin_size=args.min_bin_size,
+        dataset_version=args.dataset_version,
+    )
+    print(f"Subjects: {stats['n_subjects']}")
+    print(f"Prototypes: {stats['n_prototypes']}/{N_BINS} (empty: {stats['n_empty']})")
+    print(f"Merge levels: {stats['merge_counts']}")
+    print(f"Medoid pools: {stats['n_medoid_pools']}, exact cost evaluations: {stats['n_exact_cost_evals']}")
+    print(f"Output: {args.out_dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
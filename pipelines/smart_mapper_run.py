@@ -50,7 +50,43 @@ def create_dummy_config(output_path: str):
     print(f"Created dummy config: {output_path}")
 
 
-def run_smart_mapper(config_path: str, output_dir: Optional[str] = None, run_id_override: Optional[str] = None):
+def result_to_json(result: dict, run_id: str) -> dict:
+    """JSON-serializable view of a SmartMapper.optimize() result (result.json schema)."""
+    return {
+        "run_id": run_id,
+        "scale": result["scale"],
+        "betas": result["betas"].tolist(),
+        "beta_init": result["beta_init"].tolist(),
+        "predicted_shoulder_width_m": result["predicted_shoulder_width_m"],
+        "loss_total": result["loss_total"],
+        "loss_measurement": result["loss_measurement"],
+        "loss_anchor": result["loss_anchor"],
+        "loss_beta_mag": result["loss_beta_mag"],
+        "n_iter": result["n_iter"],
+        "status": result.get("status", "SUCCESS"),
+        "fail_reason": result.get("fail_reason"),
+        # Sanity checks
+        "height_pred_m": result.get("height_pred_m"),
+        "joint_sw_m": result.get("joint_sw_m"),
+        "measured_sw_m": result.get("measured_sw_m"),
+    }
+
+
+def write_trace_csv(path: str, trace: list):
+    """Write per-iteration trace rows to CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["iter", "loss_total", "loss_meas", "loss_anchor", "loss_beta_mag", "dt_ms"])
+        writer.writeheader()
+        for row in trace:
+            writer.writerow(row)
+
+
+def run_smart_mapper(
+    config_path: str,
+    output_dir: Optional[str] = None,
+    run_id_override: Optional[str] = None,
+    trace_level: str = "summary",
+):
     """
     Run Smart Mapper with config file.
     
@@ -58,6 +94,7 @@ def run_smart_mapper(config_path: str, output_dir: Optional[str] = None, run_id_
         config_path: Path to JSON config file
         output_dir: Output directory (default: artifacts/runs/smart_mapper/<run_id>)
         run_id_override: Optional RUN_ID override (default: from env or auto-generate)
+        trace_level: SmartMapper trace level ("off", "summary", "full")
     """
     # Resolve RUN_ID first (before any artifact path creation)
     run_id = resolve_run_id(run_id_override)
@@ -111,6 +148,7 @@ def run_smart_mapper(config_path: str, output_dir: Optional[str] = None, run_id_
     mapper = SmartMapper(
         model_path=model_path,
         beta_means=beta_means,
+        trace_level=trace_level,
     )
     print(f"  Device: {mapper.device}")
     print()
@@ -142,24 +180,7 @@ def run_smart_mapper(config_path: str, output_dir: Optional[str] = None, run_id_
     print(f"  Config: {config_out_path}")
     
     # 2. Save result
-    result_out = {
-        "run_id": run_id,
-        "scale": result["scale"],
-        "betas": result["betas"].tolist(),
-        "beta_init": result["beta_init"].tolist(),
-        "predicted_shoulder_width_m": result["predicted_shoulder_width_m"],
-        "loss_total": result["loss_total"],
-        "loss_measurement": result["loss_measurement"],
-        "loss_anchor": result["loss_anchor"],
-        "loss_beta_mag": result["loss_beta_mag"],
-        "n_iter": result["n_iter"],
-        "status": result.get("status", "SUCCESS"),
-        "fail_reason": result.get("fail_reason"),
-        # Sanity checks
-        "height_pred_m": result.get("height_pred_m"),
-        "joint_sw_m": result.get("joint_sw_m"),
-        "measured_sw_m": result.get("measured_sw_m"),
-    }
+    result_out = result_to_json(result, run_id)
     
     result_out_path = os.path.join(output_dir, "result.json")
     with open(result_out_path, "w", encoding="utf-8") as f:
@@ -168,11 +189,7 @@ def run_smart_mapper(config_path: str, output_dir: Optional[str] = None, run_id_
     
     # 3. Save trace
     trace_out_path = os.path.join(output_dir, "trace.csv")
-    with open(trace_out_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["iter", "loss_total", "loss_meas", "loss_anchor", "loss_beta_mag", "dt_ms"])
-        writer.writeheader()
-        for row in result["trace"]:
-            writer.writerow(row)
+    write_trace_csv(trace_out_path, result["trace"])
     print(f"  Trace: {trace_out_path}")
     
     # Save manifest.json (for artifact tracking)
@@ -202,6 +219,103 @@ def run_smart_mapper(config_path: str, output_dir: Optional[str] = None, run_id_
     return result
 
 
+def run_smart_mapper_batch(
+    config_path: str,
+    output_dir: Optional[str] = None,
+    run_id_override: Optional[str] = None,
+    trace_level: str = "summary",
+):
+    """
+    Run Smart Mapper for many subjects with SmartMapper.optimize_batch.
+    
+    The config holds the shared model_path/data_dir and a "subjects" list; each
+    subject has sex, height_m, weight_kg and optional age/shoulder_width_m.
+    Subjects of the same sex are fitted as one batched LBFGS problem.
+    
+    Outputs (under output_dir): config.json, results.json (list of result.json
+    records, input order), trace_<i>.csv per subject, manifest.json.
+    """
+    run_id = resolve_run_id(run_id_override)
+    
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    
+    required = ["model_path", "data_dir", "subjects"]
+    missing = [k for k in required if k not in config]
+    if missing:
+        raise ValueError(f"Config missing required fields: {missing}")
+    
+    subjects = []
+    for i, subject in enumerate(config["subjects"]):
+        missing = [k for k in ("sex", "height_m", "weight_kg") if k not in subject]
+        if missing:
+            raise ValueError(f"Subject {i} missing required fields: {missing}")
+        target = subject.get("shoulder_width_m")
+        subjects.append({
+            "sex": subject["sex"],
+            "age": subject.get("age"),
+            "height_m": float(subject["height_m"]),
+            "weight_kg": float(subject["weight_kg"]),
+            "target_shoulder_width_m": float(target) if target is not None else None,
+        })
+    
+    if output_dir is None:
+        output_dir = f"artifacts/runs/smart_mapper/{run_id}"
+    os.makedirs(output_dir, exist_ok=True)
+    
+    print("=" * 80)
+    print("Smart Mapper v0.1 (batch)")
+    print("=" * 80)
+    print(f"Config: {config_path}")
+    print(f"Output: {output_dir}")
+    print(f"Subjects: {len(subjects)}")
+    print()
+    
+    beta_means = load_beta_means(config["data_dir"])
+    mapper = SmartMapper(
+        model_path=config["model_path"],
+        beta_means=beta_means,
+        trace_level=trace_level,
+    )
+    print(f"  Device: {mapper.device}")
+    
+    print("Running batched optimization...")
+    results = mapper.optimize_batch(subjects)
+    
+    with open(os.path.join(output_dir, "config.json"), "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+    
+    results_out = [result_to_json(result, run_id) for result in results]
+    with open(os.path.join(output_dir, "results.json"), "w", encoding="utf-8") as f:
+        json.dump(results_out, f, indent=2)
+    
+    trace_files = []
+    for i, result in enumerate(results):
+        name = f"trace_{i:04d}.csv"
+        write_trace_csv(os.path.join(output_dir, name), result["trace"])
+        trace_files.append(name)
+    
+    manifest = {
+        "run_id": run_id,
+        "timestamp": datetime.now().isoformat(),
+        "script": "smart_mapper_run.py",
+        "config_path": config_path,
+        "output_dir": output_dir,
+        "artifacts": {
+            "config": "config.json",
+            "results": "results.json",
+            "traces": trace_files,
+        },
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    
+    n_ok = sum(1 for r in results_out if r["status"] == "SUCCESS")
+    print(f"[OK] {n_ok}/{len(results_out)} subjects succeeded. Results saved to: {output_dir}")
+    
+    return results
+
+
 def main():
     ap = argparse.ArgumentParser(
         description="Smart Mapper v0.1 - Map anthropometric measurements to SMPL-X parameters"
@@ -224,6 +338,18 @@ def main():
         default=None,
         help="Run ID (default: from env RUN_ID or auto-generate KST timestamp)",
     )
+    ap.add_argument(
+        "--trace-level",
+        type=str,
+        choices=["off", "summary", "full"],
+        default="summary",
+        help="Per-iteration trace: summary (closure values at the accepted step), full (extra forward per iter), off (default: summary)",
+    )
+    ap.add_argument(
+        "--batch",
+        action="store_true",
+        help="Config lists many subjects under \"subjects\"; fit them with SmartMapper.optimize_batch",
+    )
     ap.add_argument(
         "--create_dummy_config",
         type=str,
@@ -241,7 +367,8 @@ def main():
         ap.error("--config is required (unless using --create_dummy_config)")
     
     try:
-        run_smart_mapper(args.config, args.output_dir, args.run_id)
+        run = run_smart_mapper_batch if args.batch else run_smart_mapper
+        run(args.config, args.output_dir, args.run_id, args.trace_level)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         import traceback
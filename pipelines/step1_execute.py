@@ -3,9 +3,9 @@ import re
 import glob
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 import torch
-import smplx
+
+from core.smart_mapper.model_registry import MODEL_REGISTRY
 
 # ---------------------------------------------------------
 # ⚙️ 설정 (Configuration)
@@ -65,12 +65,6 @@ def parse_filename_meta(path: str):
 # ---------------------------------------------------------
 # 📏 1. Robust Canonical Height
 # ---------------------------------------------------------
-def robust_height_cm(vertices, q_low=0.005, q_high=0.995):
-    y = vertices[:, 1]
-    y_low = torch.quantile(y, q_low)
-    y_high = torch.quantile(y, q_high)
-    return (y_high - y_low).item() * 100.0
-
 def get_canonical_heights(model_root, num_betas=20):
     """
     model_root는 .../models (그 아래에 smplx 폴더 존재)
@@ -81,22 +75,8 @@ def get_canonical_heights(model_root, num_betas=20):
     canonical_h = {}
 
     for gender in ["male", "female"]:
-        model = smplx.create(
-            model_root,
-            model_type="smplx",
-            gender=gender,
-            use_pca=False,
-            num_betas=num_betas,
-            batch_size=1,
-            ext="pkl",  # ✅ .pkl 강제
-        ).to(device)
-        model.eval()
-
-        with torch.no_grad():
-            betas = torch.zeros((1, num_betas), device=device)
-            out = model(betas=betas)
-            verts = out.vertices[0]
-            h = robust_height_cm(verts)
+        # 프로세스 공용 레지스트리 (SmartMapper와 모델/캐논 신장 공유, .pkl 로드)
+        h = MODEL_REGISTRY.get_canonical_height(model_root, gender, num_betas, device) * 100.0
 
         canonical_h[gender] = h
         print(f"   ✅ {gender.capitalize()}: {h:.2f} cm")
@@ -214,6 +194,140 @@ def process_row(row, canonical_heights, source_file, age_low, age_high, file_gen
 
     return target, init_beta
 
+# ---------------------------------------------------------
+# 🧮 3-b. 컬럼 단위(벡터화) 처리 — process_row와 결과 동일
+# ---------------------------------------------------------
+TARGET_COLUMNS = [
+    "id", "source_file", "gender",
+    "age", "age_low", "age_high",
+    "height_cm", "weight_kg", "chest_cm", "waist_cm", "hip_cm",
+    "body_scale", "raw_scale", "scale_clipped",
+    "bmi", "beta0_raw", "beta0_clipped",
+]
+
+def _python_float_or_nan(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+def parse_float_column(series):
+    """
+    process_row의 float(row[col])과 같은 파싱 (실패 → NaN).
+    숫자형 컬럼은 astype, 그 외는 고유값마다 파이썬 float() 한 번씩.
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64)
+    codes, uniques = pd.factorize(series)
+    parsed = np.array([_python_float_or_nan(u) for u in uniques] + [np.nan], dtype=np.float64)
+    return parsed[codes]  # code -1 (NaN/None) → 마지막 NaN
+
+def normalize_gender_column(df, fallback_gender=None):
+    """normalize_gender를 고유값마다 한 번씩 적용 (컬럼이 없으면 전부 fallback)."""
+    col = COL_MAP["gender"]
+    if col not in df.columns:
+        return np.full(len(df), fallback_gender, dtype=object)
+    codes, uniques = pd.factorize(df[col])
+    mapped = [normalize_gender(u, fallback_gender=fallback_gender) for u in uniques] + [fallback_gender]
+    return np.array(mapped, dtype=object)[codes]
+
+def get_init_betas_batch(height_cm, weight_kg, num_betas=20):
+    """get_init_betas의 벡터화 버전: (N,) → betas (N,num_betas), bmi, beta0_raw, beta0_clipped."""
+    height_cm = np.asarray(height_cm, dtype=np.float64)
+    weight_kg = np.asarray(weight_kg, dtype=np.float64)
+    h_m = height_cm / 100.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bmi = np.where(h_m > 0, weight_kg / (h_m ** 2), np.nan)
+
+    finite = np.isfinite(bmi)
+    beta0_raw = np.where(finite, (bmi - BMI_REF) * BETA0_SCALE, np.nan)
+    beta0_clipped = np.where(finite, np.clip(beta0_raw, -BETA0_CLIP, BETA0_CLIP), np.nan)
+
+    betas = np.zeros((len(height_cm), num_betas), dtype=np.float32)
+    betas[finite, 0] = beta0_clipped[finite]
+    return betas, bmi, beta0_raw, beta0_clipped
+
+def process_frame(df, canonical_heights, source_file, age_low, age_high, file_gender):
+    """
+    process_row를 df 전체에 한 번에 적용.
+    Returns: (유효 행의 컬럼 dict, init betas (N,NUM_BETAS) float32) — 행 순서 유지
+    """
+    n = len(df)
+    gender = normalize_gender_column(df, fallback_gender=file_gender)
+    keep = (gender == "male") | (gender == "female")
+
+    # 필수 숫자 파싱 (컬럼 누락 → 전부 탈락)
+    values = {}
+    for key in ["height", "weight", "chest", "waist", "hip"]:
+        col = COL_MAP[key]
+        values[key] = parse_float_column(df[col]) if col in df.columns else np.full(n, np.nan)
+
+    # 1차 물리 필터 (NaN은 비교가 False라 자동 탈락)
+    for key, (lo, hi) in [("height", HEIGHT_RANGE), ("weight", WEIGHT_RANGE), ("chest", GIRTH_RANGE),
+                          ("waist", GIRTH_RANGE), ("hip", GIRTH_RANGE)]:
+        keep &= (values[key] >= lo) & (values[key] <= hi)
+
+    idx = np.flatnonzero(keep)
+    gender = gender[idx]
+    h = values["height"][idx]
+    w = values["weight"][idx]
+
+    # body_scale
+    base_h = np.where(gender == "male", canonical_heights["male"], canonical_heights["female"])
+    raw_scale = h / base_h
+    final_scale = np.clip(raw_scale, SCALE_CLIP[0], SCALE_CLIP[1])
+    scale_clipped = ~((SCALE_CLIP[0] <= raw_scale) & (raw_scale <= SCALE_CLIP[1]))
+
+    # init betas
+    init_betas, bmi, beta0_raw, beta0_clipped = get_init_betas_batch(h, w, NUM_BETAS)
+
+    # Age(선택)
+    if COL_MAP["age"] in df.columns:
+        age = parse_float_column(df[COL_MAP["age"]])[idx]
+    else:
+        age = np.full(len(idx), np.nan)
+
+    columns = {
+        "id": np.array([f"{source_file}:{int(name)}" for name in df.index[idx]], dtype=object),
+        "source_file": np.full(len(idx), source_file, dtype=object),
+        "gender": gender,
+        "age": age,
+        "age_low": [age_low] * len(idx),
+        "age_high": [age_high] * len(idx),
+        "height_cm": h,
+        "weight_kg": w,
+        "chest_cm": values["chest"][idx],
+        "waist_cm": values["waist"][idx],
+        "hip_cm": values["hip"][idx],
+        "body_scale": final_scale,
+        "raw_scale": raw_scale,
+        "scale_clipped": scale_clipped,
+        "bmi": bmi,
+        "beta0_raw": beta0_raw,
+        "beta0_clipped": beta0_clipped,
+    }
+    return columns, init_betas
+
+def build_targets_frame(frame_columns):
+    """파일별 컬럼 dict를 이어 붙여 targets_metadata DataFrame 생성 (list-of-dict 생성과 같은 dtype)."""
+    n_total = sum(len(cols["id"]) for cols in frame_columns)
+    if n_total == 0:
+        return pd.DataFrame([])
+
+    data = {}
+    for name in TARGET_COLUMNS:
+        parts = [cols[name] for cols in frame_columns]
+        if name in ("age_low", "age_high"):
+            # 파일명 메타: 전부 정수면 int64, None이 섞이면 float64(NaN)
+            merged = [v for part in parts for v in part]
+            if any(v is None for v in merged):
+                data[name] = np.array([np.nan if v is None else v for v in merged], dtype=np.float64)
+            else:
+                data[name] = np.array(merged, dtype=np.int64)
+        else:
+            data[name] = np.concatenate(parts)
+    return pd.DataFrame(data, columns=TARGET_COLUMNS)
+
 # ---------------------------------------------------------
 # 🚀 실행부
 # ---------------------------------------------------------
@@ -232,10 +346,8 @@ def run_step1():
     for p in csv_paths:
         print("  -", os.path.basename(p))
 
-    valid_targets = []
-    valid_betas = []
-    male_betas = []
-    female_betas = []
+    frame_columns = []
+    frame_betas = []
 
     # 3) 파일별 처리
     for path in csv_paths:
@@ -249,28 +361,21 @@ def run_step1():
 
         df = pd.read_csv(path)
 
-        for _, row in tqdm(df.iterrows(), total=len(df), desc=source_file):
-            result = process_row(row, canon_h, source_file, age_low, age_high, file_gender)
-            if result is None:
-                continue
-            target, beta = result
-            valid_targets.append(target)
-            valid_betas.append(beta)
-
-            if target["gender"] == "male":
-                male_betas.append(beta)
-            else:
-                female_betas.append(beta)
+        columns, betas = process_frame(df, canon_h, source_file, age_low, age_high, file_gender)
+        frame_columns.append(columns)
+        frame_betas.append(betas)
+        print(f"   ✅ {len(betas)}/{len(df)} rows valid")
 
     # 4) 저장
     print("\n💾 Saving Artifacts...")
 
-    df_targets = pd.DataFrame(valid_targets)
+    df_targets = build_targets_frame(frame_columns)
     df_targets.to_csv(os.path.join(OUTPUT_FOLDER, "targets_metadata.csv"), index=False)
 
-    valid_betas_arr = np.stack(valid_betas, axis=0).astype(np.float32) if valid_betas else np.zeros((0, NUM_BETAS), dtype=np.float32)
-    male_betas_arr  = np.stack(male_betas, axis=0).astype(np.float32)  if male_betas  else np.zeros((0, NUM_BETAS), dtype=np.float32)
-    female_betas_arr= np.stack(female_betas, axis=0).astype(np.float32)if female_betas else np.zeros((0, NUM_BETAS), dtype=np.float32)
+    valid_betas_arr = np.concatenate(frame_betas, axis=0) if frame_betas else np.zeros((0, NUM_BETAS), dtype=np.float32)
+    genders = df_targets["gender"].to_numpy() if len(df_targets) else np.array([], dtype=object)
+    male_betas_arr  = valid_betas_arr[genders == "male"]
+    female_betas_arr= valid_betas_arr[genders == "female"]
 
     np.save(os.path.join(OUTPUT_FOLDER, "init_betas_all.npy"), valid_betas_arr)
     np.save(os.path.join(OUTPUT_FOLDER, "init_betas_male.npy"), male_betas_arr)
@@ -278,7 +383,7 @@ def run_step1():
 
     print("-" * 60)
     print("🎉 Step 1 Complete!")
-    print(f"   - Total Valid Rows: {len(valid_targets)}")
+    print(f"   - Total Valid Rows: {len(df_targets)}")
     print(f"   - Male Betas: {male_betas_arr.shape}, Female Betas: {female_betas_arr.shape}")
     print(f"   - Canonical Heights: {canon_h}")
     print(f"   - Output Folder: {OUTPUT_FOLDER}")
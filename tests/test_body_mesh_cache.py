@@ -0,0 +1,145 @@
+# test_body_mesh_cache.py
+# Online body-mesh cache (B4): key quantization, TTL + LRU, disk tier, version-key invalidation
+# Purpose: repeat requests are served without calling the mesh factory; stale entries never are
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from core.smart_mapper.body_mesh_cache import (
+    BodyMeshCache,
+    body_mesh_key,
+    height_quant_2cm,
+)
+
+VERSION_KEYS = {
+    "binning_version": "binning_v1",
+    "selection_version": "selection_p1_medoid_v1",
+    "smplx_model_version": "smplx_1.1",
+    "calibration_version": "calib_v1",
+    "measurement_tool_version": "meas_v0",
+}
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _mesh(seed, n=1000):
+    return np.random.default_rng(seed).normal(size=(n, 3)).astype(np.float32), {"WAIST_CIRC_M": 0.8 + seed}
+
+
+def test_height_quant_2cm():
+    assert [height_quant_2cm(h) for h in (170.0, 170.4, 170.6, 171.0, 171.9)] == [170, 170, 170, 170, 172]
+    assert body_mesh_key("M_h3_b2_a1", 171.2, "PZ1") == ("M_h3_b2_a1", 170, "PZ1")
+
+
+def test_get_or_create_hits_skip_factory():
+    cache = BodyMeshCache(VERSION_KEYS)
+    calls = []
+
+    def create():
+        calls.append(1)
+        return _mesh(0)
+
+    key = body_mesh_key("M_h3_b2_a1", 171.2, "PZ1")
+    first = cache.get_or_create(key, create)
+    again = cache.get_or_create(body_mesh_key("M_h3_b2_a1", 170.3, "PZ1"), create)
+    assert len(calls) == 1
+    assert again is first and not again.verts.flags.writeable
+    assert first.verts.tobytes() == _mesh(0)[0].tobytes()
+
+    stats = cache.telemetry()
+    assert stats["hits_memory"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+    assert stats["latency_p95_ms"] is not None
+
+
+def test_ttl_and_lru_eviction():
+    clock = _Clock()
+    keys = [("P", 170 + 2 * i, "PZ1") for i in range(3)]
+    entry_bytes = BodyMeshCache(VERSION_KEYS).put(keys[0], *_mesh(0)).nbytes
+    cache = BodyMeshCache(VERSION_KEYS, max_bytes=2 * entry_bytes, ttl_s=60.0, clock=clock)
+    cache.put(keys[0], *_mesh(0))
+    cache.put(keys[1], *_mesh(1))
+    assert cache.get(keys[0]) is not None  # keys[0] now most recent
+    cache.put(keys[2], *_mesh(2))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+    assert cache.telemetry()["evictions"] == 1
+
+    clock.t += 61.0
+    assert cache.get(keys[0]) is None
+    assert cache.telemetry()["expirations"] == 1
+
+
+def test_memory_budget_counts_subset_payload():
+    verts, _ = _mesh(0, n=10)
+    subset = {"WAIST_CIRC_M": 0.8, "profile": np.zeros(100, dtype=np.float64)}
+    cache = BodyMeshCache(VERSION_KEYS)
+    entry = cache.put(("P", 170, "PZ1"), verts, subset)
+    assert entry.nbytes >= verts.nbytes + subset["profile"].nbytes + len("WAIST_CIRC_M")
+    assert cache.telemetry()["memory_bytes"] == entry.nbytes
+
+    # A budget that fits the vertices but not the subset keeps only the newest entry
+    small = BodyMeshCache(VERSION_KEYS, max_bytes=2 * verts.nbytes + 16)
+    small.put(("P", 170, "PZ1"), verts, subset)
+    small.put(("P", 172, "PZ1"), verts, subset)
+    assert len(small) == 1 and small.telemetry()["evictions"] == 1
+
+
+def test_disk_tier_mmap_and_version_invalidation(tmp_path):
+    clock = _Clock()
+    cache = BodyMeshCache(VERSION_KEYS, disk_dir=str(tmp_path), clock=clock)
+    key = ("F_h1_b0_a2", 158, "PZ1")
+    verts, subset = _mesh(3)
+    cache.put(key, verts, subset)
+
+    # New process-equivalent cache: served from disk, memory-mapped
+    cache2 = BodyMeshCache(VERSION_KEYS, disk_dir=str(tmp_path), clock=clock)
+    entry = cache2.get(key)
+    assert isinstance(entry.verts, np.memmap) and not entry.verts.flags.writeable
+    assert np.asarray(entry.verts).tobytes() == verts.tobytes()
+    assert entry.subset == pytest.approx(subset)
+    assert cache2.telemetry()["hits_disk"] == 1
+
+    # Any version key change invalidates both tiers
+    changed = dict(VERSION_KEYS, calibration_version="calib_v2")
+    created = []
+    cache2.get_or_create(key, lambda: created.append(1) or _mesh(4), version_keys=changed)
+    assert created == [1]
+    assert cache2.telemetry()["invalidations"] == 1
+    assert BodyMeshCache(VERSION_KEYS, disk_dir=str(tmp_path), clock=clock).get(key) is None
+
+    with pytest.raises(KeyError):
+        BodyMeshCache({"binning_version": "x"})
+
+
+def test_disk_tier_tracks_usage_without_rescans(tmp_path, monkeypatch):
+    clock = _Clock()
+    keys = [("P", 170 + 2 * i, "PZ1") for i in range(4)]
+    BodyMeshCache(VERSION_KEYS, disk_dir=str(tmp_path), clock=clock).put(keys[0], *_mesh(0))
+    version_dir = next(tmp_path.iterdir())
+    entry_bytes = next(version_dir.iterdir()).stat().st_size
+
+    scans = []
+    listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda path: scans.append(path) or listdir(path))
+    cache = BodyMeshCache(VERSION_KEYS, disk_dir=str(tmp_path), disk_max_bytes=int(2.5 * entry_bytes), clock=clock)
+    cache.put(keys[1], *_mesh(1))
+    cache.clear()
+    assert cache.get(keys[0]) is not None  # disk hit: keys[0] now most recent
+    cache.put(keys[2], *_mesh(2))
+    cache.put(keys[3], *_mesh(3))
+    assert len(scans) == 1  # existing files are scanned once, later puts are tracked
+    assert len(listdir(version_dir)) == 2
+
+    cache.clear()
+    assert cache.get(keys[1]) is None and cache.get(keys[0]) is None
+    assert cache.get(keys[2]) is not None and cache.get(keys[3]) is not None
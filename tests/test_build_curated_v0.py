@@ -8,6 +8,7 @@ Tests unit heuristic safety: ambiguous scale inputs should not trigger conversio
 
 import subprocess
 import sys
+import pytest
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -37,7 +38,9 @@ from pipelines.build_curated_v0 import (
     check_all_null_extracted,
     check_all_null_by_source,
     check_massive_null_introduced,
-    check_scale_and_range_suspected
+    check_scale_and_range_suspected,
+    merge_chunk_warnings,
+    merged_warnings_list
 )
 
 
@@ -2969,3 +2972,269 @@ def test_7th_unit_override_synthetic_regression():
     assert len(override_warnings2) >= 1, "WAIST_CIRC_M should also trigger 7th override"
 
 
+def _write_synthetic_8th_source(path: Path, seed: int, n_rows: int, with_code_row: bool = True):
+    """Synthetic 8th-style CSV (primary/code/secondary header rows) using the v2 mapping columns."""
+    import json
+    mapping_path = Path(__file__).parent.parent / "data" / "column_map" / "sizekorea_v2.json"
+    with open(mapping_path, 'r', encoding='utf-8') as f:
+        mapping = json.load(f)
+    columns = []
+    for key_info in mapping['keys']:
+        column = key_info['sources']['8th_direct']['column']
+        if column and column not in columns and key_info['standard_key'] not in ('HUMAN_ID', 'SEX', 'AGE'):
+            columns.append(column)
+    rng = np.random.default_rng(seed)
+    lines = [',' * (len(columns) + 3), ',표준 측정항목 명,,,' + ','.join(columns)]
+    if with_code_row:
+        lines.append(',표준 측정항목 코드,,,' + ','.join(f'C{i:03d}' for i in range(len(columns))))
+    lines.append(',HUMAN_ID,성별,나이,' + ','.join([''] * len(columns)))
+    for r in range(n_rows):
+        values = []
+        for column in columns:
+            if column == '체중(몸무게)':
+                value = f"{rng.uniform(45, 95):.1f}"
+            elif column == '키':
+                value = str(int(rng.uniform(1500, 1900)))
+            else:
+                value = str(int(rng.uniform(200, 1200)))
+            u = rng.uniform()
+            values.append('9999' if u < 0.03 else ('' if u < 0.06 else value))
+        sex = rng.choice(['M', 'F', 'm', 'X'], p=[0.45, 0.45, 0.05, 0.05])
+        lines.append(f",{2000000 + r},{sex},{int(rng.integers(15, 70))}," + ','.join(values))
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8-sig')
+
+
+def test_streaming_build_matches_in_memory(monkeypatch):
+    """
+    Streaming build (small chunks) must write the same rows and the same warnings
+    (as a multiset) and reports as the in-memory build.
+    
+    chunk_rows=128 keeps >= 100 non-null values per column in the first chunk, so unit
+    sampling (first chunk in streaming mode) sees the same values as the in-memory build.
+    """
+    import tempfile
+    import json
+    import collections
+    import pipelines.build_curated_v0 as builder
+
+    mapping_path = Path(__file__).parent.parent / "data" / "column_map" / "sizekorea_v2.json"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        raw_dir = tmp / "raw"
+        raw_dir.mkdir()
+        _write_synthetic_8th_source(raw_dir / "8th_data_direct.csv", seed=1, n_rows=230)
+        _write_synthetic_8th_source(raw_dir / "8th_data_3d.csv", seed=2, n_rows=170, with_code_row=False)
+        monkeypatch.setattr(builder, "SOURCE_FILES", {
+            "7th": str(raw_dir / "7th_data.csv"),  # missing: file_not_found in both modes
+            "8th_direct": str(raw_dir / "8th_data_direct.csv"),
+            "8th_3d": str(raw_dir / "8th_data_3d.csv"),
+        })
+
+        outputs = {}
+        for mode in ("in_memory", "streaming"):
+            out_dir = tmp / mode
+            builder.build_curated_v0(
+                mapping_path, out_dir / "curated.csv", output_format="csv",
+                warnings_output_path=out_dir / "warnings.jsonl",
+                quality_summary_path=out_dir / "quality.md",
+                completeness_report_path=out_dir / "completeness.md",
+                arm_knee_trace_path=out_dir / "arm_knee_trace.md",
+                unit_fail_trace_path=out_dir / "unit_fail_trace.md",
+                streaming=(mode == "streaming"), chunk_rows=128
+            )
+            with open(out_dir / "warnings.jsonl", 'r', encoding='utf-8') as f:
+                warnings_multiset = collections.Counter(
+                    json.dumps(json.loads(line), sort_keys=True, ensure_ascii=False) for line in f
+                )
+            reports = {
+                name: [line for line in (out_dir / name).read_text(encoding='utf-8').splitlines()
+                       if not line.startswith("Generated:")]
+                for name in ("quality.md", "completeness.md", "arm_knee_trace.md", "unit_fail_trace.md")
+            }
+            outputs[mode] = (pd.read_csv(out_dir / "curated.csv"), warnings_multiset, reports)
+            assert not (out_dir / "curated.csv.partial").exists()
+
+        df_mem, warnings_mem, reports_mem = outputs["in_memory"]
+        df_stream, warnings_stream, reports_stream = outputs["streaming"]
+        pd.testing.assert_frame_equal(df_mem, df_stream, check_dtype=False)
+        assert warnings_mem == warnings_stream
+        assert reports_mem == reports_stream
+
+
+def test_merge_chunk_warnings_sums_counts():
+    """Chunk warnings with the same counted_details template collapse into one warning with summed counts."""
+    from pipelines.build_curated_v0 import counted_details, canonicalization_details
+    base = {"source": "8th_direct", "file": "f.csv", "column": "HEIGHT_M", "row_index": None, "original_value": None}
+    unit_template = "UNIT_DEFAULT_MM_NO_UNIT: assumed_unit=mm, applied_scale=1000, non_null_before={non_null_before}, non_null_after={non_null_after}"
+    merged = {}
+    merge_chunk_warnings(merged, [
+        dict(base, reason="SENTINEL_MISSING", sentinel_value="9999", sentinel_count=2,
+             **counted_details("{sentinel_count} sentinel values (9999) replaced with NaN", sentinel_count=2)),
+        dict(base, reason="unit_conversion_applied",
+             **counted_details(unit_template, non_null_before=10, non_null_after=10)),
+        dict(base, reason="column_not_present", details="Column 'None' not mapped in 8th_direct"),
+        dict(base, reason="unit_conversion_applied",
+             **canonicalization_details("PROVENANCE: mm_to_m, quantization=0.001m", np.zeros(3))),
+    ])
+    merge_chunk_warnings(merged, [
+        dict(base, reason="SENTINEL_MISSING", sentinel_value="9999", sentinel_count=3,
+             **counted_details("{sentinel_count} sentinel values (9999) replaced with NaN", sentinel_count=3)),
+        dict(base, reason="unit_conversion_applied",
+             **counted_details(unit_template, non_null_before=7, non_null_after=6)),
+        dict(base, reason="column_not_present", details="Column 'None' not mapped in 8th_direct"),
+        dict(base, reason="unit_conversion_applied",
+             **canonicalization_details("PROVENANCE: mm_to_m, quantization=0.001m", np.zeros(3),
+                                        coercion_nan_increase=4)),
+    ])
+    result = merged_warnings_list(merged)
+    assert len(result) == 4
+    assert result[0]["details"] == "5 sentinel values (9999) replaced with NaN"
+    assert result[0]["sentinel_count"] == 5
+    assert result[1]["details"] == "UNIT_DEFAULT_MM_NO_UNIT: assumed_unit=mm, applied_scale=1000, non_null_before=17, non_null_after=16"
+    assert result[2]["details"] == "Column 'None' not mapped in 8th_direct"
+    assert result[3]["details"] == "PROVENANCE: mm_to_m, quantization=0.001m, coercion_nan_increase=4"
+
+    # Free-text details are never parsed: digits in them are not treated as counts
+    merged = {}
+    merge_chunk_warnings(merged, [dict(base, reason="file_not_found", details="2 files missing")])
+    merge_chunk_warnings(merged, [dict(base, reason="file_not_found", details="3 files missing")])
+    assert [w["details"] for w in merged_warnings_list(merged)] == ["2 files missing", "3 files missing"]
+
+    unit_fail = canonicalization_details("UNIT_FAIL: 2 invalid value(s) (inf/-inf) detected",
+                                         np.array([np.inf, 1.0, -np.inf]))
+    assert unit_fail["details"] == "UNIT_FAIL: 2 invalid value(s) (inf/-inf) detected"
+    assert unit_fail["_details_counts"]["invalid_count"] == 2
+
+
+def test_streaming_parquet_writer(tmp_path):
+    """CuratedChunkWriter appends Parquet row groups with the fixed schema and moves the file into place on close."""
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    from pipelines.build_curated_v0 import CuratedChunkWriter
+
+    output_path = tmp_path / "out" / "curated.parquet"
+    writer = CuratedChunkWriter(output_path, "parquet", ['HUMAN_ID', 'SEX', 'HEIGHT_M', 'WEIGHT_KG', '_source'])
+    writer.write(pd.DataFrame({'HUMAN_ID': [101, 102], 'SEX': ['M', None], 'HEIGHT_M': [1.7, 1.8],
+                               'WEIGHT_KG': ['61.5', 'x'], '_source': '8th_direct'}))
+    # Second chunk: different inferred dtypes and a missing column
+    writer.write(pd.DataFrame({'HUMAN_ID': ['103'], 'SEX': ['F'], 'HEIGHT_M': ['1.65'], '_source': '8th_3d'}))
+    assert not output_path.exists()
+    assert writer.close()
+    assert not writer.partial_path.exists()
+
+    parquet_file = pq.ParquetFile(output_path)
+    assert parquet_file.num_row_groups == 2
+    assert parquet_file.schema_arrow.field('HUMAN_ID').type == pa.string()
+    assert parquet_file.schema_arrow.field('HEIGHT_M').type == pa.float64()
+    df = pd.read_parquet(output_path)
+    assert list(df.columns) == ['HUMAN_ID', 'SEX', 'HEIGHT_M', 'WEIGHT_KG', '_source']
+    assert df['HUMAN_ID'].tolist() == ['101', '102', '103']
+    assert df['SEX'].tolist()[0] == 'M' and pd.isna(df['SEX'].tolist()[1])
+    np.testing.assert_allclose(df['HEIGHT_M'], [1.7, 1.8, 1.65])
+    assert df['WEIGHT_KG'].tolist()[0] == 61.5 and df['WEIGHT_KG'].isna().tolist()[1:] == [True, True]
+    assert writer.rows_written == 3
+
+    empty = CuratedChunkWriter(tmp_path / "empty.parquet", "parquet", ['HUMAN_ID'])
+    assert not empty.close()
+
+
+def _random_7th_cells(rng, n):
+    """Random 7th-like cells: decimal/thousands commas, dots, signs, junk, NaN, numbers."""
+    alphabet = list("0123456789,,,..+- ab")
+    cells = []
+    for _ in range(n):
+        kind = rng.integers(0, 8)
+        if kind == 0:
+            cells.append(f"{rng.integers(0, 100000)},{rng.integers(0, 1000)}")
+        elif kind == 1:
+            cells.append(f"{rng.integers(1, 1000)},{rng.integers(0, 1000):03d}"
+                         + (f".{rng.integers(0, 100)}" if rng.random() < 0.5 else ""))
+        elif kind == 2:
+            cells.append(("-" if rng.random() < 0.3 else " ") + f"{rng.uniform(0, 2000):.1f}".replace(".", ","))
+        elif kind == 3:
+            cells.append("".join(rng.choice(alphabet, size=rng.integers(0, 9))))
+        elif kind == 4:
+            cells.append(np.nan)
+        elif kind == 5:
+            cells.append(float(rng.uniform(0, 2000)))
+        elif kind == 6:
+            cells.append(int(rng.integers(0, 10000)))
+        else:
+            cells.append(rng.choice(["", "9999", " 1,234,567 ", "nan", "+12,5", "1,2,3", ",5", "5,"]))
+    return cells
+
+
+def _same_cells(got, expected):
+    """Cell-wise equality where NaN == NaN (list == compares NaN by identity)."""
+    if len(got) != len(expected):
+        return False
+    for x, y in zip(got, expected):
+        both_nan = isinstance(x, float) and isinstance(y, float) and np.isnan(x) and np.isnan(y)
+        if not both_nan and x != y:
+            return False
+    return True
+
+
+def test_parse_numeric_series_7th_matches_scalar_parser():
+    """
+    Property test: vectorized parse_numeric_series_7th must reproduce
+    series.astype(str).str.strip().apply(parse_numeric_string_7th) cell for cell.
+    """
+    from pipelines.build_curated_v0 import parse_numeric_string_7th, parse_numeric_series_7th
+
+    rng = np.random.default_rng(2024)
+    for trial in range(30):
+        series = pd.Series(_random_7th_cells(rng, 200), dtype=object, index=rng.permutation(200))
+        expected = series.astype(str).str.strip().apply(parse_numeric_string_7th)
+        got = parse_numeric_series_7th(series)
+        assert got.index.equals(expected.index)
+        assert _same_cells(got.tolist(), expected.tolist()), f"trial {trial}"
+
+    # Numeric dtypes (XLSX auto-converted), signed zeros, None/NaN, bool and empty columns
+    edge_cases = (
+        pd.Series([920.0, np.nan, 1736.0, 0.0, -0.0, 920.0]),
+        pd.Series([920.5, 1.25, np.nan], dtype=np.float32),
+        pd.Series([1, 2, 3, 2]),
+        pd.Series([np.nan, np.nan]),
+        pd.Series([None, np.nan, " 79,5", "79,5"], dtype=object),
+        pd.Series([True, False]),
+        pd.Series([], dtype=object),
+    )
+    for series in edge_cases:
+        expected = series.astype(str).str.strip().apply(parse_numeric_string_7th)
+        assert _same_cells(parse_numeric_series_7th(series).tolist(), expected.tolist())
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_parse_numeric_frame_7th_matches_series_parser(monkeypatch, use_pyarrow):
+    """
+    parse_numeric_frame_7th (frame-wide unique pool) must return, per column, exactly what
+    parse_numeric_series_7th returns for that column alone, with or without pyarrow.
+    """
+    import pipelines.build_curated_v0 as build_curated
+    from pipelines.build_curated_v0 import parse_numeric_frame_7th, parse_numeric_series_7th
+
+    if not use_pyarrow:
+        monkeypatch.setattr(build_curated, "pa", None)
+
+    rng = np.random.default_rng(7)
+    n = 120
+    index = rng.permutation(n) + 1000
+    df = pd.DataFrame({
+        "A": pd.Series(_random_7th_cells(rng, n), dtype=object),
+        "B": pd.Series(_random_7th_cells(rng, n), dtype=object),
+        "C": np.where(rng.random(n) < 0.2, -0.0, rng.normal(900, 50, n).round(1)),
+        "D": rng.normal(900, 50, n).round(1).astype(np.float32),
+        "E": rng.integers(0, 50, n),
+        "F": [None] * n,
+        "G": rng.random(n) < 0.5,
+        "H": ["79,5", " 1,736", None, np.nan] * (n // 4),
+        "I": pd.Series(_random_7th_cells(rng, n), dtype=object).astype(str),
+    }, index=index)
+    columns = ["H", "A", "C", "G", "B", "D", "E", "F", "I"]
+    parsed = parse_numeric_frame_7th(df, columns)
+    assert list(parsed) == columns
+    for col in columns:
+        expected = parse_numeric_series_7th(df[col])
+        assert parsed[col].index.equals(df.index), col
+        assert _same_cells(parsed[col].tolist(), expected.tolist()), col
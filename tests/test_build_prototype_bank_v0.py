@@ -0,0 +1,110 @@
+"""
+Test for build_prototype_bank_v0.
+
+- medoid_index matches the brute-force pairwise medoid (incl. HUMAN_ID tie-break)
+- bin edges: integer comparisons, equal-to-edge goes to the upper bin
+- bank build: 384 bins, sparse bins merged, deterministic rebuild
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pipelines.build_prototype_bank_v0 import (
+    N_BINS,
+    assign_bins,
+    build_prototype_bank,
+    medoid_index,
+)
+
+
+def _brute_medoid(X, keys):
+    cost = np.linalg.norm(X[:, None, :] - X[None, :, :], axis=2).sum(axis=1)
+    best = cost.min()
+    return min((k, i) for i, k in enumerate(keys) if cost[i] == best)[1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_medoid_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(300, 7))
+    X[:50] += 4.0  # skewed cluster
+    keys = [f"H{i:04d}" for i in range(300)]
+    idx, mean_dist, n_eval = medoid_index(X, keys)
+    assert idx == _brute_medoid(X, keys)
+    assert n_eval < 300
+    assert mean_dist == pytest.approx(np.linalg.norm(X - X[idx], axis=1).mean())
+
+
+def test_medoid_tie_break_by_key():
+    X = np.array([[0.0], [1.0], [1.0], [2.0]])
+    assert medoid_index(X, ["d", "c", "b", "a"])[0] == 2
+
+
+def test_assign_bins_edges_go_upper():
+    h_edges = {"M": [160, 170], "F": [150, 160]}
+    b_edges = {"M": [220], "F": [210]}
+    sex_idx, hq, bq, ab = assign_bins(
+        ["M", "M", "F", "F"], [159, 160, 160, 149], [219, 220, 210, 100], [14, 15, 49, 80],
+        h_edges, b_edges,
+    )
+    assert sex_idx.tolist() == [0, 0, 1, 1]
+    assert hq.tolist() == [0, 1, 2, 0]
+    assert bq.tolist() == [0, 1, 1, 0]
+    assert ab.tolist() == [0, 1, 2, 3]
+    with pytest.raises(ValueError):
+        assign_bins(["X"], [170], [220], [30], h_edges, b_edges)
+
+
+def _synthetic_curated(path, n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    sex = rng.choice(["M", "F"], n)
+    height = np.where(sex == "M", rng.normal(1.72, 0.06, n), rng.normal(1.59, 0.05, n))
+    bmi = rng.normal(23.0, 3.0, n)
+    df = pd.DataFrame({
+        "HUMAN_ID": [f"SK{i:06d}" for i in rng.permutation(n)],
+        "SEX": sex,
+        "AGE": rng.integers(8, 80, n).astype(float),
+        "HEIGHT_M": height.round(3),
+        "WEIGHT_KG": (bmi * height ** 2).round(1),
+        "BUST_CIRC_M": rng.normal(0.92, 0.06, n).round(3),
+        "WAIST_CIRC_M": rng.normal(0.80, 0.08, n).round(3),
+        "HIP_CIRC_M": rng.normal(0.95, 0.05, n).round(3),
+        "SHOULDER_WIDTH_M": rng.normal(0.38, 0.03, n).round(3),
+    })
+    df.loc[::17, "WAIST_CIRC_M"] = np.nan
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_build_prototype_bank(tmp_path):
+    src = tmp_path / "curated_v0.csv"
+    _synthetic_curated(src)
+
+    stats = build_prototype_bank(src, tmp_path / "bank", min_bin_size=5)
+    index = json.loads((tmp_path / "bank" / "prototype_index.json").read_text(encoding="utf-8"))
+    meta = json.loads((tmp_path / "bank" / "prototype_meta.json").read_text(encoding="utf-8"))
+    targets = json.loads((tmp_path / "bank" / "prototype_targets.json").read_text(encoding="utf-8"))
+
+    assert len(index["prototypes"]) == N_BINS
+    assert sum(meta["bin_counts"]) == stats["n_subjects"]
+    assert stats["n_prototypes"] == N_BINS and stats["n_empty"] == 0
+    assert stats["merge_counts"]["none"] > 0 and stats["merge_counts"]["age"] > 0
+    for entry in index["prototypes"]:
+        assert entry["n_pool"] >= 5
+        if entry["merge_level"] == "none":
+            assert entry["n_pool"] == entry["n_members"]
+        npz = np.load(tmp_path / "bank" / "prototype_params" / f"{entry['prototype_id']}.npz")
+        assert npz["member_human_ids"].shape == (entry["n_pool"],)
+        assert entry["medoid_human_id"] in set(npz["member_human_ids"].tolist())
+        assert targets["prototypes"][entry["prototype_id"]]["medoid_human_id"] == entry["medoid_human_id"]
+
+    # Deterministic rebuild
+    build_prototype_bank(src, tmp_path / "bank2", min_bin_size=5)
+    for name in ("prototype_index.json", "prototype_meta.json", "prototype_targets.json"):
+        assert (tmp_path / "bank" / name).read_bytes() == (tmp_path / "bank2" / name).read_bytes()
@@ -0,0 +1,61 @@
+# test_core_measurements_v0_batch.py
+# Equivalence test for measure_all_keys_batch in core_measurements_v0.py
+# Purpose: Batched (B, N, 3) entry point must return the same per-case values and
+# metadata as measuring each case on its own
+
+from __future__ import annotations
+import json
+import numpy as np
+
+from core.measurements.core_measurements_v0 import (
+    SliceIndex,
+    _measure_all_keys_indexed,
+    measure_all_keys_batch,
+)
+from tests.test_core_measurements_v0_slice_index import create_body_like_mesh
+
+
+def _dump(result) -> str:
+    return json.dumps({"value_m": result.value_m, "metadata": result.metadata}, sort_keys=True, default=str)
+
+
+def _batch(n_cases: int = 3) -> np.ndarray:
+    meshes = [create_body_like_mesh(seed=10 + i) for i in range(n_cases)]
+    n_min = min(len(m) for m in meshes)
+    return np.stack([m[:n_min] for m in meshes])
+
+
+def test_from_batch_matches_from_verts():
+    """Batched index fields equal the single-mesh index, byte for byte."""
+    verts_batch = _batch()
+    for b, index in enumerate(SliceIndex.from_batch(verts_batch)):
+        ref = SliceIndex.from_verts(verts_batch[b])
+        assert index.matches(verts_batch[b])
+        assert np.array_equal(index.order, ref.order)
+        assert index.y_sorted.tobytes() == ref.y_sorted.tobytes()
+        assert (index.y_min, index.y_max) == (ref.y_min, ref.y_max)
+        assert index.bbox_size.tobytes() == ref.bbox_size.tobytes()
+        assert index.body_center.tobytes() == ref.body_center.tobytes()
+
+
+def test_batch_results_match_per_case():
+    """Every key: identical value and metadata to the unindexed per-case path."""
+    verts_batch = _batch()
+    case_ids = ["case_a", None, "case_c"]
+    batch_results = measure_all_keys_batch(verts_batch, case_ids=case_ids)
+    assert len(batch_results) == len(verts_batch)
+    for b, results in enumerate(batch_results):
+        ref = _measure_all_keys_indexed(verts_batch[b], None, case_id=case_ids[b])
+        assert list(results.keys()) == list(ref.keys())
+        for key in ref:
+            assert _dump(results[key]) == _dump(ref[key]), (b, key)
+
+
+def test_batch_rejects_bad_shapes():
+    """Non-(B, N, 3) input and mismatched case_ids raise ValueError."""
+    for bad_args in ((np.zeros((10, 3)),), (np.zeros((2, 10, 3)), ["only_one"])):
+        try:
+            measure_all_keys_batch(*bad_args)
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {bad_args[0].shape}")
@@ -0,0 +1,90 @@
+# test_core_measurements_v0_components.py
+# Equivalence test for grid-based connected components in core_measurements_v0.py
+# Purpose: Grid neighbor graph must reproduce the brute-force BFS exactly
+# (same components, same component order, same point order, same diagnostics)
+
+from __future__ import annotations
+import numpy as np
+
+from core.measurements.core_measurements_v0 import _find_connected_components_2d
+
+
+def _reference_components_2d(vertices_2d: np.ndarray, connectivity_threshold: float = 0.01):
+    """Brute-force BFS (original O(N^2) implementation), used as reference."""
+    n = vertices_2d.shape[0]
+    visited = np.zeros(n, dtype=bool)
+    components = []
+    sizes = []
+    for i in range(n):
+        if visited[i]:
+            continue
+        component_indices = []
+        queue = [i]
+        visited[i] = True
+        while queue:
+            current = queue.pop(0)
+            component_indices.append(current)
+            distances = np.linalg.norm(vertices_2d - vertices_2d[current], axis=1)
+            neighbors = np.where((distances < connectivity_threshold) & (~visited))[0]
+            for neighbor in neighbors:
+                visited[neighbor] = True
+                queue.append(neighbor)
+        if len(component_indices) >= 3:
+            components.append(vertices_2d[component_indices])
+            sizes.append(len(component_indices))
+    return components, sizes
+
+
+def _torso_and_arms_slice(n_torso: int = 300, n_arm: int = 60, seed: int = 0) -> np.ndarray:
+    """Torso ring plus two arm rings plus a few stray points, shuffled."""
+    rng = np.random.default_rng(seed)
+    t = rng.uniform(0, 2 * np.pi, n_torso)
+    torso = np.stack([0.15 * np.cos(t), 0.10 * np.sin(t)], axis=1)
+    a = rng.uniform(0, 2 * np.pi, n_arm)
+    arm_l = np.stack([-0.25 + 0.04 * np.cos(a), 0.04 * np.sin(a)], axis=1)
+    arm_r = np.stack([0.25 + 0.04 * np.cos(a), 0.04 * np.sin(a)], axis=1)
+    stray = rng.uniform(-0.5, 0.5, (10, 2))
+    pts = np.concatenate([torso, arm_l, arm_r, stray]).astype(np.float32)
+    return pts[rng.permutation(len(pts))]
+
+
+def _assert_same(vertices_2d: np.ndarray, threshold: float = 0.01):
+    ref_components, ref_sizes = _reference_components_2d(vertices_2d, threshold)
+    components, diagnostics = _find_connected_components_2d(
+        vertices_2d, connectivity_threshold=threshold, return_diagnostics=True
+    )
+    assert len(components) == len(ref_components)
+    for comp, ref in zip(components, ref_components):
+        assert comp.dtype == ref.dtype
+        assert np.array_equal(comp, ref)
+    assert diagnostics["component_sizes"] == ref_sizes
+    assert diagnostics["n_components"] == len(ref_components)
+
+
+def test_components_match_reference_torso_and_arms():
+    """Multi-component slice: identical components and ordering."""
+    for seed in range(3):
+        _assert_same(_torso_and_arms_slice(seed=seed))
+
+
+def test_components_match_reference_dense_and_duplicates():
+    """Dense slice with duplicated points and points on cell boundaries."""
+    rng = np.random.default_rng(42)
+    pts = rng.uniform(-0.05, 0.05, (500, 2)).astype(np.float32)
+    grid = (np.arange(20, dtype=np.float32) * 0.01)
+    boundary = np.stack([grid, np.zeros_like(grid)], axis=1)
+    pts = np.concatenate([pts, pts[:50], boundary])
+    _assert_same(pts)
+
+
+def test_components_non_finite_and_small_inputs():
+    """NaN points are isolated; fewer than 3 points fail with diagnostics."""
+    pts = _torso_and_arms_slice(n_torso=80, n_arm=20, seed=7)
+    pts[::17] = np.nan
+    _assert_same(pts)
+
+    components, diagnostics = _find_connected_components_2d(
+        np.zeros((2, 2), dtype=np.float32), return_diagnostics=True
+    )
+    assert components == []
+    assert diagnostics["failure_reason"] == "TORSO_FAIL_NO_INTERSECTION"
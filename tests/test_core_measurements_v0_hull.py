@@ -0,0 +1,97 @@
+# test_core_measurements_v0_hull.py
+# Equivalence test for the 2D convex hull engine in core_measurements_v0.py
+# Purpose: Vectorized-dedup monotone chain must return byte-identical hulls to the
+# original scalar-numpy loop; Qhull path must return the same hull convention
+
+from __future__ import annotations
+import numpy as np
+
+from core.measurements.core_measurements_v0 import (
+    _convex_hull_2d_monotone_chain,
+    _convex_hull_2d_qhull,
+)
+
+
+def _reference_hull(pts: np.ndarray):
+    """Original implementation (per-pair allclose dedup, scalar cross())."""
+    if pts.shape[0] < 3:
+        return None
+    sort_indices = np.lexsort((pts[:, 1], pts[:, 0]))
+    sorted_pts = pts[sort_indices]
+    unique_mask = np.ones(len(sorted_pts), dtype=bool)
+    for i in range(1, len(sorted_pts)):
+        if np.allclose(sorted_pts[i], sorted_pts[i - 1], atol=1e-9):
+            unique_mask[i] = False
+    sorted_pts = sorted_pts[unique_mask]
+    if len(sorted_pts) < 3:
+        return None
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower = []
+    for p in sorted_pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper = []
+    for p in reversed(sorted_pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    hull = np.array(lower[:-1] + upper[:-1], dtype=np.float32)
+    if len(hull) < 3:
+        return None
+    if len(hull) == 3:
+        v1 = hull[1] - hull[0]
+        v2 = hull[2] - hull[0]
+        if abs(v1[0] * v2[1] - v1[1] * v2[0]) < 1e-9:
+            return None
+    return hull
+
+
+def _cases():
+    rng = np.random.default_rng(123)
+    cases = []
+    for n in (3, 4, 10, 50, 400):
+        t = rng.uniform(0, 2 * np.pi, n)
+        ring = np.stack([0.16 * np.cos(t), 0.11 * np.sin(t)], axis=1) + rng.normal(0, 0.003, (n, 2))
+        cases.append(ring.astype(np.float32))
+        cases.append(rng.uniform(-0.2, 0.2, (n, 2)).astype(np.float32))
+    # Exact and near-collinear points, grid points, duplicates, float64 input
+    line = np.stack([np.linspace(0, 1, 30), np.linspace(0, 0.5, 30)], axis=1).astype(np.float32)
+    cases.append(line)
+    cases.append(line + np.float32(1e-7) * rng.standard_normal(line.shape).astype(np.float32))
+    gx, gy = np.meshgrid(np.arange(12) * 0.01, np.arange(9) * 0.01)
+    grid = np.stack([gx.ravel(), gy.ravel()], axis=1).astype(np.float32)
+    cases.append(grid)
+    cases.append(np.concatenate([grid, grid[::3], grid + np.float32(1e-10)]))
+    cases.append(rng.uniform(-1, 1, (200, 2)))
+    cases.append(np.array([[0, 0], [0, 0], [1, 1]], dtype=np.float32))
+    return cases
+
+
+def test_monotone_chain_byte_identical_to_reference():
+    """Same bytes (or both None) for every case."""
+    for pts in _cases():
+        ref = _reference_hull(pts)
+        got = _convex_hull_2d_monotone_chain(pts)
+        if ref is None:
+            assert got is None
+        else:
+            assert got is not None
+            assert got.dtype == ref.dtype
+            assert got.tobytes() == ref.tobytes()
+
+
+def test_qhull_same_convention_on_general_position():
+    """Qhull path matches start point and CCW order (monotone chain if scipy is missing)."""
+    rng = np.random.default_rng(7)
+    pts = rng.uniform(-0.2, 0.2, (300, 2)).astype(np.float32)
+    assert np.array_equal(_convex_hull_2d_qhull(pts), _convex_hull_2d_monotone_chain(pts))
+
+
+def test_qhull_degenerate_falls_back_to_monotone_chain():
+    """Collinear input (Qhull error) gives the monotone chain result instead of raising."""
+    line = np.stack([np.linspace(0, 1, 10), np.linspace(0, 1, 10)], axis=1).astype(np.float32)
+    assert _convex_hull_2d_qhull(line) is None and _convex_hull_2d_monotone_chain(line) is None
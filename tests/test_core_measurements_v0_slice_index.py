@@ -0,0 +1,120 @@
+# test_core_measurements_v0_slice_index.py
+# Equivalence test for SliceIndex in core_measurements_v0.py
+# Purpose: Passing a per-mesh SliceIndex must not change any value or metadata
+
+from __future__ import annotations
+import json
+import numpy as np
+
+from core.measurements.core_measurements_v0 import (
+    SliceIndex,
+    measure_circumference_v0_with_metadata,
+    measure_width_depth_v0_with_metadata,
+    measure_waist_group_with_shared_slice,
+    measure_hip_group_with_shared_slice,
+)
+
+
+CIRC_KEYS = [
+    "NECK_CIRC_M", "BUST_CIRC_M", "UNDERBUST_CIRC_M",
+    "WAIST_CIRC_M", "HIP_CIRC_M", "THIGH_CIRC_M", "MIN_CALF_CIRC_M",
+]
+WIDTH_DEPTH_KEYS = [
+    "CHEST_WIDTH_M", "CHEST_DEPTH_M", "WAIST_WIDTH_M",
+    "WAIST_DEPTH_M", "HIP_WIDTH_M", "HIP_DEPTH_M",
+]
+
+
+def create_body_like_mesh(seed: int = 0) -> np.ndarray:
+    """Noisy body-like point cloud: torso rings plus two arm rings, shuffled."""
+    rng = np.random.default_rng(seed)
+    verts = []
+    for y in np.linspace(0.0, 1.7, 60):
+        radius = 0.3 - 0.1 * (y - 0.85) ** 2
+        t = rng.uniform(0, 2 * np.pi, 80)
+        verts.append(np.stack([radius * np.cos(t), np.full_like(t, y), 0.7 * radius * np.sin(t)], axis=1))
+        if 0.9 < y < 1.4:
+            for cx in (-0.45, 0.45):
+                a = rng.uniform(0, 2 * np.pi, 20)
+                verts.append(np.stack([cx + 0.05 * np.cos(a), np.full_like(a, y), 0.05 * np.sin(a)], axis=1))
+    verts = np.concatenate(verts)
+    verts[:, 1] += rng.normal(0, 0.002, len(verts))
+    return verts[rng.permutation(len(verts))].astype(np.float32)
+
+
+def _dump(result) -> str:
+    return json.dumps({"value_m": result.value_m, "metadata": result.metadata}, sort_keys=True, default=str)
+
+
+def test_band_indices_match_full_mask():
+    """Band query returns exactly the full-array mask indices, ascending."""
+    verts = create_body_like_mesh()
+    index = SliceIndex.from_verts(verts)
+    y = verts[:, 1]
+    for y_value in np.linspace(-0.05, 1.75, 97):
+        for tol in (1e-4, 0.004, 0.02):
+            expected = np.nonzero(np.abs(y - float(y_value)) < tol)[0]
+            assert np.array_equal(index.band_indices(float(y_value), tol), expected)
+
+
+def test_single_key_results_unchanged_with_slice_index():
+    """Circumference and width/depth: identical value and metadata."""
+    verts = create_body_like_mesh(seed=1)
+    index = SliceIndex.from_verts(verts)
+    for key in CIRC_KEYS:
+        base = measure_circumference_v0_with_metadata(verts, key, case_id="case_a")
+        fast = measure_circumference_v0_with_metadata(verts, key, case_id="case_a", slice_index=index)
+        assert _dump(base) == _dump(fast), key
+    for key in WIDTH_DEPTH_KEYS:
+        base = measure_width_depth_v0_with_metadata(verts, key)
+        fast = measure_width_depth_v0_with_metadata(verts, key, slice_index=index)
+        assert _dump(base) == _dump(fast), key
+
+
+def test_group_results_unchanged_with_slice_index():
+    """WAIST/HIP shared-slice groups: identical value and metadata."""
+    verts = create_body_like_mesh(seed=2)
+    index = SliceIndex.from_verts(verts)
+    for fn in (measure_waist_group_with_shared_slice, measure_hip_group_with_shared_slice):
+        base = fn(verts, case_id="case_b")
+        fast = fn(verts, case_id="case_b", slice_index=index)
+        assert base.keys() == fast.keys()
+        for key in base:
+            assert _dump(base[key]) == _dump(fast[key]), key
+
+
+def test_mismatched_slice_index_is_ignored():
+    """Index built for another mesh is dropped and recorded as a warning."""
+    verts = create_body_like_mesh(seed=3)
+    other = SliceIndex.from_verts(verts[:100])
+    result = measure_width_depth_v0_with_metadata(verts, "HIP_WIDTH_M", slice_index=other)
+    base = measure_width_depth_v0_with_metadata(verts, "HIP_WIDTH_M")
+    assert result.value_m == base.value_m
+    assert "SLICE_INDEX_MISMATCH: ignored" in result.metadata["warnings"]
+
+
+def test_slice_index_matches_content_not_shape():
+    """Same-shape mesh with other vertices is a mismatch; an equal copy (any dtype) matches."""
+    verts = create_body_like_mesh(seed=4)
+    index = SliceIndex.from_verts(verts)
+    assert index.matches(verts.copy())
+    assert index.matches(verts.astype(np.float64))
+
+    moved = verts.copy()
+    moved[:, 1] += 0.05
+    assert not index.matches(moved)
+    result = measure_width_depth_v0_with_metadata(moved, "HIP_WIDTH_M", slice_index=index)
+    base = measure_width_depth_v0_with_metadata(moved, "HIP_WIDTH_M")
+    assert result.value_m == base.value_m
+    assert "SLICE_INDEX_MISMATCH: ignored" in result.metadata["warnings"]
+
+
+def test_runner_malformed_mesh_fails_per_group():
+    """A mesh the index cannot be built from fails its keys, not the whole case loop."""
+    from verification.runners import run_geo_v0_facts_round1, run_geo_v0_s1_facts
+
+    verts = np.zeros(12, dtype=np.float32)  # not (N, 3)
+    for runner in (run_geo_v0_s1_facts, run_geo_v0_facts_round1):
+        results = runner.measure_all_keys(verts, "case_bad")
+        for key in ("WAIST_CIRC_M", "HIP_CIRC_M"):
+            assert np.isnan(results[key].value_m) and results[key].metadata["warnings"]
@@ -0,0 +1,140 @@
+# test_fitting_condition_images.py
+# Depth/normal condition images (fixed_camera_preset_v1) and their cache
+# Purpose: z-buffer depth/normals must match an analytic sphere, output must be deterministic
+# and independent of tile/chunk sizes, PNGs must decode, and the cache must key on
+# mesh hash + preset id
+
+from __future__ import annotations
+import dataclasses
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from modules.fitting.condition_images import (
+    FIXED_CAMERA_PRESET_V1,
+    ConditionImageCache,
+    encode_depth_u16,
+    render_condition_images,
+    write_condition_images,
+)
+from tests.test_fitting_sdf_bank import icosphere
+
+PRESET_256 = dataclasses.replace(FIXED_CAMERA_PRESET_V1, preset_id="fixed_camera_preset_v1_test256", image_resolution=256)
+
+
+def _sphere(subdiv=4, radius=0.3, center=(0.0, 0.9, 0.0)):
+    verts, faces = icosphere(subdiv, radius)
+    return verts + np.asarray(center), faces
+
+
+def _analytic_sphere(preset, radius=0.3, center=(0.0, 0.9, 0.0)):
+    """Ray-sphere depth and camera-space normals for the default (yaw=pitch=roll=0) camera."""
+    s = preset.image_resolution
+    f = (s / 2.0) / np.tan(np.deg2rad(preset.fov_deg) / 2.0)
+    jj, ii = np.meshgrid(np.arange(s), np.arange(s))
+    ray = np.stack([(jj + 0.5 - s / 2) / f, -(ii + 0.5 - s / 2) / f, -np.ones((s, s))], axis=-1)
+    c = np.asarray(center) - (np.asarray(preset.target_m) + [0, 0, preset.camera_distance_m])
+    rn = ray / np.linalg.norm(ray, axis=-1, keepdims=True)
+    b = rn @ c
+    disc = b * b - (c @ c - radius ** 2)
+    t = b - np.sqrt(np.maximum(disc, 0))
+    normal = (rn * t[..., None] - c) / radius
+    return disc, t * -rn[..., 2], normal
+
+
+def _decode_png(path):
+    data = open(path, "rb").read()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, chunks = 8, {}
+    while pos < len(data):
+        (n,) = struct.unpack(">I", data[pos:pos + 4])
+        tag = data[pos + 4:pos + 8]
+        payload = data[pos + 8:pos + 8 + n]
+        assert struct.unpack(">I", data[pos + 8 + n:pos + 12 + n])[0] == zlib.crc32(tag + payload)
+        chunks[tag] = chunks.get(tag, b"") + payload
+        pos += 12 + n
+    w, h, bit_depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    raw = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(h, -1)
+    assert np.all(raw[:, 0] == 0)
+    pixels = raw[:, 1:]
+    if bit_depth == 16:
+        return pixels.copy().view(">u2").astype(np.uint16)
+    return pixels.reshape(h, w, -1).squeeze()
+
+
+def test_sphere_depth_and_normals():
+    images = render_condition_images([_sphere()], PRESET_256)
+    disc, depth, normal = _analytic_sphere(PRESET_256)
+    interior = disc > 0.005
+    assert np.all(images.mask[interior])
+    assert not np.any(images.mask[disc < -0.005])
+    np.testing.assert_allclose(images.depth_m[interior], depth[interior], atol=2e-3)
+    cos = np.sum(images.normal[interior] * normal[interior], axis=1)
+    assert cos.min() > 0.99
+    assert np.all(np.isinf(images.depth_m[~images.mask]))
+    assert np.all(images.normal[~images.mask] == 0)
+
+
+def test_occlusion_and_determinism():
+    body = _sphere(3, 0.2)
+    garment = _sphere(3, 0.25)
+    n_body_faces = body[1].shape[0]
+    images = render_condition_images([body, garment], PRESET_256)
+    assert np.all(images.face_index[images.mask] >= n_body_faces)  # garment shell occludes the body
+
+    ref = render_condition_images([body, garment], PRESET_256)
+    small = render_condition_images([body, garment], PRESET_256, tile_size=8, max_fragments=500)
+    for other in (ref, small):
+        assert other.depth_m.tobytes() == images.depth_m.tobytes()
+        assert other.normal.tobytes() == images.normal.tobytes()
+        assert other.face_index.tobytes() == images.face_index.tobytes()
+
+    empty = render_condition_images([], PRESET_256)
+    assert not empty.mask.any()
+    with pytest.raises(ValueError):
+        render_condition_images([(np.zeros((3, 2)), np.zeros((1, 3), dtype=int))], PRESET_256)
+
+
+def test_png_outputs(tmp_path):
+    images = render_condition_images([_sphere(3)], PRESET_256)
+    paths = write_condition_images(str(tmp_path), images, PRESET_256)
+    depth = _decode_png(paths["depth"])
+    normal = _decode_png(paths["normal"])
+    assert depth.dtype == np.uint16 and depth.shape == (256, 256)
+    np.testing.assert_array_equal(depth, encode_depth_u16(images.depth_m, PRESET_256))
+    assert np.all(depth[~images.mask] == 0) and np.all(depth[images.mask] > 0)
+    assert normal.shape == (256, 256, 3)
+    assert np.all(normal[~images.mask] == 0)
+    center = normal[128, 128].astype(int)
+    assert abs(center[0] - 128) <= 2 and abs(center[1] - 128) <= 2 and center[2] == 255  # faces the camera
+
+
+def test_cache_keys_and_tiers(tmp_path):
+    mesh = _sphere(2)
+    cache = ConditionImageCache(max_entries=1, disk_dir=str(tmp_path))
+    images, key = cache.get_or_render([mesh], PRESET_256)
+    again, key2 = cache.get_or_render([mesh], PRESET_256)
+    assert key2 == key and again is images
+    assert key.startswith(PRESET_256.preset_id + "__")
+
+    moved = (mesh[0] + [0.0, 0.01, 0.0], mesh[1])
+    _, key3 = cache.get_or_render([moved], PRESET_256)
+    assert key3 != key
+    assert cache.telemetry()["evictions"] == 1
+
+    fresh = ConditionImageCache(disk_dir=str(tmp_path))
+    from_disk, _ = fresh.get_or_render([mesh], PRESET_256)
+    assert from_disk.depth_m.tobytes() == images.depth_m.tobytes()
+    stats = fresh.telemetry()
+    assert stats["hits_disk"] == 1 and stats["misses"] == 0
+
+    # Corrupt entry on disk: a miss, re-rendered and rewritten; no temp files left behind
+    (tmp_path / f"{key}.npz").write_bytes(b"PK\x03\x04truncated")
+    recovered, _ = ConditionImageCache(disk_dir=str(tmp_path)).get_or_render([mesh], PRESET_256)
+    assert recovered.depth_m.tobytes() == images.depth_m.tobytes()
+    reread = ConditionImageCache(disk_dir=str(tmp_path))
+    reread.get_or_render([mesh], PRESET_256)
+    assert reread.telemetry()["hits_disk"] == 1
+    assert not [p for p in tmp_path.iterdir() if ".tmp" in p.name]
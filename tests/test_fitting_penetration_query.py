@@ -0,0 +1,125 @@
+# test_fitting_penetration_query.py
+# ROI-restricted penetration query against Tier-0 SDF grids
+# Purpose: trilinear sampling must be exact for linear fields, penetration facts must match
+# an analytic sphere on a 50k-vertex query (CPU budget: modules/fitting/tools/bench_penetration_query_v0.py)
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from modules.fitting.penetration_query import (
+    PenetrationQueryEngine,
+    d_threshold_mm,
+    query_penetration,
+    trilinear_sample,
+)
+from modules.fitting.sdf_bank import SDFBank, SDFGrid, SDFRoi, build_sdf_bank_entry
+from tests.test_fitting_sdf_bank import icosphere
+
+
+def _sphere_grid(name, box_min, box_max, radius=0.1, h=0.002, band=0.01):
+    origin = np.asarray(box_min, dtype=np.float64)
+    shape = tuple(int(round(s)) + 1 for s in (np.asarray(box_max) - origin) / h)
+    pts = origin + np.indices(shape).reshape(3, -1).T * h
+    values = np.clip(np.linalg.norm(pts, axis=1) - radius, -band, band).astype(np.float16)
+    return SDFGrid(roi=name, origin=origin, voxel_size_m=h, band_m=band, values=values.reshape(shape))
+
+
+def test_trilinear_exact_for_linear_field():
+    origin = np.array([-0.05, -0.02, 0.01])
+    h = 0.002
+    pts = origin + np.indices((30, 20, 10)).reshape(3, -1).T * h
+    values = (0.25 * pts[:, 0] - 0.5 * pts[:, 1] + pts[:, 2]).astype(np.float16).reshape(30, 20, 10)
+    grid = SDFGrid(roi="lin", origin=origin, voxel_size_m=h, band_m=1.0, values=values)
+
+    rng = np.random.default_rng(0)
+    q = origin + rng.uniform(-0.005, np.array([29, 19, 9]) * h + 0.005, size=(2000, 3))
+    got, idx = trilinear_sample(grid, q)
+    inside = np.all((q >= origin - 1e-9) & (q <= origin + np.array([29, 19, 9]) * h + 1e-9), axis=1)
+    assert set(idx.tolist()) <= set(np.flatnonzero(inside).tolist())
+    assert idx.size >= inside.sum() - 2  # float32 boundary rounding only
+    expect = 0.25 * q[idx, 0] - 0.5 * q[idx, 1] + q[idx, 2]
+    np.testing.assert_allclose(got, expect, atol=1e-4)
+
+
+def test_query_penetration_sphere():
+    grids = {
+        "front": _sphere_grid("front", (-0.06, -0.06, 0.06), (0.06, 0.06, 0.12)),
+        "side": _sphere_grid("side", (0.06, -0.06, -0.06), (0.12, 0.06, 0.06)),
+    }
+    # +z points: 3 mm and 6 mm inside, 2 mm outside; +x point 1 mm inside; one point outside both ROIs
+    verts = np.array([[0, 0, 0.097], [0, 0, 0.094], [0, 0, 0.102], [0.099, 0, 0], [-0.1, 0, 0]])
+    res = query_penetration(grids, verts)
+
+    front = res["front"]
+    assert front.n_vertices == 3 and front.n_penetrating == 2
+    assert front.offending_idx.tolist() == [1, 0]  # deepest first
+    assert front.max_depth_mm == pytest.approx(6.0, abs=0.05)
+    assert front.mean_depth_mm == pytest.approx(4.5, abs=0.05)
+    assert front.n_severe == 2 and not front.saturated
+    side = res["side"]
+    assert side.n_penetrating == 1 and side.n_severe == 0 and side.offending_idx.tolist() == [3]
+
+    # Garment thickness: the outside point at 2 mm now violates a 3 mm clearance
+    thick = query_penetration(grids, verts, thickness_garment_m=0.003, rois=["front"])
+    assert list(thick) == ["front"]
+    assert thick["front"].n_penetrating == 3
+    assert thick["front"].to_dict()["offending_idx"] == [1, 0, 2]
+
+    deep = query_penetration(grids, np.array([[0, 0, 0.07]]))
+    assert deep["front"].saturated and deep["front"].max_depth_mm == pytest.approx(10.0, abs=0.01)
+
+    assert d_threshold_mm(1.0) == 2.2 and d_threshold_mm(2.0) == pytest.approx(2.2)
+    with pytest.raises(ValueError):
+        query_penetration(grids, np.zeros((4, 2)))
+
+
+def test_query_50k_vertices_classified():
+    grids = {
+        "front": _sphere_grid("front", (-0.11, -0.11, 0.0), (0.11, 0.11, 0.12)),
+        "back": _sphere_grid("back", (-0.11, -0.11, -0.12), (0.11, 0.11, 0.0)),
+    }
+    rng = np.random.default_rng(1)
+    d = rng.normal(size=(50_000, 3))
+    verts = d / np.linalg.norm(d, axis=1, keepdims=True) * rng.uniform(0.095, 0.105, (50_000, 1))
+    res = query_penetration(grids, verts)
+
+    r = np.linalg.norm(verts, axis=1)
+    counted = set(res["front"].offending_idx.tolist()) | set(res["back"].offending_idx.tolist())
+    clear = np.flatnonzero(np.abs(r - 0.1) > 5e-4)  # away from float16 resolution
+    assert {i for i in clear if r[i] < 0.1} <= counted
+    assert not ({i for i in clear if r[i] > 0.1} & counted)
+
+
+def test_engine_fetches_bank(tmp_path):
+    verts, faces = icosphere(2, 0.1)
+    roi = SDFRoi("chest_panel", (-0.06, -0.06, 0.06), (0.06, 0.06, 0.12))
+    build_sdf_bank_entry(str(tmp_path), "M_h3_b2_a1", verts, faces, rois=[roi], band_mm=6.0)
+    engine = PenetrationQueryEngine(SDFBank(str(tmp_path)))
+
+    out = engine.query("M_h3_b2_a1", np.array([[0, 0, 0.09], [0, 0, 0.11]]))
+    pen = out["rois"]["chest_panel"]
+    assert pen.n_vertices == 2 and pen.offending_idx.tolist() == [0]
+    assert pen.max_depth_mm == pytest.approx(6.0, abs=0.05) and pen.saturated  # 10 mm clamped to band
+    assert out["max_depth_mm"] == pen.max_depth_mm and not out["fast_fail"]
+    assert out["fetch_ms"] >= 0 and out["query_ms"] >= 0
+
+
+def test_engine_fast_fail_from_band_saturation(tmp_path):
+    verts, faces = icosphere(2, 0.1)
+    roi = SDFRoi("chest_panel", (-0.06, -0.06, 0.06), (0.06, 0.06, 0.12))
+    build_sdf_bank_entry(str(tmp_path), "M_h3_b2_a1", verts, faces, rois=[roi])  # 10 mm band
+    engine = PenetrationQueryEngine(SDFBank(str(tmp_path)))
+
+    # 20 mm deep: capped at the band, fast fail from saturation (not from float16 rounding)
+    out = engine.query("M_h3_b2_a1", np.array([[0, 0, 0.08]]))
+    assert out["rois"]["chest_panel"].saturated and out["fast_fail"]
+    out = engine.query("M_h3_b2_a1", np.array([[0, 0, 0.095]]))
+    assert not out["rois"]["chest_panel"].saturated and not out["fast_fail"]
+
+    # 6 mm band + 5 mm thickness: a saturated ROI is at least 11 mm deep
+    build_sdf_bank_entry(str(tmp_path / "narrow"), "F_h3_b2_a1", verts, faces, rois=[roi], band_mm=6.0)
+    engine = PenetrationQueryEngine(SDFBank(str(tmp_path / "narrow")))
+    out = engine.query("F_h3_b2_a1", np.array([[0, 0, 0.09]]), thickness_garment_m=0.005)
+    assert out["rois"]["chest_panel"].saturated and out["fast_fail"]
@@ -0,0 +1,118 @@
+# test_fitting_sdf_bank.py
+# Tier-0 SDF bank: narrow-band signed distances, float16 voxel store, zero-copy fetch
+# Purpose: an icosphere's grid must match |p| - r (clamped to the band) with inside < 0,
+# and fetch() must return read-only memmap views equal to the computed grids
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from modules.fitting.sdf_bank import (
+    SDFBank,
+    SDFRoi,
+    build_sdf_bank_entry,
+    closest_point_on_triangles,
+    compute_roi_sdf,
+)
+
+
+def icosphere(subdiv: int = 3, radius: float = 0.1):
+    t = (1 + 5 ** 0.5) / 2
+    verts = [(-1, t, 0), (1, t, 0), (-1, -t, 0), (1, -t, 0), (0, -1, t), (0, 1, t),
+             (0, -1, -t), (0, 1, -t), (t, 0, -1), (t, 0, 1), (-t, 0, -1), (-t, 0, 1)]
+    faces = [(0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11), (1, 5, 9), (5, 11, 4),
+             (11, 10, 2), (10, 7, 6), (7, 1, 8), (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8),
+             (3, 8, 9), (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)]
+    verts = [np.array(v, dtype=float) / np.linalg.norm(v) for v in verts]
+    for _ in range(subdiv):
+        mids = {}
+
+        def mid(a, b):
+            key = (min(a, b), max(a, b))
+            if key not in mids:
+                m = verts[a] + verts[b]
+                verts.append(m / np.linalg.norm(m))
+                mids[key] = len(verts) - 1
+            return mids[key]
+
+        new_faces = []
+        for a, b, c in faces:
+            ab, bc, ca = mid(a, b), mid(b, c), mid(c, a)
+            new_faces += [(a, ab, ca), (b, bc, ab), (c, ca, bc), (ab, bc, ca)]
+        faces = new_faces
+    return np.array(verts) * radius, np.array(faces)
+
+
+def test_closest_point_regions():
+    a = np.array([[0.0, 0, 0]] * 4)
+    b = np.array([[1.0, 0, 0]] * 4)
+    c = np.array([[0.0, 1, 0]] * 4)
+    p = np.array([[0.2, 0.2, 1.0], [-1.0, -1.0, 0.0], [0.5, -1.0, 0.0], [1.0, 1.0, 0.0]])
+    closest, region = closest_point_on_triangles(p, a, b, c)
+    assert region.tolist() == [0, 1, 4, 5]
+    np.testing.assert_allclose(closest, [[0.2, 0.2, 0], [0, 0, 0], [0.5, 0, 0], [0.5, 0.5, 0]])
+
+
+def test_roi_sdf_matches_sphere():
+    verts, faces = icosphere(3, 0.1)
+    roi = SDFRoi("slab", (-0.12, -0.004, -0.12), (0.12, 0.004, 0.12))
+    grid = compute_roi_sdf(verts, faces, roi, voxel_size_mm=2.0, band_mm=6.0)
+    assert grid.values.dtype == np.float16
+
+    idx = np.indices(grid.shape).reshape(3, -1).T
+    pts = grid.origin + idx * grid.voxel_size_m
+    true = np.clip(np.linalg.norm(pts, axis=1) - 0.1, -grid.band_m, grid.band_m)
+    got = grid.values.reshape(-1).astype(np.float64)
+
+    chord = 6e-4  # icosphere(3) flat-face deviation from the sphere (+ float16)
+    np.testing.assert_allclose(got, true, atol=chord)
+    assert np.all(np.sign(got[np.abs(true) > chord]) == np.sign(true[np.abs(true) > chord]))
+    assert np.all(got[np.linalg.norm(pts, axis=1) < 0.05] == np.float16(-grid.band_m))  # deep inside
+
+    with pytest.raises(ValueError):
+        compute_roi_sdf(verts, faces, roi, voxel_size_mm=2.5)
+
+
+def test_bank_roundtrip_zero_copy_fetch(tmp_path):
+    verts, faces = icosphere(2, 0.1)
+    rois = [SDFRoi("a", (-0.11, -0.004, 0.0), (0.11, 0.004, 0.11)), SDFRoi("b", (0.0, 0.05, -0.05), (0.05, 0.11, 0.05))]
+    build_sdf_bank_entry(str(tmp_path), "M_h3_b2_a1", verts, faces, rois=rois, band_mm=6.0)
+    build_sdf_bank_entry(str(tmp_path), "F_h0_b0_a0", verts * 0.9, faces, rois=rois, band_mm=6.0)
+
+    bank = SDFBank(str(tmp_path))
+    assert bank.prototype_ids == ["F_h0_b0_a0", "M_h3_b2_a1"]
+    grids = bank.fetch("M_h3_b2_a1")
+    for roi in rois:
+        ref = compute_roi_sdf(verts, faces, roi, band_mm=6.0)
+        got = grids[roi.name]
+        assert isinstance(got.values.base, np.memmap) or isinstance(got.values, np.memmap)
+        assert not got.values.flags.writeable
+        assert got.values.tobytes() == ref.values.tobytes()
+        np.testing.assert_array_equal(got.origin, ref.origin)
+
+    assert bank.fetch("M_h3_b2_a1") is grids  # warm fetch reuses the cached views
+
+    with pytest.raises(KeyError):
+        bank.fetch("missing")
+
+
+def test_roi_narrower_than_body_signs_inside():
+    # Whole x scanlines run inside the sphere and never reach the band
+    verts, faces = icosphere(3, 0.2)
+    roi = SDFRoi("chest_panel", (-0.1, -0.01, 0.0), (0.1, 0.01, 0.22))
+    grid = compute_roi_sdf(verts, faces, roi)
+
+    idx = np.indices(grid.shape).reshape(3, -1).T
+    pts = grid.origin + idx * grid.voxel_size_m
+    r = np.linalg.norm(pts, axis=1)
+    got = grid.values.reshape(-1)
+    deep_in = r < 0.2 - grid.band_m - 1e-3
+    deep_out = r > 0.2 + grid.band_m + 1e-3
+    assert deep_in.sum() > 10000
+    assert np.all(got[deep_in] == np.float16(-grid.band_m))
+    assert np.all(got[deep_out] == np.float16(grid.band_m))
+
+    from modules.fitting.penetration_query import query_penetration
+    res = query_penetration({"chest_panel": grid}, np.array([[0, 0, 0.05], [0, 0, 0.15], [0, 0, 0.21]]))
+    assert res["chest_panel"].offending_idx.tolist() == [0, 1]
@@ -0,0 +1,98 @@
+# test_fitting_size_recommendation.py
+# Size recommendation index over (bust, waist, hip)
+# Purpose: ease ratios must follow run_fitting_v0_facts semantics, "fits" must match the
+# per-size ease envelope, and batch ranking must equal a per-body sorted ranking
+
+from __future__ import annotations
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.fitting.size_recommendation import (
+    SizeRecommendationIndex,
+    body_values_from_curated,
+    load_size_chart,
+)
+
+CHART = np.array([
+    [0.92, 0.76, 0.96],
+    [0.98, 0.82, 1.02],
+    [1.04, 0.88, 1.08],
+    [1.10, 0.94, 1.14],
+])
+SIZES = ["S", "M", "L", "XL"]
+
+
+def test_recommend_single_body():
+    index = SizeRecommendationIndex(SIZES, CHART)
+    rec = index.recommend({"units": "m", "measurements": {"bust": 0.90, "waist": 0.74, "hip": 0.93}})
+    assert rec.best == "M"
+    assert rec.ease_ratios["S"]["bust_ease_ratio"] == pytest.approx(0.92 / 0.90)
+    for size, fit in zip(rec.sizes, rec.fits):
+        ratios = np.array(list(rec.ease_ratios[size].values()))
+        inside = np.all((ratios >= 1.0) & (ratios <= np.array([1.20, 1.25, 1.20])))
+        assert fit == inside
+    assert rec.warnings == {}
+
+    partial = index.recommend({"bust": 0.90, "waist": None, "hip": 0})
+    assert partial.warnings == {"MISSING_KEY": ["body.waist=None"], "ZERO_DIVISION": ["hip: denom=0"]}
+    assert math.isnan(partial.ease_ratios["S"]["waist_ease_ratio"])
+    assert math.isnan(partial.ease_ratios["S"]["hip_ease_ratio"])
+    assert partial.best is not None  # ranked on bust only
+
+    empty = index.recommend({})
+    assert empty.best is None and all(math.isnan(d) for d in empty.distances)
+
+
+def test_batch_ranking_matches_per_body_sort():
+    rng = np.random.default_rng(0)
+    bodies = rng.normal([0.93, 0.80, 0.97], 0.06, size=(5000, 3))
+    bodies[::11, 1] = np.nan
+    index = SizeRecommendationIndex(SIZES, CHART)
+    out = index.recommend_batch(bodies)
+
+    u_sizes = np.log(CHART / index.target_ease) / index.half_width
+    for i in range(0, 5000, 97):
+        d = u_sizes - np.log(bodies[i]) / index.half_width
+        dist = np.sqrt(np.nansum(d * d, axis=1))
+        fit = np.all(np.isnan(d) | (np.abs(d) <= 1.0), axis=1)
+        ref = sorted(range(len(SIZES)), key=lambda s: (not fit[s], dist[s], s))
+        assert out["order"][i].tolist() == ref
+        np.testing.assert_allclose(out["distance"][i], dist[ref], rtol=1e-12)
+        np.testing.assert_array_equal(out["fits"][i], fit[ref])
+
+    # fits == every valid key inside [body_lo, body_hi] of the size
+    fits_chart = np.zeros_like(out["fits"])
+    np.put_along_axis(fits_chart, out["order"], out["fits"], axis=1)
+    b = bodies[:, None, :]
+    inside = np.isnan(b) | ((b >= index.body_lo[None] - 1e-12) & (b <= index.body_hi[None] + 1e-12))
+    np.testing.assert_array_equal(fits_chart, inside.all(axis=2))
+    # fitting sizes rank before non-fitting ones
+    assert np.all(np.diff(out["fits"].astype(int), axis=1) <= 0)
+
+
+def test_size_chart_and_curated_loading(tmp_path):
+    path = tmp_path / "chart.json"
+    path.write_text(json.dumps({
+        "schema_version": "size_chart.v0",
+        "units": "m",
+        "sizes": [
+            {"size": "S", "measurements": {"bust": 0.92, "waist": 0.76, "hip": 0.96}},
+            {"size": "M", "bust": 0.98, "waist": "n/a", "hip": 1.02},
+        ],
+    }), encoding="utf-8")
+    sizes, values, warnings = load_size_chart(str(path))
+    assert sizes == ["S", "M"] and warnings == {}
+    assert np.isnan(values[1, 1])
+
+    index = SizeRecommendationIndex.from_size_chart(str(path))
+    assert "garment.M.waist=None" in index.recommend({"bust": 0.9, "waist": 0.78, "hip": 0.95}).warnings["MISSING_KEY"]
+
+    df = pd.DataFrame({"BUST_CIRC_M": [0.9, np.nan], "HIP_CIRC_M": [0.95, 1.0]})
+    np.testing.assert_array_equal(body_values_from_curated(df), [[0.9, np.nan, 0.95], [np.nan, np.nan, 1.0]])
+
+    with pytest.raises(ValueError):
+        SizeRecommendationIndex(SIZES, CHART, envelope={"bust": (1.1, 1.0), "waist": (1, 1.2), "hip": (1, 1.2)})
@@ -0,0 +1,104 @@
+# test_fitting_v0_facts_batch.py
+# Batch manifest mode of run_fitting_v0_facts
+# Purpose: per-pair summaries must equal the single-manifest run for the same inputs, the
+# cartesian body_set x garment_set expansion must be complete, and the columnar file must
+# carry one row per pair
+
+from __future__ import annotations
+import json
+import sys
+
+import numpy as np
+import pytest
+
+from modules.fitting.runners import run_fitting_v0_facts as runner
+
+
+def _write(path, obj):
+    path.write_text(json.dumps(obj), encoding="utf-8")
+    return str(path)
+
+
+def _run(monkeypatch, manifest_path, out_dir):
+    monkeypatch.setattr(sys, "argv", ["run_fitting_v0_facts.py", "--manifest", manifest_path, "--out_dir", str(out_dir)])
+    with pytest.raises(SystemExit) as exc:
+        runner.main()
+    assert exc.value.code == 0
+
+
+def _read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _strip_provenance(summary):
+    return {k: v for k, v in summary.items() if k != "provenance"}
+
+
+def test_batch_pairs_match_single_runs(tmp_path, monkeypatch):
+    bodies = {
+        "b0": _write(tmp_path / "b0.json", {"bust": 0.9, "waist": 0.75, "hip": 0.95}),
+        "b1": _write(tmp_path / "b1.json", {"units": "m", "measurements": {"bust": 0.0, "waist": None, "hip": 1.0}}),
+        "b2": str(tmp_path / "missing_body.json"),
+    }
+    garments = {
+        "g0": _write(tmp_path / "g0.json", {"bust": 1.0, "waist": 0.8, "hip": 1.05}),
+        "g1": _write(tmp_path / "g1.json", {"units": "cm", "measurements": {"bust": 100, "hip": "x"}}),
+    }
+    batch = _write(tmp_path / "batch.json", {
+        "schema_version": "fitting_batch_manifest.v0",
+        "inputs": {
+            "units": "m",
+            "body_set": [{"id": k, "body_measurements_path": v} for k, v in bodies.items()],
+            "garment_set": [{"id": k, "garment_measurements_path": v} for k, v in garments.items()],
+        },
+    })
+    _run(monkeypatch, batch, tmp_path / "out_batch")
+
+    cols = _read(tmp_path / "out_batch" / "fitting_batch_columns.json")
+    assert cols["n_pairs"] == 6
+    assert cols["columns"]["pair_id"] == [f"{b}__{g}" for b in bodies for g in garments]
+    assert cols["columns"]["bust_ease_ratio"][0] == pytest.approx(1.0 / 0.9)
+    assert cols["columns"]["bust_ease_ratio"][2] is None  # zero division
+    summary = _read(tmp_path / "out_batch" / "fitting_batch_summary.json")
+    assert summary["n_sources"] == 5
+    assert summary["nan_count"]["nan"] == sum(cols["columns"]["nan_count"])
+
+    for b, body_path in bodies.items():
+        for g, garment_path in garments.items():
+            single = _write(tmp_path / f"m_{b}_{g}.json", {
+                "schema_version": "fitting_manifest.v0",
+                "inputs": {
+                    "units": "m",
+                    "body_source": {"body_measurements_path": body_path},
+                    "garment_source": {"garment_measurements_path": garment_path},
+                },
+            })
+            _run(monkeypatch, single, tmp_path / f"out_{b}_{g}")
+            pair_dir = tmp_path / "out_batch" / "pairs" / f"{b}__{g}"
+            for name in ("fitting_summary.json", "facts_summary.json"):
+                got = _read(pair_dir / name)
+                ref = _read(tmp_path / f"out_{b}_{g}" / name)
+                assert _strip_provenance(got) == _strip_provenance(ref)
+                assert got["provenance"]["code_fingerprint"] == ref["provenance"]["code_fingerprint"]
+
+
+def test_expand_pairs_and_vectorized_ratios():
+    warnings = {}
+    pairs = runner.expand_batch_pairs({"pairs": [
+        {"pair_id": "a/b", "body_measurements_path": "x/body1.json", "garment_measurements_path": "g.json"},
+        {"pair_id": "a/b", "body_measurements_path": "x/body2.json", "garment_measurements_path": "g.json"},
+        {"body_measurements_path": "x/body3.json", "garment_id": "G", "garment_measurements_path": "g.json"},
+    ]}, warnings)
+    assert [p["pair_id"] for p in pairs] == ["a_b", "a_b__1", "pair_00002"]
+    assert pairs[2]["body_id"] == "body3" and pairs[2]["garment_id"] == "G"
+    assert "DUPLICATE_PAIR_ID" in warnings
+
+    runner.expand_batch_pairs({}, warnings)
+    assert "MISSING_INPUT" in warnings
+
+    body = np.array([[1.0, 0.0, np.nan], [2.0, 4.0, 5.0]])
+    garment = np.array([[1.5, 1.0, 1.0], [np.nan, 5.0, 6.0]])
+    ease = runner.compute_ease_ratio_arrays(body, garment)
+    np.testing.assert_array_equal(ease["zero_division"], [[False, True, False], [False, False, False]])
+    np.testing.assert_allclose(ease["ratios"], [[1.5, np.nan, np.nan], [np.nan, 1.25, 1.2]])
+    assert not ease["body_valid"][0, 2] and not ease["garment_valid"][1, 0]
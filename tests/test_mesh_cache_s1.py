@@ -0,0 +1,100 @@
+# test_mesh_cache_s1.py
+# Tests for the S1 runner binary mesh cache (run_geo_v0_s1_facts.py MeshCache)
+# Purpose: Cache hits must return the same (verts, loader, faces, scale_warning) as
+# the first load; edits invalidate; size bound evicts least-recently-used entries
+
+from __future__ import annotations
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from verification.runners.run_geo_v0_s1_facts import MeshCache, load_verts_from_path_with_info
+
+
+def _write_obj(path: Path, seed: int, scale: float = 1000.0) -> Path:
+    rng = np.random.default_rng(seed)
+    verts = rng.normal(0, 0.4, (300, 3)) * scale
+    faces = rng.integers(1, 301, (200, 3))
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(f"v {x:.5f} {y:.5f} {z:.5f}\n" for x, y, z in verts)
+        f.writelines(f"f {a}/{a} {b}/{b} {c}/{c}\n" for a, b, c in faces)
+    return path
+
+
+def test_cache_hit_identical_to_fresh_load(tmp_path):
+    """Verts/faces bytes, loader name and mm->m scale_warning survive the cache."""
+    obj = _write_obj(tmp_path / "scan_mm.obj", seed=0)
+    cache = MeshCache(tmp_path / "cache")
+    fresh = load_verts_from_path_with_info(str(obj))
+    first = load_verts_from_path_with_info(str(obj), mesh_cache=cache)
+    hit = cache.get(obj.resolve())
+    assert hit is not None
+    for loaded in (first, hit):
+        verts, loader_name, faces, scale_warning = loaded
+        assert verts.dtype == np.float32 and verts.tobytes() == fresh[0].tobytes()
+        assert loader_name == fresh[1]
+        assert faces.dtype == np.int32 and np.array_equal(faces, fresh[2])
+        assert scale_warning == fresh[3] and scale_warning["trigger_rule"] == "max_abs > 10.0"
+    assert not hit[0].flags.writeable  # memory-mapped, read-only
+
+
+def test_cache_invalidated_by_file_change(tmp_path):
+    """stat key: rewriting the OBJ (new size/mtime) is a miss, not a stale hit."""
+    obj = _write_obj(tmp_path / "scan.obj", seed=1, scale=1.0)
+    cache = MeshCache(tmp_path / "cache")
+    load_verts_from_path_with_info(str(obj), mesh_cache=cache)
+    _write_obj(obj, seed=2, scale=1.0)
+    os.utime(obj, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    assert cache.get(obj.resolve()) is None
+    reloaded = load_verts_from_path_with_info(str(obj), mesh_cache=cache)
+    assert reloaded[0].tobytes() == load_verts_from_path_with_info(str(obj))[0].tobytes()
+
+
+def test_lru_eviction_respects_size_bound(tmp_path):
+    """Bound of ~2 entries: the least recently used entry is evicted first."""
+    objs = [_write_obj(tmp_path / f"scan_{i}.obj", seed=i) for i in range(3)]
+    probe = MeshCache(tmp_path / "probe")
+    load_verts_from_path_with_info(str(objs[0]), mesh_cache=probe)
+    entry_size = probe.entries()[0][1]
+
+    cache = MeshCache(tmp_path / "cache", max_bytes=int(entry_size * 2.5))
+    load_verts_from_path_with_info(str(objs[0]), mesh_cache=cache)
+    load_verts_from_path_with_info(str(objs[1]), mesh_cache=cache)
+    # Make entry 0 the most recently used, then insert entry 2
+    meta_0 = tmp_path / "cache" / cache.key_for(objs[0].resolve()) / "meta.json"
+    os.utime(meta_0, (time.time() + 5, time.time() + 5))
+    load_verts_from_path_with_info(str(objs[2]), mesh_cache=cache)
+
+    assert len(cache.entries()) == 2
+    assert cache.get(objs[0].resolve()) is not None
+    assert cache.get(objs[1].resolve()) is None
+    assert cache.get(objs[2].resolve()) is not None
+
+
+def test_put_rescans_only_over_budget(tmp_path, monkeypatch):
+    """Sizes are tracked in memory: the directory is scanned at init and when over max_bytes."""
+    objs = [_write_obj(tmp_path / f"scan_{i}.obj", seed=i) for i in range(24)]
+    probe = MeshCache(tmp_path / "probe")
+    load_verts_from_path_with_info(str(objs[0]), mesh_cache=probe)
+    entry_size = probe.entries()[0][1]
+
+    scans = []
+    entries = MeshCache.entries
+    monkeypatch.setattr(MeshCache, "entries", lambda self: scans.append(1) or entries(self))
+    cache = MeshCache(tmp_path / "cache", max_bytes=int(entry_size * 20.5))
+    for obj in objs[:20]:
+        load_verts_from_path_with_info(str(obj), mesh_cache=cache)
+    assert len(scans) == 1  # init only
+
+    # 21st put goes over: rescan, evict to the low-water mark (18 entries), room for two more
+    for obj in objs[20:]:
+        load_verts_from_path_with_info(str(obj), mesh_cache=cache)
+    assert len(scans) == 3
+    assert sum(size for _, size, _ in entries(cache)) <= cache.max_bytes
+    assert cache.get(objs[-1].resolve()) is not None and cache.get(objs[0].resolve()) is None
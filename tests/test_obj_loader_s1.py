@@ -0,0 +1,107 @@
+# test_obj_loader_s1.py
+# Equivalence test for the S1 runner OBJ loader B (run_geo_v0_s1_facts.py)
+# Purpose: Bulk NumPy parser must return the same (verts, faces, scale_warning) as
+# the per-line parser for every supported face form, and fall back on anything else
+
+from __future__ import annotations
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from verification.runners.run_geo_v0_s1_facts import (
+    _parse_obj_bulk,
+    _parse_obj_line_by_line,
+    load_obj_with_fallback_parser,
+)
+
+
+def _write(tmp_path: Path, name: str, text: str, newline: str = "\n") -> Path:
+    path = tmp_path / name
+    path.write_bytes(text.replace("\n", newline).encode("utf-8"))
+    return path
+
+
+def _random_obj(seed: int, face_form: str, scale: float = 1.0) -> str:
+    rng = np.random.default_rng(seed)
+    verts = rng.normal(0, 0.4, (200, 3)) * scale
+    lines = ["# synthetic body scan", "o body", ""]
+    for i, (x, y, z) in enumerate(verts):
+        fmt = [f"{x:.6f}", repr(float(y)), f"{z:.4e}"]
+        lines.append(("  v " if i % 7 == 0 else "v ") + "\t".join(fmt) if i % 5 == 0 else "v " + " ".join(fmt))
+        if i % 9 == 0:
+            lines.append(f"vn 0 1 0")
+            lines.append(f"vt 0.5 0.5")
+    for _ in range(150):
+        idx = rng.integers(1, 201, 4)
+        if face_form == "plain":
+            tokens = [str(v) for v in idx[:3]]
+        elif face_form == "vt_vn":
+            tokens = [f"{v}/{v}/{v}" for v in idx[:3]]
+        elif face_form == "vn_only":
+            tokens = [f"{v}//{v}" for v in idx]
+        else:  # mixed polygons
+            k = int(rng.integers(3, 5))
+            tokens = [f"{v}/{v}" for v in idx[:k]]
+        lines.append("f " + " ".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+def _assert_same(parsed, reference):
+    verts, faces = parsed
+    ref_verts, ref_faces = reference
+    assert verts.dtype == np.float32 and verts.tobytes() == ref_verts.tobytes()
+    if ref_faces is None:
+        assert faces is None
+    else:
+        assert faces.dtype == np.int32 and np.array_equal(faces, ref_faces)
+
+
+def test_bulk_parser_matches_line_parser(tmp_path):
+    """All face forms, CRLF, tabs, vn/vt/comments: identical verts and faces."""
+    for seed, form in enumerate(["plain", "vt_vn", "vn_only", "mixed"]):
+        for newline in ("\n", "\r\n"):
+            path = _write(tmp_path, f"{form}.obj", _random_obj(seed, form), newline)
+            parsed = _parse_obj_bulk(path)
+            assert parsed is not None, (form, newline)
+            _assert_same(parsed, _parse_obj_line_by_line(path))
+
+
+def test_mixed_polygons_are_fan_triangulated(tmp_path):
+    """Quad next to a triangle: (0,1,2),(0,2,3) then the triangle."""
+    path = _write(tmp_path, "mixed.obj", "v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nf 1 2 3 4\nf 2 3 4\n")
+    verts, faces = _parse_obj_bulk(path)
+    assert verts.shape == (4, 3)
+    assert faces.tolist() == [[0, 1, 2], [0, 2, 3], [1, 2, 3]]
+
+
+def test_unsupported_syntax_falls_back(tmp_path):
+    """Relative indices, nan, unicode whitespace: bulk declines, loader still matches line parser."""
+    texts = [
+        "v 0 0 0\nv 1 0 0\nv 0 1 0\nv 0 0 1\nf -1 -2 -3\nf 1 2 3\n",
+        "v nan 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n",
+        "v 1 2 3\n\u00a0v 4 5 6\nv 7 8 9\nf 1 2 3\n",
+    ]
+    for i, text in enumerate(texts):
+        path = _write(tmp_path, f"odd_{i}.obj", text)
+        assert _parse_obj_bulk(path) is None
+        verts, faces, _ = load_obj_with_fallback_parser(path)
+        _assert_same((verts, faces), _parse_obj_line_by_line(path))
+
+    # Non-ASCII only in comments stays on the bulk path
+    path = _write(tmp_path, "comment.obj", "# 스캔\u00a0note\nv 1 2 3\nv 4 5 6\nv 7 8 9\nf 1 2 3\n")
+    parsed = _parse_obj_bulk(path)
+    assert parsed is not None
+    _assert_same(parsed, _parse_obj_line_by_line(path))
+
+
+def test_scale_warning_mm_to_m(tmp_path):
+    """mm-scale OBJ: converted to meters with the Round40 warning dict."""
+    path = _write(tmp_path, "mm.obj", _random_obj(5, "vt_vn", scale=1000.0))
+    verts, faces, scale_warning = load_obj_with_fallback_parser(path)
+    assert scale_warning is not None and scale_warning["trigger_rule"] == "max_abs > 10.0"
+    assert np.abs(verts).max() < 10.0
+    assert faces.shape == (150, 3)
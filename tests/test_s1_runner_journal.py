@@ -0,0 +1,101 @@
+# test_s1_runner_journal.py
+# Interrupt/resume and process-pool tests for the S1 runner (run_geo_v0_s1_facts.py --journal/--resume/--workers)
+# Purpose: a run resumed from a torn journal and a partially written sink, or run on a
+# process pool, must produce the same sinks, facts summary and verts NPZ as an
+# uninterrupted single-process run
+
+from __future__ import annotations
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.test_core_measurements_v0_slice_index import create_body_like_mesh
+
+RUNNER = project_root / "verification" / "runners" / "run_geo_v0_s1_facts.py"
+SINKS = ("skip_reasons", "exec_failures", "processed_sink", "success_not_processed")
+
+
+def write_manifest(tmp_path: Path) -> Path:
+    """Four body-like OBJ meshes (one in mm), one case without mesh_path, one missing file."""
+    cases = []
+    for i in range(4):
+        verts = create_body_like_mesh(seed=i) * (1000.0 if i == 2 else 1.0)
+        path = tmp_path / f"mesh_{i}.obj"
+        path.write_text("".join(f"v {x:.6f} {y:.6f} {z:.6f}\n" for x, y, z in verts), encoding="utf-8")
+        cases.append({"case_id": f"case_{i}", "mesh_path": str(path)})
+    cases.append({"case_id": "case_no_mesh", "mesh_path": None})
+    cases.append({"case_id": "case_missing", "mesh_path": str(tmp_path / "missing.obj")})
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"schema_version": "s1_mesh_v0@1", "meta_unit": "m", "cases": cases}), encoding="utf-8")
+    return manifest
+
+
+def run_s1(manifest: Path, out_dir: Path, *flags: str) -> str:
+    env = dict(os.environ, PYTHONHASHSEED="0")
+    proc = subprocess.run(
+        [sys.executable, str(RUNNER), "--manifest", str(manifest), "--out_dir", str(out_dir), *flags],
+        capture_output=True, text=True, env=env, cwd=str(project_root), timeout=300,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    return proc.stdout
+
+
+def run_outputs(out_dir: Path) -> dict:
+    """Sink bytes, facts summary (run-dir paths dropped) and verts NPZ contents."""
+    artifacts = out_dir / "artifacts"
+    outputs = {name: (artifacts / f"{name}.jsonl").read_bytes() for name in SINKS}
+    summary = json.loads((out_dir / "facts_summary.json").read_text(encoding="utf-8"))
+    summary.pop("npz_path_abs", None)
+    outputs["facts_summary"] = summary
+    npz = np.load(artifacts / "visual" / "verts_proxy.npz", allow_pickle=True)
+    outputs["npz_case_id"] = list(npz["case_id"])
+    outputs["npz_verts"] = [np.asarray(v, dtype=np.float64).tolist() for v in npz["verts"]]
+    return outputs
+
+
+def test_resume_after_interrupt_matches_uninterrupted_run(tmp_path):
+    manifest = write_manifest(tmp_path)
+    reference = tmp_path / "reference"
+    run_s1(manifest, reference)
+    assert not (reference / "artifacts" / "case_journal.jsonl").exists()  # journal is opt-in
+
+    resumed = tmp_path / "resumed"
+    run_s1(manifest, resumed, "--journal")
+    journal = resumed / "artifacts" / "case_journal.jsonl"
+    lines = journal.read_text(encoding="utf-8").splitlines(keepends=True)
+    assert len(lines) == 6
+    assert not list((resumed / "artifacts" / "case_store").glob("*.pkl"))
+
+    # Interrupted after three cases: torn fourth journal line, half-written sink record
+    journal.write_text("".join(lines[:3]) + lines[3][:40], encoding="utf-8")
+    with open(resumed / "artifacts" / "skip_reasons.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"case_id": "case_3", "stage"')
+
+    stdout = run_s1(manifest, resumed, "--resume")
+    assert "[RESUME] 3/6 cases restored from journal" in stdout
+    assert run_outputs(resumed) == run_outputs(reference)
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 6
+
+    # Edited mesh: its journal entry no longer matches and the case is measured again
+    mesh_0 = tmp_path / "mesh_0.obj"
+    mesh_0.write_text(mesh_0.read_text(encoding="utf-8") + "v 0.0 0.0 0.0\n", encoding="utf-8")
+    stdout = run_s1(manifest, resumed, "--resume")
+    assert "[RESUME] 5/6 cases restored from journal" in stdout
+
+
+def test_process_pool_matches_single_process(tmp_path):
+    # --workers replays each worker's captured sink lines in manifest order
+    manifest = write_manifest(tmp_path)
+    serial = tmp_path / "serial"
+    pooled = tmp_path / "pooled"
+    run_s1(manifest, serial, "--workers", "1")
+    stdout = run_s1(manifest, pooled, "--workers", "2")
+    assert "Process pool: 2 workers" in stdout
+    assert run_outputs(pooled) == run_outputs(serial)
@@ -0,0 +1,120 @@
+# test_shoulder_width_sweep_engine.py
+# Shoulder width sweep engine: grid order, batch equivalence, memo reuse, process pool, v1.2 evaluator
+# Purpose: extending a grid must only compute the new configs; pooled results match serial
+
+from __future__ import annotations
+import json
+
+import numpy as np
+import pytest
+
+from core.measurements.shoulder_width_v112 import (
+    ShoulderWidthV112Config,
+    measure_shoulder_width_v112_batch,
+    precompute_shoulder_width_v112_frames,
+)
+from core.measurements.shoulder_width_v12 import ShoulderWidthV12Config, measure_shoulder_width_v12
+from verification.runners.shoulder_width import sweep_engine
+from verification.runners.shoulder_width import verify_shoulder_width_v12_sensitivity as v12_runner
+from verification.runners.shoulder_width.sweep_engine import (
+    ShoulderWidthV12Frames,
+    cfg_to_hash,
+    code_fingerprint,
+    config_grid,
+    dataset_fingerprint,
+    evaluate_shoulder_width_v112,
+    evaluate_shoulder_width_v12,
+    run_sweep,
+)
+from tests.test_shoulder_width_v112_batch import JOINT_IDS, _synthetic_frames
+
+
+def test_config_grid_order():
+    grid = config_grid(ShoulderWidthV112Config(), r0_ratio=[0.2, 0.3], cap_quantile=[0.9, 0.95, 0.99])
+    assert [(c.r0_ratio, c.cap_quantile) for c in grid] == [
+        (0.2, 0.9), (0.2, 0.95), (0.2, 0.99), (0.3, 0.9), (0.3, 0.95), (0.3, 0.99),
+    ]
+    assert len({cfg_to_hash(c) for c in grid}) == 6
+
+
+def test_sweep_matches_batch_and_memo_extends_grid(tmp_path):
+    verts, lbs, joints = _synthetic_frames(4, seed=5)
+    frames = precompute_shoulder_width_v112_frames(verts, lbs, joints, JOINT_IDS)
+    key = dataset_fingerprint(verts, lbs, joints)
+    cache = tmp_path / "memo.jsonl"
+
+    grid = config_grid(ShoulderWidthV112Config(), r0_ratio=[0.22, 0.26])
+    first = run_sweep(grid, frames, evaluate_shoulder_width_v112, cache_path=str(cache), dataset_key=key)
+    assert [e["cached"] for e in first] == [False, False]
+    for entry in first:
+        ref = measure_shoulder_width_v112_batch(verts, lbs, joints, JOINT_IDS, cfg=entry["cfg"])
+        np.testing.assert_allclose(entry["result"]["widths"], ref, atol=1e-7)
+
+    extended = grid + config_grid(ShoulderWidthV112Config(), r0_ratio=[0.30])
+    second = run_sweep(extended, frames, evaluate_shoulder_width_v112, cache_path=str(cache), dataset_key=key)
+    assert [e["cached"] for e in second] == [True, True, False]
+    assert [e["result"] for e in second[:2]] == [e["result"] for e in first]
+    assert len(cache.read_text().splitlines()) == 3
+
+    # Different frame set -> no memo hits
+    other = run_sweep(grid, frames, evaluate_shoulder_width_v112, cache_path=str(cache), dataset_key="other")
+    assert not any(e["cached"] for e in other)
+
+    # Interrupted run: truncated last line is ignored
+    with cache.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"key": "x"})[:5])
+    again = run_sweep(extended, frames, evaluate_shoulder_width_v112, cache_path=str(cache), dataset_key=key)
+    assert all(e["cached"] for e in again)
+
+
+def test_sweep_process_pool_matches_serial():
+    verts, lbs, joints = _synthetic_frames(3, seed=6)
+    frames = precompute_shoulder_width_v112_frames(verts, lbs, joints, JOINT_IDS)
+    grid = config_grid(ShoulderWidthV112Config(), cap_quantile=[0.9, 0.95, 0.99])
+
+    serial = run_sweep(grid, frames, evaluate_shoulder_width_v112)
+    pooled = run_sweep(grid + grid[:1], frames, evaluate_shoulder_width_v112, workers=2)
+    assert [e["result"] for e in pooled[:3]] == [e["result"] for e in serial]
+    assert pooled[3]["result"] == serial[0]["result"]
+
+
+def test_memo_key_includes_code_fingerprint(tmp_path, monkeypatch):
+    verts, lbs, joints = _synthetic_frames(2, seed=7)
+    frames = precompute_shoulder_width_v112_frames(verts, lbs, joints, JOINT_IDS)
+    cache = tmp_path / "memo.jsonl"
+    grid = config_grid(ShoulderWidthV112Config(), r0_ratio=[0.22, 0.26])
+    run_sweep(grid, frames, evaluate_shoulder_width_v112, cache_path=str(cache), dataset_key="d")
+
+    # Fingerprint covers the measurement module the evaluator calls
+    assert code_fingerprint(evaluate_shoulder_width_v112) != code_fingerprint(evaluate_shoulder_width_v12)
+    assert code_fingerprint(evaluate_shoulder_width_v112) == code_fingerprint(evaluate_shoulder_width_v112)
+
+    # Edited measurement code -> memo entries of the old code are not reused
+    monkeypatch.setattr(sweep_engine, "code_fingerprint", lambda fn: "edited")
+    again = run_sweep(grid, frames, evaluate_shoulder_width_v112, cache_path=str(cache), dataset_key="d")
+    assert not any(e["cached"] for e in again)
+
+
+def test_v12_sensitivity_candidate_from_sweep(tmp_path):
+    verts, lbs, joints = _synthetic_frames(4, seed=8)
+    frames = ShoulderWidthV12Frames(verts, lbs, joints, JOINT_IDS)
+    cfg = ShoulderWidthV12Config(arm_distance_threshold=0.12)
+
+    swept = run_sweep([cfg], frames, evaluate_shoulder_width_v12)[0]["result"]
+    for t in range(4):
+        ref, _ = measure_shoulder_width_v12(verts[t], lbs[t], joints[t], JOINT_IDS, cfg=cfg, return_debug=True)
+        assert swept["errors"][t] is None
+        assert swept["widths"][t] == ref
+
+    perturbed = run_sweep(list(v12_runner.perturbation_configs(cfg)), frames.head(3), evaluate_shoulder_width_v12)
+    from_sweep = v12_runner.evaluate_candidate_config(
+        "candidate_001", cfg, verts, lbs, joints, JOINT_IDS, str(tmp_path / "a"),
+        frame_results=swept, perturbation_results=tuple(e["result"] for e in perturbed),
+    )
+    direct = v12_runner.evaluate_candidate_config(
+        "candidate_001", cfg, verts, lbs, joints, JOINT_IDS, str(tmp_path / "b"),
+    )
+    assert from_sweep == direct
+    assert from_sweep["cfg_hash"] == v12_runner.cfg_to_hash(cfg, 0.12)
+    assert from_sweep["n_fallback"] == 0
+    assert from_sweep["pose_perturbation"] is not None  # perturbed widths reach the stats
@@ -0,0 +1,108 @@
+# test_shoulder_width_v112_batch.py
+# Equivalence test for measure_shoulder_width_v112_batch
+# Purpose: batched widths/landmarks/fallback must match per-frame measure_shoulder_width_v112,
+# degenerate frames become NaN with the reference error message
+
+from __future__ import annotations
+import numpy as np
+import pytest
+
+from core.measurements.shoulder_width_v112 import (
+    ShoulderWidthV112Config,
+    measure_shoulder_width_v112,
+    measure_shoulder_width_v112_batch,
+)
+
+JOINT_IDS = {
+    "L_shoulder": 16,
+    "R_shoulder": 17,
+    "L_elbow": 18,
+    "R_elbow": 19,
+    "L_wrist": 20,
+    "R_wrist": 21,
+}
+
+
+def _synthetic_frames(T: int, seed: int = 0):
+    """Torso ellipse-cylinder + upper/lower arm tubes, one-hot LBS weights shared across frames."""
+    rng = np.random.default_rng(seed)
+    owners = np.concatenate([np.full(3000, 3)] + [np.full(500, o) for o in (16, 18, 17, 19)])
+    lbs = np.zeros((owners.size, 55), dtype=np.float32)
+    lbs[np.arange(owners.size), owners] = 1.0
+
+    verts_all, joints_all = [], []
+    for _ in range(T):
+        half = rng.uniform(0.15, 0.21)
+        drop = rng.uniform(0.15, 0.25)
+        joints = np.zeros((55, 3), dtype=np.float32)
+        for sign, sh, el, wr in ((1, 16, 18, 20), (-1, 17, 19, 21)):
+            joints[sh] = [sign * half, 1.42, 0.0]
+            joints[el] = [sign * (half + 0.22), 1.42 - drop, 0.02]
+            joints[wr] = [sign * (half + 0.40), 1.42 - 2 * drop, 0.04]
+
+        parts = []
+        t = rng.uniform(0, 2 * np.pi, 3000)
+        y = rng.uniform(0.95, 1.45, 3000)
+        parts.append(np.stack([(half + 0.02) * np.cos(t), y, 0.11 * np.sin(t)], axis=1))
+        for start, end in ((16, 18), (18, 20), (17, 19), (19, 21)):
+            a = rng.uniform(0, 1, 500)
+            phi = rng.uniform(0, 2 * np.pi, 500)
+            axis = joints[end] - joints[start]
+            u = axis / np.linalg.norm(axis)
+            v = np.cross(u, [0.0, 0.0, 1.0])
+            v /= np.linalg.norm(v)
+            w = np.cross(u, v)
+            parts.append(joints[start] + a[:, None] * axis + 0.045 * (np.cos(phi)[:, None] * v + np.sin(phi)[:, None] * w))
+        verts = np.concatenate(parts) + rng.normal(0, 0.002, (owners.size, 3))
+        verts_all.append(verts.astype(np.float32))
+        joints_all.append(joints)
+    return np.stack(verts_all), lbs, np.stack(joints_all)
+
+
+@pytest.mark.parametrize("cfg", [
+    ShoulderWidthV112Config(),
+    ShoulderWidthV112Config(r0_ratio=0.26, r1_ratio=0.18, cap_quantile=0.88),
+    ShoulderWidthV112Config(cap_quantile=0.99, min_cap_points=400),  # forces quantile relaxation
+])
+def test_batch_matches_per_frame(cfg):
+    verts, lbs, joints = _synthetic_frames(6)
+    widths, debug = measure_shoulder_width_v112_batch(verts, lbs, joints, JOINT_IDS, cfg=cfg, return_debug=True)
+
+    assert widths.shape == (6,)
+    for t in range(6):
+        ref, ref_debug = measure_shoulder_width_v112(verts[t], lbs, joints[t], JOINT_IDS, cfg=cfg, return_debug=True)
+        assert widths[t] == pytest.approx(ref, abs=1e-6)
+        np.testing.assert_allclose(debug["landmark_L"][t], ref_debug["landmark_L"], atol=1e-6)
+        np.testing.assert_allclose(debug["landmark_R"][t], ref_debug["landmark_R"], atol=1e-6)
+        np.testing.assert_array_equal(debug["mask_keep_step2"][t], ref_debug["mask_keep_step2"])
+        assert debug["fallback"][t] == ref_debug["fallback"][0]
+        assert debug["errors"][t] is None
+
+
+def test_batch_per_frame_weights_and_degenerate_frame():
+    verts, lbs, joints = _synthetic_frames(3, seed=1)
+    joints[1, 18] = joints[1, 16]  # L shoulder-elbow axis collapses on frame 1
+    lbs_t = np.broadcast_to(lbs, (3,) + lbs.shape)
+
+    widths, debug = measure_shoulder_width_v112_batch(verts, lbs_t, joints, JOINT_IDS, return_debug=True)
+
+    assert np.isnan(widths[1])
+    with pytest.raises(ValueError) as exc:
+        measure_shoulder_width_v112(verts[1], lbs, joints[1], JOINT_IDS)
+    assert debug["errors"][1] == f"ValueError: {exc.value}"
+    for t in (0, 2):
+        assert widths[t] == pytest.approx(measure_shoulder_width_v112(verts[t], lbs, joints[t], JOINT_IDS), abs=1e-6)
+
+
+def test_batch_no_geometry_fallback_and_shape_errors():
+    verts, lbs, joints = _synthetic_frames(2, seed=2)
+    lbs_all_distal = np.zeros_like(lbs)
+    lbs_all_distal[:, 18] = 1.0
+    widths, debug = measure_shoulder_width_v112_batch(verts, lbs_all_distal, joints, JOINT_IDS, return_debug=True)
+    np.testing.assert_array_equal(debug["fallback"], [1, 1])
+    np.testing.assert_allclose(widths, np.linalg.norm(joints[:, 16] - joints[:, 17], axis=1), atol=1e-7)
+
+    with pytest.raises(ValueError):
+        measure_shoulder_width_v112_batch(verts[0], lbs, joints[0], JOINT_IDS)
+    with pytest.raises(KeyError):
+        measure_shoulder_width_v112_batch(verts, lbs, joints, {"L_shoulder": 16})
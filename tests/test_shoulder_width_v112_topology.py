@@ -0,0 +1,53 @@
+# test_shoulder_width_v112_topology.py
+# Precomputed Step1 topology for measure_shoulder_width_v112
+# Purpose: topology path (full verts or candidate subset, lbs_weights=None) must be
+# bit-identical to the plain call; mismatched topology/cfg must be rejected
+
+from __future__ import annotations
+import numpy as np
+import pytest
+
+from core.measurements.shoulder_width_v112 import (
+    ShoulderWidthV112Config,
+    measure_shoulder_width_v112,
+    precompute_shoulder_width_v112_topology,
+)
+from tests.test_shoulder_width_v112_batch import JOINT_IDS, _synthetic_frames
+
+
+@pytest.mark.parametrize("cfg", [
+    ShoulderWidthV112Config(),
+    ShoulderWidthV112Config(cap_quantile=0.99, min_cap_points=400),
+])
+def test_topology_matches_plain_call(cfg):
+    verts, lbs, joints = _synthetic_frames(3, seed=7)
+    topo = precompute_shoulder_width_v112_topology(lbs, JOINT_IDS, cfg)
+    assert topo.n_verts == lbs.shape[0] and topo.n_candidates == 4000
+    assert not topo.candidate_idx.flags.writeable
+
+    for t in range(3):
+        ref, ref_debug = measure_shoulder_width_v112(verts[t], lbs, joints[t], JOINT_IDS, cfg=cfg, return_debug=True)
+        for v in (verts[t], verts[t][topo.candidate_idx]):
+            width, debug = measure_shoulder_width_v112(
+                v, None, joints[t], JOINT_IDS, cfg=cfg, return_debug=True, topology=topo
+            )
+            assert width == ref
+            for key in ("mask_keep_step1", "mask_keep_step2", "landmark_L", "landmark_R", "fallback"):
+                np.testing.assert_array_equal(debug[key], ref_debug[key])
+
+
+def test_topology_mismatch_errors():
+    verts, lbs, joints = _synthetic_frames(1, seed=8)
+    topo = precompute_shoulder_width_v112_topology(lbs, JOINT_IDS)
+
+    with pytest.raises(ValueError):
+        measure_shoulder_width_v112(verts[0][:100], None, joints[0], JOINT_IDS, topology=topo)
+    with pytest.raises(ValueError):
+        measure_shoulder_width_v112(
+            verts[0], None, joints[0], JOINT_IDS,
+            cfg=ShoulderWidthV112Config(distal_w_threshold=0.4), topology=topo,
+        )
+    with pytest.raises(ValueError):
+        measure_shoulder_width_v112(verts[0], None, joints[0], {**JOINT_IDS, "L_wrist": 22}, topology=topo)
+    with pytest.raises(KeyError):
+        precompute_shoulder_width_v112_topology(lbs, {"L_shoulder": 16})
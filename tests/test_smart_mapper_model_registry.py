@@ -0,0 +1,113 @@
+# test_smart_mapper_model_registry.py
+# SMPL-X model registry: one load per key, shared LBS weights, disk-cached canonical heights
+# Purpose: smplx.create is replaced by a tiny fake model, so no SMPL-X files are needed
+
+from __future__ import annotations
+import types
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("smplx")
+
+from core.smart_mapper import model_registry
+from core.smart_mapper.model_registry import SMPLXModelRegistry
+
+
+class _FakeSMPLX(torch.nn.Module):
+    """Zero-beta forward gives a 1.7 m tall vertex column."""
+
+    def __init__(self, num_betas: int):
+        super().__init__()
+        self.num_betas = num_betas
+        self.register_buffer("lbs_weights", torch.full((201, 55), 1.0 / 55))
+        self.forward_calls = 0
+
+    def forward(self, betas):
+        self.forward_calls += 1
+        y = torch.linspace(0.0, 1.7, 201)
+        verts = torch.stack([torch.zeros_like(y), y, torch.zeros_like(y)], dim=1)
+        return types.SimpleNamespace(vertices=verts[None] + betas.sum() * 0.0)
+
+
+@pytest.fixture
+def fake_create(monkeypatch):
+    created = []
+
+    def create(model_path, model_type, gender, use_pca, num_betas, ext, dtype):
+        model = _FakeSMPLX(num_betas)
+        created.append((model_path, gender, num_betas, model))
+        return model
+
+    monkeypatch.setattr(model_registry.smplx, "create", create)
+    return created
+
+
+def _write_model_files(root):
+    smplx_dir = root / "smplx"
+    smplx_dir.mkdir()
+    for sex in ("MALE", "FEMALE"):
+        (smplx_dir / f"SMPLX_{sex}.pkl").write_bytes(sex.encode() * 64)
+
+
+def test_registry_loads_each_key_once(fake_create, tmp_path):
+    reg = SMPLXModelRegistry()
+    cpu = torch.device("cpu")
+    m1 = reg.get_model(str(tmp_path), "male", 10, cpu)
+    m2 = reg.get_model(str(tmp_path), "male", 10, "cpu")
+    reg.get_model(str(tmp_path), "female", 10, cpu)
+    reg.get_model(str(tmp_path), "male", 16, cpu)
+    assert m1 is m2
+    assert len(fake_create) == 3
+
+    w = reg.get_lbs_weights_np(str(tmp_path), "male", 10, cpu)
+    assert isinstance(w, np.ndarray) and w.shape == (201, 55)
+    assert w is reg.get_lbs_weights_np(str(tmp_path), "male", 10, cpu)
+    assert not w.flags.writeable
+
+    with pytest.raises(ValueError):
+        reg.get_model(str(tmp_path), "other", 10, cpu)
+
+
+def test_canonical_height_disk_cache(fake_create, tmp_path):
+    _write_model_files(tmp_path)
+    cache_dir = tmp_path / "cache"
+    cpu = torch.device("cpu")
+
+    reg = SMPLXModelRegistry(cache_dir=str(cache_dir))
+    h = reg.get_canonical_height(str(tmp_path), "male", 10, cpu)
+    assert h == pytest.approx(1.7 * 0.99, abs=1e-4)
+    assert reg.get_canonical_height(str(tmp_path), "male", 10, cpu) == h
+    assert fake_create[0][3].forward_calls == 1
+    assert (cache_dir / model_registry.CANONICAL_HEIGHTS_FILENAME).exists()
+
+    # New process-equivalent registry: served from disk, no model load
+    reg2 = SMPLXModelRegistry(cache_dir=str(cache_dir))
+    assert reg2.get_canonical_height(str(tmp_path), "male", 10, cpu) == pytest.approx(h)
+    assert len(fake_create) == 1
+
+    # Changed model file -> new hash -> recomputed
+    (tmp_path / "smplx" / "SMPLX_MALE.pkl").write_bytes(b"changed")
+    reg3 = SMPLXModelRegistry(cache_dir=str(cache_dir))
+    reg3.get_canonical_height(str(tmp_path), "male", 10, cpu)
+    assert len(fake_create) == 2
+
+
+def test_shoulder_width_topology_shared(fake_create, tmp_path):
+    from core.measurements.shoulder_width_v112 import ShoulderWidthV112Config
+    from core.smart_mapper.smart_mapper_v001 import SMPLX_JOINT_IDS
+
+    reg = SMPLXModelRegistry()
+    cpu = torch.device("cpu")
+    t1 = reg.get_shoulder_width_v112_topology(str(tmp_path), "male", 10, cpu, SMPLX_JOINT_IDS)
+    t2 = reg.get_shoulder_width_v112_topology(
+        str(tmp_path), "male", 10, cpu, SMPLX_JOINT_IDS, ShoulderWidthV112Config(r0_ratio=0.2)
+    )
+    t3 = reg.get_shoulder_width_v112_topology(
+        str(tmp_path), "male", 10, cpu, SMPLX_JOINT_IDS, ShoulderWidthV112Config(distal_w_threshold=0.01)
+    )
+    assert t1 is t2  # Step1 does not depend on r0_ratio
+    assert t3 is not t1
+    assert t1.n_candidates == 201 and t3.n_candidates == 0
+    assert len(fake_create) == 1
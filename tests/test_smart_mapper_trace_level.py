@@ -0,0 +1,103 @@
+# test_smart_mapper_trace_level.py
+# SmartMapper trace_level ("off" / "summary" / "full") on the fake differentiable SMPL-X model
+# Purpose: the trace level only changes what is logged; "summary" must report the loss
+# components of the accepted step, i.e. what "full" recomputes with an extra forward
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("smplx")
+
+from core.smart_mapper import model_registry
+from core.smart_mapper.model_registry import SMPLXModelRegistry
+from core.smart_mapper.smart_mapper_v001 import SmartMapper, accepted_step_record
+from tests.test_smart_mapper_batch import NUM_BETAS, _FakeSMPLX, _subjects
+
+COMPONENTS = ("loss_meas", "loss_anchor", "loss_beta_mag")
+
+
+@pytest.fixture
+def make_mapper(monkeypatch, tmp_path):
+    def create(model_path, model_type, gender, use_pca, num_betas, ext, dtype):
+        return _FakeSMPLX(num_betas)
+
+    monkeypatch.setattr(model_registry.smplx, "create", create)
+    rng = np.random.default_rng(0)
+    beta_means = {
+        "male": rng.normal(0, 0.3, NUM_BETAS).astype(np.float32),
+        "female": rng.normal(0, 0.3, NUM_BETAS).astype(np.float32),
+    }
+    registry = SMPLXModelRegistry()
+
+    def make(trace_level):
+        return SmartMapper(
+            str(tmp_path), beta_means, device=torch.device("cpu"),
+            trace_level=trace_level, registry=registry,
+        )
+
+    return make
+
+
+def _assert_same_fit(got, ref):
+    assert got["status"] == ref["status"]
+    assert got["n_iter"] == ref["n_iter"]
+    assert np.array_equal(got["betas"], ref["betas"])
+    for key in ("loss_total", "loss_measurement", "loss_anchor", "loss_beta_mag"):
+        assert got[key] == pytest.approx(ref[key], rel=1e-6, abs=1e-9)
+
+
+def _assert_same_trace(got, ref):
+    assert len(got["trace"]) == len(ref["trace"]) > 0
+    for entry, ref_entry in zip(got["trace"], ref["trace"]):
+        assert entry["iter"] == ref_entry["iter"]
+        assert entry["loss_total"] == ref_entry["loss_total"]
+        for key in COMPONENTS:
+            assert entry[key] == pytest.approx(ref_entry[key], rel=1e-6, abs=1e-9)
+
+
+def test_default_trace_level_is_summary(make_mapper, tmp_path):
+    assert SmartMapper(str(tmp_path), {"male": np.zeros(NUM_BETAS), "female": np.zeros(NUM_BETAS)}).trace_level == "summary"
+    with pytest.raises(ValueError):
+        make_mapper("verbose")
+
+
+def test_optimize_trace_levels_agree(make_mapper):
+    full, summary, off = make_mapper("full"), make_mapper("summary"), make_mapper("off")
+    for subject in _subjects()[:4]:
+        ref = full.optimize(**subject)
+        got = summary.optimize(**subject)
+        _assert_same_fit(got, ref)
+        _assert_same_trace(got, ref)
+
+        silent = off.optimize(**subject)
+        _assert_same_fit(silent, ref)
+        assert silent["trace"] == []
+
+
+def test_optimize_batch_trace_levels_agree(make_mapper):
+    subjects = _subjects()
+    ref = make_mapper("full").optimize_batch(subjects)
+    got = make_mapper("summary").optimize_batch(subjects)
+    silent = make_mapper("off").optimize_batch(subjects)
+    for r, g, o in zip(ref, got, silent):
+        _assert_same_fit(g, r)
+        _assert_same_fit(o, r)
+        assert o["trace"] == []
+        if r["status"] == "SUCCESS":
+            _assert_same_trace(g, r)
+
+
+def test_accepted_step_record_skips_rejected_trials():
+    betas = torch.tensor([[0.0, 1.0], [2.0, 3.0]])
+    accepted = {"betas": betas.clone(), "tag": "accepted"}
+    rejected = {"betas": betas + 0.5, "tag": "rejected"}
+    assert accepted_step_record([accepted, rejected], betas)["tag"] == "accepted"
+
+    # Batched: only the compared rows have to match (frozen rows may have been restored)
+    moved = betas.clone()
+    moved[1] += 1.0
+    assert accepted_step_record([accepted, rejected], moved, rows=np.array([0]))["tag"] == "accepted"
+    assert accepted_step_record([rejected], betas)["tag"] == "rejected"  # no match: last record
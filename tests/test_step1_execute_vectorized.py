@@ -0,0 +1,115 @@
+"""
+Test for step1_execute columnar row processing.
+
+process_frame + build_targets_frame must reproduce the per-row
+df.iterrows() + process_row path bit for bit: targets_metadata.csv text
+and init_betas_*.npy bytes.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("smplx")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pipelines.step1_execute import (
+    NUM_BETAS,
+    build_targets_frame,
+    get_init_betas,
+    get_init_betas_batch,
+    process_frame,
+    process_row,
+)
+
+CANON_H = {"male": 171.3, "female": 160.9}
+
+
+def _synthetic_csv(seed, n=400, with_gender=True, messy=False):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Age": rng.integers(20, 60, n).astype(float),
+        "Height": rng.uniform(120, 220, n).round(1),
+        "Weight": rng.uniform(30, 190, n).round(1),
+        "Chest_Girth": rng.uniform(45, 165, n).round(1),
+        "Waist_Girth": rng.uniform(45, 165, n).round(1),
+        "Hip_Girth": rng.uniform(45, 165, n).round(1),
+    })
+    if with_gender:
+        df.insert(0, "Gender", rng.choice(["M", "F", "male", "여자", "unknown", None], n))
+    if messy:
+        df["Height"] = df["Height"].astype(object)
+        df.loc[::7, "Height"] = " 170.5 "
+        df.loc[::11, "Height"] = "n/a"
+        df.loc[::13, "Weight"] = np.nan
+        df["Age"] = df["Age"].astype(object)
+        df.loc[::5, "Age"] = "thirty"
+    # Round-trip through CSV like run_step1 does
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)))
+
+
+def _reference(frames):
+    targets, betas = [], []
+    for df, source_file, age_low, age_high, file_gender in frames:
+        for _, row in df.iterrows():
+            result = process_row(row, CANON_H, source_file, age_low, age_high, file_gender)
+            if result is None:
+                continue
+            targets.append(result[0])
+            betas.append(result[1])
+    betas_arr = np.stack(betas, axis=0).astype(np.float32) if betas else np.zeros((0, NUM_BETAS), dtype=np.float32)
+    return pd.DataFrame(targets), betas_arr
+
+
+def _vectorized(frames):
+    columns, betas = [], []
+    for df, source_file, age_low, age_high, file_gender in frames:
+        cols, b = process_frame(df, CANON_H, source_file, age_low, age_high, file_gender)
+        columns.append(cols)
+        betas.append(b)
+    return build_targets_frame(columns), np.concatenate(betas, axis=0)
+
+
+@pytest.mark.parametrize("file_meta", [
+    [(20, 29, "male"), (30, 39, "female")],
+    [(20, 29, "female"), (None, None, None)],
+])
+def test_process_frame_matches_process_row(file_meta):
+    frames = []
+    for k, (a0, a1, g) in enumerate(file_meta):
+        df = _synthetic_csv(k, with_gender=(k == 0 or g is None), messy=(k == 1))
+        frames.append((df, f"SizeKorea_{k}.csv", a0, a1, g))
+
+    ref_df, ref_betas = _reference(frames)
+    got_df, got_betas = _vectorized(frames)
+
+    assert got_df.to_csv(index=False) == ref_df.to_csv(index=False)
+    assert got_betas.dtype == ref_betas.dtype
+    assert got_betas.tobytes() == ref_betas.tobytes()
+
+    genders = got_df["gender"].to_numpy()
+    ref_male = np.stack([b for b, t in zip(ref_betas, ref_df["gender"]) if t == "male"])
+    assert got_betas[genders == "male"].tobytes() == ref_male.tobytes()
+
+
+def test_get_init_betas_batch_matches_scalar():
+    rng = np.random.default_rng(3)
+    h = rng.uniform(130, 210, 500)
+    w = rng.uniform(35, 180, 500)
+    betas, bmi, raw, clipped = get_init_betas_batch(h, w, NUM_BETAS)
+    for i in range(len(h)):
+        b_ref, bmi_ref, raw_ref, clipped_ref = get_init_betas(h[i], w[i], NUM_BETAS)
+        assert betas[i].tobytes() == b_ref.tobytes()
+        assert bmi[i] == bmi_ref and raw[i] == raw_ref and clipped[i] == clipped_ref
+
+
+def test_build_targets_frame_empty():
+    df = pd.DataFrame({"Height": ["x"], "Weight": [1.0]})
+    cols, betas = process_frame(df, CANON_H, "SizeKorea_x.csv", 20, 29, "male")
+    assert betas.shape == (0, NUM_BETAS)
+    assert build_targets_frame([cols]).to_csv(index=False) == pd.DataFrame([]).to_csv(index=False)
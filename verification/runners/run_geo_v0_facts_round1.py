@@ -33,6 +33,8 @@ from core.measurements.core_measurements_v0 import (
     measure_waist_group_with_shared_slice,
     measure_hip_group_with_shared_slice,
     MeasurementResult,
+    SliceIndex,
+    measure_all_keys_batch,
 )
 
 # This round's keys
@@ -148,9 +150,16 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
     """Measure all keys for a single case."""
     results = {}
     
+    # One Y-sorted slice index per mesh, shared by every slice-based key
+    # (an empty or malformed mesh has no index; its keys fail in the per-group handlers below)
+    try:
+        slice_index = SliceIndex.from_verts(verts) if len(verts) > 0 else None
+    except Exception:
+        slice_index = None
+    
     # WAIST group: Use shared slice (CIRC, WIDTH, DEPTH)
     try:
-        waist_results = measure_waist_group_with_shared_slice(verts)
+        waist_results = measure_waist_group_with_shared_slice(verts, slice_index=slice_index)
         results.update(waist_results)
     except Exception as e:
         for key in ["WAIST_CIRC_M", "WAIST_WIDTH_M", "WAIST_DEPTH_M"]:
@@ -169,7 +178,7 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
     
     # HIP group: Use shared slice (CIRC, WIDTH, DEPTH)
     try:
-        hip_results = measure_hip_group_with_shared_slice(verts)
+        hip_results = measure_hip_group_with_shared_slice(verts, slice_index=slice_index)
         results.update(hip_results)
     except Exception as e:
         for key in ["HIP_CIRC_M", "HIP_WIDTH_M", "HIP_DEPTH_M"]:
@@ -191,7 +200,7 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
         if key in ["WAIST_CIRC_M", "HIP_CIRC_M"]:
             continue  # Already measured above
         try:
-            result = measure_circumference_v0_with_metadata(verts, key)
+            result = measure_circumference_v0_with_metadata(verts, key, slice_index=slice_index)
             results[key] = result
         except Exception as e:
             results[key] = MeasurementResult(
@@ -212,7 +221,7 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
         if key in ["WAIST_WIDTH_M", "WAIST_DEPTH_M", "HIP_WIDTH_M", "HIP_DEPTH_M"]:
             continue  # Already measured above
         try:
-            result = measure_width_depth_v0_with_metadata(verts, key, proxy_used=False)
+            result = measure_width_depth_v0_with_metadata(verts, key, proxy_used=False, slice_index=slice_index)
             results[key] = result
         except Exception as e:
             results[key] = MeasurementResult(
@@ -735,16 +744,27 @@ def main():
     # Process all cases
     print("\nProcessing cases...")
     all_results = []
-    for i, (verts, case_id) in enumerate(zip(verts_list, case_ids)):
-        print(f"  [{i+1}/{len(verts_list)}] {case_id}")
+    # Shared vertex count (e.g. SMPL-X golden sets): one batched call
+    batched = len(verts_list) > 1 and len({np.shape(v) for v in verts_list}) == 1
+    if batched:
+        print(f"  Batched: {len(verts_list)} cases x {verts_list[0].shape[0]} verts")
         try:
-            results = measure_all_keys(verts, case_id)
-            all_results.append(results)
+            all_results = measure_all_keys_batch(np.stack(verts_list))
         except Exception as e:
-            print(f"    ERROR: {e}")
+            print(f"    BATCH ERROR: {e} (falling back to per-case)")
             traceback.print_exc()
-            # Continue with empty results
-            all_results.append({})
+            batched = False
+    if not batched:
+        for i, (verts, case_id) in enumerate(zip(verts_list, case_ids)):
+            print(f"  [{i+1}/{len(verts_list)}] {case_id}")
+            try:
+                results = measure_all_keys(verts, case_id)
+                all_results.append(results)
+            except Exception as e:
+                print(f"    ERROR: {e}")
+                traceback.print_exc()
+                # Continue with empty results
+                all_results.append({})
     
     # Aggregate
     print("\nAggregating results...")
@@ -15,9 +15,11 @@ import argparse
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import subprocess
 import traceback
+import hashlib
+import dataclasses
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -32,6 +34,7 @@ from core.measurements.core_measurements_v0 import (
     measure_waist_group_with_shared_slice,
     measure_hip_group_with_shared_slice,
     MeasurementResult,
+    SliceIndex,
 )
 
 # This round's keys (same as geo v0)
@@ -120,56 +123,217 @@ def load_obj_with_trimesh(path: Path) -> Optional[tuple[np.ndarray, Optional[np.
     return None
 
 
+def _faces_list_to_array(faces: List[List[int]]) -> Optional[np.ndarray]:
+    """(F, k) int32 for uniform face arity; mixed polygons are fan-triangulated to (F', 3)."""
+    if len(faces) == 0:
+        return None
+    arity = np.array([len(face) for face in faces], dtype=np.int64)
+    flat = np.array([idx for face in faces for idx in face], dtype=np.int64)
+    return _faces_flat_to_array(flat, arity)
+
+
+def _faces_flat_to_array(flat: np.ndarray, arity: np.ndarray) -> Optional[np.ndarray]:
+    """Flat face indices + per-face arity (all >= 3) -> (F, k) or fan-triangulated (F', 3) int32."""
+    if arity.size == 0:
+        return None
+    if flat.size and (flat.min() < np.iinfo(np.int32).min or flat.max() > np.iinfo(np.int32).max):
+        raise OverflowError("face index out of int32 range")
+    if np.all(arity == arity[0]):
+        return flat.reshape(-1, int(arity[0])).astype(np.int32)
+    # Fan triangulation: (v0, vj, vj+1) for j = 1..k-2, in face order
+    offsets = np.concatenate([[0], np.cumsum(arity)[:-1]])
+    n_tri = arity - 2
+    tri_face = np.repeat(np.arange(arity.size), n_tri)
+    tri_j = np.arange(int(n_tri.sum())) - np.repeat(np.cumsum(n_tri) - n_tri, n_tri) + 1
+    base = offsets[tri_face]
+    tris = np.stack([flat[base], flat[base + tri_j], flat[base + tri_j + 1]], axis=1)
+    return tris.astype(np.int32)
+
+
+def _parse_obj_line_by_line(path: Path) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """Reference OBJ parser (per-line Python); defines the accepted syntax for the bulk parser."""
+    vertices = []
+    faces = []
+
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            # Parse vertex: "v x y z"
+            if line.startswith('v ') and not line.startswith('vn ') and not line.startswith('vt '):
+                parts = line.split()
+                if len(parts) >= 4:
+                    try:
+                        x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
+                        vertices.append([x, y, z])
+                    except ValueError:
+                        continue
+
+            # Parse face: "f a/b/c d/e/f g/h/i" or "f a d g"
+            elif line.startswith('f '):
+                parts = line.split()[1:]  # Skip 'f'
+                face_indices = []
+                for part in parts:
+                    # Extract vertex index (before first slash, or whole if no slash)
+                    if '/' in part:
+                        idx_str = part.split('/')[0]
+                    else:
+                        idx_str = part
+                    try:
+                        idx = int(idx_str) - 1  # 1-indexed -> 0-indexed
+                        if idx >= 0:
+                            face_indices.append(idx)
+                    except ValueError:
+                        continue
+
+                if len(face_indices) >= 3:
+                    faces.append(face_indices)
+
+    verts_array = np.array(vertices, dtype=np.float32).reshape(-1, 3)
+    return verts_array, _faces_list_to_array(faces)
+
+
+# Bytes the bulk parser models exactly (printable ASCII, tab, newline); anything else
+# (unicode/extra whitespace, control bytes) is allowed only on comment lines
+_OBJ_PLAIN_BYTES = bytes(range(0x20, 0x7f)) + b'\t\n'
+_OBJ_PLAIN_TABLE = np.zeros(256, dtype=bool)
+_OBJ_PLAIN_TABLE[np.frombuffer(_OBJ_PLAIN_BYTES, dtype=np.uint8)] = True
+_OBJ_FLOAT_BYTES = np.zeros(256, dtype=bool)
+_OBJ_FLOAT_BYTES[np.frombuffer(b"0123456789.eE+-", dtype=np.uint8)] = True
+_OBJ_MAX_TOKEN_LEN = 64
+
+
+def _tokens_to_fixed_bytes(buf: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> Optional[np.ndarray]:
+    """Gather tokens into a NUL-padded (T, L) uint8 matrix (None if a token is too long).
+
+    buf must be padded with at least _OBJ_MAX_TOKEN_LEN trailing bytes.
+    """
+    width = int(lengths.max()) if lengths.size else 1
+    if width > _OBJ_MAX_TOKEN_LEN:
+        return None
+    windows = np.lib.stride_tricks.sliding_window_view(buf, width)[starts]
+    return windows * (np.arange(width)[None, :] < lengths[:, None])
+
+
+def _parse_obj_bulk(path: Path) -> Optional[tuple[np.ndarray, Optional[np.ndarray]]]:
+    """Vectorized OBJ parser over the whole file as bytes.
+
+    Tokenizes with NumPy masks (space/tab separated, one record per line) and
+    converts v coordinates and f vertex indices (a, a/b, a//c, a/b/c; any
+    polygon arity) in bulk. Returns None whenever the file uses syntax outside
+    the validated subset (non-numeric tokens, relative/zero indices, unicode
+    whitespace, ...), so the caller can fall back to the line parser.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    # Universal newlines, as in text-mode iteration; padding for token windows
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    has_special_bytes = len(data.translate(None, _OBJ_PLAIN_BYTES)) > 0
+    buf = np.frombuffer(data + b'\n' * (_OBJ_MAX_TOKEN_LEN + 1), dtype=np.uint8)
+
+    # Tokens: runs of bytes > 0x20 (exact split() semantics once special bytes are excluded)
+    edges = np.diff((buf <= 0x20).view(np.int8), prepend=np.int8(1))
+    edge_pos = np.flatnonzero(edges)
+    edge_kind = edges[edge_pos]
+    tok_starts = edge_pos[edge_kind == -1]
+    tok_ends = edge_pos[edge_kind == 1]
+    if tok_starts.size == 0:
+        return np.zeros((0, 3), dtype=np.float32), None
+    tok_lens = tok_ends - tok_starts
+    newline_pos = np.flatnonzero(buf == 0x0a)
+    tok_line = np.searchsorted(newline_pos, tok_starts)
+
+    # Keyword (first token) of each token's line, and the token's position in it
+    first_of_line = np.concatenate([[True], tok_line[1:] != tok_line[:-1]])
+    tok_index = np.arange(tok_starts.size)
+    kw_tok = np.maximum.accumulate(np.where(first_of_line, tok_index, 0))
+    tok_pos = tok_index - kw_tok
+    line_run = np.cumsum(first_of_line) - 1
+    tokens_in_line = np.bincount(line_run)[line_run]
+
+    if has_special_bytes:
+        # Allowed only on comment lines (first token starts with '#')
+        special_line = np.searchsorted(newline_pos, np.flatnonzero(~_OBJ_PLAIN_TABLE[buf]))
+        run_lines = tok_line[first_of_line]
+        run = np.minimum(np.searchsorted(run_lines, special_line), run_lines.size - 1)
+        is_comment = buf[tok_starts[first_of_line][run]] == ord('#')
+        if not np.all((run_lines[run] == special_line) & is_comment):
+            return None
+
+    # "v " / "f ": single-char keyword followed by a space (tab after keyword is not a record)
+    kw_char = buf[tok_starts[kw_tok]]
+    kw_record = (tok_lens[kw_tok] == 1) & (buf[tok_ends[kw_tok]] == 0x20) & (tok_pos >= 1)
+    v_sel = kw_record & (kw_char == ord('v')) & (tokens_in_line >= 4) & (tok_pos <= 3)
+    f_sel = kw_record & (kw_char == ord('f'))
+
+    # Vertices: tokens 1..3 of each v line
+    v_mat = _tokens_to_fixed_bytes(buf, tok_starts[v_sel], tok_lens[v_sel])
+    if v_mat is None or not np.all(_OBJ_FLOAT_BYTES[v_mat] | (v_mat == 0)):
+        return None
+    try:
+        coords = np.ascontiguousarray(v_mat).view(f"S{v_mat.shape[1]}").ravel().astype(np.float64)
+    except ValueError:
+        return None  # Token float() would reject; line parser skips just that line
+    verts_array = coords.reshape(-1, 3).astype(np.float32)
+
+    # Faces: vertex index = token up to its first '/'
+    faces_array = None
+    f_starts = tok_starts[f_sel]
+    if f_starts.size:
+        slash_pos = np.flatnonzero(buf == ord('/'))
+        next_slash = np.searchsorted(slash_pos, f_starts)
+        cut = np.where(
+            next_slash < slash_pos.size,
+            slash_pos[np.minimum(next_slash, max(slash_pos.size - 1, 0))] - f_starts if slash_pos.size else tok_lens[f_sel],
+            tok_lens[f_sel],
+        )
+        cut = np.minimum(cut, tok_lens[f_sel])
+        if np.any(cut == 0):
+            return None  # Empty vertex index ("/2/3")
+        if int(cut.max()) > 18:
+            return None  # Would overflow int64 digit accumulation
+        # Decimal digits -> int64, one column at a time (exact, no string conversion)
+        indices = np.zeros(f_starts.size, dtype=np.int64)
+        for col in range(int(cut.max())):
+            in_token = col < cut
+            digit = buf[f_starts + np.where(in_token, col, 0)] - np.uint8(ord('0'))
+            if np.any(in_token & (digit > 9)):
+                return None  # Signed (relative) or non-numeric index
+            indices = np.where(in_token, indices * 10 + digit, indices)
+        if np.any(indices <= 0):
+            return None  # Zero index (dropped per token by the line parser)
+        face_run = line_run[f_sel]
+        face_first = np.concatenate([[True], face_run[1:] != face_run[:-1]])
+        arity = np.diff(np.append(np.flatnonzero(face_first), face_run.size))
+        keep_face = arity >= 3
+        face_of_token = np.repeat(np.arange(arity.size), arity)
+        faces_array = _faces_flat_to_array(indices[keep_face[face_of_token]] - 1, arity[keep_face])
+
+    return verts_array, faces_array
+
+
 def load_obj_with_fallback_parser(path: Path) -> Optional[tuple[np.ndarray, Optional[np.ndarray], Optional[str]]]:
-    """Load OBJ using pure Python parser (loader B, required).
-    
+    """Load OBJ without trimesh (loader B, required).
+
+    Bulk NumPy parser first; files outside its validated subset go through the
+    per-line parser, which accepts the same syntax (same verts/faces either way).
+    Faces keep their arity (F, k); mixed polygon arities are fan-triangulated.
+
     Returns:
         (vertices, faces, scale_warning) or None if failed
     """
     try:
-        vertices = []
-        faces = []
-        
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse vertex: "v x y z"
-                if line.startswith('v ') and not line.startswith('vn ') and not line.startswith('vt '):
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        try:
-                            x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                            vertices.append([x, y, z])
-                        except ValueError:
-                            continue
-                
-                # Parse face: "f a/b/c d/e/f g/h/i" or "f a d g"
-                elif line.startswith('f '):
-                    parts = line.split()[1:]  # Skip 'f'
-                    face_indices = []
-                    for part in parts:
-                        # Extract vertex index (before first slash, or whole if no slash)
-                        if '/' in part:
-                            idx_str = part.split('/')[0]
-                        else:
-                            idx_str = part
-                        try:
-                            idx = int(idx_str) - 1  # 1-indexed -> 0-indexed
-                            if idx >= 0:
-                                face_indices.append(idx)
-                        except ValueError:
-                            continue
-                    
-                    if len(face_indices) >= 3:
-                        faces.append(face_indices)
-        
-        if len(vertices) == 0:
+        parsed = _parse_obj_bulk(path)
+        if parsed is None:
+            parsed = _parse_obj_line_by_line(path)
+        verts_array, faces_array = parsed
+
+        if verts_array.shape[0] == 0:
             return None
         
-        verts_array = np.array(vertices, dtype=np.float32)
         # Round33: OBJ files may be in mm/cm, but S1 manifest meta_unit="m" assumes meters
         # If OBJ is in mm, convert to m (assume > 10.0 means mm/cm scale)
         # Round40: scale_warning을 상세 정보 딕셔너리로 변경
@@ -185,20 +349,165 @@ def load_obj_with_fallback_parser(path: Path) -> Optional[tuple[np.ndarray, Opti
             }
             print(f"[OBJ/fallback] Converted from mm to m (max_abs={max_abs:.2f})")
         
-        faces_array = np.array(faces, dtype=np.int32) if len(faces) > 0 else None
-        
         # Return with scale warning for logging
         return (verts_array, faces_array, scale_warning)
     except Exception:
         return None
 
 
-def load_verts_from_path_with_info(verts_path: str) -> Optional[tuple[np.ndarray, str, Optional[np.ndarray], Optional[str]]]:
+class MeshCache:
+    """Content-addressed cache of loaded OBJ meshes as float32/int32 .npy pairs.
+
+    Key: resolved path + mtime/size ("stat") or file sha256 ("sha256"). Each entry
+    stores verts.npy (already in meters), optional faces.npy and meta.json with the
+    loader name and the Round40 scale_warning, so a hit returns the same tuple as
+    the first load. Hits are memory-mapped (np.load(mmap_mode='r')). Entries are
+    evicted least-recently-used first once the cache exceeds max_bytes.
+
+    Size and LRU order are tracked in memory (one directory scan at init); the
+    directory is rescanned only when the tracked total goes over max_bytes, which
+    also picks up entries written or touched by other processes.
+    """
+
+    FORMAT_VERSION = 1
+    # Evict down to this fraction of max_bytes, so a full cache is not rescanned on every put
+    EVICT_LOW_WATER = 0.9
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 2 * 1024 ** 3, key_mode: str = "stat"):
+        if key_mode not in ("stat", "sha256"):
+            raise ValueError(f"Unknown mesh cache key_mode: {key_mode} (expected 'stat' or 'sha256')")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+        self.key_mode = key_mode
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lru: "OrderedDict[str, int]" = OrderedDict()  # entry name -> bytes, oldest first
+        self._total_bytes = 0
+        self._rescan()
+
+    def key_for(self, path: Path) -> str:
+        """Cache key for a resolved mesh path."""
+        st = path.stat()
+        h = hashlib.sha256(f"v{self.FORMAT_VERSION}|{path}".encode('utf-8'))
+        if self.key_mode == "sha256":
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+        else:
+            h.update(f"|{st.st_mtime_ns}|{st.st_size}".encode('utf-8'))
+        return h.hexdigest()[:24]
+
+    def get(self, path: Path) -> Optional[tuple[np.ndarray, str, Optional[np.ndarray], Optional[Dict[str, Any]]]]:
+        """(verts, loader_name, faces, scale_warning) from cache, or None on miss."""
+        entry = self.cache_dir / self.key_for(path)
+        try:
+            with open(entry / "meta.json", 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            verts = np.asarray(np.load(entry / "verts.npy", mmap_mode='r'))
+            faces = np.asarray(np.load(entry / "faces.npy", mmap_mode='r')) if meta.get("has_faces") else None
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(entry / "meta.json")  # LRU recency (across processes)
+        except OSError:
+            pass
+        if entry.name in self._lru:
+            self._lru.move_to_end(entry.name)
+        return verts, meta["loader_name"], faces, meta.get("scale_warning")
+
+    def put(
+        self,
+        path: Path,
+        verts: np.ndarray,
+        loader_name: str,
+        faces: Optional[np.ndarray],
+        scale_warning: Optional[Dict[str, Any]],
+    ) -> None:
+        """Store a loaded mesh (atomic per entry); evicts if the cache goes over max_bytes."""
+        key = self.key_for(path)
+        entry = self.cache_dir / key
+        if entry.exists():
+            return
+        tmp_entry = self.cache_dir / f".tmp_{key}_{os.getpid()}"
+        tmp_entry.mkdir(parents=True, exist_ok=True)
+        np.save(tmp_entry / "verts.npy", np.ascontiguousarray(verts, dtype=np.float32))
+        if faces is not None:
+            np.save(tmp_entry / "faces.npy", np.ascontiguousarray(faces, dtype=np.int32))
+        meta = {
+            "format_version": self.FORMAT_VERSION,
+            "source_path": str(path),
+            "key_mode": self.key_mode,
+            "loader_name": loader_name,
+            "has_faces": faces is not None,
+            "n_verts": int(verts.shape[0]),
+            "n_faces": int(faces.shape[0]) if faces is not None else None,
+            "scale_warning": scale_warning,
+        }
+        with open(tmp_entry / "meta.json", 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        size = sum(f.stat().st_size for f in tmp_entry.iterdir())
+        try:
+            os.replace(tmp_entry, entry)
+        except OSError:
+            # Another process stored the same key first
+            for tmp_file in tmp_entry.iterdir():
+                tmp_file.unlink()
+            tmp_entry.rmdir()
+            return
+        self._lru[key] = size
+        self._total_bytes += size
+        if self._total_bytes > self.max_bytes:
+            self.evict(int(self.max_bytes * self.EVICT_LOW_WATER))
+
+    def entries(self) -> List[tuple[float, int, Path]]:
+        """(last_used, size_bytes, entry_dir) for every complete entry."""
+        result = []
+        for entry in self.cache_dir.iterdir():
+            if entry.name.startswith(".tmp_") or not entry.is_dir():
+                continue
+            try:
+                files = list(entry.iterdir())
+                size = sum(f.stat().st_size for f in files)
+                last_used = (entry / "meta.json").stat().st_mtime
+            except OSError:
+                continue  # Evicted concurrently
+            result.append((last_used, size, entry))
+        return result
+
+    def _rescan(self) -> None:
+        """Reload size and LRU order (meta.json mtime) from the cache directory."""
+        entries = sorted(self.entries(), key=lambda e: e[0])
+        self._lru = OrderedDict((entry.name, size) for _, size, entry in entries)
+        self._total_bytes = sum(self._lru.values())
+
+    def evict(self, target_bytes: Optional[int] = None) -> int:
+        """Rescan, then drop least-recently-used entries until total size <= target_bytes
+        (default max_bytes); returns count."""
+        target = self.max_bytes if target_bytes is None else int(target_bytes)
+        self._rescan()
+        evicted = 0
+        while self._lru and self._total_bytes > target:
+            name, size = self._lru.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                for f in (self.cache_dir / name).iterdir():
+                    f.unlink()
+                (self.cache_dir / name).rmdir()
+            except OSError:
+                continue  # Evicted concurrently
+            evicted += 1
+        return evicted
+
+
+def load_verts_from_path_with_info(
+    verts_path: str,
+    mesh_cache: Optional[MeshCache] = None,
+) -> Optional[tuple[np.ndarray, str, Optional[np.ndarray], Optional[str]]]:
     """Load verts from file path (NPZ or OBJ format) with loader info.
     
     For OBJ files, uses 2-stage loader:
     - Loader A: trimesh (optional)
     - Loader B: pure Python OBJ parser (required fallback)
+    With mesh_cache, OBJ loads are served from / stored to the binary cache.
     
     Returns:
         (verts, loader_name, faces, scale_warning) or None if failed
@@ -241,19 +550,30 @@ def load_verts_from_path_with_info(verts_path: str) -> Optional[tuple[np.ndarray
     
     # Try OBJ (2-stage loader)
     if path_resolved.suffix.lower() == ".obj":
+        if mesh_cache is not None:
+            cached = mesh_cache.get(path_resolved)
+            if cached is not None:
+                return cached
+
+        loaded = None
         # Loader A: trimesh (optional)
         result = load_obj_with_trimesh(path_resolved)
         if result is not None:
             verts, faces, scale_warning = result
-            return (verts, "trimesh", faces, scale_warning)
-        
-        # Loader B: pure Python OBJ parser (required fallback)
-        result = load_obj_with_fallback_parser(path_resolved)
-        if result is not None:
-            verts, faces, scale_warning = result
-            return (verts, "fallback_obj_parser", faces, scale_warning)
-        
-        return None
+            loaded = (verts, "trimesh", faces, scale_warning)
+        else:
+            # Loader B: pure Python OBJ parser (required fallback)
+            result = load_obj_with_fallback_parser(path_resolved)
+            if result is not None:
+                verts, faces, scale_warning = result
+                loaded = (verts, "fallback_obj_parser", faces, scale_warning)
+
+        if loaded is not None and mesh_cache is not None:
+            try:
+                mesh_cache.put(path_resolved, loaded[0], loaded[1], loaded[2], loaded[3])
+            except OSError as e:
+                print(f"[WARN] Mesh cache store failed for {path_resolved}: {e}")
+        return loaded
     
     return None
 
@@ -271,9 +591,16 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
     """Measure all keys for a single case (reuse existing geo v0 logic)."""
     results = {}
     
+    # One Y-sorted slice index per mesh, shared by every slice-based key
+    # (an empty or malformed mesh has no index; its keys fail in the per-group handlers below)
+    try:
+        slice_index = SliceIndex.from_verts(verts) if len(verts) > 0 else None
+    except Exception:
+        slice_index = None
+    
     # WAIST group: Use shared slice (CIRC, WIDTH, DEPTH)
     try:
-        waist_results = measure_waist_group_with_shared_slice(verts, case_id=case_id)
+        waist_results = measure_waist_group_with_shared_slice(verts, case_id=case_id, slice_index=slice_index)
         results.update(waist_results)
     except Exception as e:
         # Round52: Classify exception into sub-codes and record fingerprint
@@ -316,7 +643,7 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
     
     # HIP group: Use shared slice (CIRC, WIDTH, DEPTH)
     try:
-        hip_results = measure_hip_group_with_shared_slice(verts, case_id=case_id)
+        hip_results = measure_hip_group_with_shared_slice(verts, case_id=case_id, slice_index=slice_index)
         results.update(hip_results)
     except Exception as e:
         # Round52: Classify exception into sub-codes and record fingerprint
@@ -366,7 +693,7 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
     for key in CIRCUMFERENCE_KEYS:
         if key not in results:
             try:
-                result = measure_circumference_v0_with_metadata(verts, key, case_id=case_id)
+                result = measure_circumference_v0_with_metadata(verts, key, case_id=case_id, slice_index=slice_index)
                 results[key] = result
                 
                 # Round41/43: Extract torso-only circumference for torso keys
@@ -431,7 +758,7 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
     for key in WIDTH_DEPTH_KEYS:
         if key not in results:
             try:
-                result = measure_width_depth_v0_with_metadata(verts, key)
+                result = measure_width_depth_v0_with_metadata(verts, key, slice_index=slice_index)
                 results[key] = result
             except Exception as e:
                 results[key] = MeasurementResult(
@@ -493,6 +820,21 @@ def measure_all_keys(verts: np.ndarray, case_id: str) -> Dict[str, MeasurementRe
     return results
 
 
+# JSONL sink capture: None = write directly (serial); dict = buffer lines per file
+# (process-pool workers), so the parent is the single writer for every sink.
+_JSONL_CAPTURE: Optional[Dict[str, List[str]]] = None
+
+
+def _append_jsonl(path: Path, record: Dict[str, Any]) -> None:
+    """Append one JSON record to a JSONL sink (or to the worker capture buffer)."""
+    line = json.dumps(record, ensure_ascii=False) + '\n'
+    if _JSONL_CAPTURE is not None:
+        _JSONL_CAPTURE.setdefault(str(path), []).append(line)
+        return
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(line)
+
+
 def log_skip_reason(
     skip_reasons_file: Path,
     case_id: str,
@@ -537,8 +879,7 @@ def log_skip_reason(
     if loaded_faces is not None:
         record["loaded_faces"] = loaded_faces
 
-    with open(skip_reasons_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    _append_jsonl(skip_reasons_file, record)
 
     # Round68: Track that this case_id has been logged
     if tracking_set is not None:
@@ -570,8 +911,7 @@ def log_exec_failure(
     if failed_keys:
         record["failed_keys"] = failed_keys
 
-    with open(exec_failures_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    _append_jsonl(exec_failures_file, record)
 
 
 def log_processed_sink(
@@ -601,8 +941,7 @@ def log_processed_sink(
     if exception_1line:
         record["exception_1line"] = exception_1line
 
-    with open(processed_sink_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    _append_jsonl(processed_sink_file, record)
 
 
 def log_success_not_processed(
@@ -635,8 +974,7 @@ def log_success_not_processed(
     if note_1line:
         record["note_1line"] = note_1line
 
-    with open(success_not_processed_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    _append_jsonl(success_not_processed_file, record)
 
 
 def log_record_missing_skip_reason(
@@ -654,8 +992,7 @@ def log_record_missing_skip_reason(
         "note_1line": note_1line,
     }
 
-    with open(record_missing_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    _append_jsonl(record_missing_file, record)
 
 
 def resolve_mesh_path(mesh_path: str) -> tuple[Path, bool]:
@@ -680,7 +1017,8 @@ def process_case(
     skip_reasons_file: Path,
     exec_failures_file: Path,
     processed_sink_file: Path,
-    log_skip_reason_tracking: Optional[set] = None
+    log_skip_reason_tracking: Optional[set] = None,
+    mesh_cache: Optional[MeshCache] = None
 ) -> Optional[Dict[str, MeasurementResult]]:
     """Process a single case from S1 manifest.
 
@@ -790,7 +1128,7 @@ def process_case(
         if verts_path is not None:
             attempted_load = True
             try:
-                result = load_verts_from_path_with_info(verts_path)
+                result = load_verts_from_path_with_info(verts_path, mesh_cache=mesh_cache)
                 if result is not None:
                     verts, loader_name, faces, scale_warn = result
                     loaded_verts = verts.shape[0] if verts is not None else None
@@ -807,7 +1145,7 @@ def process_case(
         if verts is None and mesh_path is not None:
             attempted_load = True
             try:
-                result = load_verts_from_path_with_info(mesh_path)
+                result = load_verts_from_path_with_info(mesh_path, mesh_cache=mesh_cache)
                 if result is not None:
                     verts, loader_name, faces, scale_warn = result
                     loaded_verts = verts.shape[0] if verts is not None else None
@@ -1035,6 +1373,236 @@ def process_case(
             )
 
 
+def _process_case_in_worker(
+    case: Dict[str, Any],
+    out_dir: Path,
+    skip_reasons_file: Path,
+    exec_failures_file: Path,
+    processed_sink_file: Path,
+    mesh_cache: Optional[MeshCache] = None,
+    hash_content: bool = False,
+) -> Dict[str, Any]:
+    """Run process_case with every side effect captured for the parent (pool or journal).
+
+    Returns JSONL lines per sink, skipped_entries, logged case_ids and the result;
+    an exception re-raised by process_case is returned (after its log lines) instead.
+    hash_content: also return the case's resume content hash (computed before loading).
+    """
+    global _JSONL_CAPTURE
+    _JSONL_CAPTURE = {}
+    skipped_entries: List[Dict[str, Any]] = []
+    tracking: set = set()
+    outcome: Dict[str, Any] = {"result_data": None, "error": None}
+    if hash_content:
+        outcome["content_hash"] = compute_case_content_hash(case)
+    try:
+        outcome["result_data"] = process_case(
+            case, out_dir, skipped_entries, skip_reasons_file, exec_failures_file, processed_sink_file, tracking,
+            mesh_cache=mesh_cache
+        )
+    except Exception as e:
+        outcome["error"] = e
+    finally:
+        outcome["jsonl_lines"] = _JSONL_CAPTURE
+        _JSONL_CAPTURE = None
+    outcome["skipped_entries"] = skipped_entries
+    outcome["logged_case_ids"] = tracking
+    return outcome
+
+
+def _replay_case_outcome(
+    outcome: Dict[str, Any],
+    skipped_entries: List[Dict[str, Any]],
+    log_skip_reason_tracking: set,
+) -> Optional[Dict[str, Any]]:
+    """Apply a captured case outcome in the parent (single writer) and return its result."""
+    for sink_path, lines in outcome["jsonl_lines"].items():
+        with open(sink_path, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+    skipped_entries.extend(outcome["skipped_entries"])
+    log_skip_reason_tracking.update(outcome["logged_case_ids"])
+    if outcome["error"] is not None:
+        raise outcome["error"]
+    return outcome["result_data"]
+
+
+def compute_case_content_hash(case: Dict[str, Any]) -> str:
+    """Resume key part: sha256 over the manifest entry and the bytes of the file it loads."""
+    h = hashlib.sha256(json.dumps(case, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+    path_to_use = case.get("verts_path") or case.get("mesh_path")
+    if path_to_use:
+        path_abs, exists = resolve_mesh_path(str(path_to_use))
+        if exists and path_abs.is_file():
+            with open(path_abs, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+        else:
+            h.update(b"<absent>")
+    return h.hexdigest()[:16]
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps fallback for numpy values inside measurement metadata."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class CaseJournal:
+    """Per-case completion journal for --journal/--resume (artifacts/case_journal.jsonl).
+
+    One JSON line per completed case: case_id, content hash, its captured sink lines,
+    skipped_entries, logged ids and measurements (MeasurementResult fields). Only the
+    case's verts, needed for verts_proxy.npz, live outside the line, as a float .npy under
+    artifacts/case_store/. A resumed run replays finished cases instead of re-measuring them.
+    """
+
+    def __init__(self, artifacts_dir: Path, resume: bool):
+        self.journal_file = artifacts_dir / "case_journal.jsonl"
+        self.store_dir = artifacts_dir / "case_store"
+        self.entries: Dict[tuple, Dict[str, Any]] = {}
+        if not resume:
+            if self.journal_file.exists():
+                self.journal_file.unlink()  # Clear previous run
+            if self.store_dir.exists():
+                for stale in self.store_dir.glob("*.npy"):
+                    stale.unlink()
+        elif self.journal_file.exists():
+            valid_lines: List[str] = []
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn last line from a crash
+                    self.entries[(record["case_id"], record["content_sha256"])] = record
+                    valid_lines.append(line if line.endswith('\n') else line + '\n')
+            # Rewrite without torn lines so new appends start on a fresh line
+            tmp_path = self.journal_file.with_suffix(".jsonl.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(valid_lines)
+            os.replace(tmp_path, self.journal_file)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.journaled_case_ids = {case_id for case_id, _ in self.entries}
+
+    def load(self, case: Dict[str, Any], content_hash: str) -> Optional[Dict[str, Any]]:
+        """Stored outcome for this case_id + content hash, or None (not done / unreadable)."""
+        record = self.entries.get((case["case_id"], content_hash))
+        if record is None:
+            return None
+        result_data = record["result_data"]
+        try:
+            if isinstance(result_data, dict) and "results" in result_data:
+                result_data = dict(result_data)
+                result_data["results"] = {
+                    key: MeasurementResult(**fields) for key, fields in result_data["results"].items()
+                }
+                verts_file = result_data.pop("verts_file", None)
+                if verts_file is not None:
+                    result_data["verts"] = np.load(self.store_dir / verts_file, allow_pickle=False)
+        except Exception:
+            return None
+        return {
+            "result_data": result_data,
+            "error": None,
+            "jsonl_lines": record["jsonl_lines"],
+            "skipped_entries": record["skipped_entries"],
+            "logged_case_ids": set(record["logged_case_ids"]),
+        }
+
+    def record(self, index: int, case: Dict[str, Any], content_hash: str, outcome: Dict[str, Any]) -> None:
+        """Journal a completed outcome (verts stored first, so a journaled case is loadable)."""
+        result_data = outcome["result_data"]
+        if isinstance(result_data, dict) and "results" in result_data:
+            result_data = dict(result_data)
+            result_data["results"] = {
+                key: dataclasses.asdict(result) for key, result in result_data["results"].items()
+            }
+            verts = result_data.pop("verts", None)
+            if verts is not None:
+                verts_file = f"{index:06d}_{content_hash}.npy"
+                tmp_path = self.store_dir / (verts_file + ".tmp")
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, np.asarray(verts), allow_pickle=False)
+                os.replace(tmp_path, self.store_dir / verts_file)
+                result_data["verts_file"] = verts_file
+        record = {
+            "case_id": case["case_id"],
+            "content_sha256": content_hash,
+            "result_data": result_data,
+            "jsonl_lines": outcome["jsonl_lines"],
+            "skipped_entries": outcome["skipped_entries"],
+            "logged_case_ids": sorted(outcome["logged_case_ids"]),
+        }
+        line = json.dumps(record, ensure_ascii=False, default=_json_default) + '\n'
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def iter_process_cases(
+    cases: List[Dict[str, Any]],
+    out_dir: Path,
+    skipped_entries: List[Dict[str, Any]],
+    skip_reasons_file: Path,
+    exec_failures_file: Path,
+    processed_sink_file: Path,
+    log_skip_reason_tracking: set,
+    workers: int = 1,
+    journal: Optional[CaseJournal] = None,
+    mesh_cache: Optional[MeshCache] = None,
+):
+    """Yield process_case results in manifest order (process pool and/or resume journal).
+
+    Each case runs with its side effects captured; the parent replays captured
+    JSONL lines, skipped_entries and Round68 tracking ids in manifest order, so
+    every sink has one writer and the same content as a serial run. With a
+    journal, already-completed cases are replayed from it, not re-run. Content
+    hashes are computed per case: up front only for case_ids already in the
+    journal, otherwise by the (worker) run that measures the case.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    worker_kwargs = {
+        "out_dir": out_dir,
+        "skip_reasons_file": skip_reasons_file,
+        "exec_failures_file": exec_failures_file,
+        "processed_sink_file": processed_sink_file,
+        "mesh_cache": mesh_cache,
+        "hash_content": journal is not None,
+    }
+    stored: Dict[int, Dict[str, Any]] = {}
+    if journal is not None and journal.entries:
+        for i, case in enumerate(cases):
+            if case["case_id"] not in journal.journaled_case_ids:
+                continue
+            outcome = journal.load(case, compute_case_content_hash(case))
+            if outcome is not None:
+                stored[i] = outcome
+        print(f"[RESUME] {len(stored)}/{len(cases)} cases restored from journal")
+
+    pending = [i for i in range(len(cases)) if i not in stored]
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(pending) > 1 else None
+    try:
+        futures = {i: executor.submit(_process_case_in_worker, cases[i], **worker_kwargs) for i in pending} if executor else {}
+        for i, case in enumerate(cases):
+            if i in stored:
+                outcome = stored.pop(i)
+            else:
+                if executor is not None:
+                    outcome = futures.pop(i).result()
+                else:
+                    outcome = _process_case_in_worker(case, **worker_kwargs)
+                if journal is not None and outcome["error"] is None:
+                    journal.record(i, case, outcome["content_hash"], outcome)
+            yield _replay_case_outcome(outcome, skipped_entries, log_skip_reason_tracking)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Geometric v0 S1 Facts-Only Runner (Round 23)"
@@ -1051,6 +1619,41 @@ def main():
         required=True,
         help="Output directory for facts summary"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Process pool size for the case loop (1 = serial; outputs keep manifest order)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip cases already completed in artifacts/case_journal.jsonl (same case_id + content hash); implies --journal"
+    )
+    parser.add_argument(
+        "--journal",
+        action="store_true",
+        help="Record completed cases in artifacts/case_journal.jsonl so an interrupted run can be resumed"
+    )
+    parser.add_argument(
+        "--mesh_cache_dir",
+        type=str,
+        default=None,
+        help="Binary mesh cache directory (.npy verts/faces per OBJ; disabled if not set)"
+    )
+    parser.add_argument(
+        "--mesh_cache_max_gb",
+        type=float,
+        default=2.0,
+        help="Mesh cache size bound in GB (LRU eviction)"
+    )
+    parser.add_argument(
+        "--mesh_cache_key",
+        type=str,
+        default="stat",
+        choices=["stat", "sha256"],
+        help="Mesh cache key: path+mtime/size (stat) or path+content sha256"
+    )
     args = parser.parse_args()
     
     out_dir = Path(args.out_dir)
@@ -1092,6 +1695,17 @@ def main():
         record_missing_file.unlink()  # Clear previous run
     print(f"[RECORD MISSING] Logging to: {record_missing_file}")
 
+    # Per-case completion journal (--journal / --resume): cleared on a fresh journaled run,
+    # read back with --resume. Sinks above are always rebuilt; resumed cases replay
+    # their captured lines.
+    case_journal = CaseJournal(artifacts_dir, resume=args.resume) if args.resume or args.journal else None
+    mesh_cache = None
+    if args.mesh_cache_dir:
+        mesh_cache = MeshCache(Path(args.mesh_cache_dir), int(args.mesh_cache_max_gb * 1024 ** 3), args.mesh_cache_key)
+        print(f"[MESH CACHE] {mesh_cache.cache_dir} (max {args.mesh_cache_max_gb:.1f} GB, key={args.mesh_cache_key})")
+    if case_journal is not None:
+        print(f"[CASE JOURNAL] Logging to: {case_journal.journal_file} (resume={args.resume}, {len(case_journal.entries)} entries)")
+
     # Load S1 manifest
     print(f"[S1 MANIFEST] Loading: {args.manifest}")
     manifest = load_s1_manifest(args.manifest)
@@ -1151,6 +1765,13 @@ def main():
     log_skip_reason_called_case_ids: set = set()
 
     print(f"[PROCESS] Processing {len(cases)} cases...")
+    if args.workers > 1:
+        print(f"[PROCESS] Process pool: {args.workers} workers (results replayed in manifest order)")
+    case_results = iter_process_cases(
+        cases, out_dir, skipped_entries, skip_reasons_file, exec_failures_file,
+        processed_sink_file, log_skip_reason_called_case_ids,
+        workers=args.workers, journal=case_journal, mesh_cache=mesh_cache
+    )
     for i, case in enumerate(cases):
         case_id = case["case_id"]
         if (i + 1) % 50 == 0:
@@ -1162,7 +1783,7 @@ def main():
         # Round68: Track that this case_id entered the loop
         entered_loop_case_ids.add(case_id)
 
-        result_data = process_case(case, out_dir, skipped_entries, skip_reasons_file, exec_failures_file, processed_sink_file, log_skip_reason_called_case_ids)
+        result_data = next(case_results)
 
         # Round67: Track what was returned for this case
         tracking_info = {
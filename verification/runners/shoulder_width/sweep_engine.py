@@ -0,0 +1,285 @@
+"""
+Shared parameter-sweep engine for shoulder width policy exploration.
+
+- config_grid(): cartesian grid over config dataclass fields
+- run_sweep(): evaluates configs on one precomputed frame set, optionally
+  across a process pool (each worker receives the frame set once)
+- SweepCache: JSONL memo of completed configs keyed by
+  (dataset fingerprint, evaluator, code fingerprint, cfg_to_hash), so extending
+  a grid only computes the new points and edited measurement code recomputes all
+
+Config-independent work (distal LBS weights, joint-axis projections,
+lateral scores) is done once per frame set, e.g. by
+precompute_shoulder_width_v112_frames; evaluators only apply the config.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import inspect
+import json
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.measurements.shoulder_width_v112 import (
+    ShoulderWidthV112Frames,
+    measure_shoulder_width_v112_frames,
+)
+from core.measurements.shoulder_width_v12 import ShoulderWidthV12Config, measure_shoulder_width_v12
+
+
+def cfg_to_hash(cfg: Any) -> str:
+    """Hash of every field of a config dataclass (sorted keys, JSON)."""
+    cfg_str = json.dumps(dataclasses.asdict(cfg), sort_keys=True)
+    return hashlib.sha256(cfg_str.encode()).hexdigest()[:16]
+
+
+def config_grid(base_cfg: Any, **axes: Sequence[Any]) -> List[Any]:
+    """
+    All combinations of the given field values applied to base_cfg
+    (first axis varies slowest, like nested for-loops in argument order).
+    """
+    names = list(axes.keys())
+    return [
+        dataclasses.replace(base_cfg, **dict(zip(names, values)))
+        for values in product(*(axes[name] for name in names))
+    ]
+
+
+def dataset_fingerprint(*arrays: np.ndarray) -> str:
+    """SHA-256 over shapes, dtypes and bytes of the input arrays (memo key of a frame set)."""
+    h = hashlib.sha256()
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(f"{arr.shape}|{arr.dtype}|".encode())
+        h.update(arr.tobytes())
+    return h.hexdigest()[:16]
+
+
+def _evaluator_name(evaluate_fn: Callable) -> str:
+    return f"{evaluate_fn.__module__}.{evaluate_fn.__qualname__}"
+
+
+def code_fingerprint(evaluate_fn: Callable) -> str:
+    """
+    SHA-256 over the source files of evaluate_fn's module and of every module-level
+    function, class or module it references by name (e.g. the measurement function
+    it calls), so memo entries computed by other measurement code are not reused.
+    """
+    objs = [evaluate_fn]
+    objs += [evaluate_fn.__globals__.get(name) for name in evaluate_fn.__code__.co_names]
+    files = set()
+    for obj in objs:
+        if not (inspect.isfunction(obj) or inspect.isclass(obj) or inspect.ismodule(obj)):
+            continue
+        try:
+            path = inspect.getsourcefile(obj)
+        except TypeError:
+            continue  # Builtin
+        if path:
+            files.add(path)
+    h = hashlib.sha256()
+    for path in sorted(files, key=lambda p: (Path(p).name, p)):
+        h.update(f"{Path(path).name}|".encode())
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()[:16]
+
+
+class SweepCache:
+    """Append-only JSONL memo of sweep results (the parent process is the only writer)."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._records: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Truncated last line of an interrupted run
+                        continue
+                    self._records[record["key"]] = record
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(key)
+        return record["result"] if record is not None else None
+
+    def put(self, key: str, cfg_hash: str, cfg: Any, result: Dict[str, Any]) -> None:
+        record = {"key": key, "cfg_hash": cfg_hash, "cfg": dataclasses.asdict(cfg), "result": result}
+        self._records[key] = record
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+# Worker state: frame set and evaluator are sent once per worker (initializer), not per config
+_WORKER_FRAMES: Any = None
+_WORKER_EVALUATE: Optional[Callable] = None
+
+
+def _init_worker(frames: Any, evaluate_fn: Callable) -> None:
+    global _WORKER_FRAMES, _WORKER_EVALUATE
+    _WORKER_FRAMES = frames
+    _WORKER_EVALUATE = evaluate_fn
+
+
+def _evaluate_in_worker(cfg: Any) -> Dict[str, Any]:
+    return _WORKER_EVALUATE(_WORKER_FRAMES, cfg)
+
+
+def run_sweep(
+    configs: Sequence[Any],
+    frames: Any,
+    evaluate_fn: Callable[[Any, Any], Dict[str, Any]],
+    workers: int = 1,
+    cache_path: Optional[str] = None,
+    dataset_key: str = "",
+    hash_fn: Callable[[Any], str] = cfg_to_hash,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate every config on the same precomputed frames.
+
+    Args:
+        configs: config dataclasses (duplicates by hash are computed once)
+        frames: config-independent frame data passed to evaluate_fn
+        evaluate_fn: module-level fn(frames, cfg) -> JSON-serializable dict
+        workers: process pool size (1 = serial)
+        cache_path: JSONL memo file (None = no memo)
+        dataset_key: identifies the frame set in the memo (e.g. dataset_fingerprint(...))
+        hash_fn: config hash used in the memo key
+        (the memo key also holds code_fingerprint(evaluate_fn))
+
+    Returns:
+        One dict per config, in input order:
+        {"cfg": cfg, "cfg_hash": str, "result": dict, "cached": bool}
+    """
+    cache = SweepCache(cache_path) if cache_path else None
+    evaluator = _evaluator_name(evaluate_fn)
+    code_key = code_fingerprint(evaluate_fn) if cache is not None else ""
+
+    hashes = [hash_fn(cfg) for cfg in configs]
+    keys = [f"{dataset_key}:{evaluator}:{code_key}:{h}" for h in hashes]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    cached_keys = set()
+    todo: Dict[str, Any] = {}
+    todo_hashes: Dict[str, str] = {}
+    for key, cfg, cfg_hash in zip(keys, configs, hashes):
+        if key in results or key in todo:
+            continue
+        hit = cache.get(key) if cache is not None else None
+        if hit is not None:
+            results[key] = hit
+            cached_keys.add(key)
+        else:
+            todo[key] = cfg
+            todo_hashes[key] = cfg_hash
+
+    if todo:
+        todo_keys = list(todo.keys())
+        todo_cfgs = [todo[k] for k in todo_keys]
+        if workers > 1 and len(todo_cfgs) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(frames, evaluate_fn),
+            ) as executor:
+                computed = executor.map(_evaluate_in_worker, todo_cfgs)
+                for key, cfg, result in zip(todo_keys, todo_cfgs, computed):
+                    results[key] = result
+                    if cache is not None:
+                        cache.put(key, todo_hashes[key], cfg, result)
+        else:
+            for key, cfg in zip(todo_keys, todo_cfgs):
+                result = evaluate_fn(frames, cfg)
+                results[key] = result
+                if cache is not None:
+                    cache.put(key, todo_hashes[key], cfg, result)
+
+    return [
+        {"cfg": cfg, "cfg_hash": h, "result": results[key], "cached": key in cached_keys}
+        for cfg, h, key in zip(configs, hashes, keys)
+    ]
+
+
+# ---------------------------------------------------------
+# Shoulder width v1.1.2 evaluator
+# ---------------------------------------------------------
+def evaluate_shoulder_width_v112(frames: ShoulderWidthV112Frames, cfg: Any) -> Dict[str, Any]:
+    """
+    Per-frame v1.1.2 results for one config on precomputed frames.
+
+    Returns lists of length T: "widths" (NaN on error), "fallback", "errors",
+    "landmark_L", "landmark_R" (3-vectors).
+    """
+    widths, debug = measure_shoulder_width_v112_frames(frames, cfg=cfg, return_debug=True)
+    return {
+        "widths": [float(w) for w in widths],
+        "fallback": [int(f) for f in debug["fallback"]],
+        "errors": list(debug["errors"]),
+        "landmark_L": debug["landmark_L"].astype(float).tolist(),
+        "landmark_R": debug["landmark_R"].astype(float).tolist(),
+    }
+
+
+# ---------------------------------------------------------
+# Shoulder width v1.2 evaluator
+# ---------------------------------------------------------
+@dataclasses.dataclass
+class ShoulderWidthV12Frames:
+    """Golden frames for the v1.2 prototype (it has no config-independent precompute)."""
+    verts: np.ndarray  # (T, N, 3)
+    lbs_weights: np.ndarray  # (T, N, J)
+    joints_xyz: np.ndarray  # (T, J, 3)
+    joint_ids: Dict[str, int]
+
+    def head(self, n: int) -> "ShoulderWidthV12Frames":
+        """First n frames."""
+        return ShoulderWidthV12Frames(self.verts[:n], self.lbs_weights[:n], self.joints_xyz[:n], self.joint_ids)
+
+
+def evaluate_shoulder_width_v12(frames: ShoulderWidthV12Frames, cfg: ShoulderWidthV12Config) -> Dict[str, Any]:
+    """
+    Per-frame v1.2 results for one config.
+
+    Returns lists of length T: "widths" (NaN on error), "fallback", "errors",
+    "arm_excluded_count", "torso_candidates_count", "cross_section_count"
+    (counts 0 where the debug info has none).
+    """
+    out: Dict[str, List[Any]] = {
+        "widths": [], "fallback": [], "errors": [],
+        "arm_excluded_count": [], "torso_candidates_count": [], "cross_section_count": [],
+    }
+    for t in range(frames.verts.shape[0]):
+        try:
+            width, debug = measure_shoulder_width_v12(
+                verts=frames.verts[t],
+                lbs_weights=frames.lbs_weights[t],
+                joints_xyz=frames.joints_xyz[t],
+                joint_ids=frames.joint_ids,
+                cfg=cfg,
+                return_debug=True,
+            )
+            error = None
+        except Exception as e:
+            width, debug, error = float("nan"), {}, f"{type(e).__name__}: {str(e)}"
+        out["widths"].append(float(width))
+        out["fallback"].append(bool(debug.get("fallback", False)))
+        out["errors"].append(error)
+        out["arm_excluded_count"].append(int(debug.get("arm_excluded_count", 0)))
+        out["torso_candidates_count"].append(int(debug.get("torso_candidates_count", 0)))
+        out["cross_section_count"].append(int(debug.get("cross_section_vertices_count", 0)))
+    return out
@@ -31,7 +31,6 @@ import os
 import sys
 import json
 import argparse
-import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -48,7 +47,13 @@ _project_root = _script_path.parent.parent.parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-from core.measurements.shoulder_width_v112 import measure_shoulder_width_v112, ShoulderWidthV112Config
+from core.measurements.shoulder_width_v112 import ShoulderWidthV112Config, precompute_shoulder_width_v112_frames
+from verification.runners.shoulder_width.sweep_engine import (
+    cfg_to_hash,
+    dataset_fingerprint,
+    evaluate_shoulder_width_v112,
+    run_sweep,
+)
 
 # SMPL-X joint IDs
 SMPLX_JOINT_IDS = {
@@ -65,21 +70,6 @@ RATIO_MAX = 1.3  # measured_sw / joint_sw must be <= 1.3
 LANDMARK_DIST_MAX = 0.20  # meters - landmark distance from shoulder joint
 
 
-def cfg_to_hash(cfg: ShoulderWidthV112Config) -> str:
-    """Compute hash of configuration for wiring proof."""
-    cfg_dict = {
-        "r0_ratio": float(cfg.r0_ratio),
-        "r1_ratio": float(cfg.r1_ratio),
-        "cap_quantile": float(cfg.cap_quantile),
-        "distal_w_threshold": float(cfg.distal_w_threshold),
-        "s_min_ratio": float(cfg.s_min_ratio),
-        "s_max_ratio": float(cfg.s_max_ratio),
-        "min_cap_points": int(cfg.min_cap_points),
-    }
-    cfg_str = json.dumps(cfg_dict, sort_keys=True)
-    return hashlib.sha256(cfg_str.encode()).hexdigest()[:16]
-
-
 def detect_upper_arm_leakage(
     landmark_L: np.ndarray,
     landmark_R: np.ndarray,
@@ -121,8 +111,14 @@ def evaluate_candidate_config(
     joints_xyz_all: np.ndarray,
     output_base_dir: str,
     debug_first_frame: bool = False,
+    frame_results: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Evaluate a single candidate configuration across golden set."""
+    """
+    Evaluate a single candidate configuration across golden set.
+    
+    frame_results: evaluate_shoulder_width_v112 output for this cfg (from run_sweep);
+    computed here if None.
+    """
     
     n_frames = verts_all.shape[0]
     results = []
@@ -139,9 +135,12 @@ def evaluate_candidate_config(
     leakage_reasons = []
     exceptions = []
     
+    # Per-frame measurements (degenerate frames: NaN + per-frame error message)
+    if frame_results is None:
+        frames = precompute_shoulder_width_v112_frames(verts_all, lbs_weights_all, joints_xyz_all, SMPLX_JOINT_IDS)
+        frame_results = evaluate_shoulder_width_v112(frames, cfg)
+    
     for frame_idx in range(n_frames):
-        verts = verts_all[frame_idx, :, :]
-        lbs_weights = lbs_weights_all[frame_idx, :, :]
         joints_xyz = joints_xyz_all[frame_idx, :, :]
         
         frame_result = {
@@ -157,16 +156,30 @@ def evaluate_candidate_config(
             "exception": None,
         }
         
+        def record_exception(message: str) -> None:
+            frame_result["exception"] = message
+            exceptions.append(message)
+            widths.append(np.nan)
+            joint_sws.append(np.nan)
+            leakage_flags.append(False)  # Exception is separate from leakage
+            fallback_flags.append(False)
+            leakage_reasons.append("")
+        
+        # Batched measurement result for this frame; its error is already the
+        # "Type: message" string of the per-frame check, recorded as is
+        frame_error = frame_results["errors"][frame_idx]
+        if frame_error is not None:
+            record_exception(frame_error)
+            results.append(frame_result)
+            continue
+        
         try:
-            # Run measurement with debug
-            width, debug_info = measure_shoulder_width_v112(
-                verts=verts,
-                lbs_weights=lbs_weights,
-                joints_xyz=joints_xyz,
-                joint_ids=SMPLX_JOINT_IDS,
-                cfg=cfg,
-                return_debug=True,
-            )
+            width = float(frame_results["widths"][frame_idx])
+            debug_info = {
+                "landmark_L": np.asarray(frame_results["landmark_L"][frame_idx], dtype=np.float32),
+                "landmark_R": np.asarray(frame_results["landmark_R"][frame_idx], dtype=np.float32),
+                "fallback": [frame_results["fallback"][frame_idx]],
+            }
             
             # Compute joint-based SW
             shoulder_L = joints_xyz[SMPLX_JOINT_IDS["L_shoulder"], :]
@@ -231,13 +244,7 @@ def evaluate_candidate_config(
             exceptions.append(None)
             
         except Exception as e:
-            frame_result["exception"] = f"{type(e).__name__}: {str(e)}"
-            exceptions.append(frame_result["exception"])
-            widths.append(np.nan)
-            joint_sws.append(np.nan)
-            leakage_flags.append(False)  # Exception is separate from leakage
-            fallback_flags.append(False)
-            leakage_reasons.append("")
+            record_exception(f"{type(e).__name__}: {str(e)}")
         
         results.append(frame_result)
     
@@ -416,6 +423,18 @@ def main():
         action="store_true",
         help="Print debug info for frame 1 of candidate_001 (joint_sw, measured_sw, landmark distances)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Process pool size over candidate configs (1 = serial)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="JSONL memo of completed configs (re-runs only compute new candidates)",
+    )
     args = parser.parse_args()
     
     # Setup output directory
@@ -486,11 +505,24 @@ def main():
     print(f"Evaluating {len(candidate_configs)} candidate configurations")
     print("-" * 80)
     
+    # Measure all candidates on shared config-independent frame data
+    frames = precompute_shoulder_width_v112_frames(verts_all, lbs_weights_all, joints_xyz_all, SMPLX_JOINT_IDS)
+    sweep = run_sweep(
+        [candidate["config"] for candidate in candidate_configs],
+        frames,
+        evaluate_shoulder_width_v112,
+        workers=args.workers,
+        cache_path=args.cache,
+        dataset_key=dataset_fingerprint(verts_all, lbs_weights_all, joints_xyz_all),
+    )
+    if args.cache:
+        print(f"Memo: {sum(e['cached'] for e in sweep)}/{len(sweep)} candidates from {args.cache}")
+    
     # Evaluate each candidate
     all_results = []
     wiring_proofs = {}
     
-    for candidate in candidate_configs:
+    for candidate, sweep_entry in zip(candidate_configs, sweep):
         candidate_id = candidate["id"]
         cfg = candidate["config"]
         
@@ -504,6 +536,7 @@ def main():
             joints_xyz_all=joints_xyz_all,
             output_base_dir=args.out_dir,
             debug_first_frame=args.debug_first_frame,
+            frame_results=sweep_entry["result"],
         )
         
         all_results.append(result)
@@ -29,6 +29,7 @@ import argparse
 import hashlib
 from datetime import datetime
 import datetime as dt
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
 import numpy as np
@@ -41,7 +42,13 @@ _project_root = _script_path.parent.parent.parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-from core.measurements.shoulder_width_v12 import measure_shoulder_width_v12, ShoulderWidthV12Config
+from core.measurements.shoulder_width_v12 import ShoulderWidthV12Config
+from verification.runners.shoulder_width.sweep_engine import (
+    ShoulderWidthV12Frames,
+    dataset_fingerprint,
+    evaluate_shoulder_width_v12,
+    run_sweep,
+)
 
 # SMPL-X joint IDs
 SMPLX_JOINT_IDS = {
@@ -90,6 +97,17 @@ def cfg_to_hash(cfg: ShoulderWidthV12Config, arm_distance_threshold: float) -> s
     return hashlib.sha256(cfg_str.encode('utf-8')).hexdigest()[:16]
 
 
+def perturbation_configs(cfg: ShoulderWidthV12Config) -> Tuple[ShoulderWidthV12Config, ShoulderWidthV12Config]:
+    """Stricter / looser arm exclusion variants of cfg (arm direction threshold +/- 0.2, clamped)."""
+    cfg_stricter = replace(
+        cfg, arm_direction_exclusion_threshold=min(0.9, cfg.arm_direction_exclusion_threshold + 0.2)
+    )
+    cfg_looser = replace(
+        cfg, arm_direction_exclusion_threshold=max(0.2, cfg.arm_direction_exclusion_threshold - 0.2)
+    )
+    return cfg_stricter, cfg_looser
+
+
 def evaluate_candidate_config(
     candidate_id: str,
     cfg: ShoulderWidthV12Config,
@@ -98,16 +116,29 @@ def evaluate_candidate_config(
     joints_xyz_all: np.ndarray,
     joint_ids: Dict[str, int],
     output_base_dir: str,
-    arm_distance_threshold: float = 0.15,  # Parameter for arm exclusion distance
+    frame_results: Optional[Dict[str, Any]] = None,
+    perturbation_results: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """
     Evaluate a candidate configuration across golden set.
     
-    Note: arm_distance_threshold is passed separately as it's not in ShoulderWidthV12Config yet.
-    For now, we'll modify the measurement function call to include this.
+    frame_results: evaluate_shoulder_width_v12 output for cfg on all frames;
+    perturbation_results: the same for perturbation_configs(cfg) on frames 1-3
+    (both from run_sweep; computed here if None).
     """
     
     n_frames = verts_all.shape[0]
+    arm_distance_threshold = cfg.arm_distance_threshold
+    
+    if frame_results is None or perturbation_results is None:
+        frames = ShoulderWidthV12Frames(verts_all, lbs_weights_all, joints_xyz_all, joint_ids)
+        if frame_results is None:
+            frame_results = evaluate_shoulder_width_v12(frames, cfg)
+        if perturbation_results is None:
+            perturbation_results = tuple(
+                evaluate_shoulder_width_v12(frames.head(3), c) for c in perturbation_configs(cfg)
+            )
+    stricter_results, looser_results = perturbation_results
     
     # Per-frame results
     results = []
@@ -123,13 +154,7 @@ def evaluate_candidate_config(
     # Pose perturbation results (for frames 1-3 only)
     pose_perturbation_results = []
     
-    # Stricter/looser arm exclusion configs for perturbation test
-    # Note: These are computed per candidate, using the same cfg structure
-    # We'll create them inside the frame loop after we have the baseline measurement
-    
     for frame_idx in range(n_frames):
-        verts = verts_all[frame_idx, :, :]
-        lbs_weights = lbs_weights_all[frame_idx, :, :]
         joints_xyz = joints_xyz_all[frame_idx, :, :]
         
         # Compute joint-based SW
@@ -137,50 +162,24 @@ def evaluate_candidate_config(
         R_sh = joints_xyz[joint_ids["R_shoulder"], :]
         joint_sw = float(np.linalg.norm(L_sh - R_sh))
         
-        # Run measurement with normal config
-        try:
-            # Note: We'll need to modify v1.2 to accept arm_distance_threshold as a parameter
-            # For now, we'll use a wrapper or modify the config approach
-            # Actually, looking at the code, arm_distance_threshold is hardcoded as 0.15
-            # We'll need to modify the measurement function to accept it, or create a wrapper
-            # For now, let's assume we modify the function to accept it via a custom config extension
-            
-            # Temporary: We'll patch the function behavior by creating a modified config
-            # Actually, better approach: modify the measurement function to accept arm_distance_threshold
-            # But user said "Do NOT modify v1.1.x code" - they didn't say we can't extend v1.2
-            
-            # Let's check if we can pass it as an additional parameter or extend the config
-            # For now, we'll create a wrapper function that patches the behavior
-            
-            width, debug_info = _measure_with_arm_distance_threshold(
-                verts=verts,
-                lbs_weights=lbs_weights,
-                joints_xyz=joints_xyz,
-                joint_ids=joint_ids,
-                cfg=cfg,
-                arm_distance_threshold=arm_distance_threshold,
-                return_debug=True,
-            )
-            
-            measured_sw = float(width)
-            fallback = debug_info.get("fallback", False)
-            exception = None
+        exception = frame_results["errors"][frame_idx]
+        if exception is None:
+            measured_sw = float(frame_results["widths"][frame_idx])
+            fallback = bool(frame_results["fallback"][frame_idx])
             
             # Collect stats
             measured_sws.append(measured_sw)
             joint_sws.append(joint_sw)
             if joint_sw > 0:
                 ratios.append(measured_sw / joint_sw)
-            arm_excluded_counts.append(debug_info.get("arm_excluded_count", 0))
-            torso_candidates_counts.append(debug_info.get("torso_candidates_count", 0))
-            cross_section_counts.append(debug_info.get("cross_section_vertices_count", 0))
+            arm_excluded_counts.append(frame_results["arm_excluded_count"][frame_idx])
+            torso_candidates_counts.append(frame_results["torso_candidates_count"][frame_idx])
+            cross_section_counts.append(frame_results["cross_section_count"][frame_idx])
             fallback_flags.append(fallback)
             exceptions.append(None)
-            
-        except Exception as e:
+        else:
             measured_sw = np.nan
             fallback = False
-            exception = f"{type(e).__name__}: {str(e)}"
             measured_sws.append(np.nan)
             joint_sws.append(joint_sw)
             arm_excluded_counts.append(0)
@@ -201,67 +200,20 @@ def evaluate_candidate_config(
             "exception": exception,
         })
         
-        # Pose perturbation test (frames 1-3 only)
+        # Pose perturbation test (frames 1-3 only; skipped if a perturbed measurement fails)
         if frame_idx < 3 and not np.isnan(measured_sw) and exception is None and not fallback:
-            try:
-                # Normal config (already measured)
+            if stricter_results["errors"][frame_idx] is None and looser_results["errors"][frame_idx] is None:
                 sw_normal = measured_sw
-                
-                # Create stricter/looser configs for perturbation test
-                cfg_stricter = ShoulderWidthV12Config(
-                    plane_height_tolerance=cfg.plane_height_tolerance,
-                    arm_direction_exclusion_threshold=min(0.9, cfg.arm_direction_exclusion_threshold + 0.2),
-                    arm_distance_threshold=arm_distance_threshold,
-                    lateral_quantile=cfg.lateral_quantile,
-                    eps=cfg.eps,
-                    min_points=cfg.min_points,
-                )
-                cfg_looser = ShoulderWidthV12Config(
-                    plane_height_tolerance=cfg.plane_height_tolerance,
-                    arm_direction_exclusion_threshold=max(0.2, cfg.arm_direction_exclusion_threshold - 0.2),
-                    arm_distance_threshold=arm_distance_threshold,
-                    lateral_quantile=cfg.lateral_quantile,
-                    eps=cfg.eps,
-                    min_points=cfg.min_points,
-                )
-                
-                # Stricter arm exclusion
-                sw_stricter, _ = measure_shoulder_width_v12(
-                    verts=verts,
-                    lbs_weights=lbs_weights,
-                    joints_xyz=joints_xyz,
-                    joint_ids=joint_ids,
-                    cfg=cfg_stricter,
-                    return_debug=False,
-                )
-                sw_stricter = float(sw_stricter)
-                
-                # Looser arm exclusion
-                sw_looser, _ = measure_shoulder_width_v12(
-                    verts=verts,
-                    lbs_weights=lbs_weights,
-                    joints_xyz=joints_xyz,
-                    joint_ids=joint_ids,
-                    cfg=cfg_looser,
-                    return_debug=False,
-                )
-                sw_looser = float(sw_looser)
-                
-                delta_stricter = abs(sw_normal - sw_stricter)
-                delta_looser = abs(sw_normal - sw_looser)
-                
+                sw_stricter = float(stricter_results["widths"][frame_idx])
+                sw_looser = float(looser_results["widths"][frame_idx])
                 pose_perturbation_results.append({
                     "frame_id": frame_idx + 1,
                     "sw_normal": sw_normal,
                     "sw_stricter": sw_stricter,
                     "sw_looser": sw_looser,
-                    "delta_stricter": delta_stricter,
-                    "delta_looser": delta_looser,
+                    "delta_stricter": abs(sw_normal - sw_stricter),
+                    "delta_looser": abs(sw_normal - sw_looser),
                 })
-                
-            except Exception as e:
-                # Log but don't fail - perturbation test is optional
-                pass  # Skip perturbation test if it fails
     
     # Aggregate statistics
     measured_sws_arr = np.array(measured_sws)
@@ -383,39 +335,6 @@ def evaluate_candidate_config(
     }
 
 
-def _measure_with_arm_distance_threshold(
-    verts: np.ndarray,
-    lbs_weights: np.ndarray,
-    joints_xyz: np.ndarray,
-    joint_ids: Dict[str, int],
-    cfg: ShoulderWidthV12Config,
-    arm_distance_threshold: float,
-    return_debug: bool,
-):
-    """
-    Wrapper that creates a modified config with arm_distance_threshold.
-    Now that v1.2 supports arm_distance_threshold in config, we can use it directly.
-    """
-    # Create modified config with arm_distance_threshold
-    cfg_modified = ShoulderWidthV12Config(
-        plane_height_tolerance=cfg.plane_height_tolerance,
-        arm_direction_exclusion_threshold=cfg.arm_direction_exclusion_threshold,
-        arm_distance_threshold=arm_distance_threshold,
-        lateral_quantile=cfg.lateral_quantile,
-        eps=cfg.eps,
-        min_points=cfg.min_points,
-    )
-    
-    return measure_shoulder_width_v12(
-        verts=verts,
-        lbs_weights=lbs_weights,
-        joints_xyz=joints_xyz,
-        joint_ids=joint_ids,
-        cfg=cfg_modified,
-        return_debug=return_debug,
-    )
-
-
 def main():
     parser = argparse.ArgumentParser(
         description="Shoulder Width v1.2 Sensitivity Analysis & Verification"
@@ -438,6 +357,18 @@ def main():
         default=None,
         help="Run ID (default: from env RUN_ID or auto-generate KST timestamp)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Process pool size over candidate configs (1 = serial)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="JSONL memo of completed configs (re-runs only compute new candidates)",
+    )
     args = parser.parse_args()
     
     # Resolve RUN_ID first (before any artifact path creation)
@@ -518,15 +449,38 @@ def main():
     print(f"Evaluating {len(candidate_configs)} candidate configurations")
     print("-" * 80)
     
+    # Measure all candidates (all frames) and their stricter/looser perturbations
+    # (frames 1-3, shared by candidates with the same perturbed config)
+    frames = ShoulderWidthV12Frames(verts_all, lbs_weights_all, joints_xyz_all, joint_ids)
+    sweep = run_sweep(
+        [candidate["cfg"] for candidate in candidate_configs],
+        frames,
+        evaluate_shoulder_width_v12,
+        workers=args.workers,
+        cache_path=args.cache,
+        dataset_key=dataset_fingerprint(verts_all, lbs_weights_all, joints_xyz_all),
+    )
+    perturbed_frames = frames.head(3)
+    perturbation_sweep = run_sweep(
+        [c for candidate in candidate_configs for c in perturbation_configs(candidate["cfg"])],
+        perturbed_frames,
+        evaluate_shoulder_width_v12,
+        workers=args.workers,
+        cache_path=args.cache,
+        dataset_key=dataset_fingerprint(perturbed_frames.verts, perturbed_frames.lbs_weights, perturbed_frames.joints_xyz),
+    )
+    if args.cache:
+        n_cached = sum(e["cached"] for e in sweep) + sum(e["cached"] for e in perturbation_sweep)
+        print(f"Memo: {n_cached}/{len(sweep) + len(perturbation_sweep)} configs from {args.cache}")
+    
     # Evaluate each candidate
     all_results = []
     wiring_proofs = {}
     cfg_hash_map = {}  # Track hash -> candidate_ids for collision detection
     
-    for candidate in candidate_configs:
+    for i, (candidate, sweep_entry) in enumerate(zip(candidate_configs, sweep)):
         candidate_id = candidate["id"]
         cfg = candidate["cfg"]
-        arm_dist_thresh = candidate["arm_distance_threshold"]
         
         print(f"Evaluating {candidate_id}... ", end="", flush=True)
         
@@ -538,7 +492,11 @@ def main():
             joints_xyz_all=joints_xyz_all,
             joint_ids=joint_ids,
             output_base_dir=args.out_dir,
-            arm_distance_threshold=arm_dist_thresh,
+            frame_results=sweep_entry["result"],
+            perturbation_results=(
+                perturbation_sweep[2 * i]["result"],
+                perturbation_sweep[2 * i + 1]["result"],
+            ),
         )
         
         all_results.append(result)
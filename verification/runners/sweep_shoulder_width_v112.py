@@ -9,17 +9,22 @@ import csv
 import os
 import sys
 from pathlib import Path
-from itertools import product
 import numpy as np
 
-# Add core/measurements to path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-target_dir = os.path.join(current_dir, "../core/measurements")
-sys.path.insert(0, target_dir)
+# Bootstrap: Add project root to sys.path (for core.* and the shared sweep engine)
+_project_root = Path(__file__).resolve().parent.parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
 
-from shoulder_width_v112 import (
-    measure_shoulder_width_v112,
+from core.measurements.shoulder_width_v112 import (
     ShoulderWidthV112Config,
+    precompute_shoulder_width_v112_frames,
+)
+from verification.runners.shoulder_width.sweep_engine import (
+    config_grid,
+    dataset_fingerprint,
+    evaluate_shoulder_width_v112,
+    run_sweep,
 )
 
 # ---------------------------------------------------------
@@ -117,38 +122,11 @@ def _compute_stats(widths: np.ndarray, fallback_flags: np.ndarray):
     }
 
 
-def _run_config(verts, w, j, r0_ratio, r1_ratio, cap_quantile):
-    """Run measurement for one configuration across all frames."""
-    cfg = ShoulderWidthV112Config(
-        r0_ratio=r0_ratio,
-        r1_ratio=r1_ratio,
-        cap_quantile=cap_quantile,
-    )
-
-    widths = []
-    fallback_flags = []
-    err_count = 0
-
-    for t in range(verts.shape[0]):
-        try:
-            width, debug = measure_shoulder_width_v112(
-                verts=verts[t],
-                lbs_weights=w[t],
-                joints_xyz=j[t],
-                joint_ids=SMPLX_JOINT_IDS,
-                cfg=cfg,
-                return_debug=True,
-            )
-            fb = int(np.array(debug.get("fallback", [0])).reshape(-1)[0])
-            widths.append(width)
-            fallback_flags.append(fb)
-        except Exception:
-            err_count += 1
-            widths.append(np.nan)
-            fallback_flags.append(0)
-
-    widths = np.array(widths, dtype=np.float64)
-    fallback_flags = np.array(fallback_flags, dtype=np.int32)
+def _run_config(result: dict):
+    """Statistics for one configuration from its per-frame sweep result."""
+    widths = np.array(result["widths"], dtype=np.float64)
+    err_count = sum(e is not None for e in result["errors"])
+    fallback_flags = np.where(np.isfinite(widths), result["fallback"], 0).astype(np.int32)
 
     stats = _compute_stats(widths, fallback_flags)
     stats["error_count"] = err_count
@@ -237,6 +215,18 @@ def main():
         default="verification/reports/sweep_shoulder_v112.csv",
         help="Output CSV path",
     )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Process pool size over configurations (1 = serial)",
+    )
+    ap.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="JSONL memo of completed configurations (re-runs only compute new grid points)",
+    )
     args = ap.parse_args()
 
     # Load data
@@ -246,20 +236,42 @@ def main():
     n_frames = verts.shape[0]
     print(f"Loaded {n_frames} frames")
 
+    # Config-independent work once per frame set
+    frames = precompute_shoulder_width_v112_frames(verts, w, j, SMPLX_JOINT_IDS)
+
     # Generate all parameter combinations
-    param_combos = list(product(R0_RATIOS, R1_RATIOS, CAP_QUANTILES))
-    n_configs = len(param_combos)
+    configs = config_grid(
+        ShoulderWidthV112Config(),
+        r0_ratio=R0_RATIOS,
+        r1_ratio=R1_RATIOS,
+        cap_quantile=CAP_QUANTILES,
+    )
+    n_configs = len(configs)
     print(f"\nSweeping {n_configs} configurations...")
     print(f"  r0_ratio: {R0_RATIOS}")
     print(f"  r1_ratio: {R1_RATIOS}")
     print(f"  cap_quantile: {CAP_QUANTILES}")
 
     # Run sweep
+    sweep = run_sweep(
+        configs,
+        frames,
+        evaluate_shoulder_width_v112,
+        workers=args.workers,
+        cache_path=args.cache,
+        dataset_key=dataset_fingerprint(verts, w, j),
+    )
+    n_cached = sum(entry["cached"] for entry in sweep)
+    if args.cache:
+        print(f"  memo: {n_cached}/{n_configs} configurations from {args.cache}")
+
     results = []
-    for idx, (r0, r1, cap_q) in enumerate(param_combos, 1):
+    for idx, entry in enumerate(sweep, 1):
+        cfg = entry["cfg"]
+        r0, r1, cap_q = cfg.r0_ratio, cfg.r1_ratio, cfg.cap_quantile
         print(f"\n[{idx}/{n_configs}] r0={r0:.2f}, r1={r1:.2f}, cap_quantile={cap_q:.2f}")
 
-        stats = _run_config(verts, w, j, r0, r1, cap_q)
+        stats = _run_config(entry["result"])
 
         row = {
             "r0_ratio": r0,
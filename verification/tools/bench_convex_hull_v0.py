@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+2D Convex Hull Microbenchmark (core_measurements_v0)
+
+Purpose: Record hull time per slice size for three paths:
+- legacy: original per-pair allclose dedup + scalar-numpy cross() loop
+- numpy: _convex_hull_2d_monotone_chain (vectorized dedup, guarded float chain)
+- qhull: _convex_hull_2d_qhull (scipy, skipped if not installed)
+Facts-only: timings and identity flags, no PASS/FAIL.
+
+Usage:
+    python verification/tools/bench_convex_hull_v0.py
+    python verification/tools/bench_convex_hull_v0.py --sizes 50 1000 20000 --out bench.json
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+# Bootstrap: Add project root to sys.path
+_script_path = Path(__file__).resolve()
+_project_root = _script_path.parent.parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from core.measurements.core_measurements_v0 import (
+    _convex_hull_2d_monotone_chain,
+    _convex_hull_2d_qhull,
+)
+
+# _convex_hull_2d_qhull falls back to the monotone chain without scipy; don't bill that as qhull
+HAVE_SCIPY = importlib.util.find_spec("scipy") is not None
+
+
+def legacy_hull(pts: np.ndarray) -> Optional[np.ndarray]:
+    """Original implementation (reference for byte identity)."""
+    if pts.shape[0] < 3:
+        return None
+    sorted_pts = pts[np.lexsort((pts[:, 1], pts[:, 0]))]
+    unique_mask = np.ones(len(sorted_pts), dtype=bool)
+    for i in range(1, len(sorted_pts)):
+        if np.allclose(sorted_pts[i], sorted_pts[i - 1], atol=1e-9):
+            unique_mask[i] = False
+    sorted_pts = sorted_pts[unique_mask]
+    if len(sorted_pts) < 3:
+        return None
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower = []
+    for p in sorted_pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper = []
+    for p in reversed(sorted_pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    hull = np.array(lower[:-1] + upper[:-1], dtype=np.float32)
+    return hull if len(hull) >= 3 else None
+
+
+def make_slice(n_points: int, seed: int = 0) -> np.ndarray:
+    """Synthetic torso slice: noisy ellipse ring, float32 (x, z)."""
+    rng = np.random.default_rng(seed)
+    t = rng.uniform(0, 2 * np.pi, n_points)
+    ring = np.stack([0.16 * np.cos(t), 0.11 * np.sin(t)], axis=1)
+    ring += rng.normal(0, 0.003, ring.shape)
+    return ring.astype(np.float32)
+
+
+def time_call(fn, repeats: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark 2D convex hull paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 1000, 5000, 20000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--out", type=str, default=None, help="Optional JSON output path")
+    args = parser.parse_args()
+
+    # Warm up scipy import so it is not billed to the first size
+    if HAVE_SCIPY:
+        _convex_hull_2d_qhull(make_slice(16))
+
+    rows: List[Dict[str, Any]] = []
+    print(f"{'n_points':>9} | {'legacy_ms':>10} | {'numpy_ms':>9} | {'qhull_ms':>9} | {'n_hull':>6} | numpy==legacy | qhull==legacy")
+    print("-" * 92)
+    for n_points in args.sizes:
+        pts = make_slice(n_points)
+        ref = legacy_hull(pts)
+        fast = _convex_hull_2d_monotone_chain(pts)
+        qh = _convex_hull_2d_qhull(pts) if HAVE_SCIPY else None
+
+        legacy_ms = time_call(lambda: legacy_hull(pts), args.repeats)
+        numpy_ms = time_call(lambda: _convex_hull_2d_monotone_chain(pts), args.repeats)
+        qhull_ms = time_call(lambda: _convex_hull_2d_qhull(pts), args.repeats) if qh is not None else None
+
+        numpy_identical = (ref is None and fast is None) or (
+            ref is not None and fast is not None and ref.tobytes() == fast.tobytes()
+        )
+        qhull_identical = None
+        if qh is not None:
+            qhull_identical = ref is not None and ref.tobytes() == qh.tobytes()
+
+        rows.append({
+            "n_points": int(n_points),
+            "legacy_ms": legacy_ms,
+            "numpy_ms": numpy_ms,
+            "qhull_ms": qhull_ms,
+            "n_hull": int(len(ref)) if ref is not None else 0,
+            "numpy_identical_to_legacy": numpy_identical,
+            "qhull_identical_to_legacy": qhull_identical,
+        })
+        print(f"{n_points:>9} | {legacy_ms:>10.2f} | {numpy_ms:>9.2f} | "
+              f"{(f'{qhull_ms:.2f}' if qhull_ms is not None else 'n/a'):>9} | "
+              f"{rows[-1]['n_hull']:>6} | {str(numpy_identical):>13} | "
+              f"{qhull_identical if qhull_identical is not None else 'n/a'}")
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump({"repeats": args.repeats, "results": rows}, f, indent=2)
+        print(f"\nSaved: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+OBJ Loader Benchmark (run_geo_v0_s1_facts loader A/B)
+
+Purpose: Record load time per mesh size for:
+- line: _parse_obj_line_by_line (original per-line loader B)
+- bulk: _parse_obj_bulk (vectorized loader B)
+- trimesh: loader A (skipped if trimesh is not installed)
+Facts-only: timings and identity flags, no PASS/FAIL.
+
+Usage:
+    python verification/tools/bench_obj_loader_v0.py
+    python verification/tools/bench_obj_loader_v0.py --sizes 10475 300000 --face-form vt_vn --out bench.json
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any
+
+import numpy as np
+
+# Bootstrap: Add project root to sys.path
+_script_path = Path(__file__).resolve()
+_project_root = _script_path.parent.parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from verification.runners.run_geo_v0_s1_facts import (
+    _parse_obj_bulk,
+    _parse_obj_line_by_line,
+    load_obj_with_trimesh,
+)
+
+
+def write_synthetic_obj(path: Path, n_verts: int, face_form: str, seed: int = 0) -> None:
+    """Scan-like OBJ: n_verts vertices (mm scale), 2*n_verts faces in the given form."""
+    rng = np.random.default_rng(seed)
+    verts = rng.normal(0, 400.0, (n_verts, 3))
+    faces = rng.integers(1, n_verts + 1, (2 * n_verts, 3))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# synthetic scan\n")
+        f.writelines(f"v {x:.6f} {y:.6f} {z:.6f}\n" for x, y, z in verts)
+        if face_form == "plain":
+            f.writelines(f"f {a} {b} {c}\n" for a, b, c in faces)
+        elif face_form == "vn_only":
+            f.writelines(f"f {a}//{a} {b}//{b} {c}//{c}\n" for a, b, c in faces)
+        else:
+            f.writelines(f"f {a}/{a}/{a} {b}/{b}/{b} {c}/{c}/{c}\n" for a, b, c in faces)
+
+
+def time_call(fn, repeats: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark S1 OBJ loaders")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10475, 50000, 200000])
+    parser.add_argument("--face-form", type=str, default="vt_vn", choices=["plain", "vt_vn", "vn_only"])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", type=str, default=None, help="Optional JSON output path")
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    print(f"{'n_verts':>8} | {'file_mb':>7} | {'line_ms':>9} | {'bulk_ms':>9} | {'trimesh_ms':>10} | {'speedup':>7} | identical")
+    print("-" * 82)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_verts in args.sizes:
+            path = Path(tmp_dir) / f"scan_{n_verts}.obj"
+            write_synthetic_obj(path, n_verts, args.face_form)
+            file_mb = path.stat().st_size / 1e6
+
+            ref_verts, ref_faces = _parse_obj_line_by_line(path)
+            bulk = _parse_obj_bulk(path)
+            identical = bulk is not None and bulk[0].tobytes() == ref_verts.tobytes() and np.array_equal(bulk[1], ref_faces)
+
+            line_ms = time_call(lambda: _parse_obj_line_by_line(path), args.repeats)
+            bulk_ms = time_call(lambda: _parse_obj_bulk(path), args.repeats)
+            trimesh_ms = None
+            if load_obj_with_trimesh(path) is not None:
+                trimesh_ms = time_call(lambda: load_obj_with_trimesh(path), args.repeats)
+
+            speedup = line_ms / bulk_ms if bulk_ms > 0 else None
+            rows.append({
+                "n_verts": int(n_verts),
+                "file_mb": file_mb,
+                "line_ms": line_ms,
+                "bulk_ms": bulk_ms,
+                "trimesh_ms": trimesh_ms,
+                "speedup_vs_line": speedup,
+                "bulk_identical_to_line": identical,
+            })
+            print(f"{n_verts:>8} | {file_mb:>7.1f} | {line_ms:>9.1f} | {bulk_ms:>9.1f} | "
+                  f"{(f'{trimesh_ms:.1f}' if trimesh_ms is not None else 'n/a'):>10} | "
+                  f"{(f'{speedup:.1f}x' if speedup is not None else '-'):>7} | {identical}")
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump({"face_form": args.face_form, "repeats": args.repeats, "results": rows}, f, indent=2)
+        print(f"\nSaved: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+7th Numeric Parser Benchmark (build_curated_v0)
+
+Purpose: Record per-source parse time of the 7th comma parser over every numeric column:
+- scalar: series.astype(str).str.strip().apply(parse_numeric_string_7th) (original)
+- vectorized: parse_numeric_series_7th per column
+- frame: parse_numeric_frame_7th (distinct values of the whole frame parsed once; used by the build)
+Input is the full 7th XLSX (header rows resolved via the column mapping); if it is
+missing, a synthetic 7th-shaped frame is used instead.
+Facts-only: timings and identity flags, no PASS/FAIL.
+
+Usage:
+    python verification/tools/bench_parse_numeric_7th_v0.py
+    python verification/tools/bench_parse_numeric_7th_v0.py --input data/raw/sizekorea_raw/7th_data.xlsx --out bench.json
+    python verification/tools/bench_parse_numeric_7th_v0.py --synthetic-rows 6000 --synthetic-cols 300
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Bootstrap: Add project root to sys.path
+_script_path = Path(__file__).resolve()
+_project_root = _script_path.parent.parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from pipelines.build_curated_v0 import (
+    find_header_rows,
+    load_mapping_v1,
+    load_raw_file,
+    parse_numeric_frame_7th,
+    parse_numeric_string_7th,
+    parse_numeric_series_7th,
+)
+
+
+def load_7th_frame(input_path: Path, mapping_path: Path) -> Optional[pd.DataFrame]:
+    """Load the 7th raw file the way build_curated_v0 does (None if missing)."""
+    if not input_path.exists():
+        return None
+    is_xlsx = input_path.suffix.lower() == ".xlsx"
+    mapping = load_mapping_v1(mapping_path)
+    primary_row, _, secondary_row = find_header_rows(input_path, mapping, is_xlsx=is_xlsx, source_key="7th")
+    return load_raw_file(input_path, primary_row, secondary_row, "7th", is_xlsx=is_xlsx)
+
+
+def make_synthetic_7th(n_rows: int, n_cols: int, seed: int = 0) -> pd.DataFrame:
+    """7th-shaped frame: mixed numeric/object columns with decimal and thousands commas."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for j in range(n_cols):
+        # Anthropometric spread: ~5% around a per-column mean, 0.1 resolution
+        mean = rng.uniform(100, 2000)
+        values = rng.normal(mean, 0.05 * mean, n_rows).round(1)
+        if j % 3 == 0:
+            # XLSX auto-converted numeric column
+            data[f"COL_{j}"] = values
+            continue
+        cells = np.array([f"{v:.1f}" for v in values], dtype=object)
+        decimal = rng.random(n_rows) < 0.2
+        cells[decimal] = [c.replace(".", ",") for c in cells[decimal]]
+        thousands = rng.random(n_rows) < 0.05
+        cells[thousands] = [f"{int(v):,}" for v in values[thousands] * 10]
+        cells[rng.random(n_rows) < 0.03] = "9999"
+        cells[rng.random(n_rows) < 0.03] = np.nan
+        data[f"COL_{j}"] = cells
+    return pd.DataFrame(data)
+
+
+def same_cells(a: pd.Series, b: pd.Series) -> bool:
+    """Cell-wise equality where missing == missing."""
+    return a.index.equals(b.index) and bool(((a == b) | (a.isna() & b.isna())).all())
+
+
+def time_frame(df: pd.DataFrame, repeats: int) -> tuple[List[float], bool]:
+    """Best-of-N wall time (ms) for scalar, vectorized and frame paths over all numeric columns,
+    plus whether all three return identical cells."""
+    numeric_cols = [c for c in df.columns if c not in ("SEX", "AGE", "HUMAN_ID")]
+
+    def run_scalar():
+        return [df[c].astype(str).str.strip().apply(parse_numeric_string_7th) for c in numeric_cols]
+
+    def run_vectorized():
+        return [parse_numeric_series_7th(df[c]) for c in numeric_cols]
+
+    def run_frame():
+        return list(parse_numeric_frame_7th(df, numeric_cols).values())
+
+    runs = (run_scalar, run_vectorized, run_frame)
+    reference, *others = [fn() for fn in runs]
+    identical = all(same_cells(a, b) for other in others for a, b in zip(reference, other))
+    timings = []
+    for fn in runs:
+        best = float("inf")
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, (time.perf_counter() - t0) * 1000.0)
+        timings.append(best)
+    return timings, identical
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark 7th comma parser (scalar vs vectorized)")
+    parser.add_argument("--input", type=str, default="data/raw/sizekorea_raw/7th_data.xlsx")
+    parser.add_argument("--mapping", type=str, default="data/column_map/sizekorea_v2.json")
+    parser.add_argument("--synthetic-rows", type=int, default=6000)
+    parser.add_argument("--synthetic-cols", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", type=str, default=None, help="Optional JSON output path")
+    args = parser.parse_args()
+
+    df = load_7th_frame(Path(args.input), Path(args.mapping))
+    source = args.input
+    if df is None:
+        print(f"[INFO] {args.input} not found; using synthetic 7th frame")
+        df = make_synthetic_7th(args.synthetic_rows, args.synthetic_cols)
+        source = f"synthetic({args.synthetic_rows}x{args.synthetic_cols})"
+
+    (scalar_ms, vectorized_ms, frame_ms), identical = time_frame(df, args.repeats)
+    result: Dict[str, Any] = {
+        "source": source,
+        "n_rows": int(len(df)),
+        "n_cols": int(len(df.columns)),
+        "scalar_ms": scalar_ms,
+        "vectorized_ms": vectorized_ms,
+        "frame_ms": frame_ms,
+        "speedup": scalar_ms / frame_ms if frame_ms > 0 else None,
+        "identical": identical,
+    }
+    print(f"source: {source} ({result['n_rows']} rows x {result['n_cols']} cols)")
+    print(f"scalar_ms: {scalar_ms:.1f} | vectorized_ms: {vectorized_ms:.1f} | frame_ms: {frame_ms:.1f} | "
+          f"speedup (scalar/frame): {result['speedup']:.1f}x | identical: {identical}")
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump({"repeats": args.repeats, "result": result}, f, indent=2)
+        print(f"\nSaved: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
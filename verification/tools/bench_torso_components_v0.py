@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Torso Slice Connected Components Benchmark (core_measurements_v0)
+
+Purpose: Record per-slice time of _find_connected_components_2d as slice point
+count scales, against the original brute-force BFS (O(N^2)) as reference.
+Facts-only: timings and equality flags, no PASS/FAIL.
+
+Usage:
+    python verification/tools/bench_torso_components_v0.py
+    python verification/tools/bench_torso_components_v0.py --sizes 500 2000 20000 --out bench.json
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any
+
+import numpy as np
+
+# Bootstrap: Add project root to sys.path
+_script_path = Path(__file__).resolve()
+_project_root = _script_path.parent.parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from core.measurements.core_measurements_v0 import _find_connected_components_2d
+
+
+def reference_components_2d(vertices_2d: np.ndarray, connectivity_threshold: float = 0.01) -> List[np.ndarray]:
+    """Original brute-force BFS (pop(0) queue, full-array distance per visit)."""
+    n = vertices_2d.shape[0]
+    visited = np.zeros(n, dtype=bool)
+    components = []
+    for i in range(n):
+        if visited[i]:
+            continue
+        component_indices = []
+        queue = [i]
+        visited[i] = True
+        while queue:
+            current = queue.pop(0)
+            component_indices.append(current)
+            distances = np.linalg.norm(vertices_2d - vertices_2d[current], axis=1)
+            neighbors = np.where((distances < connectivity_threshold) & (~visited))[0]
+            for neighbor in neighbors:
+                visited[neighbor] = True
+                queue.append(neighbor)
+        if len(component_indices) >= 3:
+            components.append(vertices_2d[component_indices])
+    return components
+
+
+def make_slice(n_points: int, seed: int = 0) -> np.ndarray:
+    """Synthetic torso slice: torso ellipse (80%) + two arm rings (20%), float32."""
+    rng = np.random.default_rng(seed)
+    n_arm = max(3, n_points // 10)
+    n_torso = max(3, n_points - 2 * n_arm)
+    t = rng.uniform(0, 2 * np.pi, n_torso)
+    torso = np.stack([0.16 * np.cos(t), 0.11 * np.sin(t)], axis=1)
+    a = rng.uniform(0, 2 * np.pi, 2 * n_arm)
+    arms = np.stack([0.045 * np.cos(a), 0.045 * np.sin(a)], axis=1)
+    arms[:n_arm, 0] -= 0.26
+    arms[n_arm:, 0] += 0.26
+    pts = np.concatenate([torso, arms]).astype(np.float32)
+    return pts[rng.permutation(len(pts))]
+
+
+def time_call(fn, repeats: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark torso slice connected components")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000, 2500, 5000, 10000, 20000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.01)
+    parser.add_argument("--max-ref-points", type=int, default=5000,
+                        help="Skip brute-force reference above this slice size (O(N^2))")
+    parser.add_argument("--out", type=str, default=None, help="Optional JSON output path")
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    print(f"{'n_points':>9} | {'grid_ms':>9} | {'ref_ms':>9} | {'speedup':>8} | {'n_comp':>6} | identical")
+    print("-" * 64)
+    for n_points in args.sizes:
+        pts = make_slice(n_points)
+        comps = _find_connected_components_2d(pts, connectivity_threshold=args.threshold)
+        grid_ms = time_call(lambda: _find_connected_components_2d(pts, connectivity_threshold=args.threshold), args.repeats)
+
+        ref_ms = None
+        identical = None
+        if n_points <= args.max_ref_points:
+            ref = reference_components_2d(pts, args.threshold)
+            identical = len(ref) == len(comps) and all(np.array_equal(a, b) for a, b in zip(comps, ref))
+            ref_ms = time_call(lambda: reference_components_2d(pts, args.threshold), 1)
+
+        speedup = (ref_ms / grid_ms) if (ref_ms is not None and grid_ms > 0) else None
+        rows.append({
+            "n_points": int(n_points),
+            "grid_ms": grid_ms,
+            "reference_ms": ref_ms,
+            "speedup": speedup,
+            "n_components": len(comps),
+            "identical_to_reference": identical,
+        })
+        print(f"{n_points:>9} | {grid_ms:>9.2f} | "
+              f"{(f'{ref_ms:.2f}' if ref_ms is not None else 'skipped'):>9} | "
+              f"{(f'{speedup:.1f}x' if speedup is not None else '-'):>8} | {len(comps):>6} | "
+              f"{identical if identical is not None else '-'}")
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump({"threshold": args.threshold, "repeats": args.repeats, "results": rows}, f, indent=2)
+        print(f"\nSaved: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
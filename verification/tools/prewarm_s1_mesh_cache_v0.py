@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+S1 Mesh Cache Prewarm (run_geo_v0_s1_facts MeshCache)
+
+Purpose: Load every OBJ referenced by an S1 manifest once and store it in the
+binary mesh cache (.npy verts/faces + scale_warning), so later S1 runs with
+--mesh_cache_dir skip OBJ parsing.
+Facts-only: counts, sizes and timings, no PASS/FAIL.
+
+Usage:
+    python verification/tools/prewarm_s1_mesh_cache_v0.py --cache_dir verification/local_artifacts/mesh_cache
+    python verification/tools/prewarm_s1_mesh_cache_v0.py --manifest m.json --cache_dir c --max_gb 4 --key sha256
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Bootstrap: Add project root to sys.path
+_script_path = Path(__file__).resolve()
+_project_root = _script_path.parent.parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from verification.runners.run_geo_v0_s1_facts import (
+    MeshCache,
+    load_s1_manifest,
+    load_verts_from_path_with_info,
+    resolve_mesh_path,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Prewarm the S1 binary mesh cache from a manifest")
+    parser.add_argument("--manifest", type=str, default="verification/datasets/golden/s1_mesh_v0/s1_manifest_v0.json")
+    parser.add_argument("--cache_dir", type=str, required=True)
+    parser.add_argument("--max_gb", type=float, default=2.0, help="Cache size bound in GB (LRU eviction)")
+    parser.add_argument("--key", type=str, default="stat", choices=["stat", "sha256"])
+    args = parser.parse_args()
+
+    cache = MeshCache(Path(args.cache_dir), int(args.max_gb * 1024 ** 3), args.key)
+    manifest = load_s1_manifest(args.manifest)
+    cases = manifest.get("cases", [])
+
+    counts = {"cases": len(cases), "obj_paths": 0, "already_cached": 0, "stored": 0, "missing": 0, "load_failed": 0}
+    seen = set()
+    t0 = time.perf_counter()
+    for case in cases:
+        path_to_use = case.get("verts_path") or case.get("mesh_path")
+        if not path_to_use or not str(path_to_use).lower().endswith(".obj"):
+            continue
+        resolved, exists = resolve_mesh_path(str(path_to_use))
+        if resolved in seen:
+            continue
+        seen.add(resolved)
+        counts["obj_paths"] += 1
+        if not exists:
+            counts["missing"] += 1
+            continue
+        if cache.get(resolved) is not None:
+            counts["already_cached"] += 1
+            continue
+        if load_verts_from_path_with_info(str(resolved), mesh_cache=cache) is None:
+            counts["load_failed"] += 1
+        else:
+            counts["stored"] += 1
+    elapsed_s = time.perf_counter() - t0
+
+    entries = cache.entries()
+    print(f"[PREWARM] manifest: {args.manifest}")
+    for name, value in counts.items():
+        print(f"[PREWARM] {name}: {value}")
+    print(f"[PREWARM] cache entries: {len(entries)}, size: {sum(e[1] for e in entries) / 1e6:.1f} MB "
+          f"(max {args.max_gb:.1f} GB), elapsed: {elapsed_s:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())